@@ -0,0 +1,83 @@
+"""Benchmark concurrent writes to Sopel's SQLite database, for each profile.
+
+Run it from the repository root::
+
+    python contrib/benchmark_sqlite.py --threads 8 --writes 200
+
+Each thread sets its own plugin values with ``SopelDB.set_plugin_value``,
+like threaded plugins do, and the script reports the throughput and the
+number of failed writes (such as "database is locked" errors) for each value
+of the ``db_sqlite_profile`` setting.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from sopel.config import Config
+from sopel.db import SopelDB
+
+
+CONFIG = """
+[core]
+owner = benchmark
+db_filename = {db_filename}
+db_sqlite_profile = {profile}
+"""
+
+
+def run(profile: str, threads: int, writes: int) -> tuple[float, int]:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'benchmark.cfg')
+        with open(filename, 'w') as fd:
+            fd.write(CONFIG.format(
+                db_filename=os.path.join(tmpdir, 'benchmark.db'),
+                profile=profile,
+            ))
+        db = SopelDB(Config(filename))
+        errors = []
+        start = threading.Barrier(threads + 1)
+
+        def write(index: int) -> None:
+            start.wait()
+            for count in range(writes):
+                try:
+                    db.set_plugin_value(
+                        'benchmark', 'key%d-%d' % (index, count % 10), count)
+                except Exception as error:
+                    errors.append(error)
+
+        workers = [
+            threading.Thread(target=write, args=(index,))
+            for index in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        start.wait()
+        started_at = time.perf_counter()
+        for worker in workers:
+            worker.join()
+        duration = time.perf_counter() - started_at
+        db.engine.dispose()
+
+    return threads * writes / duration, len(errors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--writes', type=int, default=200,
+                        help='number of writes per thread')
+    args = parser.parse_args()
+
+    print('%d threads x %d writes' % (args.threads, args.writes))
+    for profile in ('default', 'performance'):
+        throughput, errors = run(profile, args.threads, args.writes)
+        print('%-12s %8.0f writes/s %6d errors' % (profile, throughput, errors))
+
+
+if __name__ == '__main__':
+    main()
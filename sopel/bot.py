@@ -8,13 +8,13 @@
 from __future__ import annotations
 
 from ast import literal_eval
+import asyncio
 from datetime import timedelta
 import inspect
 import itertools
 import logging
 import math
 import re
-import threading
 import time
 from types import MappingProxyType
 from typing import (
@@ -26,14 +26,20 @@ from typing import (
 )
 
 from sopel import db, irc, logger, plugins, tools
-from sopel.irc import modes
+from sopel.irc import modes, outbound as irc_outbound
 from sopel.lifecycle import deprecated
 from sopel.plugins import (
     capabilities as plugin_capabilities,
     jobs as plugin_jobs,
     rules as plugin_rules,
 )
-from sopel.tools import jobs as tools_jobs
+from sopel.tools import (
+    blocklist as tools_blocklist,
+    jobs as tools_jobs,
+    metrics as tools_metrics,
+    stats as tools_stats,
+    workers as tools_workers,
+)
 from sopel.trigger import Trigger
 
 
@@ -48,7 +54,7 @@ if TYPE_CHECKING:
     from sopel.trigger import PreTrigger
 
 
-__all__ = ['Sopel', 'SopelWrapper']
+__all__ = ['AsyncSopelWrapper', 'Sopel', 'SopelWrapper']
 
 LOGGER = logging.getLogger(__name__)
 
@@ -59,12 +65,24 @@ class Sopel(irc.AbstractBot):
     def __init__(self, config, daemon=False):
         super().__init__(config)
         self._daemon = daemon  # Used for iPython. TODO something saner here
-        self._running_triggers = []
-        self._running_triggers_lock = threading.Lock()
+        self._worker_pool = tools_workers.WorkerPool(
+            self.settings.core.dispatch_workers,
+            queue_size=self.settings.core.dispatch_queue_size,
+            policy=self.settings.core.dispatch_queue_policy,
+            group_limits=self._get_dispatch_plugin_workers(),
+            name='sopel-dispatch',
+        )
         self._plugins: dict[str, Any] = {}
         self._rules_manager = plugin_rules.Manager()
         self._cap_requests_manager = plugin_capabilities.Manager()
-        self._scheduler = plugin_jobs.Scheduler(self)
+        self._handler_stats = tools_stats.StatsRegistry()
+        self._metrics_server: tools_metrics.MetricsServer | None = None
+        self._scheduler = plugin_jobs.Scheduler(
+            self,
+            stats=self._handler_stats,
+            watchdog=self._watchdog,
+            max_workers=self.settings.core.job_workers,
+        )
 
         self._url_callbacks = tools.SopelMemory()
         """Tracking of manually registered URL callbacks.
@@ -75,12 +93,18 @@ class Sopel(irc.AbstractBot):
         Remove in Sopel 9, along with the above related methods.
         """
 
-        self._times = {}
+        self._rate_limits: dict[Any, plugin_rules.RateLimitStore] = {}
         """
-        A dictionary mapping lowercased nicks to dictionaries which map
-        function names to the time which they were last used by that nick.
+        A dictionary mapping functions to the store of the monotonic time at
+        which they were last used, by nick, by channel, and by the bot's nick
+        (for the global rate limit).
+
+        .. versionadded:: 8.1
         """
 
+        self._blocklist: tools_blocklist.Blocklist | None = None
+        self._blocklist_sources: tuple[Any, ...] = tuple()
+
         self.modeparser = modes.ModeParser()
         """A mode parser used to parse ``MODE`` messages and modestrings."""
 
@@ -123,11 +147,76 @@ class Sopel(irc.AbstractBot):
         """Rules manager."""
         return self._rules_manager
 
+    @property
+    def handler_stats(self) -> tools_stats.StatsRegistry:
+        """Execution statistics of the plugins' rules and jobs.
+
+        For each rule and job, by plugin and label, this counts invocations,
+        errors, rate-limited hits, time spent waiting for a worker, and
+        execution time::
+
+            for stats in bot.handler_stats.get_snapshots(plugin='seen'):
+                print(stats.label, stats.invocations, stats.execution_time_avg)
+
+        .. versionadded:: 8.1
+        """
+        return self._handler_stats
+
     @property
     def scheduler(self) -> plugin_jobs.Scheduler:
         """Job Scheduler. See :func:`sopel.plugin.interval`."""
         return self._scheduler
 
+    @property
+    def dispatch_stats(self) -> tools_workers.WorkerPoolStats:
+        """Statistics of the worker pool executing threaded rules.
+
+        This includes the number of triggered rules waiting in the queue, and
+        how long they waited before being executed, which helps to configure
+        the :ref:`Worker Pool`.
+
+        .. versionadded:: 8.1
+        """
+        return self._worker_pool.get_stats()
+
+    def _get_dispatch_plugin_workers(self) -> dict[str, int]:
+        limits = {}
+        for item in self.settings.core.dispatch_plugin_workers:
+            plugin_name, _, limit = item.partition(':')
+            try:
+                limits[plugin_name.strip()] = max(1, int(limit))
+            except ValueError:
+                LOGGER.warning(
+                    'Ignoring invalid dispatch_plugin_workers item: %r', item)
+        return limits
+
+    @property
+    @deprecated(
+        reason='Rate limits are now stored by function, in `bot._rate_limits`.',
+        version='8.1',
+        removed_in='9.0',
+    )
+    def _times(self) -> dict[Any, dict[Any, float]]:
+        """A dictionary mapping nicks and channels to dictionaries which map
+        functions to the time which they were last used by that nick or in
+        that channel.
+
+        .. deprecated:: 8.1
+
+            This is now a read-only snapshot of :attr:`_rate_limits`, where
+            the last uses expire: changing it doesn't change any rate limit.
+
+            Will be removed in Sopel 9.
+
+        """
+        times: dict[Any, dict[Any, float]] = {}
+        for func, store in list(self._rate_limits.items()):
+            for key, metrics in store.items():
+                last_time = metrics.last_time
+                if last_time is not None:
+                    times.setdefault(key, {})[func] = last_time.timestamp()
+        return times
+
     @property
     def command_groups(self) -> dict[str, list]:
         """A mapping of plugin names to lists of their commands.
@@ -323,9 +412,14 @@ class Sopel(irc.AbstractBot):
         are loaded, and before the bot can connect to the IRC server.
 
         At the moment, this method checks for undefined configuration options,
-        and starts the job scheduler.
+        starts the job scheduler, and starts the metrics endpoint and the
+        watchdog if they are enabled.
 
         .. versionadded:: 7.1
+        .. versionchanged:: 8.1
+
+            The metrics endpoint and the watchdog are started here.
+
         """
         settings = self.settings
         for section_name, section in settings.get_defined_sections():
@@ -345,6 +439,25 @@ class Sopel(irc.AbstractBot):
 
         self._scheduler.start()
 
+        if self._watchdog is not None:
+            self._watchdog.start()
+
+        if settings.core.metrics_port:
+            self._start_metrics_server()
+
+    def _start_metrics_server(self) -> None:
+        core = self.settings.core
+        try:
+            self._metrics_server = tools_metrics.MetricsServer(
+                self, core.metrics_host, core.metrics_port)
+        except OSError as error:
+            LOGGER.error(
+                'Unable to serve metrics on %s:%d: %s',
+                core.metrics_host, core.metrics_port, error)
+            return
+
+        self._metrics_server.start()
+
     # plugins management
 
     def set_plugin_handler(
@@ -369,7 +482,8 @@ class Sopel(irc.AbstractBot):
 
         :param name: plugin name to forget
 
-        Removing a plugin handler removes only its name from :attr:``plugins``.
+        Removing a plugin handler removes only its name from :attr:``plugins``,
+        and the statistics of its rules and jobs from :attr:`handler_stats`.
         To unregister a plugin handler's callables, jobs, etc. you should use
         its :meth:`~sopel.plugins.handlers.AbstractPluginHandler.unregister`
         method.
@@ -377,6 +491,7 @@ class Sopel(irc.AbstractBot):
         .. versionadded:: 8.1
         """
         del self._plugins[name]
+        self._handler_stats.remove_plugin(name)
 
     def reload_plugin(self, name: str) -> None:
         """Reload a plugin.
@@ -509,6 +624,7 @@ class Sopel(irc.AbstractBot):
 
         # remove plugin from registry
         del self._plugins[name]
+        self._handler_stats.remove_plugin(name)
 
     def has_plugin(self, name: str) -> bool:
         """Check if the bot has registered a plugin of the specified name.
@@ -668,7 +784,7 @@ class Sopel(irc.AbstractBot):
             return False, None
 
         nick = trigger.nick
-        if trigger.admin and not rule.is_admin_rate_limited():
+        if not rule.is_admin_rate_limited() and trigger.admin:
             LOGGER.debug(
                 "Skipping rate limit checks for %s on rule %s: "
                 "rule does not rate-limit admins",
@@ -734,53 +850,129 @@ class Sopel(irc.AbstractBot):
 
     # message dispatch
 
-    def call_rule(
+    def _can_call_rule(
         self,
         rule: plugin_rules.AbstractRule,
         sopel: 'SopelWrapper',
         trigger: Trigger,
-    ) -> None:
+    ) -> bool:
         nick = trigger.nick
         context = trigger.sender
-        is_channel = context and not context.is_nick()
 
         limited, limit_msg = self.rate_limit_info(rule, trigger)
         if limited:
+            self._get_rule_stats(rule).record_rate_limited()
             if limit_msg:
                 sopel.notice(limit_msg, destination=nick)
-            return
+            return False
 
         # channel config
-        if is_channel and context in self.settings:
-            channel_config = self.settings[context]
-            plugin_name = rule.get_plugin_name()
+        policy = self._rules_manager.get_channel_policy(self.settings, context)
+        if policy is not None and not policy.allows(rule):
+            return False
 
-            # disable listed plugins completely on provided channel
-            if 'disable_plugins' in channel_config:
-                disabled_plugins = channel_config.disable_plugins.split(',')
+        return True
 
-                if plugin_name == 'coretasks':
-                    LOGGER.debug("disable_plugins refuses to skip a coretasks handler")
-                elif '*' in disabled_plugins:
-                    return
-                elif plugin_name in disabled_plugins:
-                    return
+    def _get_rule_stats(
+        self,
+        rule: plugin_rules.AbstractRule,
+    ) -> tools_stats.HandlerStats:
+        return self._handler_stats.get(
+            tools_stats.KIND_RULE,
+            rule.get_plugin_name(),
+            rule.get_rule_label(),
+        )
 
-            # disable chosen methods from plugins
-            if 'disable_commands' in channel_config:
-                disabled_commands = literal_eval(channel_config.disable_commands)
-                disabled_commands = disabled_commands.get(plugin_name, [])
-                if rule.get_rule_label() in disabled_commands:
-                    if plugin_name != 'coretasks':
-                        return
-                    LOGGER.debug("disable_commands refuses to skip a coretasks handler")
+    def call_rule(
+        self,
+        rule: plugin_rules.AbstractRule,
+        sopel: 'SopelWrapper',
+        trigger: Trigger,
+        queued_at: float | None = None,
+    ) -> None:
+        """Execute a ``rule``, applying rate limits and channel policies.
+
+        :param rule: the rule to execute
+        :param sopel: a SopelWrapper instance
+        :param trigger: the Trigger object for the line from the server that
+                        triggered this call
+        :param queued_at: optional monotonic time at which the rule was
+                          queued for execution
+
+        The execution is recorded in :attr:`handler_stats`.
+
+        .. versionchanged:: 8.1
+
+            The ``queued_at`` parameter has been added.
+
+        """
+        queue_wait = 0.0
+        if queued_at is not None:
+            queue_wait = max(0.0, time.monotonic() - queued_at)
+
+        if not self._can_call_rule(rule, sopel, trigger):
+            return
 
+        started_at = time.perf_counter()
+        failed = False
         try:
-            rule.execute(sopel, trigger)
+            with self._track('rule %s.%s' % (
+                rule.get_plugin_name(), rule.get_rule_label(),
+            )):
+                rule.execute(sopel, trigger)
         except KeyboardInterrupt:
             raise
         except Exception as error:
+            failed = True
             self.error(trigger, exception=error)
+        finally:
+            self._get_rule_stats(rule).record_execution(
+                time.perf_counter() - started_at,
+                error=failed,
+                queue_wait=queue_wait,
+            )
+
+    async def call_rule_async(
+        self,
+        rule: plugin_rules.AbstractRule,
+        sopel: 'AsyncSopelWrapper',
+        trigger: Trigger,
+        queued_at: float | None = None,
+    ) -> None:
+        """Execute an asynchronous ``rule`` on the event loop.
+
+        :param rule: the rule to execute
+        :param sopel: an AsyncSopelWrapper instance
+        :param trigger: the Trigger object for the line from the server that
+                        triggered this call
+        :param queued_at: optional monotonic time at which the rule was
+                          scheduled on the event loop
+
+        This works like :meth:`call_rule`, but the rule is executed with its
+        :meth:`~sopel.plugins.rules.AbstractRule.execute_async` method.
+
+        .. versionadded:: 8.1
+        """
+        queue_wait = 0.0
+        if queued_at is not None:
+            queue_wait = max(0.0, time.monotonic() - queued_at)
+
+        if not self._can_call_rule(rule, sopel, trigger):
+            return
+
+        started_at = time.perf_counter()
+        failed = False
+        try:
+            await rule.execute_async(sopel, trigger)
+        except Exception as error:
+            failed = True
+            self.error(trigger, exception=error)
+        finally:
+            self._get_rule_stats(rule).record_execution(
+                time.perf_counter() - started_at,
+                error=failed,
+                queue_wait=queue_wait,
+            )
 
     def call(
         self,
@@ -803,17 +995,21 @@ class Sopel(irc.AbstractBot):
 
         """
         nick = trigger.nick
-        current_time = time.time()
-        if nick not in self._times:
-            self._times[nick] = dict()
-        if self.nick not in self._times:
-            self._times[self.nick] = dict()
-        if not trigger.is_privmsg and trigger.sender not in self._times:
-            self._times[trigger.sender] = dict()
+        current_time = time.monotonic()
+        times = self._rate_limits.get(func)
+        if times is None:
+            times = self._rate_limits.setdefault(func, plugin_rules.RateLimitStore(
+                max(func.user_rate, func.channel_rate, func.global_rate)))
+
+        def time_since(key: str) -> float | None:
+            metrics = times.get(key)
+            if metrics is None or metrics.last_monotonic is None:
+                return None
+            return current_time - metrics.last_monotonic
 
         if not trigger.admin and not func.unblockable:
-            if func in self._times[nick]:
-                usertimediff = current_time - self._times[nick][func]
+            usertimediff = time_since(nick)
+            if usertimediff is not None:
                 if func.user_rate > 0 and usertimediff < func.user_rate:
                     LOGGER.info(
                         "%s prevented from using %s in %s due to user limit: %d < %d",
@@ -821,8 +1017,8 @@ class Sopel(irc.AbstractBot):
                         func.user_rate
                     )
                     return
-            if func in self._times[self.nick]:
-                globaltimediff = current_time - self._times[self.nick][func]
+            globaltimediff = time_since(self.nick)
+            if globaltimediff is not None:
                 if func.global_rate > 0 and globaltimediff < func.global_rate:
                     LOGGER.info(
                         "%s prevented from using %s in %s due to global limit: %d < %d",
@@ -831,8 +1027,10 @@ class Sopel(irc.AbstractBot):
                     )
                     return
 
-            if not trigger.is_privmsg and func in self._times[trigger.sender]:
-                chantimediff = current_time - self._times[trigger.sender][func]
+            chantimediff = None
+            if not trigger.is_privmsg:
+                chantimediff = time_since(trigger.sender)
+            if chantimediff is not None:
                 if func.channel_rate > 0 and chantimediff < func.channel_rate:
                     LOGGER.info(
                         "%s prevented from using %s in %s due to channel limit: %d < %d",
@@ -888,10 +1086,13 @@ class Sopel(irc.AbstractBot):
             self.error(trigger, exception=error)
 
         if exit_code != plugin_rules.IGNORE_RATE_LIMIT:
-            self._times[nick][func] = current_time
-            self._times[self.nick][func] = current_time
+            keys = [nick, self.nick]
             if not trigger.is_privmsg:
-                self._times[trigger.sender][func] = current_time
+                keys.append(trigger.sender)
+            for key in keys:
+                metrics = times.use(key)
+                metrics.start(current_time)
+                metrics.end(current_time)
 
     def _is_pretrigger_blocked(
         self,
@@ -904,10 +1105,32 @@ class Sopel(irc.AbstractBot):
         ):
             return (None, None, None)
 
-        nick_blocked = self._nick_blocked(pretrigger.nick)
-        host_blocked = self._host_blocked(pretrigger.host)
-        hostmask_blocked = self._hostmask_blocked(pretrigger.hostmask)
-        return (nick_blocked, host_blocked, hostmask_blocked)
+        return self._get_blocklist().check(
+            pretrigger.nick, pretrigger.host, pretrigger.hostmask)
+
+    def _get_blocklist(self) -> tools_blocklist.Blocklist:
+        """Get the index of blocked nicks, hosts, and hostmasks.
+
+        The index is built again when any of the ``*_blocks`` settings is
+        set, or when the server's casemapping changes.
+        """
+        core = self.settings.core
+        sources = (
+            core.nick_blocks,
+            core.host_blocks,
+            core.hostmask_blocks,
+            self.isupport.get('CASEMAPPING'),
+        )
+        if self._blocklist is None or sources != self._blocklist_sources:
+            self._blocklist = tools_blocklist.Blocklist(
+                sources[0],
+                sources[1],
+                sources[2],
+                self.make_identifier,
+            )
+            self._blocklist_sources = sources
+
+        return self._blocklist
 
     def dispatch(self, pretrigger: PreTrigger) -> None:
         """Dispatch a parsed message to any registered callables.
@@ -917,7 +1140,9 @@ class Sopel(irc.AbstractBot):
 
         The ``pretrigger`` (a parsed message) is used to find matching rules;
         it will retrieve them by order of priority, and execute them. It runs
-        triggered rules in separate threads, unless they are marked otherwise.
+        triggered rules in a pool of worker threads, unless they are marked
+        otherwise. Asynchronous rules (defined with ``async def``) are
+        scheduled on the connection backend's event loop instead.
 
         However, it won't run triggered blockable rules at all when they can't
         be executed for blocked nickname or hostname.
@@ -928,8 +1153,6 @@ class Sopel(irc.AbstractBot):
             :class:`Rules Manager<sopel.plugins.rules.Manager>`.
 
         """
-        # list of commands running in separate threads for this dispatch
-        running_triggers = []
         # nickname/hostname blocking
         nick_blocked, host_blocked, hostmask_blocked = (
             self._is_pretrigger_blocked(pretrigger)
@@ -950,30 +1173,34 @@ class Sopel(irc.AbstractBot):
         for rule, match in self._rules_manager.get_triggered_rules(self, pretrigger):
             trigger = Trigger(self.settings, pretrigger, match, account)
 
-            is_unblockable = trigger.admin or rule.is_unblockable()
-            if blocked and not is_unblockable:
+            # only ask for admin status when it matters
+            if blocked and not (rule.is_unblockable() or trigger.admin):
                 list_of_blocked_rules.add(str(rule))
                 continue
 
+            if rule.is_async():
+                # run on the backend's event loop
+                async_wrapper = AsyncSopelWrapper(
+                    self, trigger, output_prefix=rule.get_output_prefix())
+                self.run_coroutine(self.call_rule_async(
+                    rule, async_wrapper, trigger, time.monotonic()))
+                continue
+
             wrapper = SopelWrapper(
                 self, trigger, output_prefix=rule.get_output_prefix())
 
             if rule.is_threaded():
-                # run in a separate thread
-                targs = (rule, wrapper, trigger)
-                t = threading.Thread(target=self.call_rule, args=targs)
+                # run in the worker pool
                 plugin_name = rule.get_plugin_name()
-                rule_label = rule.get_rule_label()
-                t.name = '%s-%s-%s' % (t.name, plugin_name, rule_label)
-                t.start()
-                running_triggers.append(t)
+                self._worker_pool.submit(
+                    self.call_rule, rule, wrapper, trigger, time.monotonic(),
+                    name='%s-%s' % (plugin_name, rule.get_rule_label()),
+                    group=plugin_name,
+                )
             else:
                 # direct call
                 self.call_rule(rule, wrapper, trigger)
 
-        # update currently running triggers
-        self._update_running_triggers(running_triggers)
-
         if list_of_blocked_rules:
             block_types = []
             if nick_blocked:
@@ -991,34 +1218,23 @@ class Sopel(irc.AbstractBot):
 
     @property
     def running_triggers(self) -> list:
-        """Current active threads for triggers.
+        """Current active tasks for triggers.
 
-        :return: the running thread(s) currently processing trigger(s)
+        :return: the task(s) processing trigger(s) or waiting to
         :rtype: :term:`iterable`
 
-        This is for testing and debugging purposes only.
-        """
-        with self._running_triggers_lock:
-            return [t for t in self._running_triggers if t.is_alive()]
+        Each task can be joined like a thread to wait until it is done.
 
-    def _update_running_triggers(self, running_triggers: list) -> None:
-        """Update list of running triggers.
+        This is for testing and debugging purposes only.
 
-        :param list running_triggers: newly started threads
+        .. versionchanged:: 8.1
 
-        We want to keep track of running triggers, mostly for testing and
-        debugging purposes. For instance, it'll help make sure, in tests, that
-        a bot plugin has finished processing a trigger, by manually joining
-        all running threads.
+            Threaded rules are executed by a pool of worker threads, so this
+            returns :class:`~sopel.tools.workers.Task` objects instead of
+            threads.
 
-        This is kept private, as it's purely internal machinery and isn't
-        meant to be manipulated by outside code.
         """
-        # update bot's global running triggers
-        with self._running_triggers_lock:
-            running_triggers = running_triggers + self._running_triggers
-            self._running_triggers = [
-                t for t in running_triggers if t.is_alive()]
+        return self._worker_pool.tasks
 
     # capability negotiation
     def request_capabilities(self) -> bool:
@@ -1148,15 +1364,7 @@ class Sopel(irc.AbstractBot):
 
         :param host: the hostname to check
         """
-        bad_masks = self.settings.core.host_blocks
-        for bad_mask in bad_masks:
-            bad_mask = bad_mask.strip()
-            if not bad_mask:
-                continue
-            if (re.match(bad_mask + '$', host, re.IGNORECASE) or
-                    bad_mask == host):
-                return True
-        return False
+        return self._get_blocklist().is_host_blocked(host)
 
     def _hostmask_blocked(self, hostmask: str | None) -> bool:
         """Check if a hostmask is blocked.
@@ -1166,34 +1374,14 @@ class Sopel(irc.AbstractBot):
         ``PreTrigger.hostmask`` can be ``None`` if the incoming line did not
         include a source, in which case this method always returns ``False``.
         """
-        if not hostmask:
-            # None, or empty string, cannot match any masks
-            return False
-
-        bad_masks = self.settings.core.hostmask_blocks
-        for bad_mask in bad_masks:
-            bad_mask = bad_mask.strip()
-            if not bad_mask:
-                continue
-            if (re.match(bad_mask + '$', hostmask, re.IGNORECASE) or
-                    bad_mask == hostmask):
-                return True
-        return False
+        return self._get_blocklist().is_hostmask_blocked(hostmask)
 
     def _nick_blocked(self, nick: str) -> bool:
         """Check if a nickname is blocked.
 
         :param nick: the nickname to check
         """
-        bad_nicks = self.settings.core.nick_blocks
-        for bad_nick in bad_nicks:
-            bad_nick = bad_nick.strip()
-            if not bad_nick:
-                continue
-            if (re.match(bad_nick + '$', nick, re.IGNORECASE) or
-                    self.make_identifier(bad_nick) == nick):
-                return True
-        return False
+        return self._get_blocklist().is_nick_blocked(nick)
 
     def _shutdown(self) -> None:
         """Internal bot shutdown method."""
@@ -1213,6 +1401,20 @@ class Sopel(irc.AbstractBot):
 
         self._scheduler.clear_jobs()
 
+        # Stop the worker pool, once the triggered rules are done
+        LOGGER.info("Stopping the worker pool.")
+        self._worker_pool.shutdown(timeout=15)
+        LOGGER.info("Worker pool stopped.")
+
+        if self._metrics_server is not None:
+            self._metrics_server.stop()
+            self._metrics_server = None
+            LOGGER.info("Metrics endpoint stopped.")
+
+        if self._watchdog is not None:
+            self._watchdog.stop()
+            LOGGER.info("Watchdog stopped.")
+
         # Shutdown plugins
         LOGGER.info(
             "Calling shutdown for %d plugins.", len(self.shutdown_methods))
@@ -1230,6 +1432,12 @@ class Sopel(irc.AbstractBot):
         # Avoid calling shutdown methods if we already have.
         self.shutdown_methods = []
 
+        # Write the buffered values, including those set by shutdown methods
+        try:
+            self.db.shutdown()
+        except Exception:
+            LOGGER.exception("Unable to write buffered values to the database.")
+
     # TODO: Remove in Sopel 9.0
     # URL callbacks management
 
@@ -1454,6 +1662,27 @@ class SopelWrapper:
 
         return destination
 
+    @property
+    def output_priority(self) -> int:
+        """Priority of the messages sent through this wrapper.
+
+        :return: :data:`~sopel.irc.outbound.PRIORITY_ADMIN` if the trigger
+                 comes from a bot admin, otherwise
+                 :data:`~sopel.irc.outbound.PRIORITY_NORMAL`
+
+        This property is used by these methods:
+
+        * :meth:`say`
+        * :meth:`reply`
+        * :meth:`action`
+        * :meth:`notice`
+
+        .. versionadded:: 8.1
+        """
+        if self._trigger.admin:
+            return irc_outbound.PRIORITY_ADMIN
+        return irc_outbound.PRIORITY_NORMAL
+
     def say(self, message, destination=None, max_messages=1, truncation='', trailing=''):
         """Override ``Sopel.say`` to use trigger source by default.
 
@@ -1486,6 +1715,26 @@ class SopelWrapper:
             max_messages,
             truncation,
             trailing,
+            priority=self.output_priority,
+        )
+
+    def say_many(self, message, recipients):
+        """Override ``Sopel.say_many`` to use the output prefix and priority.
+
+        :param str message: message to say
+        :param recipients: channels or nicknames to send the message to
+        :type recipients: :term:`iterable` of :class:`str`
+
+        .. seealso::
+
+            :meth:`sopel.bot.Sopel.say_many`
+
+        .. versionadded:: 8.1
+        """
+        self._bot.say_many(
+            self._out_pfx + message,
+            recipients,
+            priority=self.output_priority,
         )
 
     def action(self, message, destination=None):
@@ -1505,7 +1754,8 @@ class SopelWrapper:
         if destination is None:
             destination = self.default_destination
 
-        self._bot.action(message, destination)
+        self._bot.action(
+            message, destination, priority=self.output_priority)
 
     def notice(self, message, destination=None):
         """Override ``Sopel.notice`` to use trigger source by default.
@@ -1524,7 +1774,11 @@ class SopelWrapper:
         if destination is None:
             destination = self.default_destination
 
-        self._bot.notice(self._out_pfx + message, destination)
+        self._bot.notice(
+            self._out_pfx + message,
+            destination,
+            priority=self.output_priority,
+        )
 
     def reply(self, message, destination=None, reply_to=None, notice=False):
         """Override ``Sopel.reply`` to ``reply_to`` sender by default.
@@ -1551,7 +1805,13 @@ class SopelWrapper:
         if reply_to is None:
             reply_to = self._trigger.nick
 
-        self._bot.reply(message, destination, reply_to, notice)
+        self._bot.reply(
+            message,
+            destination,
+            reply_to,
+            notice,
+            priority=self.output_priority,
+        )
 
     def kick(self, nick, channel=None, message=None):
         """Override ``Sopel.kick`` to kick in a channel
@@ -1578,3 +1838,106 @@ class SopelWrapper:
             raise RuntimeError('Error: KICK requires a nick.')
 
         self._bot.kick(nick, channel, message)
+
+
+class AsyncSopelWrapper(SopelWrapper):
+    """Wrapper around a Sopel instance and a Trigger, for coroutines.
+
+    :param sopel: Sopel instance
+    :type sopel: :class:`~sopel.bot.Sopel`
+    :param trigger: IRC Trigger line
+    :type trigger: :class:`~sopel.trigger.Trigger`
+    :param str output_prefix: prefix for messages sent through this wrapper
+                              (e.g. plugin tag)
+
+    This wrapper is used as the ``bot`` argument of asynchronous rules, i.e.
+    rules defined with ``async def``::
+
+        @plugin.command('hello')
+        async def hello(bot, trigger):
+            await bot.say('Hello!')
+
+    It works like :class:`SopelWrapper`, except that its :meth:`say`,
+    :meth:`say_many`, :meth:`action`, :meth:`notice`, and :meth:`reply`
+    methods return an awaitable. Sending a message never waits for the flood
+    protection (messages are queued for the sender thread instead), so the
+    message is sent (or queued) in order, right away, and the awaitable is
+    already done: awaiting it is optional.
+
+    .. versionadded:: 8.1
+    """
+    def _send(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+    ) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        try:
+            with self._bot._defer_echo(self._dispatch_echoes):
+                future.set_result(func(*args))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+    def _dispatch_echoes(self, pretriggers: list[PreTrigger]) -> None:
+        # dispatching can wait for a free slot in the workers' queue: do it
+        # in another thread, not to block the event loop
+        def dispatch() -> None:
+            for pretrigger in pretriggers:
+                self._bot.dispatch(pretrigger)
+
+        asyncio.get_running_loop().run_in_executor(None, dispatch)
+
+    def say(self, message, destination=None, max_messages=1, truncation='', trailing=''):
+        """Override ``SopelWrapper.say`` to return an awaitable.
+
+        .. seealso::
+
+            :meth:`SopelWrapper.say` for the arguments.
+        """
+        return self._send(
+            super().say,
+            message,
+            destination,
+            max_messages,
+            truncation,
+            trailing,
+        )
+
+    def say_many(self, message, recipients):
+        """Override ``SopelWrapper.say_many`` to return an awaitable.
+
+        .. seealso::
+
+            :meth:`SopelWrapper.say_many` for the arguments.
+        """
+        return self._send(super().say_many, message, recipients)
+
+    def action(self, message, destination=None):
+        """Override ``SopelWrapper.action`` to return an awaitable.
+
+        .. seealso::
+
+            :meth:`SopelWrapper.action` for the arguments.
+        """
+        return self._send(super().action, message, destination)
+
+    def notice(self, message, destination=None):
+        """Override ``SopelWrapper.notice`` to return an awaitable.
+
+        .. seealso::
+
+            :meth:`SopelWrapper.notice` for the arguments.
+        """
+        return self._send(super().notice, message, destination)
+
+    def reply(self, message, destination=None, reply_to=None, notice=False):
+        """Override ``SopelWrapper.reply`` to return an awaitable.
+
+        .. seealso::
+
+            :meth:`SopelWrapper.reply` for the arguments.
+        """
+        return self._send(
+            super().reply, message, destination, reply_to, notice)
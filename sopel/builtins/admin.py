@@ -27,6 +27,8 @@ ERROR_NOTHING_TO_SAY = 'I need a channel and a message to talk.'
 """Error message when channel and/or message are missing."""
 ERROR_NOTHING_TO_RAW = 'I need an IRC message to send.'
 """Error message when no raw IRC message was given."""
+HANDLER_STATS_LIMIT = 5
+"""Maximum number of handlers shown by the ``handlerstats`` command."""
 
 
 class AdminSection(types.StaticSection):
@@ -504,3 +506,43 @@ def save_config(bot, trigger):
     bot.settings.save()
     LOGGER.info('Configuration file saved.')
     bot.say('Configuration file saved.')
+
+
+@plugin.require_privmsg
+@plugin.require_admin
+@plugin.command('handlerstats')
+@plugin.priority('low')
+@plugin.example('.handlerstats seen')
+@plugin.example('.handlerstats')
+def handler_stats(bot, trigger):
+    """Show the slowest rules and jobs, optionally for one plugin.
+
+    Handlers are sorted by total execution time. This is an admin-only
+    command.
+    """
+    plugin_name = trigger.group(3)
+    snapshots = sorted(
+        bot.handler_stats.get_snapshots(plugin=plugin_name),
+        key=lambda stats: stats.execution_time_total,
+        reverse=True,
+    )
+    if not snapshots:
+        bot.reply('No statistics yet.')
+        return
+
+    for stats in snapshots[:HANDLER_STATS_LIMIT]:
+        bot.say(
+            '%s %s.%s: %d calls, %d errors, %d rate-limited; '
+            'avg %.1fms, max %.1fms; queue avg %.1fms'
+            % (
+                stats.kind,
+                stats.plugin,
+                stats.label,
+                stats.invocations,
+                stats.errors,
+                stats.rate_limited,
+                stats.execution_time_avg * 1000,
+                stats.execution_time_max * 1000,
+                stats.queue_wait_avg * 1000,
+            )
+        )
@@ -35,14 +35,17 @@ def seen(bot, trigger):
         bot.reply("I'm right here!")
         return
 
-    saw = bot.db.get_nick_value(nick, 'seen_timestamp')
+    values = bot.db.get_nick_values(nick, [
+        'seen_timestamp', 'seen_channel', 'seen_message', 'seen_action',
+    ])
+    saw = values.get('seen_timestamp')
     if not saw:
         bot.reply("Sorry, I haven't seen {nick} around.".format(nick=nick))
         return
 
-    channel = bot.db.get_nick_value(nick, 'seen_channel')
-    message = bot.db.get_nick_value(nick, 'seen_message')
-    action = bot.db.get_nick_value(nick, 'seen_action')
+    channel = values.get('seen_channel')
+    message = values.get('seen_message')
+    action = values.get('seen_action')
 
     # as of Sopel 8, trigger.time is an aware datetime
     delta = seconds_to_human(trigger.time.timestamp() - saw)
@@ -73,9 +76,11 @@ def note(bot, trigger):
     try:
         # as of Sopel 8, `trigger.time` is Aware, meaning we should store its value
         # for timezone safety when comparing it later
-        bot.db.set_nick_value(nick, 'seen_timestamp', trigger.time.timestamp())
-        bot.db.set_nick_value(nick, 'seen_channel', trigger.sender)
-        bot.db.set_nick_value(nick, 'seen_message', trigger)
-        bot.db.set_nick_value(nick, 'seen_action', trigger.ctcp is not None)
+        bot.db.set_nick_values(nick, {
+            'seen_timestamp': trigger.time.timestamp(),
+            'seen_channel': trigger.sender,
+            'seen_message': trigger,
+            'seen_action': trigger.ctcp is not None,
+        })
     except SQLAlchemyError as error:
         logger.error("Unable to save seen, database error: %s" % error)
@@ -191,11 +191,53 @@ class Config:
             eliminate most users' need to ever manually edit the text, but it's
             still worth keeping in mind.
 
+        .. versionchanged:: 8.1
+
+            Saving clears the cache of parsed values of every section.
+
         """
         with open(self.filename, 'w') as cfgfile:
             self.parser.write(cfgfile)
             cfgfile.flush()
 
+        self.clear_cache()
+
+    def reload(self):
+        """Read the config file again, discarding any unsaved change.
+
+        Every section defined with :meth:`define_section` is kept, with the
+        values from the file, and its cache of parsed values is cleared. The
+        values overridden by environment variables are read again as well.
+
+        .. versionadded:: 8.1
+        """
+        self.parser.clear()
+        self.parser.read(self.filename)
+
+        for name, value in list(vars(self).items()):
+            if isinstance(value, types.StaticSection):
+                if not self.parser.has_section(name):
+                    self.parser.add_section(name)
+            elif isinstance(value, self.ConfigSection):
+                # rebuilt from the file on next access
+                delattr(self, name)
+
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Clear the cache of parsed values of every defined section.
+
+        .. seealso::
+
+            The :meth:`StaticSection.clear_cache
+            <sopel.config.types.StaticSection.clear_cache>` method.
+
+        .. versionadded:: 8.1
+        """
+        for value in list(vars(self).values()):
+            if isinstance(value, types.StaticSection):
+                value.clear_cache()
+
     def add_section(self, name):
         """Add a new, empty section to the config file.
 
@@ -6,6 +6,8 @@ from sopel.config.types import (
     BooleanAttribute,
     ChoiceAttribute,
     FilenameAttribute,
+    FloatAttribute,
+    IntegerAttribute,
     ListAttribute,
     NO_DEFAULT,
     SecretAttribute,
@@ -405,6 +407,27 @@ class CoreSection(StaticSection):
     Ignored when using SQLite.
     """
 
+    db_nick_id_cache_size = IntegerAttribute(
+        'db_nick_id_cache_size', minimum=0, default=1024)
+    """How many nick IDs the database keeps in memory.
+
+    :default: ``1024``
+
+    Looking up a nick's ID is required to get or set its values in the
+    database. The most recently used IDs are kept in memory, as well as the
+    nicks recently found not to have an ID, so the following lookups don't
+    query the database. A value of ``0`` disables this cache; it can't be
+    negative.
+
+    This is equivalent to the default value:
+
+    .. code-block:: ini
+
+        db_nick_id_cache_size = 1024
+
+    .. versionadded:: 8.1
+    """
+
     db_pass = SecretAttribute('db_pass')
     """The password for Sopel's database.
 
@@ -417,6 +440,101 @@ class CoreSection(StaticSection):
     Ignored when using SQLite.
     """
 
+    db_sqlite_busy_timeout = FloatAttribute(
+        'db_sqlite_busy_timeout', minimum=0, default=5)
+    """How long (in seconds) to wait for a locked SQLite database.
+
+    :default: ``5``
+
+    When another thread or process is writing to the database, SQLite waits
+    up to this long for its lock before failing with a "database is locked"
+    error. This is equivalent to the default value:
+
+    .. code-block:: ini
+
+        db_sqlite_busy_timeout = 5
+
+    Ignored when not using SQLite.
+
+    .. versionadded:: 8.1
+    """
+
+    db_sqlite_cache_size = IntegerAttribute(
+        'db_sqlite_cache_size', minimum=0, default=8192)
+    """Size (in KiB) of SQLite's page cache, per connection.
+
+    :default: ``8192``
+
+    Used only with the ``performance`` :attr:`db_sqlite_profile`. This is
+    equivalent to the default value:
+
+    .. code-block:: ini
+
+        db_sqlite_cache_size = 8192
+
+    .. versionadded:: 8.1
+    """
+
+    db_sqlite_mmap_size = IntegerAttribute(
+        'db_sqlite_mmap_size', minimum=0, default=65536)
+    """Size (in KiB) of the SQLite database file to map in memory.
+
+    :default: ``65536``
+
+    Used only with the ``performance`` :attr:`db_sqlite_profile`; ``0``
+    disables memory-mapped I/O. This is equivalent to the default value:
+
+    .. code-block:: ini
+
+        db_sqlite_mmap_size = 65536
+
+    .. versionadded:: 8.1
+    """
+
+    db_sqlite_profile = ChoiceAttribute(
+        'db_sqlite_profile',
+        choices=['default', 'performance'],
+        default='default')
+    """How to tune the SQLite database.
+
+    :default: ``default``
+
+    The available profiles are:
+
+    * ``default``: SQLite's own settings, with a rollback journal and a full
+      sync to the disk for each transaction
+    * ``performance``: the write-ahead log (``journal_mode=WAL``), so readers
+      don't block the writer, with ``synchronous=NORMAL``, a larger page
+      cache (see :attr:`db_sqlite_cache_size`), memory-mapped I/O (see
+      :attr:`db_sqlite_mmap_size`), and a pool of connections shared by
+      Sopel's threads
+
+    For example:
+
+    .. code-block:: ini
+
+        db_sqlite_profile = performance
+
+    With the ``performance`` profile, the pool keeps one connection for each
+    thread that can use the database: one per worker (see
+    :attr:`dispatch_workers` and :attr:`job_workers`), plus 4 for Sopel's
+    other threads. Up to 10 more connections are opened when needed, such as
+    for threads started by plugins.
+
+    Ignored when not using SQLite.
+
+    .. warning::
+
+        With the ``performance`` profile, the last transactions may be lost
+        (but the database is not corrupted) if the machine loses power.
+
+    .. seealso::
+
+        The :ref:`SQLite` chapter.
+
+    .. versionadded:: 8.1
+    """
+
     db_type = ChoiceAttribute('db_type', choices=[
         'sqlite', 'mysql', 'postgres', 'mssql', 'oracle', 'firebird', 'sybase'], default='sqlite')
     """The type of database Sopel should connect to.
@@ -488,6 +606,98 @@ class CoreSection(StaticSection):
     Ignored when using SQLite.
     """
 
+    db_value_cache_size = IntegerAttribute(
+        'db_value_cache_size', minimum=0, default=0)
+    """How many values read from the database to keep in memory.
+
+    :default: ``0`` (disabled)
+
+    When set, values read by plugins (such as with
+    :meth:`~sopel.db.SopelDB.get_nick_value`) are cached, so reading them
+    again doesn't query the database, until they expire (see
+    :attr:`db_value_cache_ttl`) or are set again. For example:
+
+    .. code-block:: ini
+
+        db_value_cache_size = 4096
+
+    .. note::
+
+        Values changed in the database by another process are seen only once
+        their cache entry has expired.
+
+    .. seealso::
+
+        The :ref:`Value Cache` chapter.
+
+    .. versionadded:: 8.1
+    """
+
+    db_value_cache_ttl = FloatAttribute(
+        'db_value_cache_ttl', minimum=0, default=60)
+    """How long (in seconds) to keep a value read from the database in memory.
+
+    :default: ``60``
+
+    Used only when :attr:`db_value_cache_size` is set. This is equivalent to
+    the default value:
+
+    .. code-block:: ini
+
+        db_value_cache_ttl = 60
+
+    .. versionadded:: 8.1
+    """
+
+    db_write_behind_interval = FloatAttribute(
+        'db_write_behind_interval', minimum=0, default=0)
+    """How often (in seconds) to write buffered values to the database.
+
+    :default: ``0`` (disabled)
+
+    When set, values set by plugins (such as with
+    :meth:`~sopel.db.SopelDB.set_nick_value`) are kept in memory and written
+    to the database together, at this interval, instead of one transaction
+    per value. Repeated writes to the same key are merged into one, and
+    plugins always read the values they have set, even before they are
+    written. For example:
+
+    .. code-block:: ini
+
+        db_write_behind_interval = 5
+
+    Buffered values are also written when there are
+    :attr:`db_write_behind_max_pending` of them, and when the bot shuts down.
+
+    .. warning::
+
+        Values that are not written yet are lost if the bot crashes. The
+        values of a nick, channel, or plugin that fail to be written 3 times
+        in a row are dropped, and the error is logged.
+
+    .. seealso::
+
+        The :ref:`Write-Behind` chapter.
+
+    .. versionadded:: 8.1
+    """
+
+    db_write_behind_max_pending = IntegerAttribute(
+        'db_write_behind_max_pending', minimum=1, default=1000)
+    """How many buffered values trigger a write to the database.
+
+    :default: ``1000``
+
+    Used only when :attr:`db_write_behind_interval` is set. It must be at
+    least ``1``. This is equivalent to the default value:
+
+    .. code-block:: ini
+
+        db_write_behind_max_pending = 1000
+
+    .. versionadded:: 8.1
+    """
+
     default_time_format = ValidatedAttribute('default_time_format',
                                              default='%Y-%m-%d - %T %Z')
     """The default format to use for time in messages.
@@ -528,6 +738,103 @@ class CoreSection(StaticSection):
 
     """
 
+    dispatch_plugin_workers = ListAttribute('dispatch_plugin_workers')
+    """Per-plugin limits of threaded rules running at the same time.
+
+    :default: no limit
+
+    Each item is a plugin name and a maximum number of threaded rules of that
+    plugin that can run at the same time, separated by a colon:
+
+    .. code-block:: ini
+
+        dispatch_plugin_workers =
+            url:2
+            wikipedia:1
+
+    Triggered rules above their plugin's limit wait in the queue, without
+    blocking the rules of other plugins.
+
+    .. seealso::
+
+        The :ref:`Worker Pool` chapter.
+
+    .. versionadded:: 8.1
+    """
+
+    dispatch_queue_policy = ChoiceAttribute(
+        'dispatch_queue_policy',
+        choices=['block', 'drop', 'oldest'],
+        default='block')
+    """What to do with a triggered rule when the dispatch queue is full.
+
+    :default: ``block``
+
+    The available policies are:
+
+    * ``block``: wait until a slot is free in the queue; this slows down the
+      processing of incoming messages until the workers catch up
+    * ``drop``: ignore the triggered rule
+    * ``oldest``: ignore the oldest triggered rule waiting in the queue
+
+    This is equivalent to the default value:
+
+    .. code-block:: ini
+
+        dispatch_queue_policy = block
+
+    .. seealso::
+
+        The :ref:`Worker Pool` chapter.
+
+    .. versionadded:: 8.1
+    """
+
+    dispatch_queue_size = IntegerAttribute(
+        'dispatch_queue_size', minimum=0, default=256)
+    """How many triggered rules can wait for a worker.
+
+    :default: ``256``
+
+    When this limit is reached, the :attr:`dispatch_queue_policy` applies. A
+    value of ``0`` means the queue is unbounded; it can't be negative.
+
+    This is equivalent to the default value:
+
+    .. code-block:: ini
+
+        dispatch_queue_size = 256
+
+    .. seealso::
+
+        The :ref:`Worker Pool` chapter.
+
+    .. versionadded:: 8.1
+    """
+
+    dispatch_workers = IntegerAttribute(
+        'dispatch_workers', minimum=1, default=16)
+    """How many threads can execute threaded rules at the same time.
+
+    :default: ``16``
+
+    Threaded rules are executed by a pool of worker threads. Threads are
+    started when needed, up to this number, and they are reused for the
+    following triggered rules. There must be at least one worker.
+
+    This is equivalent to the default value:
+
+    .. code-block:: ini
+
+        dispatch_workers = 16
+
+    .. seealso::
+
+        The :ref:`Worker Pool` chapter.
+
+    .. versionadded:: 8.1
+    """
+
     enable = ListAttribute('enable')
     """A list of the only plugins you want to enable.
 
@@ -836,6 +1143,107 @@ class CoreSection(StaticSection):
 
     """
 
+    inbound_queue_policy = ChoiceAttribute(
+        'inbound_queue_policy',
+        choices=['block', 'drop', 'oldest'],
+        default='block')
+    """What to do with an incoming message when the inbound queue is full.
+
+    :default: ``block``
+
+    The available policies are:
+
+    * ``block``: stop reading from the server until the dispatcher catches up;
+      the bot still answers a ``PING`` already read, and sends its messages
+    * ``drop``: ignore the incoming message
+    * ``oldest``: ignore the oldest message waiting in the queue
+
+    This is equivalent to the default value:
+
+    .. code-block:: ini
+
+        inbound_queue_policy = block
+
+    .. warning::
+
+        Ignored messages are never seen by Sopel, including the ones it needs
+        to keep track of channels and users: the ``drop`` and ``oldest``
+        policies trade accuracy for responsiveness.
+
+    .. seealso::
+
+        The :ref:`Inbound Queue` chapter.
+
+    .. versionadded:: 8.1
+    """
+
+    inbound_queue_size = IntegerAttribute(
+        'inbound_queue_size', minimum=0, default=1024)
+    """How many incoming messages can wait for the dispatcher.
+
+    :default: ``1024``
+
+    When this limit is reached, the :attr:`inbound_queue_policy` applies. A
+    value of ``0`` means the queue is unbounded; it can't be negative.
+
+    This is equivalent to the default value:
+
+    .. code-block:: ini
+
+        inbound_queue_size = 1024
+
+    .. seealso::
+
+        The :ref:`Inbound Queue` chapter.
+
+    .. versionadded:: 8.1
+    """
+
+    job_jitter = ValidatedAttribute('job_jitter', float, default=0)
+    """Maximum random delay (in seconds) before the first run of each job.
+
+    :default: ``0`` (disabled)
+
+    Jobs that share an interval are started at the same time, and run at the
+    same time afterward. With a jitter, each job's first run is delayed by a
+    random amount of time, up to this value (and up to the job's interval), so
+    the jobs are spread over time. For example:
+
+    .. code-block:: ini
+
+        job_jitter = 30
+
+    A job can set its own jitter with :func:`sopel.plugin.interval`.
+
+    .. seealso::
+
+        The :ref:`Jobs` chapter.
+
+    .. versionadded:: 8.1
+    """
+
+    job_workers = IntegerAttribute('job_workers', minimum=1, default=8)
+    """How many threads can execute threaded jobs at the same time.
+
+    :default: ``8``
+
+    Threaded jobs are executed by a pool of worker threads. Threads are
+    started when needed, up to this number, and they are reused for the
+    following jobs. There must be at least one worker.
+
+    This is equivalent to the default value:
+
+    .. code-block:: ini
+
+        job_workers = 8
+
+    .. seealso::
+
+        The :ref:`Jobs` chapter.
+
+    .. versionadded:: 8.1
+    """
+
     log_raw = BooleanAttribute('log_raw', default=False)
     """Whether a log of raw lines as sent and received should be kept.
 
@@ -986,6 +1394,41 @@ class CoreSection(StaticSection):
 
     """
 
+    metrics_host = ValidatedAttribute('metrics_host', default='127.0.0.1')
+    """The address the metrics endpoint listens on.
+
+    :default: ``127.0.0.1``
+
+    This is used only when the :attr:`metrics_port` is set. The default keeps
+    the metrics endpoint local to the machine running the bot.
+
+    .. seealso::
+
+        The :ref:`Metrics` chapter.
+
+    .. versionadded:: 8.1
+    """
+
+    metrics_port = ValidatedAttribute('metrics_port', int, default=0)
+    """The port of the metrics endpoint.
+
+    :default: ``0`` (disabled)
+
+    When set, Sopel serves its runtime statistics in the Prometheus/OpenMetrics
+    text format on ``http://<metrics_host>:<metrics_port>/metrics``. For
+    example:
+
+    .. code-block:: ini
+
+        metrics_port = 9712
+
+    .. seealso::
+
+        The :ref:`Metrics` chapter.
+
+    .. versionadded:: 8.1
+    """
+
     modes = ValidatedAttribute('modes')
     """User modes to be set on connection.
 
@@ -1113,6 +1556,29 @@ class CoreSection(StaticSection):
     won't work until the bot has been properly configured.
     """
 
+    output_deadline = ValidatedAttribute('output_deadline', float, default=0)
+    """How many seconds a queued message can wait before being dropped.
+
+    :default: ``0``
+
+    Messages waiting for the flood protection (or for the connection) are
+    dropped once they have waited longer than this, so the bot doesn't reply
+    long after the fact. Messages required by the IRC protocol and messages
+    for bot admins are never dropped. A value of ``0`` disables the deadline.
+
+    For example, to drop messages that waited more than 30 seconds:
+
+    .. code-block:: ini
+
+        output_deadline = 30
+
+    .. seealso::
+
+        The :ref:`Flood Prevention` chapter.
+
+    .. versionadded:: 8.1
+    """
+
     owner = ValidatedAttribute('owner', default=NO_DEFAULT)
     """The IRC name of the owner of the bot.
 
@@ -1453,3 +1919,24 @@ class CoreSection(StaticSection):
         verify_ssl = true
 
     """
+
+    watchdog_budget = ValidatedAttribute('watchdog_budget', float, default=0)
+    """How many seconds a handler can block its thread before it is reported.
+
+    :default: ``0`` (disabled)
+
+    When set, a watchdog thread reports rules and jobs that run for longer
+    than this, as well as an event loop or a dispatcher blocked for longer
+    than this, with a warning that includes the stack of the blocked thread.
+    For example:
+
+    .. code-block:: ini
+
+        watchdog_budget = 5
+
+    .. seealso::
+
+        The :ref:`Watchdog` chapter.
+
+    .. versionadded:: 8.1
+    """
@@ -53,6 +53,7 @@ import getpass
 import logging
 import os.path
 import re
+import threading
 
 from sopel.lifecycle import deprecated
 
@@ -81,6 +82,17 @@ class StaticSection:
         However, this is *only* a convention. Any class name that is legal in
         Python will work just fine.
 
+    Parsed values are cached by the section, so reading a setting more than
+    once doesn't read and parse it again. The cache is cleared when a value
+    is set or deleted through the section, when the configuration is
+    :meth:`saved <sopel.config.Config.save>` or
+    :meth:`reloaded <sopel.config.Config.reload>`, and by
+    :meth:`clear_cache`.
+
+    .. versionchanged:: 8.1
+
+        Parsed values are cached.
+
     """
     def __init__(self, config, section_name, validate=True):
         if not config.parser.has_section(section_name):
@@ -88,9 +100,17 @@ class StaticSection:
         self._parent = config
         self._parser = config.parser
         self._section_name = section_name
+        self._cache = {}
+        self._cache_lock = threading.RLock()
 
         for value in dir(self):
-            if value in ('_parent', '_parser', '_section_name'):
+            if value in (
+                '_cache',
+                '_cache_lock',
+                '_parent',
+                '_parser',
+                '_section_name',
+            ):
                 # ignore internal attributes
                 continue
 
@@ -142,6 +162,20 @@ class StaticSection:
                 break
         setattr(self, name, value)
 
+    def clear_cache(self):
+        """Clear the cache of parsed values of this section.
+
+        The next time a setting is read, its value is read from the
+        environment or the configuration file, and parsed again. There is no
+        need to call this method after setting a value through the section,
+        but it is required after changing the
+        :attr:`~sopel.config.Config.parser` or the environment directly.
+
+        .. versionadded:: 8.1
+        """
+        with self._cache_lock:
+            self._cache.clear()
+
 
 class BaseValidated(abc.ABC):
     """The base type for a setting descriptor in a :class:`StaticSection`.
@@ -239,16 +273,28 @@ class BaseValidated(abc.ABC):
             # instance here.
             return self
 
-        value = None
-        env_name = 'SOPEL_%s_%s' % (instance._section_name.upper(), self.name.upper())
-        if env_name in os.environ:
-            value = os.environ.get(env_name)
-        elif instance._parser.has_option(instance._section_name, self.name):
-            value = instance._parser.get(instance._section_name, self.name)
-
-        settings = instance._parent
-        section = getattr(settings, instance._section_name)
-        return self._parse(value, settings, section)
+        # several attributes can share the same name, with different defaults
+        try:
+            return instance._cache[self]
+        except KeyError:
+            pass
+
+        with instance._cache_lock:
+            if self in instance._cache:
+                return instance._cache[self]
+
+            value = None
+            env_name = 'SOPEL_%s_%s' % (instance._section_name.upper(), self.name.upper())
+            if env_name in os.environ:
+                value = os.environ.get(env_name)
+            elif instance._parser.has_option(instance._section_name, self.name):
+                value = instance._parser.get(instance._section_name, self.name)
+
+            settings = instance._parent
+            section = getattr(settings, instance._section_name)
+            value = self._parse(value, settings, section)
+            instance._cache[self] = value
+            return value
 
     def _parse(self, value, settings, section):
         if value is not None:
@@ -265,19 +311,25 @@ class BaseValidated(abc.ABC):
         if value is None:
             if self.default == NO_DEFAULT:
                 raise ValueError('Cannot unset an option with a required value.')
-            instance._parser.remove_option(instance._section_name, self.name)
+            with instance._cache_lock:
+                instance._parser.remove_option(instance._section_name, self.name)
+                instance._cache.clear()
             return
 
         settings = instance._parent
         section = getattr(settings, instance._section_name)
         value = self._serialize(value, settings, section)
-        instance._parser.set(instance._section_name, self.name, value)
+        with instance._cache_lock:
+            instance._parser.set(instance._section_name, self.name, value)
+            instance._cache.clear()
 
     def _serialize(self, value, settings, section):
         return self.serialize(value)
 
     def __delete__(self, instance):
-        instance._parser.remove_option(instance._section_name, self.name)
+        with instance._cache_lock:
+            instance._parser.remove_option(instance._section_name, self.name)
+            instance._cache.clear()
 
 
 def _parse_boolean(value):
@@ -423,13 +475,90 @@ class BooleanAttribute(BaseValidated):
 
     def __set__(self, instance, value):
         if value is None:
-            instance._parser.remove_option(instance._section_name, self.name)
+            with instance._cache_lock:
+                instance._parser.remove_option(instance._section_name, self.name)
+                instance._cache.clear()
             return
 
         settings = instance._parent
         section = getattr(settings, instance._section_name)
         value = self._serialize(value, settings, section)
-        instance._parser.set(instance._section_name, self.name, value)
+        with instance._cache_lock:
+            instance._parser.set(instance._section_name, self.name, value)
+            instance._cache.clear()
+
+
+class IntegerAttribute(BaseValidated):
+    """A config attribute which must be an integer within a range.
+
+    :param str name: the attribute name to use in the config file
+    :param int minimum: the lowest valid value (optional)
+    :param int maximum: the highest valid value (optional)
+    :param int default: the default value to use if this setting is not
+                        present in the config file (optional)
+
+    .. versionadded:: 8.1
+    """
+    def __init__(self, name, minimum=None, maximum=None, default=None):
+        super().__init__(name, default=default)
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def parse(self, value):
+        """Parse ``value`` as an integer, and check its range.
+
+        :param str value: the value loaded from the config file
+        :return: the integer ``value``, if it is valid
+        :rtype: int
+        :raise ValueError: if ``value`` is not an integer, or if it is out of
+                           range
+        """
+        return self._check_range(int(value))
+
+    def _check_range(self, value):
+        if self.minimum is not None and value < self.minimum:
+            raise ValueError(
+                '{} is lower than the minimum of {}'
+                .format(value, self.minimum))
+        if self.maximum is not None and value > self.maximum:
+            raise ValueError(
+                '{} is greater than the maximum of {}'
+                .format(value, self.maximum))
+        return value
+
+    def serialize(self, value):
+        """Make sure ``value`` is valid and safe to write in the config file.
+
+        :param int value: the value needing to be saved
+        :return: the ``value`` as a string, if it is valid
+        :rtype: str
+        :raise ValueError: if ``value`` is not an integer, or if it is out of
+                           range
+        """
+        return str(self.parse(value))
+
+
+class FloatAttribute(IntegerAttribute):
+    """A config attribute which must be a number within a range.
+
+    :param str name: the attribute name to use in the config file
+    :param float minimum: the lowest valid value (optional)
+    :param float maximum: the highest valid value (optional)
+    :param float default: the default value to use if this setting is not
+                          present in the config file (optional)
+
+    .. versionadded:: 8.1
+    """
+    def parse(self, value):
+        """Parse ``value`` as a float, and check its range.
+
+        :param str value: the value loaded from the config file
+        :return: the float ``value``, if it is valid
+        :rtype: float
+        :raise ValueError: if ``value`` is not a number, or if it is out of
+                           range
+        """
+        return self._check_range(float(value))
 
 
 class SecretAttribute(ValidatedAttribute):
@@ -525,6 +654,13 @@ class ListAttribute(BaseValidated):
         super().__init__(name, default=default)
         self.strip = strip  # Warn in Sopel 9.x and remove in Sopel 10.x
 
+    def __get__(self, instance, owner=None):
+        value = super().__get__(instance, owner)
+        if instance is None or value is None:
+            return value
+        # a copy, so changing it doesn't change the cached value
+        return list(value)
+
     def parse(self, value):
         """Parse ``value`` into a list.
 
@@ -15,31 +15,83 @@ convenience methods, such as :meth:`~SopelDB.get_nick_value` or
 """
 from __future__ import annotations
 
+import copy
 import errno
 import json
 import logging
 import os.path
+import threading
+import time
 import traceback
 import typing
 
-from sqlalchemy import Column, create_engine, ForeignKey, Integer, String
+from sqlalchemy import (
+    bindparam,
+    Column,
+    create_engine,
+    event,
+    ForeignKey,
+    insert,
+    Integer,
+    String,
+)
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.engine.url import make_url, URL
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql import delete, func, select, update
 
 from sopel.lifecycle import deprecated
+from sopel.tools import cache as tools_cache, stats as tools_stats
 from sopel.tools.identifiers import Identifier, IdentifierFactory
 
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Mapping
+
+    from sqlalchemy.orm import Session
 
     from sopel.config import Config
 
 
 LOGGER = logging.getLogger(__name__)
 
+NICK_ID_MISS_TTL = 10.0
+"""How long (in seconds) a nick found not to have an ID is remembered."""
+
+SQLITE_PROFILE_PERFORMANCE = 'performance'
+"""SQLite profile using the write-ahead log and a pool of connections."""
+SQLITE_POOL_EXTRA_CONNECTIONS = 4
+"""Pooled connections for the threads that are not workers.
+
+With the ``performance`` profile, the pool keeps one connection per worker
+thread (see ``dispatch_workers`` and ``job_workers``), plus these ones for
+the main thread, the event loop, the job scheduler, and the database writer.
+"""
+
+
+def _get_sqlite_pragmas(config: Config) -> list[tuple[str, typing.Any]]:
+    pragmas: list[tuple[str, typing.Any]] = [
+        ('busy_timeout', int(config.core.db_sqlite_busy_timeout * 1000)),
+    ]
+    if config.core.db_sqlite_profile == SQLITE_PROFILE_PERFORMANCE:
+        pragmas += [
+            ('journal_mode', 'WAL'),
+            ('synchronous', 'NORMAL'),
+            # a negative cache size is in KiB, instead of pages
+            ('cache_size', -config.core.db_sqlite_cache_size),
+            ('mmap_size', config.core.db_sqlite_mmap_size * 1024),
+        ]
+    return pragmas
+
+
+def _copy_value(value):
+    # deserialized values are shared by the cache: don't let callers mutate them
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
 
 def _deserialize(value):
     if value is None:
@@ -104,6 +156,304 @@ class PluginValues(BASE):
     value = Column(String(255))
 
 
+ValuesTable = typing.Union[
+    typing.Type[NickValues],
+    typing.Type[ChannelValues],
+    typing.Type[PluginValues],
+]
+"""Type of the tables of the key-value stores."""
+
+_OWNER_COLUMNS: dict[typing.Any, str] = {
+    NickValues: 'nick_id',
+    ChannelValues: 'channel',
+    PluginValues: 'plugin',
+}
+
+
+class WriteBehindStats(typing.NamedTuple):
+    """Statistics of a :class:`WriteBehindBuffer`."""
+    pending: int
+    """Number of values waiting to be written."""
+    writes: int
+    """Number of values set since the buffer was created."""
+    coalesced: int
+    """Number of values replaced by a newer one before being written."""
+    flushes: int
+    """Number of batches written to the database."""
+    errors: int
+    """Number of batches that failed to be written."""
+    dropped: int
+    """Number of values dropped after too many failed writes."""
+
+
+class WriteBehindBuffer:
+    """Buffer of values to write to the key-value stores later, in batches.
+
+    :param write: function that writes a batch of values in one transaction
+    :param interval: how often (in seconds) to write the pending values
+    :param max_pending: how many pending values trigger a write
+    :param max_attempts: how many times the values of an owner can fail to be
+                         written before they are dropped
+
+    Values are buffered by table, owner (such as a nick ID), and key: setting
+    a value that is still pending replaces it, so only the last one is
+    written. Pending values are written by a thread, every ``interval``
+    seconds or as soon as there are ``max_pending`` of them, and by
+    :meth:`flush`.
+
+    A batch is a mapping of ``(table, owner)`` to the serialized values by
+    key. When ``write`` fails, each owner's values are written again in their
+    own batch, so one owner's invalid values can't prevent the others from
+    being written. The values that still fail are pending again, unless a
+    newer value has been set in the meantime, and they are dropped (and
+    logged) once they have failed ``max_attempts`` times in a row.
+
+    .. versionadded:: 8.1
+    """
+    def __init__(
+        self,
+        write: typing.Callable[
+            [dict[tuple[ValuesTable, typing.Any], dict[str, str]]],
+            None,
+        ],
+        interval: float,
+        max_pending: int = 1000,
+        max_attempts: int = 3,
+    ) -> None:
+        self.interval = interval
+        """How often (in seconds) to write the pending values."""
+        self.max_pending = max_pending
+        """How many pending values trigger a write."""
+        self.max_attempts = max_attempts
+        """How many failed writes make an owner's values dropped."""
+        self._write = write
+        self._pending: dict[
+            tuple[ValuesTable, typing.Any],
+            dict[str, str],
+        ] = {}
+        # values being written: still visible to readers until committed
+        self._flushing: dict[
+            tuple[ValuesTable, typing.Any],
+            dict[str, str],
+        ] = {}
+        # failed writes in a row, by (table, owner)
+        self._attempts: dict[tuple[ValuesTable, typing.Any], int] = {}
+        self._count = 0
+        self._writes = 0
+        self._coalesced = 0
+        self._flushes = 0
+        self._errors = 0
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def set(
+        self,
+        table: ValuesTable,
+        owner: typing.Any,
+        values: Mapping[str, str],
+    ) -> None:
+        """Buffer serialized ``values`` for an ``owner``.
+
+        :param table: the table of the values
+        :param owner: the owner of the values (such as a nick ID)
+        :param values: the serialized values, by key
+
+        When the buffer isn't running (before :meth:`start` or after
+        :meth:`stop`), the values are written immediately.
+        """
+        with self._lock:
+            pending = self._pending.setdefault((table, owner), {})
+            for key, value in values.items():
+                if key in pending:
+                    self._coalesced += 1
+                else:
+                    self._count += 1
+                pending[key] = value
+            self._writes += len(values)
+            full = self._count >= self.max_pending
+
+        if self._thread is None:
+            self.flush()
+        elif full:
+            self._wakeup.set()
+
+    def get(self, table: ValuesTable, owner: typing.Any, key: str) -> str:
+        """Get a pending serialized value.
+
+        :param table: the table of the value
+        :param owner: the owner of the value
+        :param key: the key of the value
+        :return: the pending value, or :data:`sopel.tools.cache.MISSING` if
+                 there is none
+        """
+        with self._lock:
+            for buffer in (self._pending, self._flushing):
+                values = buffer.get((table, owner))
+                if values is not None and key in values:
+                    return values[key]
+        return tools_cache.MISSING
+
+    def discard(
+        self,
+        table: ValuesTable,
+        owner: typing.Any,
+        keys: Iterable[str] | None = None,
+    ) -> None:
+        """Discard pending values, before deleting them from the database.
+
+        :param table: the table of the values
+        :param owner: the owner of the values
+        :param keys: the keys of the values to discard; all of them if
+                     ``None``
+
+        This waits for an ongoing write to be over, so discarded values can't
+        be written after they are deleted.
+        """
+        with self._flush_lock, self._lock:
+            pending = self._pending.get((table, owner))
+            if not pending:
+                return
+            if keys is None:
+                keys = list(pending)
+            for key in keys:
+                if pending.pop(key, tools_cache.MISSING) is not (
+                    tools_cache.MISSING
+                ):
+                    self._count -= 1
+            if not pending:
+                del self._pending[(table, owner)]
+                self._attempts.pop((table, owner), None)
+
+    def flush(self) -> None:
+        """Write the pending values now, in one batch.
+
+        :raise Exception: the first error raised by the ``write`` function,
+                          once the values that could be written are written,
+                          and the others are pending again or dropped
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                self._flushing, self._pending = self._pending, {}
+                self._count = 0
+
+            failed: dict[tuple[ValuesTable, typing.Any], Exception] = {}
+            dropped: dict[tuple[ValuesTable, typing.Any], dict[str, str]] = {}
+            try:
+                failed = self._write_batch(self._flushing)
+                with self._lock:
+                    if failed:
+                        self._errors += 1
+                    else:
+                        self._flushes += 1
+                    for target in self._flushing:
+                        if target not in failed:
+                            self._attempts.pop(target, None)
+                    for target in failed:
+                        attempts = self._attempts.get(target, 0) + 1
+                        if attempts >= self.max_attempts:
+                            self._attempts.pop(target, None)
+                            dropped[target] = self._flushing[target]
+                            self._dropped += len(self._flushing[target])
+                            continue
+                        self._attempts[target] = attempts
+                        pending = self._pending.setdefault(target, {})
+                        for key, value in self._flushing[target].items():
+                            if key not in pending:
+                                pending[key] = value
+                                self._count += 1
+            finally:
+                with self._lock:
+                    self._flushing = {}
+
+        for (table, owner), values in dropped.items():
+            LOGGER.error(
+                'Dropping %d values of %r in %s after %d failed writes: %s',
+                len(values), owner, table.__tablename__,
+                self.max_attempts, failed[(table, owner)])
+
+        if failed:
+            raise next(iter(failed.values()))
+
+    def _write_batch(
+        self,
+        batch: dict[tuple[ValuesTable, typing.Any], dict[str, str]],
+    ) -> dict[tuple[ValuesTable, typing.Any], Exception]:
+        # write the whole batch at once, then each owner on its own on error
+        try:
+            self._write(batch)
+            return {}
+        except Exception as error:
+            if len(batch) == 1:
+                return dict.fromkeys(batch, error)
+
+        failed: dict[tuple[ValuesTable, typing.Any], Exception] = {}
+        for target, values in batch.items():
+            try:
+                self._write({target: values})
+            except Exception as target_error:
+                failed[target] = target_error
+        return failed
+
+    def get_stats(self) -> WriteBehindStats:
+        """Get the current statistics of the buffer.
+
+        :return: a snapshot of the buffer's counters
+        """
+        with self._lock:
+            return WriteBehindStats(
+                self._count,
+                self._writes,
+                self._coalesced,
+                self._flushes,
+                self._errors,
+                self._dropped,
+            )
+
+    def start(self) -> None:
+        """Start writing the pending values in a thread."""
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name='sopel-db-writer',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread, and write the pending values.
+
+        :raise Exception: any error raised while writing the pending values
+
+        Once stopped, values are written as soon as they are set.
+        """
+        thread, self._thread = self._thread, None
+        self._stopping.set()
+        self._wakeup.set()
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                LOGGER.exception(
+                    'Unable to write %d pending values to the database.',
+                    len(self))
+
+
 class SopelDB:
     """Database object class.
 
@@ -135,6 +485,12 @@ class SopelDB:
         :class:`~sopel.tools.identifiers.Identifier` when dealing with Nick or
         Channel names.
 
+    .. versionchanged:: 8.1
+
+        Nick IDs are cached in memory; see :meth:`get_nick_id`. Values can
+        be cached (see :attr:`value_cache`) and written in batches (see
+        :attr:`write_buffer`).
+
     .. seealso::
 
         For any advanced usage of the ORM, refer to the
@@ -210,7 +566,26 @@ class SopelDB:
                            password=db_pass, host=db_host, port=db_port,
                            database=db_name, query=query)
 
-        self.engine = create_engine(self.url, pool_recycle=3600)
+        engine_options: dict[str, typing.Any] = {'pool_recycle': 3600}
+        self._sqlite_pragmas: list[tuple[str, typing.Any]] = []
+        if self.type == 'sqlite':
+            self._sqlite_pragmas = _get_sqlite_pragmas(config)
+            if (
+                config.core.db_sqlite_profile == SQLITE_PROFILE_PERFORMANCE
+                and self.url.database not in (None, '', ':memory:')
+            ):
+                # keep connections open, and share them between threads
+                # (one at a time), instead of opening one per session
+                engine_options['poolclass'] = QueuePool
+                # enough for every thread to use the database at once
+                engine_options['pool_size'] = (
+                    config.core.dispatch_workers
+                    + config.core.job_workers
+                    + SQLITE_POOL_EXTRA_CONNECTIONS
+                )
+                engine_options['connect_args'] = {'check_same_thread': False}
+
+        self.engine = create_engine(self.url, **engine_options)
         """SQLAlchemy Engine used to connect to Sopel's database.
 
         .. seealso::
@@ -235,6 +610,62 @@ class SopelDB:
         .. __: https://docs.sqlalchemy.org/en/14/changelog/migration_20.html
         """
 
+        self.query_stats = tools_stats.DurationStats()
+        """Statistics of the queries executed on the :attr:`engine`.
+
+        .. versionadded:: 8.1
+        """
+        event.listen(
+            self.engine, 'before_cursor_execute', self._before_execute)
+        event.listen(
+            self.engine, 'after_cursor_execute', self._after_execute)
+        event.listen(self.engine, 'handle_error', self._on_execute_error)
+        if self._sqlite_pragmas:
+            event.listen(self.engine, 'connect', self._configure_sqlite)
+
+        self.nick_id_cache = tools_cache.LRUCache(
+            config.core.db_nick_id_cache_size)
+        """Cache of nick IDs by nick slug; see :meth:`get_nick_id`.
+
+        .. versionadded:: 8.1
+        """
+        self.value_cache = tools_cache.LRUCache(
+            config.core.db_value_cache_size,
+            ttl=config.core.db_value_cache_ttl,
+        )
+        """Cache of the values read from the key-value stores.
+
+        Values are cached by table, owner, and key, including the keys found
+        without a value, until they expire, are set, or are deleted. This is
+        disabled by default; see the
+        :attr:`~sopel.config.core_section.CoreSection.db_value_cache_size`
+        setting.
+
+        .. versionadded:: 8.1
+        """
+        # ongoing fetches by cache key: [number of fetches, generation]; an
+        # invalidation bumps the generation, so a fetch that started before
+        # it doesn't cache the value it read
+        self._value_fetches: dict[typing.Any, list[int]] = {}
+        self._value_cache_lock = threading.Lock()
+
+        self.write_buffer: WriteBehindBuffer | None = None
+        """Buffer of the values to write, if enabled.
+
+        This is enabled by the
+        :attr:`~sopel.config.core_section.CoreSection.db_write_behind_interval`
+        setting: values set with the ``set_*_value`` methods are then written
+        in batches.
+
+        .. versionadded:: 8.1
+        """
+        if config.core.db_write_behind_interval > 0:
+            self.write_buffer = WriteBehindBuffer(
+                self._write_values,
+                config.core.db_write_behind_interval,
+                config.core.db_write_behind_max_pending,
+            )
+
         # Catch any errors connecting to database
         try:
             self.engine.connect()
@@ -248,6 +679,33 @@ class SopelDB:
         self.ssession = scoped_session(
             sessionmaker(bind=self.engine, future=True))
 
+        if self.write_buffer is not None:
+            self.write_buffer.start()
+
+    def _configure_sqlite(self, dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in self._sqlite_pragmas:
+                cursor.execute('PRAGMA %s = %s' % (name, value))
+        finally:
+            cursor.close()
+
+    def _before_execute(self, conn, cursor, statement, parameters, context,
+                        executemany):
+        conn.info.setdefault('query_start_time', []).append(
+            time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context,
+                       executemany):
+        started_at = conn.info['query_start_time'].pop()
+        self.query_stats.record(time.perf_counter() - started_at)
+
+    def _on_execute_error(self, exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get('query_start_time'):
+            # the query failed: it won't be recorded
+            conn.info['query_start_time'].pop()
+
     def connect(self):
         """Get a direct database connection.
 
@@ -284,6 +742,31 @@ class SopelDB:
                 traceback.format_list(traceback.extract_stack()[:-1])[-1][:-1])
         return self.engine.raw_connection()
 
+    def flush(self) -> None:
+        """Write the values buffered by the :attr:`write_buffer` now.
+
+        :raise ~sqlalchemy.exc.SQLAlchemyError: if there is a database error
+
+        This does nothing when the write buffer is disabled.
+
+        .. versionadded:: 8.1
+        """
+        if self.write_buffer is not None:
+            self.write_buffer.flush()
+
+    def shutdown(self) -> None:
+        """Stop the :attr:`write_buffer`, and write its values.
+
+        :raise ~sqlalchemy.exc.SQLAlchemyError: if there is a database error
+
+        Once shut down, values are written as soon as they are set. This is
+        called by the bot when it shuts down.
+
+        .. versionadded:: 8.1
+        """
+        if self.write_buffer is not None:
+            self.write_buffer.stop()
+
     def session(self):
         """Get a SQLAlchemy Session object.
 
@@ -339,6 +822,307 @@ class SopelDB:
         """
         return self.engine.execute(*args, **kwargs)
 
+    def _upsert_values(
+        self,
+        session: Session,
+        model: ValuesTable,
+        owner_column: str,
+        owner: typing.Any,
+        values: Mapping[str, str],
+    ) -> None:
+        """Insert or update the serialized ``values`` of an ``owner``.
+
+        :param session: the session of the transaction
+        :param model: the table of the values
+        :param owner_column: the name of the column of the values' owner
+                             (such as ``nick_id``)
+        :param owner: the owner of the values
+        :param values: the serialized values, by key
+
+        The values are upserted with a single statement when the database
+        supports it (SQLite, PostgreSQL, and MySQL). Otherwise, the existing
+        keys are selected first, then updated, and the new keys are inserted,
+        in the same transaction.
+        """
+        if not values:
+            return
+
+        table = model.__table__
+        rows = [
+            {owner_column: owner, 'key': key, 'value': value}
+            for key, value in values.items()
+        ]
+        dialect = self.engine.dialect.name
+
+        if dialect in ('sqlite', 'postgresql'):
+            dialect_insert = (
+                sqlite.insert if dialect == 'sqlite' else postgresql.insert)
+            stmt = dialect_insert(table).values(rows)
+            session.execute(stmt.on_conflict_do_update(
+                index_elements=[owner_column, 'key'],
+                set_={'value': stmt.excluded.value},
+            ))
+            return
+
+        if dialect == 'mysql':
+            stmt = mysql.insert(table).values(rows)
+            session.execute(
+                stmt.on_duplicate_key_update(value=stmt.inserted.value))
+            return
+
+        owner_col = table.c[owner_column]
+        existing = set(session.execute(
+            select(table.c.key)
+            .where(owner_col == owner)
+            .where(table.c.key.in_(list(values)))
+        ).scalars())
+
+        if existing:
+            session.execute(
+                update(table)
+                .where(owner_col == owner)
+                .where(table.c.key == bindparam('existing_key'))
+                .values(value=bindparam('new_value')),
+                [
+                    {'existing_key': key, 'new_value': values[key]}
+                    for key in existing
+                ],
+            )
+
+        new_rows = [row for row in rows if row['key'] not in existing]
+        if new_rows:
+            session.execute(insert(table), new_rows)
+
+    def _write_values(
+        self,
+        batch: dict[tuple[ValuesTable, typing.Any], dict[str, str]],
+    ) -> None:
+        """Write a batch of the :attr:`write_buffer` in one transaction."""
+        with self.session() as session:
+            for (model, owner), values in batch.items():
+                self._upsert_values(
+                    session, model, _OWNER_COLUMNS[model], owner, values)
+            session.commit()
+
+    def _set_values(
+        self,
+        model: ValuesTable,
+        owner: typing.Any,
+        values: Mapping[str, str],
+    ) -> None:
+        """Set the serialized ``values`` of an ``owner``.
+
+        The values are buffered if the :attr:`write_buffer` is enabled, or
+        written in one transaction otherwise.
+        """
+        if self.write_buffer is not None:
+            self.write_buffer.set(model, owner, values)
+        else:
+            with self.session() as session:
+                self._upsert_values(
+                    session, model, _OWNER_COLUMNS[model], owner, values)
+                session.commit()
+
+        self._invalidate_values(model, owner, values)
+
+    def _get_pending_value(
+        self,
+        model: ValuesTable,
+        owner: typing.Any,
+        key: str,
+    ) -> typing.Any:
+        """Get a serialized value from the :attr:`write_buffer`.
+
+        :return: the pending value, or :data:`sopel.tools.cache.MISSING`
+        """
+        if self.write_buffer is None:
+            return tools_cache.MISSING
+        return self.write_buffer.get(model, owner, key)
+
+    def _discard_pending_values(
+        self,
+        model: ValuesTable,
+        owner: typing.Any,
+        keys: Iterable[str] | None = None,
+    ) -> None:
+        """Discard values from the :attr:`write_buffer`, if enabled."""
+        if self.write_buffer is not None:
+            self.write_buffer.discard(model, owner, keys)
+
+    def _invalidate_values(
+        self,
+        model: ValuesTable,
+        owner: typing.Any,
+        keys: Iterable[str] | None = None,
+    ) -> None:
+        """Remove values from the :attr:`value_cache`.
+
+        The whole cache is cleared when ``keys`` is ``None``. Ongoing fetches
+        of the removed values won't cache what they read.
+        """
+        with self._value_cache_lock:
+            if keys is None:
+                self.value_cache.clear()
+                for fetch in self._value_fetches.values():
+                    fetch[1] += 1
+                return
+
+            for key in keys:
+                cache_key = (model, owner, key)
+                self.value_cache.pop(cache_key)
+                if cache_key in self._value_fetches:
+                    self._value_fetches[cache_key][1] += 1
+
+    def _start_fetch(self, cache_keys: list[typing.Any]) -> list[int]:
+        """Start fetching values from the database for the :attr:`value_cache`.
+
+        :param cache_keys: the cache keys of the values to fetch
+        :return: the generation of each key, for :meth:`_finish_fetch`
+        """
+        generations = []
+        with self._value_cache_lock:
+            for cache_key in cache_keys:
+                fetch = self._value_fetches.setdefault(cache_key, [0, 0])
+                fetch[0] += 1
+                generations.append(fetch[1])
+        return generations
+
+    def _finish_fetch(
+        self,
+        cache_keys: list[typing.Any],
+        generations: list[int],
+        values: list[typing.Any] | None,
+    ) -> None:
+        """Cache the fetched ``values`` that weren't invalidated meanwhile.
+
+        :param cache_keys: the cache keys of the fetched values
+        :param generations: the generations returned by :meth:`_start_fetch`
+        :param values: the fetched values, in the same order as
+                       ``cache_keys``; ``None`` if the fetch failed
+        """
+        with self._value_cache_lock:
+            for index, cache_key in enumerate(cache_keys):
+                fetch = self._value_fetches[cache_key]
+                if values is not None and fetch[1] == generations[index]:
+                    self.value_cache.set(cache_key, values[index])
+                fetch[0] -= 1
+                if not fetch[0]:
+                    del self._value_fetches[cache_key]
+
+    def _get_cached_value(
+        self,
+        model: ValuesTable,
+        owner: typing.Any,
+        key: str,
+    ) -> typing.Any:
+        """Get a deserialized value without querying the database.
+
+        :return: the pending or cached value (``None`` if it is known not to
+                 exist), or :data:`sopel.tools.cache.MISSING`
+        """
+        pending = self._get_pending_value(model, owner, key)
+        if pending is not tools_cache.MISSING:
+            return _deserialize(pending)
+
+        return _copy_value(self.value_cache.get((model, owner, key)))
+
+    def _fetch_value(
+        self,
+        model: ValuesTable,
+        owner: typing.Any,
+        key: str,
+    ) -> typing.Any:
+        """Get a deserialized value from the database, and cache it.
+
+        :return: the value, or ``None`` if it doesn't exist
+        """
+        table = model.__table__
+        cache_keys = [(model, owner, key)]
+        generations = self._start_fetch(cache_keys)
+        value = None
+        try:
+            with self.session() as session:
+                result = session.execute(
+                    select(table.c.value)
+                    .where(table.c[_OWNER_COLUMNS[model]] == owner)
+                    .where(table.c.key == key)
+                ).scalar_one_or_none()
+            value = _deserialize(result)
+        except Exception:
+            self._finish_fetch(cache_keys, generations, None)
+            raise
+
+        self._finish_fetch(cache_keys, generations, [value])
+        return _copy_value(value)
+
+    def _get_value(
+        self,
+        model: ValuesTable,
+        owner: typing.Any,
+        key: str,
+    ) -> typing.Any:
+        """Get a deserialized value, from the caches or the database.
+
+        :return: the value, or ``None`` if it doesn't exist
+        """
+        value = self._get_cached_value(model, owner, key)
+        if value is tools_cache.MISSING:
+            value = self._fetch_value(model, owner, key)
+        return value
+
+    def _select_values(
+        self,
+        model: ValuesTable,
+        owner_column: str,
+        owner: typing.Any,
+        keys: Iterable[str],
+    ) -> dict[str, typing.Any]:
+        """Select the deserialized values of an ``owner`` for some ``keys``.
+
+        :param model: the table of the values
+        :param owner_column: the name of the column of the values' owner
+                             (such as ``nick_id``)
+        :param owner: the owner of the values
+        :param keys: the keys of the values to select
+        :return: the deserialized values found, by key
+        """
+        results = {}
+        keys_to_select = []
+        for key in keys:
+            value = self._get_cached_value(model, owner, key)
+            if value is tools_cache.MISSING:
+                keys_to_select.append(key)
+            elif value is not None:
+                results[key] = value
+
+        if not keys_to_select:
+            return results
+
+        table = model.__table__
+        cache_keys = [(model, owner, key) for key in keys_to_select]
+        generations = self._start_fetch(cache_keys)
+        try:
+            with self.session() as session:
+                rows = session.execute(
+                    select(table.c.key, table.c.value)
+                    .where(table.c[owner_column] == owner)
+                    .where(table.c.key.in_(keys_to_select))
+                ).all()
+            found = {key: _deserialize(value) for key, value in rows}
+        except Exception:
+            self._finish_fetch(cache_keys, generations, None)
+            raise
+
+        self._finish_fetch(
+            cache_keys,
+            generations,
+            [found.get(key) for key in keys_to_select],
+        )
+
+        results.update(
+            (key, _copy_value(value)) for key, value in found.items())
+        return results
+
     def get_uri(self) -> URL:
         """Return a direct URL for the database.
 
@@ -365,10 +1149,20 @@ class SopelDB:
         The nick ID is shared across all of a user's aliases, assuming their
         nicks have been grouped together.
 
+        Nick IDs are kept in the :attr:`nick_id_cache`, and so are the nicks
+        found not to have an ID (for :data:`NICK_ID_MISS_TTL` seconds). The
+        cache is invalidated by the alias/group management functions; a
+        plugin that modifies the ``nicknames`` table directly must
+        :meth:`~sopel.tools.cache.LRUCache.clear` it.
+
         .. versionchanged:: 8.0
 
             The ``create`` parameter is now ``False`` by default.
 
+        .. versionchanged:: 8.1
+
+            Nick IDs are cached.
+
         .. seealso::
 
             Alias/group management functions: :meth:`alias_nick`,
@@ -377,6 +1171,13 @@ class SopelDB:
 
         """
         slug = self.make_identifier(nick).lower()
+        cached_id = self.nick_id_cache.get(slug)
+        if cached_id is not None and cached_id is not tools_cache.MISSING:
+            return cached_id
+        elif cached_id is None and not create:
+            # recently found not to have an ID
+            raise ValueError('No ID exists for the given nick')
+
         with self.session() as session:
             nickname = session.execute(
                 select(Nicknames).where(Nicknames.slug == slug)
@@ -396,6 +1197,7 @@ class SopelDB:
 
             if nickname is None:  # "is /* still */ None", if Python had inline comments
                 if not create:
+                    self.nick_id_cache.set(slug, None, ttl=NICK_ID_MISS_TTL)
                     raise ValueError('No ID exists for the given nick')
                 # Generate a new ID
                 nick_id = NickIDs()
@@ -410,6 +1212,8 @@ class SopelDB:
                 )
                 session.add(nickname)
                 session.commit()
+
+            self.nick_id_cache.set(slug, nickname.nick_id)
             return nickname.nick_id
 
     def alias_nick(self, nick: str, alias: str) -> None:
@@ -446,6 +1250,9 @@ class SopelDB:
             session.add(nickname)
             session.commit()
 
+        # the alias may have been cached as a nick without ID
+        self.nick_id_cache.pop(slug)
+
     def set_nick_value(self, nick: str, key: str, value: typing.Any) -> None:
         """Set or update a value in the key-value store for ``nick``.
 
@@ -469,6 +1276,11 @@ class SopelDB:
         """
         value = json.dumps(value, ensure_ascii=False)
         nick_id = self.get_nick_id(nick, create=True)
+        if self.write_buffer is not None:
+            self.write_buffer.set(NickValues, nick_id, {key: value})
+            self._invalidate_values(NickValues, nick_id, [key])
+            return
+
         with self.session() as session:
             result = session.execute(
                 select(NickValues)
@@ -490,6 +1302,8 @@ class SopelDB:
                 session.add(new_nickvalue)
                 session.commit()
 
+        self._invalidate_values(NickValues, nick_id, [key])
+
     def delete_nick_value(self, nick: str, key: str) -> None:
         """Delete a value from the key-value store for ``nick``.
 
@@ -511,6 +1325,7 @@ class SopelDB:
             # there's nothing to do if the nick doesn't exist
             return
 
+        self._discard_pending_values(NickValues, nick_id, [key])
         with self.session() as session:
             result = session.execute(
                 select(NickValues)
@@ -522,6 +1337,8 @@ class SopelDB:
                 session.delete(result)
                 session.commit()
 
+        self._invalidate_values(NickValues, nick_id, [key])
+
     def get_nick_value(
         self,
         nick: str,
@@ -540,6 +1357,11 @@ class SopelDB:
 
             The ``default`` parameter.
 
+        .. versionchanged:: 8.1
+
+            The nick's ID is looked up with :meth:`get_nick_id`, so its cache
+            is used, and the value can come from the :attr:`value_cache`.
+
         .. seealso::
 
             To set a value for later retrieval with this method, use
@@ -549,21 +1371,84 @@ class SopelDB:
             :meth:`delete_nick_value`.
 
         """
-        slug = self.make_identifier(nick).lower()
-        with self.session() as session:
-            result = session.execute(
-                select(NickValues)
-                .where(Nicknames.nick_id == NickValues.nick_id)
-                .where(Nicknames.slug == slug)
-                .where(NickValues.key == key)
-            ).scalar_one_or_none()
+        try:
+            nick_id = self.get_nick_id(nick)
+        except ValueError:
+            # no ID, no value
+            result = None
+        else:
+            result = self._get_value(NickValues, nick_id, key)
+
+        if result is None and default is not None:
+            return _deserialize(default)
+
+        return result
+
+    def set_nick_values(
+        self,
+        nick: str,
+        values: Mapping[str, typing.Any],
+    ) -> None:
+        """Set or update many values in the key-value store for ``nick``.
+
+        :param nick: the nickname with which to associate the ``values``
+        :param values: the values to set, by key
+        :raise ~sqlalchemy.exc.SQLAlchemyError: if there is a database error
+
+        This is like calling :meth:`set_nick_value` for each key, but all the
+        values are written in a single transaction.
+
+        .. versionadded:: 8.1
+
+        .. seealso::
+
+            To retrieve values set with this method, use
+            :meth:`get_nick_values`.
+
+        """
+        serialized = {
+            key: json.dumps(value, ensure_ascii=False)
+            for key, value in values.items()
+        }
+        if not serialized:
+            return
+
+        nick_id = self.get_nick_id(nick, create=True)
+        self._set_values(NickValues, nick_id, serialized)
 
-            if result is not None:
-                result = result.value
-            elif default is not None:
-                result = default
+    def get_nick_values(
+        self,
+        nick: str,
+        keys: Iterable[str],
+    ) -> dict[str, typing.Any]:
+        """Get many values from the key-value store for ``nick``.
+
+        :param nick: the nickname whose values to access
+        :param keys: the names by which the desired values were saved
+        :return: the values found, by key; keys without a value are omitted
+        :raise ~sqlalchemy.exc.SQLAlchemyError: if there is a database error
+
+        This is like calling :meth:`get_nick_value` for each key, but all the
+        values are read with a single query::
+
+            values = bot.db.get_nick_values(nick, ['timezone', 'time_format'])
+            timezone = values.get('timezone', 'UTC')
+
+        .. versionadded:: 8.1
+
+        .. seealso::
 
-            return _deserialize(result)
+            To set values for later retrieval with this method, use
+            :meth:`set_nick_values`.
+
+        """
+        try:
+            nick_id = self.get_nick_id(nick)
+        except ValueError:
+            # no ID, no values
+            return {}
+
+        return self._select_values(NickValues, 'nick_id', nick_id, keys)
 
     def unalias_nick(self, alias: str) -> None:
         """Remove an alias.
@@ -596,6 +1481,8 @@ class SopelDB:
             )
             session.commit()
 
+        self.nick_id_cache.pop(slug)
+
     def forget_nick_group(self, nick: str) -> None:
         """Remove a nickname, all of its aliases, and all of its stored values.
 
@@ -610,6 +1497,7 @@ class SopelDB:
 
         """
         nick_id = self.get_nick_id(nick)
+        self._discard_pending_values(NickValues, nick_id)
         with self.session() as session:
             session.execute(
                 delete(Nicknames)
@@ -623,6 +1511,10 @@ class SopelDB:
             )
             session.commit()
 
+        # all the nicks of the group are gone, and they aren't known here
+        self.nick_id_cache.clear()
+        self._invalidate_values(NickValues, nick_id)
+
     @deprecated(
         version='8.0',
         removed_in='9.0',
@@ -651,6 +1543,8 @@ class SopelDB:
         Plugins which define their own tables relying on the nick table will
         need to handle their own merging separately.
         """
+        # the values to merge must be in the database
+        self.flush()
         first_id = self.get_nick_id(first_nick, create=True)
         second_id = self.get_nick_id(second_nick, create=True)
         with self.session() as session:
@@ -684,6 +1578,10 @@ class SopelDB:
             )
             session.commit()
 
+        # all the nicks of the second group have a new ID
+        self.nick_id_cache.clear()
+        self._invalidate_values(NickValues, second_id)
+
     # CHANNEL FUNCTIONS
 
     def get_channel_slug(self, chan: str) -> str:
@@ -698,7 +1596,6 @@ class SopelDB:
         different clients and/or servers on the network.
         """
         slug = self.make_identifier(chan).lower()
-
         with self.session() as session:
             # Always migrate from old casemapping
             session.execute(
@@ -739,6 +1636,11 @@ class SopelDB:
         """
         channel = self.get_channel_slug(channel)
         value = json.dumps(value, ensure_ascii=False)
+        if self.write_buffer is not None:
+            self.write_buffer.set(ChannelValues, channel, {key: value})
+            self._invalidate_values(ChannelValues, channel, [key])
+            return
+
         with self.session() as session:
             result = session.execute(
                 select(ChannelValues)
@@ -760,6 +1662,8 @@ class SopelDB:
                 session.add(new_channelvalue)
                 session.commit()
 
+        self._invalidate_values(ChannelValues, channel, [key])
+
     def delete_channel_value(self, channel: str, key: str) -> None:
         """Delete a value from the key-value store for ``channel``.
 
@@ -776,6 +1680,7 @@ class SopelDB:
 
         """
         channel = self.get_channel_slug(channel)
+        self._discard_pending_values(ChannelValues, channel, [key])
         with self.session() as session:
             session.execute(
                 delete(ChannelValues)
@@ -786,6 +1691,8 @@ class SopelDB:
             )
             session.commit()
 
+        self._invalidate_values(ChannelValues, channel, [key])
+
     def get_channel_value(
         self,
         channel: str,
@@ -804,6 +1711,10 @@ class SopelDB:
 
             The ``default`` parameter.
 
+        .. versionchanged:: 8.1
+
+            The value can come from the :attr:`value_cache`.
+
         .. seealso::
 
             To set a value for later retrieval with this method, use
@@ -813,18 +1724,75 @@ class SopelDB:
             :meth:`delete_channel_value`.
 
         """
+        slug = self.make_identifier(channel).lower()
+        result = self._get_cached_value(ChannelValues, slug, key)
+        if result is tools_cache.MISSING:
+            # migrate from the old casemapping before querying the database
+            slug = self.get_channel_slug(channel)
+            result = self._fetch_value(ChannelValues, slug, key)
+
+        if result is None and default is not None:
+            return _deserialize(default)
+
+        return result
+
+    def set_channel_values(
+        self,
+        channel: str,
+        values: Mapping[str, typing.Any],
+    ) -> None:
+        """Set or update many values in the key-value store for ``channel``.
+
+        :param channel: the channel with which to associate the ``values``
+        :param values: the values to set, by key
+        :raise ~sqlalchemy.exc.SQLAlchemyError: if there is a database error
+
+        This is like calling :meth:`set_channel_value` for each key, but all
+        the values are written in a single transaction.
+
+        .. versionadded:: 8.1
+
+        .. seealso::
+
+            To retrieve values set with this method, use
+            :meth:`get_channel_values`.
+
+        """
+        serialized = {
+            key: json.dumps(value, ensure_ascii=False)
+            for key, value in values.items()
+        }
+        if not serialized:
+            return
+
         channel = self.get_channel_slug(channel)
-        with self.session() as session:
-            result = session.execute(
-                select(ChannelValues)
-                .where(ChannelValues.channel == channel)
-                .where(ChannelValues.key == key)
-            ).scalar_one_or_none()
-            if result is not None:
-                result = result.value
-            elif default is not None:
-                result = default
-            return _deserialize(result)
+        self._set_values(ChannelValues, channel, serialized)
+
+    def get_channel_values(
+        self,
+        channel: str,
+        keys: Iterable[str],
+    ) -> dict[str, typing.Any]:
+        """Get many values from the key-value store for ``channel``.
+
+        :param channel: the channel whose values to access
+        :param keys: the names by which the desired values were saved
+        :return: the values found, by key; keys without a value are omitted
+        :raise ~sqlalchemy.exc.SQLAlchemyError: if there is a database error
+
+        This is like calling :meth:`get_channel_value` for each key, but all
+        the values are read with a single query.
+
+        .. versionadded:: 8.1
+
+        .. seealso::
+
+            To set values for later retrieval with this method, use
+            :meth:`set_channel_values`.
+
+        """
+        channel = self.get_channel_slug(channel)
+        return self._select_values(ChannelValues, 'channel', channel, keys)
 
     def forget_channel(self, channel: str) -> None:
         """Remove all of a channel's stored values.
@@ -838,6 +1806,7 @@ class SopelDB:
 
         """
         channel = self.get_channel_slug(channel)
+        self._discard_pending_values(ChannelValues, channel)
         with self.session() as session:
             session.execute(
                 delete(ChannelValues)
@@ -845,6 +1814,8 @@ class SopelDB:
             )
             session.commit()
 
+        self._invalidate_values(ChannelValues, channel)
+
     # PLUGIN FUNCTIONS
 
     def set_plugin_value(
@@ -875,6 +1846,11 @@ class SopelDB:
         """
         plugin = plugin.lower()
         value = json.dumps(value, ensure_ascii=False)
+        if self.write_buffer is not None:
+            self.write_buffer.set(PluginValues, plugin, {key: value})
+            self._invalidate_values(PluginValues, plugin, [key])
+            return
+
         with self.session() as session:
             result = session.execute(
                 select(PluginValues)
@@ -891,6 +1867,8 @@ class SopelDB:
                 session.add(new_pluginvalue)
                 session.commit()
 
+        self._invalidate_values(PluginValues, plugin, [key])
+
     def delete_plugin_value(self, plugin: str, key: str) -> None:
         """Delete a value from the key-value store for ``plugin``.
 
@@ -907,6 +1885,7 @@ class SopelDB:
 
         """
         plugin = plugin.lower()
+        self._discard_pending_values(PluginValues, plugin, [key])
         with self.session() as session:
             result = session.execute(
                 select(PluginValues)
@@ -918,6 +1897,8 @@ class SopelDB:
                 session.delete(result)
                 session.commit()
 
+        self._invalidate_values(PluginValues, plugin, [key])
+
     def get_plugin_value(
         self,
         plugin: str,
@@ -936,6 +1917,10 @@ class SopelDB:
 
             The ``default`` parameter.
 
+        .. versionchanged:: 8.1
+
+            The value can come from the :attr:`value_cache`.
+
         .. seealso::
 
             To set a value for later retrieval with this method, use
@@ -946,18 +1931,70 @@ class SopelDB:
 
         """
         plugin = plugin.lower()
-        with self.session() as session:
-            result = session.execute(
-                select(PluginValues)
-                .where(PluginValues.plugin == plugin)
-                .where(PluginValues.key == key)
-            ).scalar_one_or_none()
+        result = self._get_value(PluginValues, plugin, key)
+
+        if result is None and default is not None:
+            return _deserialize(default)
+
+        return result
+
+    def set_plugin_values(
+        self,
+        plugin: str,
+        values: Mapping[str, typing.Any],
+    ) -> None:
+        """Set or update many values in the key-value store for ``plugin``.
+
+        :param plugin: the plugin name with which to associate the ``values``
+        :param values: the values to set, by key
+        :raise ~sqlalchemy.exc.SQLAlchemyError: if there is a database error
+
+        This is like calling :meth:`set_plugin_value` for each key, but all
+        the values are written in a single transaction.
+
+        .. versionadded:: 8.1
+
+        .. seealso::
+
+            To retrieve values set with this method, use
+            :meth:`get_plugin_values`.
+
+        """
+        serialized = {
+            key: json.dumps(value, ensure_ascii=False)
+            for key, value in values.items()
+        }
+        if not serialized:
+            return
+
+        plugin = plugin.lower()
+        self._set_values(PluginValues, plugin, serialized)
+
+    def get_plugin_values(
+        self,
+        plugin: str,
+        keys: Iterable[str],
+    ) -> dict[str, typing.Any]:
+        """Get many values from the key-value store for ``plugin``.
+
+        :param plugin: the plugin name whose values to access
+        :param keys: the names by which the desired values were saved
+        :return: the values found, by key; keys without a value are omitted
+        :raise ~sqlalchemy.exc.SQLAlchemyError: if there is a database error
+
+        This is like calling :meth:`get_plugin_value` for each key, but all
+        the values are read with a single query.
+
+        .. versionadded:: 8.1
+
+        .. seealso::
 
-            if result is not None:
-                result = result.value
-            elif default is not None:
-                result = default
-            return _deserialize(result)
+            To set values for later retrieval with this method, use
+            :meth:`set_plugin_values`.
+
+        """
+        plugin = plugin.lower()
+        return self._select_values(PluginValues, 'plugin', plugin, keys)
 
     def forget_plugin(self, plugin: str) -> None:
         """Remove all of a plugin's stored values.
@@ -971,12 +2008,15 @@ class SopelDB:
 
         """
         plugin = plugin.lower()
+        self._discard_pending_values(PluginValues, plugin)
         with self.session() as session:
             session.execute(
                 delete(PluginValues).where(PluginValues.plugin == plugin)
             )
             session.commit()
 
+        self._invalidate_values(PluginValues, plugin)
+
     # NICK AND CHANNEL FUNCTIONS
 
     def get_nick_or_channel_value(
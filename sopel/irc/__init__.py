@@ -31,28 +31,33 @@ interface for the bot itself (:class:`~sopel.irc.AbstractBot`).
 from __future__ import annotations
 
 import abc
-from collections import deque
+import asyncio
+import concurrent.futures
+import contextlib
 from datetime import datetime, timezone
 import logging
 import os
+import queue
 import threading
-import time
 from typing import (
     Any,
+    Callable,
     TYPE_CHECKING,
 )
 
 from sopel import tools, trigger
 from sopel.lifecycle import deprecated
-from sopel.tools import identifiers, memories
+from sopel.tools import identifiers, memories, stats, watchdog, workers
 
 from .backends import AsyncioBackend, UninitializedBackend
 from .capabilities import Capabilities
 from .isupport import ISupport
+from .outbound import OutboundScheduler, OutboundStats, PRIORITY_NORMAL
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Coroutine, Iterable, Iterator
+    from contextlib import AbstractContextManager
 
     from sopel.config import Config
 
@@ -66,6 +71,14 @@ LOGGER = logging.getLogger(__name__)
 ERR_BACKEND_NOT_INITIALIZED = 'Backend not initialized; is the bot running?'
 
 
+def _is_ping(message: str) -> bool:
+    # check the command of a raw IRC message, skipping its tags and source
+    for word in message.split(' ', 3)[:3]:
+        if word[:1] not in ('@', ':'):
+            return word.upper() == 'PING'
+    return False
+
+
 class AbstractBot(abc.ABC):
     """Abstract definition of Sopel's interface."""
     def __init__(self, settings: Config):
@@ -96,6 +109,22 @@ class AbstractBot(abc.ABC):
         self.hasquit = False
         self.wantsrestart = False
         self.last_raw_line = ''  # last raw line received
+        self._lines_received = stats.Counter()
+        self._lines_sent = stats.Counter()
+        # simulated echo-messages waiting for the send lock to be released
+        self._deferred_echoes = threading.local()
+        self._outbound = OutboundScheduler(self)
+        self._inbound_pool = workers.WorkerPool(
+            1,  # a single dispatcher handles messages in order
+            queue_size=settings.core.inbound_queue_size,
+            policy=settings.core.inbound_queue_policy,
+            name='sopel-inbound',
+        )
+        self._watchdog: watchdog.Watchdog | None = None
+        if settings.core.watchdog_budget > 0:
+            self._watchdog = watchdog.Watchdog(settings.core.watchdog_budget)
+            self._watchdog.add_heartbeat(
+                'event loop', self._send_loop_heartbeat)
 
     @property
     def connection_registered(self) -> bool:
@@ -416,11 +445,187 @@ class AbstractBot(abc.ABC):
         LOGGER.debug('Sending user "%s" (name: "%s")', self.user, self.name)
         self.backend.send_user(self.user, '0', '*', self.name)
 
+    @property
+    def inbound_stats(self) -> workers.WorkerPoolStats:
+        """Statistics of the inbound queue.
+
+        The :attr:`~sopel.tools.workers.WorkerPoolStats.wait_time_avg` and
+        :attr:`~sopel.tools.workers.WorkerPoolStats.wait_time_max` statistics
+        are the average and maximum dispatch lag of the handled messages.
+
+        .. seealso::
+
+            The :meth:`queue_message` method.
+
+        .. versionadded:: 8.1
+        """
+        return self._inbound_pool.get_stats()
+
+    @property
+    def dispatch_lag(self) -> float:
+        """Current dispatch lag, in seconds.
+
+        The dispatch lag is the time between the reception of a message and
+        the moment the dispatcher starts to handle it. This is how long the
+        oldest message in the inbound queue has been waiting, or ``0`` when
+        the queue is empty.
+
+        .. versionadded:: 8.1
+        """
+        return self._inbound_pool.oldest_wait_time
+
+    @property
+    def outbound_stats(self) -> OutboundStats:
+        """Statistics of the outbound queues.
+
+        This includes the number of messages waiting for each recipient, and
+        how long the flood protection made the sender thread wait.
+
+        .. versionadded:: 8.1
+        """
+        return self._outbound.get_stats()
+
+    @property
+    def lines_received(self) -> int:
+        """Number of lines received from the server.
+
+        .. versionadded:: 8.1
+        """
+        return int(self._lines_received.value)
+
+    @property
+    def lines_sent(self) -> int:
+        """Number of lines sent to the server.
+
+        .. versionadded:: 8.1
+        """
+        return int(self._lines_sent.value)
+
+    @property
+    def watchdog_stats(self) -> watchdog.WatchdogStats | None:
+        """Statistics of the watchdog, if enabled.
+
+        This includes the number of stalls detected, and the current lag of
+        the event loop's heartbeat. This is ``None`` when the
+        :attr:`~sopel.config.core_section.CoreSection.watchdog_budget` is not
+        set.
+
+        .. versionadded:: 8.1
+        """
+        if self._watchdog is None:
+            return None
+        return self._watchdog.get_stats()
+
+    def _track(self, name: str) -> AbstractContextManager[None]:
+        """Track an execution with the watchdog, if enabled.
+
+        :param name: the name of the execution, used to report a stall
+        """
+        if self._watchdog is None:
+            return contextlib.nullcontext()
+        return self._watchdog.track(name)
+
+    def _send_loop_heartbeat(self, beat: Callable[[], None]) -> bool:
+        if not self.backend.is_connected():
+            return False
+
+        self.run_coroutine(watchdog.beat_async(beat))
+        return True
+
+    def queue_message(self, message: str) -> None:
+        """Queue an incoming IRC message for the dispatcher thread.
+
+        :param message: the received raw IRC message
+
+        The dispatcher thread handles queued messages one at a time and in
+        order, with :meth:`on_message`, so the connection backend can keep
+        reading from the server while plugins are slow. A ``PING`` from the
+        server is answered right away, without waiting in the queue.
+
+        When the queue is full, the
+        :attr:`~sopel.config.core_section.CoreSection.inbound_queue_policy`
+        decides what to do with the message.
+
+        .. warning::
+
+            With the ``block`` policy, this waits until the dispatcher frees
+            a slot in the queue: the event loop must use
+            :meth:`queue_message_async` instead.
+
+        .. versionadded:: 8.1
+        """
+        send_pong = self._receive_message(message)
+        self._inbound_pool.submit(
+            self._handle_queued_message,
+            message,
+            send_pong,
+            name='dispatcher',
+        )
+
+    async def queue_message_async(self, message: str) -> None:
+        """Queue an incoming IRC message, without blocking the event loop.
+
+        :param message: the received raw IRC message
+
+        This is like :meth:`queue_message`, but when the queue is full with
+        the ``block`` policy, the coroutine waits for a free slot in another
+        thread: the event loop keeps sending messages and running its tasks,
+        and a ``PING`` from the server is answered before waiting.
+
+        .. versionadded:: 8.1
+        """
+        send_pong = self._receive_message(message)
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                self._inbound_pool.submit(
+                    self._handle_queued_message,
+                    message,
+                    send_pong,
+                    name='dispatcher',
+                    block=False,
+                )
+            except queue.Full:
+                await loop.run_in_executor(
+                    None, self._inbound_pool.wait_for_slot)
+            else:
+                return
+
+    def _receive_message(self, message: str) -> bool:
+        # count the message, and answer it right away if it's a PING;
+        # return whether the dispatcher must answer it instead
+        if self.backend is None:
+            raise RuntimeError(ERR_BACKEND_NOT_INITIALIZED)
+
+        self._lines_received.increment()
+        if _is_ping(message):
+            pretrigger = trigger.PreTrigger(self.nick, message)
+            self.backend.send_pong(pretrigger.args[-1])
+            return False
+        return True
+
+    def _handle_queued_message(self, message: str, send_pong: bool) -> None:
+        try:
+            with self._track('dispatcher'):
+                self._handle_message(message, send_pong)
+        except Exception:
+            LOGGER.exception('Unexpected exception on message handling.')
+
     def on_message(self, message: str) -> None:
         """Handle an incoming IRC message.
 
         :param message: the received raw IRC message
+
+        .. seealso::
+
+            The :meth:`queue_message` method to handle the message in the
+            dispatcher thread instead.
+
         """
+        self._lines_received.increment()
+        self._handle_message(message, send_pong=True)
+
+    def _handle_message(self, message: str, send_pong: bool) -> None:
         if self.backend is None:
             raise RuntimeError(ERR_BACKEND_NOT_INITIALIZED)
 
@@ -441,7 +646,8 @@ class AbstractBot(abc.ABC):
             pretrigger.tags.pop('account', None)
 
         if pretrigger.event == 'PING':
-            self.backend.send_pong(pretrigger.args[-1])
+            if send_pong:
+                self.backend.send_pong(pretrigger.args[-1])
         elif pretrigger.event == 'ERROR':
             LOGGER.error("ERROR received from server: %s", pretrigger.args[-1])
             self.backend.on_irc_error(pretrigger)
@@ -455,10 +661,14 @@ class AbstractBot(abc.ABC):
 
         When a message is sent through the IRC connection, the bot will log
         the raw message. If necessary, it will also simulate the
-        `echo-message`_ feature of IRCv3.
+        `echo-message`_ feature of IRCv3; when the message is sent by the
+        outbound scheduler, the echo is dispatched once the scheduler has
+        released its lock.
 
         .. _echo-message: https://ircv3.net/irc/#echo-message
         """
+        self._lines_sent.increment()
+
         # Log raw message
         self.log_raw(raw, '>>')
 
@@ -477,13 +687,52 @@ class AbstractBot(abc.ABC):
                 except KeyError:
                     pass  # we tried, and that's good enough
 
-            pretrigger = trigger.PreTrigger(
-                self.nick,
-                ":{0}!{1}@{2} {3}".format(self.nick, self.user, host, raw),
-                url_schemes=self.settings.core.auto_url_schemes,
-                identifier_factory=self.make_identifier,
-                statusmsg_prefixes=self.isupport.get('STATUSMSG'),
-            )
+            # a message to many targets is echoed once per target
+            command, _, params = raw.partition(' ')
+            targets, _, params = params.partition(' ')
+            deferred = getattr(self._deferred_echoes, 'pretriggers', None)
+            for target in targets.split(','):
+                pretrigger = trigger.PreTrigger(
+                    self.nick,
+                    ":{0}!{1}@{2} {3} {4} {5}".format(
+                        self.nick, self.user, host, command, target, params),
+                    url_schemes=self.settings.core.auto_url_schemes,
+                    identifier_factory=self.make_identifier,
+                    statusmsg_prefixes=self.isupport.get('STATUSMSG'),
+                )
+                if deferred is not None:
+                    deferred.append(pretrigger)
+                else:
+                    self.dispatch(pretrigger)
+
+    @contextlib.contextmanager
+    def _defer_echo(
+        self,
+        dispatch: Callable[[list[trigger.PreTrigger]], None] | None = None,
+    ) -> Iterator[None]:
+        # dispatch the simulated echo-messages of the lines sent in this block
+        # only once it is over: the outbound scheduler sends lines while
+        # holding the send lock, and a rule triggered by an echo (or a full
+        # dispatch queue) may wait for a thread that needs that lock;
+        # ``dispatch`` can handle the echoes instead of :meth:`dispatch`
+        if getattr(self._deferred_echoes, 'pretriggers', None) is not None:
+            # nested block: the outermost one dispatches the echoes
+            yield
+            return
+
+        pretriggers: list[trigger.PreTrigger] = []
+        self._deferred_echoes.pretriggers = pretriggers
+        try:
+            yield
+        finally:
+            self._deferred_echoes.pretriggers = None
+
+        if dispatch is not None:
+            if pretriggers:
+                dispatch(pretriggers)
+            return
+
+        for pretrigger in pretriggers:
             self.dispatch(pretrigger)
 
     @deprecated(
@@ -547,8 +796,29 @@ class AbstractBot(abc.ABC):
         self.backend.send_nick(self.nick)
 
     def on_close(self) -> None:
-        """Call shutdown methods."""
+        """Call shutdown methods.
+
+        The shutdown waits for the last received messages to be handled: when
+        this is called from a running event loop, this happens in another
+        thread, so the event loop is never blocked.
+
+        .. versionchanged:: 8.1
+
+            The shutdown doesn't block a running event loop anymore.
+
+        """
         self._connection_registered.clear()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._close()
+        else:
+            loop.run_in_executor(None, self._close)
+
+    def _close(self) -> None:
+        # handle the last messages before shutting down
+        self._inbound_pool.shutdown(timeout=15)
+        self._outbound.stop()
         self._shutdown()
 
     def _shutdown(self) -> None:
@@ -583,12 +853,19 @@ class AbstractBot(abc.ABC):
         logger = logging.getLogger('sopel.raw')
         logger.info("%s\t%r", prefix, line)
 
-    def write(self, args: Iterable[str], text: str | None = None) -> None:
+    def write(
+        self,
+        args: Iterable[str],
+        text: str | None = None,
+        priority: int | None = None,
+    ) -> None:
         """Send a command to the server.
 
         :param args: an iterable of strings, which will be joined by spaces
         :param text: a string that will be prepended with a ``:`` and added to
                      the end of the command
+        :param priority: the priority of the command; by default, it depends
+                         on the command (see :mod:`sopel.irc.outbound`)
 
         ``args`` is an iterable of strings, which are joined by spaces.
         ``text`` is treated as though it were the final item in ``args``, but
@@ -611,24 +888,66 @@ class AbstractBot(abc.ABC):
             :meth:`sopel.irc.abstract_backends.AbstractIRCBackend.send_command`
             method for more information.
 
+        .. versionchanged:: 8.1
+
+            The ``priority`` parameter.
+
+        """
+        if self.backend is None:
+            raise RuntimeError(ERR_BACKEND_NOT_INITIALIZED)
+
+        self.backend.send_command(*args, text=text, priority=priority)
+
+    def run_coroutine(
+        self,
+        coro: Coroutine[Any, Any, Any],
+    ) -> concurrent.futures.Future:
+        """Run a coroutine on the connection backend's event loop.
+
+        :param coro: the coroutine to run
+        :return: a future for the result of the coroutine
+
+        This method is thread-safe. It doesn't wait for the coroutine's result
+        when the backend runs an event loop; the returned future can be used
+        for that purpose (from another thread than the event loop's).
+
+        .. seealso::
+
+            The connection backend is responsible for running the coroutine.
+            See the
+            :meth:`sopel.irc.abstract_backends.AbstractIRCBackend.run_coroutine`
+            method for more information.
+
+        .. versionadded:: 8.1
         """
         if self.backend is None:
             raise RuntimeError(ERR_BACKEND_NOT_INITIALIZED)
 
-        self.backend.send_command(*args, text=text)
+        return self.backend.run_coroutine(coro)
 
     # IRC Commands
 
-    def action(self, text: str, dest: str) -> None:
+    def action(
+        self,
+        text: str,
+        dest: str,
+        priority: int = PRIORITY_NORMAL,
+    ) -> None:
         """Send a CTCP ACTION PRIVMSG to a user or channel.
 
         :param text: the text to send in the CTCP ACTION
         :param dest: the destination of the CTCP ACTION
+        :param priority: the priority of the message (optional)
 
         The same loop detection and length restrictions apply as with
         :func:`say`, though automatic message splitting is not available.
+
+        .. versionchanged:: 8.1
+
+            The ``priority`` parameter.
+
         """
-        self.say('\001ACTION {}\001'.format(text), dest)
+        self.say('\001ACTION {}\001'.format(text), dest, priority=priority)
 
     def join(self, channel: str, password: str | None = None) -> None:
         """Join a ``channel``.
@@ -667,16 +986,27 @@ class AbstractBot(abc.ABC):
 
         self.backend.send_kick(channel, nick, reason=text)
 
-    def notice(self, text: str, dest: str) -> None:
+    def notice(
+        self,
+        text: str,
+        dest: str,
+        priority: int = PRIORITY_NORMAL,
+    ) -> None:
         """Send an IRC NOTICE to a user or channel (``dest``).
 
         :param text: the text to send in the NOTICE
         :param dest: the destination of the NOTICE
+        :param priority: the priority of the notice (optional)
+
+        .. versionchanged:: 8.1
+
+            The ``priority`` parameter.
+
         """
         if self.backend is None:
             raise RuntimeError(ERR_BACKEND_NOT_INITIALIZED)
 
-        self.backend.send_notice(dest, text)
+        self.backend.send_notice(dest, text, priority=priority)
 
     def part(self, channel: str, msg: str | None = None) -> None:
         """Leave a channel.
@@ -722,6 +1052,7 @@ class AbstractBot(abc.ABC):
         dest: str,
         reply_to: str,
         notice: bool = False,
+        priority: int = PRIORITY_NORMAL,
     ) -> None:
         """Send a PRIVMSG to a user or channel, prepended with ``reply_to``.
 
@@ -730,17 +1061,23 @@ class AbstractBot(abc.ABC):
         :param reply_to: the nickname that the reply will be prepended with
         :param notice: whether to send the reply as a ``NOTICE`` or not,
                        defaults to ``False``
+        :param priority: the priority of the reply (optional)
 
         If ``notice`` is ``True``, send a ``NOTICE`` rather than a ``PRIVMSG``.
 
         The same loop detection and length restrictions apply as with
         :meth:`say`, though automatic message splitting is not available.
+
+        .. versionchanged:: 8.1
+
+            The ``priority`` parameter.
+
         """
         text = '%s: %s' % (reply_to, text)
         if notice:
-            self.notice(text, dest)
+            self.notice(text, dest, priority=priority)
         else:
-            self.say(text, dest)
+            self.say(text, dest, priority=priority)
 
     def say(
         self,
@@ -749,6 +1086,7 @@ class AbstractBot(abc.ABC):
         max_messages: int = 1,
         truncation: str = '',
         trailing: str = '',
+        priority: int = PRIORITY_NORMAL,
     ) -> None:
         """Send a ``PRIVMSG`` to a user or channel.
 
@@ -761,6 +1099,8 @@ class AbstractBot(abc.ABC):
                            ``max_messages`` is greater than 1 (optional)
         :param trailing: string to append after ``text`` and (if used)
                          ``truncation`` (optional)
+        :param priority: the priority of the message (optional); see
+                         :mod:`sopel.irc.outbound` for the available values
 
         By default, this will attempt to send the entire ``text`` in one
         message. If the text is too long for the server, it may be truncated.
@@ -809,122 +1149,116 @@ class AbstractBot(abc.ABC):
             # Sopel says: "This quote is very long […]
             # The ending " goes missing
 
+        Messages are subject to flood protection, but this method never waits
+        for it: when a message can't be sent right away, it is queued and sent
+        later by the outbound scheduler, in order for each recipient.
+
         .. versionadded:: 7.1
 
             The ``truncation`` and ``trailing`` parameters.
 
+        .. versionchanged:: 8.1
+
+            Messages are queued instead of waiting for the flood protection
+            while holding a lock shared by every recipient.
+
+            The ``priority`` parameter.
+
+            The ``text`` is split into messages in a single pass, using
+            :func:`sopel.tools.get_sendable_messages`.
+
         """
         if self.backend is None:
             raise RuntimeError(ERR_BACKEND_NOT_INITIALIZED)
 
-        excess = ''
-
         if not isinstance(text, str):
             # Make sure we are dealing with a Unicode string
             text = text.decode('utf-8')
 
         safe_length = self.safe_text_length(recipient)
-        if trailing and max_messages == 1:
-            # last message needs to leave room for `trailing`
+        messages: list[str] = []
+
+        if max_messages > 1:
+            # every message but the last one is split at the safe length
+            messages, text = tools.get_sendable_messages(
+                text, safe_length, max_messages - 1)
+
+        if max_messages <= 1 or text:
+            # the last message needs to leave room for `trailing`
             safe_length -= len(trailing.encode('utf-8'))
 
-        # only think about `truncation` if we need to
-        if safe_length < len(text.encode('utf-8')):
-            if max_messages == 1:
+            # only think about `truncation` if we need to
+            if safe_length < len(text.encode('utf-8')):
                 # last message needs to leave room for `truncation`
                 # if it's still too long to fit in the line
                 safe_length -= len(truncation.encode('utf-8'))
-            text, excess = tools.get_sendable_message(text, safe_length)
-            if max_messages == 1:
+                text, _ = tools.get_sendable_message(text, safe_length)
                 text += truncation
 
-        if max_messages == 1:
             # ALWAYS append `trailing` to the last message;
-            # its size is included in the initial `safe_length` check
-            text += trailing
-
-        flood_max_wait = self.settings.core.flood_max_wait
-        flood_burst_lines = self.settings.core.flood_burst_lines
-        flood_refill_rate = self.settings.core.flood_refill_rate
-        flood_empty_wait = self.settings.core.flood_empty_wait
-
-        flood_text_length = self.settings.core.flood_text_length
-        flood_penalty_ratio = self.settings.core.flood_penalty_ratio
-
-        antiloop_threshold = min(10, self.settings.core.antiloop_threshold)
-        antiloop_window = self.settings.core.antiloop_window
-        antiloop_repeat_text = self.settings.core.antiloop_repeat_text
-        antiloop_silent_after = self.settings.core.antiloop_silent_after
-
-        with self.sending:
-            recipient_id = self.make_identifier(recipient)
-            recipient_stack = self.stack.setdefault(recipient_id, {
-                'messages': deque(maxlen=10),
-                'flood_left': flood_burst_lines,
-            })
-
-            if recipient_stack['messages']:
-                elapsed = time.time() - recipient_stack['messages'][-1][0]
-            else:
-                # Default to a high enough value that we won't care.
-                # Five minutes should be enough not to matter anywhere below.
-                elapsed = 300
-
-            # If flood bucket is empty, refill the appropriate number of lines
-            # based on how long it's been since our last message to recipient
-            if not recipient_stack['flood_left']:
-                recipient_stack['flood_left'] = min(
-                    flood_burst_lines,
-                    int(elapsed) * flood_refill_rate)
-
-            # If it's too soon to send another message, wait
-            if not recipient_stack['flood_left']:
-                penalty = 0
-
-                if flood_penalty_ratio > 0:
-                    penalty_ratio = flood_text_length * flood_penalty_ratio
-                    text_length_overflow = float(
-                        max(0, len(text) - flood_text_length))
-                    penalty = text_length_overflow / penalty_ratio
-
-                # Maximum wait time is 2 sec by default
-                initial_wait_time = flood_empty_wait + penalty
-                wait = min(initial_wait_time, flood_max_wait)
-                if elapsed < wait:
-                    sleep_time = wait - elapsed
-                    LOGGER.debug(
-                        'Flood protection wait time: %.3fs; '
-                        'elapsed time: %.3fs; '
-                        'initial wait time (limited to %.3fs): %.3fs '
-                        '(including %.3fs of penalty).',
-                        sleep_time,
-                        elapsed,
-                        flood_max_wait,
-                        initial_wait_time,
-                        penalty,
-                    )
-                    time.sleep(sleep_time)
-
-            # Loop detection
-            if antiloop_threshold > 0 and elapsed < antiloop_window:
-                messages = [m[1] for m in recipient_stack['messages']]
-
-                # If what we're about to send repeated at least N times
-                # in the anti-looping window, replace it
-                if messages.count(text) >= antiloop_threshold:
-                    text = antiloop_repeat_text
-                    if messages.count(text) >= antiloop_silent_after:
-                        # If we've already said that N times, discard message
-                        return
-
-            self.backend.send_privmsg(recipient, text)
-
-            # update recipient metadata
-            flood_left = recipient_stack['flood_left'] - 1
-            recipient_stack['flood_left'] = max(0, flood_left)
-            recipient_stack['messages'].append((time.time(), text))
-
-        # Now that we've sent the first part, we need to send the rest if
-        # requested. Doing so recursively seems simpler than iteratively.
-        if max_messages > 1 and excess:
-            self.say(excess, recipient, max_messages - 1, truncation, trailing)
+            # its size is included in the `safe_length` check above
+            messages.append(text + trailing)
+
+        for message in messages:
+            self._outbound.send(recipient, message, priority)
+
+    def say_many(
+        self,
+        text: str,
+        recipients: Iterable[str],
+        priority: int = PRIORITY_NORMAL,
+    ) -> None:
+        """Send the same ``PRIVMSG`` to several users or channels.
+
+        :param text: the text to send
+        :param recipients: the message recipients
+        :param priority: the priority of the message (optional); see
+                         :mod:`sopel.irc.outbound` for the available values
+
+        This sends ``text`` to every recipient using as few lines as possible:
+        recipients are grouped in the same ``PRIVMSG`` command, up to the
+        number of targets allowed by the server (the ``PRIVMSG`` value of the
+        ``TARGMAX`` ISUPPORT parameter, or one target per command if the
+        server doesn't advertise it).
+
+        Flood protection applies to each recipient as if the message was sent
+        to it alone. The ``text`` is truncated if it's too long to fit in a
+        single message, and duplicate recipients get the message once.
+
+        .. seealso::
+
+            The :meth:`say` method to send a message to a single recipient.
+
+        .. versionadded:: 8.1
+        """
+        if self.backend is None:
+            raise RuntimeError(ERR_BACKEND_NOT_INITIALIZED)
+
+        if not isinstance(text, str):
+            # Make sure we are dealing with a Unicode string
+            text = text.decode('utf-8')
+
+        # remove duplicates, keeping the first occurrence of each recipient
+        unique_recipients: dict[identifiers.Identifier, str] = {}
+        for recipient in recipients:
+            unique_recipients.setdefault(
+                self.make_identifier(recipient), recipient)
+
+        if not unique_recipients:
+            return
+
+        safe_length = min(
+            self.safe_text_length(recipient)
+            for recipient in unique_recipients.values()
+        )
+        if safe_length < len(text.encode('utf-8')):
+            text, _ = tools.get_sendable_message(text, safe_length)
+
+        max_targets: int | None = 1
+        try:
+            max_targets = self.isupport.TARGMAX.get('PRIVMSG', 1)
+        except AttributeError:
+            pass  # the server doesn't advertise TARGMAX
+
+        self._outbound.send_many(
+            unique_recipients.values(), text, priority, max_targets)
@@ -15,17 +15,39 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import concurrent.futures
+import functools
+import inspect
 import logging
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
+from .outbound import get_command_priority, PRIORITY_NORMAL
 from .utils import safe
 
 
 if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
     from sopel.irc import AbstractBot
     from sopel.trigger import PreTrigger
 
 
+@functools.lru_cache(maxsize=None)
+def _irc_send_accepts_priority(
+    backend_class: type[AbstractIRCBackend],
+) -> bool:
+    # backends written before Sopel 8.1 override ``irc_send(self, data)``
+    try:
+        parameters = inspect.signature(backend_class.irc_send).parameters
+    except (TypeError, ValueError):
+        return False
+    return 'priority' in parameters or any(
+        parameter.kind == inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters.values()
+    )
+
+
 class AbstractIRCBackend(abc.ABC):
     """Abstract class defining the interface and basic logic of an IRC backend.
 
@@ -64,12 +86,20 @@ class AbstractIRCBackend(abc.ABC):
         """
 
     @abc.abstractmethod
-    def irc_send(self, data: bytes) -> None:
+    def irc_send(self, data: bytes, priority: int = PRIORITY_NORMAL) -> None:
         """Send an IRC line as raw ``data``.
 
         :param bytes data: raw line to send
+        :param priority: the priority of the line; see
+                         :mod:`sopel.irc.outbound` for the available values
+
+        This method must be thread-safe. A backend that queues outgoing lines
+        must send the lines with a higher priority (i.e. a lower value) first.
+
+        .. versionchanged:: 8.1
+
+            The ``priority`` parameter.
 
-        This method must be thread-safe.
         """
 
     @abc.abstractmethod
@@ -85,6 +115,31 @@ class AbstractIRCBackend(abc.ABC):
         thread-safe way.
         """
 
+    def run_coroutine(
+        self,
+        coro: Coroutine[Any, Any, Any],
+    ) -> concurrent.futures.Future:
+        """Run a coroutine on the backend's event loop.
+
+        :param coro: the coroutine to run
+        :return: a future for the result of the coroutine
+
+        This method must be thread-safe. Backends with an event loop must
+        override it to schedule the coroutine on their loop without waiting
+        for its result.
+
+        By default, a backend has no event loop: the coroutine runs to
+        completion in a new event loop before this method returns.
+
+        .. versionadded:: 8.1
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        try:
+            future.set_result(asyncio.run(coro))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
     def decode_line(self, line: bytes) -> str:
         """Decode a raw IRC line from ``bytes`` to ``str``."""
         # We can't trust clients to pass valid Unicode.
@@ -102,11 +157,18 @@ class AbstractIRCBackend(abc.ABC):
 
         return data
 
-    def send_command(self, *args: str, text: str | None = None) -> None:
+    def send_command(
+        self,
+        *args: str,
+        text: str | None = None,
+        priority: int | None = None,
+    ) -> None:
         """Send a command through the IRC connection.
 
         :param args: IRC command to send with its argument(s)
         :param text: the text to send (optional keyword argument)
+        :param priority: the priority of the command (optional keyword
+                         argument); by default, it depends on the command
 
         Example::
 
@@ -121,9 +183,22 @@ class AbstractIRCBackend(abc.ABC):
 
             This will call the :meth:`sopel.bot.Sopel.on_message_sent`
             callback on the bot instance with the raw message sent.
+
+        .. versionchanged:: 8.1
+
+            The ``priority`` parameter. The default priority comes from
+            :func:`sopel.irc.outbound.get_command_priority`. It is passed to
+            :meth:`irc_send` only if the backend's method accepts it.
+
         """
+        if priority is None:
+            priority = get_command_priority(args[0]) if args else PRIORITY_NORMAL
+
         raw_command = self.prepare_command(*args, text=text)
-        self.irc_send(raw_command.encode('utf-8'))
+        if _irc_send_accepts_priority(type(self)):
+            self.irc_send(raw_command.encode('utf-8'), priority=priority)
+        else:
+            self.irc_send(raw_command.encode('utf-8'))
         self.bot.on_message_sent(raw_command)
 
     def prepare_command(self, *args: str, text: str | None = None) -> str:
@@ -253,18 +328,40 @@ class AbstractIRCBackend(abc.ABC):
         """
         self.send_command('KICK', channel, nick, text=reason)
 
-    def send_privmsg(self, dest: str, text: str) -> None:
+    def send_privmsg(
+        self,
+        dest: str,
+        text: str,
+        priority: int = PRIORITY_NORMAL,
+    ) -> None:
         """Send a ``PRIVMSG`` command to ``dest`` with ``text``.
 
         :param dest: nickname or channel name
         :param text: the text to send
+        :param priority: the priority of the message
+
+        .. versionchanged:: 8.1
+
+            The ``priority`` parameter.
+
         """
-        self.send_command('PRIVMSG', dest, text=text)
+        self.send_command('PRIVMSG', dest, text=text, priority=priority)
 
-    def send_notice(self, dest: str, text: str) -> None:
+    def send_notice(
+        self,
+        dest: str,
+        text: str,
+        priority: int = PRIORITY_NORMAL,
+    ) -> None:
         """Send a ``NOTICE`` command to ``dest`` with ``text``.
 
         :param str dest: nickname or channel name
         :param str text: the text to send
+        :param priority: the priority of the notice
+
+        .. versionchanged:: 8.1
+
+            The ``priority`` parameter.
+
         """
-        self.send_command('NOTICE', dest, text=text)
+        self.send_command('NOTICE', dest, text=text, priority=priority)
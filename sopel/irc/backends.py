@@ -15,17 +15,24 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import heapq
+import itertools
 import logging
 import signal
 import socket
 import ssl
 import threading
+import time
 from typing import Any, TYPE_CHECKING
 
 from .abstract_backends import AbstractIRCBackend
+from .outbound import PRIORITY_NORMAL
 
 
 if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
     from sopel.irc import AbstractBot
     from sopel.trigger import PreTrigger
 
@@ -87,7 +94,7 @@ class UninitializedBackend(AbstractIRCBackend):
         """
         raise RuntimeError("Received error from unconnected backend.")
 
-    def irc_send(self, data: bytes) -> None:
+    def irc_send(self, data: bytes, priority: int = PRIORITY_NORMAL) -> None:
         """Dummy method to send IRC data.
 
         Since it is impossible to send data to IRC without an IRC connection,
@@ -187,7 +194,13 @@ class AsyncioBackend(AbstractIRCBackend):
         self._writer: asyncio.StreamWriter | None = None
         self._reader: asyncio.StreamReader | None = None
 
+        # outgoing lines: (priority, sequence, deadline, data)
+        self._send_queue: list[tuple[int, int, float | None, bytes]] = []
+        self._send_sequence = itertools.count()
+        self._send_ready: asyncio.Event | None = None
+
         # connection tasks
+        self._write_task: asyncio.Task | None = None
         self._read_task: asyncio.Task | None = None
         self._ping_task: asyncio.TimerHandle | None = None
         self._timeout_task: asyncio.TimerHandle | None = None
@@ -251,14 +264,45 @@ class AsyncioBackend(AbstractIRCBackend):
     def on_irc_error(self, pretrigger: PreTrigger) -> None:
         LOGGER.warning('Error received from server: %s', pretrigger.text)
 
-    def irc_send(self, data: bytes) -> None:
+    def irc_send(self, data: bytes, priority: int = PRIORITY_NORMAL) -> None:
         if self._loop is None:
             raise RuntimeError('EventLoop not initialized.')
 
+        deadline: float | None = None
+        output_deadline = self.bot.settings.core.output_deadline
+        if output_deadline and priority >= PRIORITY_NORMAL:
+            deadline = time.monotonic() + output_deadline
+
+        item = (priority, next(self._send_sequence), deadline, data)
         if threading.current_thread() is threading.main_thread():
-            self._loop.create_task(self.send(data))
+            self._queue_data(item)
         else:
-            asyncio.run_coroutine_threadsafe(self.send(data), self._loop)
+            self._loop.call_soon_threadsafe(self._queue_data, item)
+
+    def _queue_data(self, item: tuple[int, int, float | None, bytes]) -> None:
+        # must be called from the event loop's thread
+        heapq.heappush(self._send_queue, item)
+        if self._send_ready is not None:
+            self._send_ready.set()
+
+    def run_coroutine(
+        self,
+        coro: Coroutine[Any, Any, Any],
+    ) -> concurrent.futures.Future:
+        """Schedule a coroutine on the backend's event loop.
+
+        :param coro: the coroutine to schedule
+        :return: a future for the result of the coroutine
+
+        The coroutine is scheduled from any thread, including the event loop's
+        own thread, without waiting for its result. Before the event loop runs
+        (or once it is closed), the coroutine runs to completion in a new
+        event loop instead.
+        """
+        if self._loop is None or self._loop.is_closed():
+            return super().run_coroutine(coro)
+
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
 
     # read/write
 
@@ -275,13 +319,44 @@ class AsyncioBackend(AbstractIRCBackend):
         except asyncio.CancelledError:
             LOGGER.debug('Writer was cancelled')
 
+    async def write_forever(self) -> None:
+        """Main writing loop of the backend.
+
+        This sends the lines queued by :meth:`irc_send` through the writer,
+        one at a time, until the task is cancelled. Lines with a higher
+        priority are sent first, and lines past their deadline (see
+        :attr:`~sopel.config.core_section.CoreSection.output_deadline`) are
+        dropped.
+
+        .. versionadded:: 8.1
+        """
+        self._send_ready = asyncio.Event()
+
+        while True:
+            if not self._send_queue:
+                self._send_ready.clear()
+                await self._send_ready.wait()
+                continue
+
+            priority, _, deadline, data = heapq.heappop(self._send_queue)
+            if deadline is not None and deadline < time.monotonic():
+                LOGGER.debug('Dropping stale line: %r', data)
+                continue
+
+            try:
+                await self.send(data)
+            except ConnectionError as err:
+                LOGGER.error('Connection error on write: %s', err)
+                break
+
     async def read_forever(self) -> None:
         """Main reading loop of the backend.
 
         This listens to the reader for an incoming IRC line, decodes the data,
         and passes it to
-        :meth:`bot.on_message(data) <sopel.irc.AbstractBot.on_message>`, until
-        the reader reaches the EOF (i.e. connection closed).
+        :meth:`bot.queue_message_async(data)
+        <sopel.irc.AbstractBot.queue_message_async>`,
+        until the reader reaches the EOF (i.e. connection closed).
 
         It manages connection timeouts by scheduling two tasks:
 
@@ -300,6 +375,12 @@ class AsyncioBackend(AbstractIRCBackend):
             The :meth:`~.decode_line` method is used to decode the IRC line
             from :class:`bytes` to :class:`str`.
 
+        .. versionchanged:: 8.1
+
+            Messages are queued for the bot's dispatcher thread instead of
+            being handled by the event loop. When the queue is full, the
+            event loop keeps running while this waits for a free slot.
+
         """
         if self._reader is None:
             raise RuntimeError(
@@ -337,7 +418,7 @@ class AsyncioBackend(AbstractIRCBackend):
 
             # use bot's callbacks
             try:
-                self.bot.on_message(data)
+                await self.bot.queue_message_async(data)
             except Exception:
                 LOGGER.exception('Unexpected exception on message handling.')
                 LOGGER.warning('Stopping the backend after error.')
@@ -492,6 +573,7 @@ class AsyncioBackend(AbstractIRCBackend):
         # on socket connection
         LOGGER.debug('Connection registered.')
         self._connected = True
+        self._write_task = asyncio.create_task(self.write_forever())
         self.bot.on_connect()
 
         # read forever
@@ -527,6 +609,10 @@ class AsyncioBackend(AbstractIRCBackend):
         # cancel timeout tasks
         self._cancel_timeout_tasks()
 
+        # nothing to write anymore
+        self._write_task.cancel()
+        self._send_queue.clear()
+
         # nothing to read anymore
         LOGGER.debug('Shutting down writer.')
         self._writer.close()
@@ -0,0 +1,495 @@
+"""Outbound message scheduling with flood protection.
+
+Sopel doesn't wait when a plugin sends a message: the message is queued for
+its recipient, and a single sender thread sends the queued messages as soon as
+the flood protection allows it, alternating between recipients so that a long
+output to one channel doesn't delay a reply to another.
+
+Outgoing lines also have a priority: protocol messages (such as ``PONG``,
+``CAP``, or ``WHO``) come first, then messages for admins, then everything
+else. Backends that queue outgoing lines must honor these priorities.
+
+.. versionadded:: 8.1
+
+.. important::
+
+    This is an internal tool used by Sopel to send messages. Plugins should
+    use :meth:`bot.say <sopel.bot.Sopel.say>` and similar methods instead.
+
+"""
+# Licensed under the Eiffel Forum License 2.
+from __future__ import annotations
+
+from collections import deque
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, NamedTuple, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sopel.irc import AbstractBot
+    from sopel.tools import identifiers
+
+
+LOGGER = logging.getLogger(__name__)
+
+PRIORITY_PROTOCOL = 0
+"""Priority of the messages required by the IRC protocol."""
+PRIORITY_ADMIN = 1
+"""Priority of the messages sent in response to a bot admin."""
+PRIORITY_NORMAL = 2
+"""Priority of every other message."""
+PROTOCOL_COMMANDS = frozenset((
+    'AUTHENTICATE',
+    'CAP',
+    'JOIN',
+    'MODE',
+    'NICK',
+    'PART',
+    'PASS',
+    'PING',
+    'PONG',
+    'USER',
+    'WHO',
+))
+"""IRC commands sent with the :data:`PRIORITY_PROTOCOL` priority."""
+
+
+def get_command_priority(command: str) -> int:
+    """Get the default priority of an IRC ``command``.
+
+    :param command: the IRC command (e.g. ``PRIVMSG``)
+    :return: :data:`PRIORITY_PROTOCOL` for the :data:`PROTOCOL_COMMANDS`, and
+             :data:`PRIORITY_NORMAL` otherwise
+    """
+    if command.upper() in PROTOCOL_COMMANDS:
+        return PRIORITY_PROTOCOL
+    return PRIORITY_NORMAL
+
+
+class QueuedMessage(NamedTuple):
+    """A message waiting in a queue, ordered by priority then by sequence."""
+    priority: int
+    """Priority of the message; the lower, the sooner it is sent."""
+    sequence: int
+    """Sequence number of the message, to keep messages in order."""
+    queued_at: float
+    """When the message was queued (monotonic clock)."""
+    recipient: str
+    """Recipient of the message."""
+    text: str
+    """Text of the message."""
+
+
+class OutboundStats(NamedTuple):
+    """Statistics of an :class:`OutboundScheduler`."""
+    queued: int
+    """Number of messages waiting in the queues."""
+    queued_by_recipient: dict[str, int]
+    """Number of messages waiting in the queue of each recipient."""
+    flood_wait_total: float
+    """Time spent by the sender thread waiting for the flood protection."""
+
+
+class OutboundScheduler:
+    """Send queued messages per recipient, with flood protection.
+
+    :param bot: the bot sending messages
+
+    Each recipient has its own queue and its own flood bucket, configured by
+    the ``flood_*`` options of the ``[core]`` section. Flood buckets start full
+    with ``flood_burst_lines`` tokens; a message consumes a token, and when the
+    bucket is empty it refills based on the time elapsed since the last message
+    sent to that recipient. Without any token, a message waits until
+    ``flood_empty_wait`` seconds (plus a penalty for long messages, up to
+    ``flood_max_wait``) have passed since the last message.
+
+    When a message can be sent right away and nothing is waiting for its
+    recipient, it is sent by the calling thread. Otherwise, it is queued and
+    a sender thread sends it later: recipients take turns, one message each,
+    so every one of them gets its messages as soon as its own bucket allows.
+
+    The anti-loop protection (the ``antiloop_*`` options) applies when a
+    message is actually sent.
+
+    Messages with a higher priority are sent first, both for a recipient and
+    between recipients. A queued message with the :data:`PRIORITY_NORMAL`
+    priority is dropped if it is still in the queue after ``output_deadline``
+    seconds (when set).
+    """
+    def __init__(self, bot: AbstractBot) -> None:
+        self._bot = bot
+        self._condition = threading.Condition(bot.sending)
+        self._queues: dict[identifiers.Identifier, list[QueuedMessage]] = {}
+        self._turns: deque[identifiers.Identifier] = deque()
+        self._sequence = itertools.count()
+        self._sender: threading.Thread | None = None
+        self._stopping = False
+        self._flood_wait_total = 0.0
+
+    def send(
+        self,
+        recipient: str,
+        text: str,
+        priority: int = PRIORITY_NORMAL,
+    ) -> None:
+        """Send or queue a ``PRIVMSG`` with ``text`` to ``recipient``.
+
+        :param recipient: the message recipient
+        :param text: the text to send; it must fit in a single message
+        :param priority: the priority of the message
+
+        This method never waits for the flood protection: if the message
+        can't be sent right away, it is queued for the sender thread.
+        """
+        with self._bot._defer_echo(), self._condition:
+            recipient_id = self._bot.make_identifier(recipient)
+            recipient_stack = self._get_recipient_stack(recipient_id)
+
+            if recipient_id not in self._queues:
+                now = time.time()
+                if self._get_ready_time(recipient_stack, text, now) <= now:
+                    self._send_message(
+                        recipient_stack, recipient, text, now, priority)
+                    return
+
+                self._queues[recipient_id] = []
+                self._turns.append(recipient_id)
+
+            heapq.heappush(self._queues[recipient_id], QueuedMessage(
+                priority,
+                next(self._sequence),
+                time.monotonic(),
+                recipient,
+                text,
+            ))
+            self._start_sender()
+            self._condition.notify_all()
+
+    def send_many(
+        self,
+        recipients: Iterable[str],
+        text: str,
+        priority: int = PRIORITY_NORMAL,
+        max_targets: int | None = 1,
+    ) -> None:
+        """Send the same ``text`` to several ``recipients``.
+
+        :param recipients: the message recipients
+        :param text: the text to send; it must fit in a single message for
+                     any of the ``recipients``
+        :param priority: the priority of the message
+        :param max_targets: the maximum number of targets per ``PRIVMSG``
+                            command; ``None`` for no limit
+
+        The recipients that can receive the message right away are grouped
+        into as few ``PRIVMSG`` commands as possible: each command has at most
+        ``max_targets`` targets, and the targets and the text must fit in a
+        single line. Each recipient's flood bucket is used as if the message
+        was sent to it alone.
+
+        The other recipients (the ones that must wait for the flood protection
+        or the anti-loop protection) get the message on its own, as with
+        :meth:`send`.
+        """
+        text_length = len(text.encode('utf-8'))
+
+        with self._bot._defer_echo(), self._condition:
+            now = time.time()
+            group: list[tuple[str, dict[str, Any]]] = []
+
+            for recipient in recipients:
+                recipient_id = self._bot.make_identifier(recipient)
+                recipient_stack = self._get_recipient_stack(recipient_id)
+                is_ready = (
+                    recipient_id not in self._queues
+                    and self._get_ready_time(
+                        recipient_stack, text, now) <= now
+                    and self._check_loop(recipient_stack, text, now) == text
+                )
+                if not is_ready:
+                    # can't be grouped: send it on its own
+                    self.send(recipient, text, priority)
+                    continue
+
+                targets = [name for name, _ in group] + [recipient]
+                if group and (
+                    (max_targets is not None and len(targets) > max_targets)
+                    or self._bot.safe_text_length(','.join(targets)) < text_length
+                ):
+                    self._send_group(group, text, priority)
+                    group = []
+
+                group.append((recipient, recipient_stack))
+
+            if group:
+                self._send_group(group, text, priority)
+
+    @property
+    def queued(self) -> int:
+        """Number of messages waiting in the queues."""
+        with self._condition:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def get_stats(self) -> OutboundStats:
+        """Get the current statistics of the queues.
+
+        :return: a snapshot of the queues and of the flood protection
+        """
+        with self._condition:
+            return OutboundStats(
+                sum(len(queue) for queue in self._queues.values()),
+                {
+                    str(recipient_id): len(queue)
+                    for recipient_id, queue in self._queues.items()
+                },
+                self._flood_wait_total,
+            )
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait until every queued message is sent.
+
+        :param timeout: optional timeout in seconds
+        :return: ``True`` if the queues are empty, ``False`` on timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queues, timeout=timeout)
+
+    def stop(self) -> None:
+        """Stop the sender thread and discard every queued message."""
+        with self._condition:
+            self._stopping = True
+            discarded = sum(len(queue) for queue in self._queues.values())
+            self._queues.clear()
+            self._turns.clear()
+            self._condition.notify_all()
+
+        if discarded:
+            LOGGER.warning('Discarding %d queued messages.', discarded)
+
+    def _get_recipient_stack(
+        self,
+        recipient_id: identifiers.Identifier,
+    ) -> dict[str, Any]:
+        return self._bot.stack.setdefault(recipient_id, {
+            'messages': deque(maxlen=10),
+            'flood_left': self._bot.settings.core.flood_burst_lines,
+        })
+
+    def _get_ready_time(
+        self,
+        recipient_stack: dict[str, Any],
+        text: str,
+        now: float,
+    ) -> float:
+        # must be called with the condition acquired
+        core = self._bot.settings.core
+        if recipient_stack['messages']:
+            last_time = recipient_stack['messages'][-1][0]
+        else:
+            # Default to a high enough value that we won't care.
+            # Five minutes should be enough not to matter anywhere below.
+            last_time = now - 300
+
+        # If flood bucket is empty, refill the appropriate number of lines
+        # based on how long it's been since our last message to recipient
+        if not recipient_stack['flood_left']:
+            recipient_stack['flood_left'] = min(
+                core.flood_burst_lines,
+                int(now - last_time) * core.flood_refill_rate)
+
+        if recipient_stack['flood_left']:
+            return now
+
+        penalty = 0.0
+        if core.flood_penalty_ratio > 0:
+            penalty_ratio = core.flood_text_length * core.flood_penalty_ratio
+            text_length_overflow = float(
+                max(0, len(text) - core.flood_text_length))
+            penalty = text_length_overflow / penalty_ratio
+
+        # Maximum wait time is 2 sec by default
+        wait = min(core.flood_empty_wait + penalty, core.flood_max_wait)
+        return last_time + wait
+
+    def _check_loop(
+        self,
+        recipient_stack: dict[str, Any],
+        text: str,
+        now: float,
+    ) -> str | None:
+        # must be called with the condition acquired
+        core = self._bot.settings.core
+        antiloop_threshold = min(10, core.antiloop_threshold)
+
+        if recipient_stack['messages']:
+            elapsed = now - recipient_stack['messages'][-1][0]
+        else:
+            elapsed = 300
+
+        # Loop detection
+        if antiloop_threshold > 0 and elapsed < core.antiloop_window:
+            messages = [m[1] for m in recipient_stack['messages']]
+
+            # If what we're about to send repeated at least N times
+            # in the anti-looping window, replace it
+            if messages.count(text) >= antiloop_threshold:
+                text = core.antiloop_repeat_text
+                if messages.count(text) >= core.antiloop_silent_after:
+                    # If we've already said that N times, discard message
+                    return None
+
+        return text
+
+    def _update_recipient_stack(
+        self,
+        recipient_stack: dict[str, Any],
+        text: str,
+    ) -> None:
+        # must be called with the condition acquired
+        flood_left = recipient_stack['flood_left'] - 1
+        recipient_stack['flood_left'] = max(0, flood_left)
+        recipient_stack['messages'].append((time.time(), text))
+
+    def _send_message(
+        self,
+        recipient_stack: dict[str, Any],
+        recipient: str,
+        text: str,
+        now: float,
+        priority: int = PRIORITY_NORMAL,
+    ) -> None:
+        # must be called with the condition acquired
+        checked_text = self._check_loop(recipient_stack, text, now)
+        if checked_text is None:
+            return
+
+        self._bot.backend.send_privmsg(
+            recipient, checked_text, priority=priority)
+        self._update_recipient_stack(recipient_stack, checked_text)
+
+    def _send_group(
+        self,
+        group: list[tuple[str, dict[str, Any]]],
+        text: str,
+        priority: int,
+    ) -> None:
+        # must be called with the condition acquired
+        self._bot.backend.send_privmsg(
+            ','.join(recipient for recipient, _ in group),
+            text,
+            priority=priority,
+        )
+        for _, recipient_stack in group:
+            self._update_recipient_stack(recipient_stack, text)
+
+    def _start_sender(self) -> None:
+        # must be called with the condition acquired
+        if self._sender is not None and self._sender.is_alive():
+            return
+
+        self._sender = threading.Thread(
+            target=self._send_forever,
+            name='sopel-outbound',
+            daemon=True,
+        )
+        self._sender.start()
+
+    def _drop_stale_messages(self) -> None:
+        # must be called with the condition acquired
+        deadline = self._bot.settings.core.output_deadline
+        if not deadline:
+            return
+
+        stale_time = time.monotonic() - deadline
+        for recipient_id in list(self._turns):
+            queue = self._queues[recipient_id]
+            stale = [
+                message for message in queue
+                if message.priority >= PRIORITY_NORMAL
+                and message.queued_at < stale_time
+            ]
+            if not stale:
+                continue
+
+            LOGGER.debug(
+                'Dropping %d stale messages for %s.',
+                len(stale), recipient_id)
+            queue[:] = [message for message in queue if message not in stale]
+            heapq.heapify(queue)
+            if not queue:
+                del self._queues[recipient_id]
+                self._turns.remove(recipient_id)
+
+    def _send_forever(self) -> None:
+        while self._send_next():
+            pass
+
+    def _send_next(self) -> bool:
+        # send the next ready message, or wait for one to be ready; return
+        # False once there is nothing left to send
+        # the echo of the message is dispatched once the condition is released
+        with self._bot._defer_echo(), self._condition:
+            if not self._stopping:
+                self._drop_stale_messages()
+            if self._stopping or not self._turns:
+                self._sender = None
+                # wake up the threads waiting for the queues to be empty
+                self._condition.notify_all()
+                return False
+
+            now = time.time()
+            next_time: float | None = None
+            selected: identifiers.Identifier | None = None
+            selected_priority = PRIORITY_NORMAL + 1
+
+            # recipients take turns: the first one ready is served, unless
+            # another ready recipient has a message with a higher priority
+            for recipient_id in self._turns:
+                message = self._queues[recipient_id][0]
+                ready_time = self._get_ready_time(
+                    self._bot.stack[recipient_id], message.text, now)
+                if ready_time <= now:
+                    if message.priority < selected_priority:
+                        selected = recipient_id
+                        selected_priority = message.priority
+                elif next_time is None or ready_time < next_time:
+                    next_time = ready_time
+
+            if selected is None:
+                # nobody is ready: wait for the first one
+                wait = max(0.0, (next_time or now) - now)
+                LOGGER.debug('Flood protection wait time: %.3fs.', wait)
+                waited_since = time.monotonic()
+                self._condition.wait(wait)
+                self._flood_wait_total += time.monotonic() - waited_since
+                return True
+
+            queue = self._queues[selected]
+            message = heapq.heappop(queue)
+            self._turns.remove(selected)
+            if queue:
+                # back in line for its next message
+                self._turns.append(selected)
+            else:
+                del self._queues[selected]
+
+            try:
+                self._send_message(
+                    self._bot.stack[selected],
+                    message.recipient,
+                    message.text,
+                    now,
+                    message.priority,
+                )
+            except Exception:
+                LOGGER.exception(
+                    'Unable to send a message to %s.', message.recipient)
+
+            return True
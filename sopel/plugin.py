@@ -250,10 +250,21 @@ def unblockable(function=None):
     return decorator
 
 
-def interval(*intervals: int | float) -> TypedJobDecorator:
+def interval(
+    *intervals: int | float,
+    overlap: Literal['skip', 'queue', 'coalesce'] | None = None,
+    jitter: float | None = None,
+) -> TypedJobDecorator:
     """Decorate a function to be called by the bot every *n* seconds.
 
     :param intervals: one or more duration(s), in seconds
+    :param overlap: what to do when the function is still running at its next
+                    tick; one of ``skip``, ``queue``, or ``coalesce``
+                    (the default)
+    :param jitter: maximum random delay (in seconds) before the first call;
+                   defaults to the
+                   :attr:`~sopel.config.core_section.CoreSection.job_jitter`
+                   setting
 
     This decorator can be used multiple times for multiple intervals, or
     multiple intervals can be given in multiple arguments. The first time the
@@ -276,6 +287,31 @@ def interval(*intervals: int | float) -> TypedJobDecorator:
             if "#here" in bot.channels:
                 bot.say("It has been five seconds!", "#here")
 
+    A function is never called again while it's still running. When it runs
+    for longer than its interval, the ``overlap`` policy decides what happens
+    to the ticks that came in the meantime:
+
+    * ``skip``: they are skipped, and the function waits for its next tick
+    * ``queue``: the function is called once more right away, and then
+      follows its original schedule
+    * ``coalesce``: the function is called once more right away, and its
+      schedule restarts from there
+
+    Jobs that share an interval are called at the same time; a ``jitter``
+    spreads them by delaying each first call by a random amount of time::
+
+        @plugin.interval(60, overlap='skip', jitter=30)
+        def check_feeds(bot):
+            ...
+
+    .. versionchanged:: 8.1
+
+        Intervals can be shorter than a second (e.g. ``0.5``).
+
+    .. versionchanged:: 8.1
+
+        The ``overlap`` and ``jitter`` parameters have been added.
+
     """
     def decorator(
         function: TypedPluginJobHandler | AbstractPluginObject,
@@ -286,6 +322,12 @@ def interval(*intervals: int | float) -> TypedJobDecorator:
             if arg not in handler.intervals:
                 handler.intervals.append(arg)
 
+        if overlap is not None:
+            handler.overlap = overlap
+
+        if jitter is not None:
+            handler.jitter = jitter
+
         return handler
 
     return decorator
@@ -248,6 +248,19 @@ class AbstractPluginObject(abc.ABC):
     def __init__(self, handler: Callable) -> None:
         ...
 
+    @property
+    def is_async(self) -> bool:
+        """Check if the handler is a coroutine function.
+
+        :return: ``True`` if the handler is defined with ``async def``
+
+        Decorated handlers are unwrapped (see :func:`inspect.unwrap`) to check
+        the original function.
+
+        .. versionadded:: 8.1
+        """
+        return inspect.iscoroutinefunction(inspect.unwrap(self.get_handler()))
+
     @abc.abstractmethod
     def get_handler(self) -> Callable:
         """Return this plugin object's handler.
@@ -809,6 +822,8 @@ class PluginJob(AbstractPluginObject):
 
         # job
         self.intervals: list = []
+        self.overlap: str | None = None
+        self.jitter: float | None = None
 
     def __call__(self, bot: Sopel, *args: Any, **kwargs: Any) -> Any:
         return self._handler(bot, *args, **kwargs)
@@ -16,7 +16,6 @@
 # Licensed under the Eiffel Forum License 2.
 from __future__ import annotations
 
-import itertools
 import logging
 
 from sopel import tools
@@ -31,6 +30,11 @@ class Scheduler(jobs.Scheduler):
 
     :param manager: bot instance passed to jobs as argument
     :type manager: :class:`sopel.bot.Sopel`
+    :param stats: optional registry to record the jobs' execution statistics
+    :type stats: :class:`sopel.tools.stats.StatsRegistry`
+    :param watchdog: optional watchdog to report jobs blocking their thread
+    :type watchdog: :class:`sopel.tools.watchdog.Watchdog`
+    :param int max_workers: maximum number of threads executing threaded jobs
 
     Scheduler that stores plugin jobs and behaves like its
     :class:`parent class <sopel.tools.jobs.Scheduler>`.
@@ -50,14 +54,20 @@ class Scheduler(jobs.Scheduler):
         a job, plugin authors should use :func:`sopel.plugin.interval`.
 
     """
-    def __init__(self, manager):
-        super().__init__(manager)
+    def __init__(self, manager, stats=None, watchdog=None, max_workers=8):
+        super().__init__(
+            manager,
+            stats=stats,
+            watchdog=watchdog,
+            max_workers=max_workers,
+        )
         # NOTE:the annotation and type-ignore here resolves conflict with the same attribute on the base class
         self._jobs: tools.SopelMemoryWithDefault = tools.SopelMemoryWithDefault(list)  # type: ignore[assignment]
 
     def register(self, job):
         with self._mutex:
             self._jobs[job.get_plugin_name()].append(job)
+            self._schedule(job)
         LOGGER.debug('Job registered: %s', str(job))
 
     def unregister_plugin(self, plugin_name):
@@ -75,6 +85,8 @@ class Scheduler(jobs.Scheduler):
         unregistered_jobs = 0
         with self._mutex:
             jobs_count = len(self._jobs[plugin_name])
+            for job in self._jobs[plugin_name]:
+                self._unschedule(job)
             del self._jobs[plugin_name]
             unregistered_jobs = unregistered_jobs + jobs_count
 
@@ -88,6 +100,7 @@ class Scheduler(jobs.Scheduler):
     def clear_jobs(self):
         with self._mutex:
             self._jobs = tools.SopelMemoryWithDefault(list)
+            self._unschedule_all()
 
         LOGGER.debug('Successfully unregistered all jobs')
 
@@ -97,16 +110,29 @@ class Scheduler(jobs.Scheduler):
             return
 
         with self._mutex:
+            for job in self._jobs[plugin_name]:
+                if job._handler == callable:
+                    self._unschedule(job)
             self._jobs[plugin_name] = [
                 job for job in self._jobs[plugin_name]
                 if job._handler != callable
             ]
 
-    def _get_ready_jobs(self, now):
-        with self._mutex:
-            jobs = [
-                job for job in itertools.chain(*self._jobs.values())
-                if job.is_ready_to_run(now)
-            ]
+    def _run_coroutine(self, coro):
+        """Run the coroutine of an asynchronous job on the bot's event loop.
+
+        :param coro: the coroutine to run
+
+        .. seealso::
+
+            The :meth:`sopel.irc.AbstractBot.run_coroutine` method is used to
+            run the coroutine.
+
+        .. versionadded:: 8.1
+        """
+        if getattr(self.manager, 'backend', None) is None:
+            # not connected yet: no event loop to run the coroutine on
+            super()._run_coroutine(coro)
+            return
 
-        return jobs
+        self.manager.run_coroutine(coro)
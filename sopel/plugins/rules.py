@@ -17,13 +17,19 @@
 from __future__ import annotations
 
 import abc
+from ast import literal_eval
+import collections
 import datetime
+import inspect
 import itertools
 import logging
 import re
+import sys
 import threading
+import time
 from typing import (
     Any,
+    NamedTuple,
     Type,
     TYPE_CHECKING,
     TypeVar,
@@ -38,8 +44,14 @@ from sopel.config.core_section import (
 )
 
 
+if sys.version_info >= (3, 11):
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+else:
+    import sre_parse
+
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
 
     from sopel.bot import Sopel
     from sopel.config import Config
@@ -49,7 +61,9 @@ if TYPE_CHECKING:
 
 
 __all__ = [
+    'ChannelPolicy',
     'Manager',
+    'RateLimitStore',
     'Rule',
     'FindRule',
     'SearchRule',
@@ -89,6 +103,13 @@ PRIORITY_SCALES = {
     PRIORITY_LOW: 1000,
 }
 """Mapping of priority label to priority scale."""
+EVENT_INDEX_MAX_SIZE = 512
+"""Maximum number of ``(event, ctcp)`` entries kept in a manager's index.
+
+IRC events are a small, closed set, but CTCP commands are chosen by whoever
+sends the message. Once the index is full, rules for unseen keys are still
+looked up, but the result is not stored.
+"""
 
 
 def _clean_rules(
@@ -162,6 +183,191 @@ def _has_named_rule(
     return has_name or (follow_alias and any(aliases))
 
 
+def _is_async_handler(handler: Callable) -> bool:
+    # plugin objects know if their handler is a coroutine function
+    is_async = getattr(handler, 'is_async', None)
+    if isinstance(is_async, bool):
+        return is_async
+    return inspect.iscoroutinefunction(inspect.unwrap(handler))
+
+
+def _iter_required_chars(items: Iterable) -> Iterator[str | None]:
+    # yield the ASCII characters required by a parsed regex, in order, with
+    # ``None`` whenever two characters are not guaranteed to be adjacent
+    for op, av in items:
+        name = str(op)
+        if name == 'LITERAL' and av < 128:
+            yield chr(av)
+        elif name == 'AT':
+            # zero-width assertions don't break a run of characters
+            continue
+        elif name == 'SUBPATTERN':
+            yield from _iter_required_chars(av[-1])
+        elif name == 'ATOMIC_GROUP':
+            yield from _iter_required_chars(av)
+        elif name.endswith('_REPEAT') and av[0] >= 1:
+            # the repeated items are required at least once, but they are not
+            # adjacent to what comes before or after them
+            yield None
+            yield from _iter_required_chars(av[2])
+            yield None
+        else:
+            yield None
+
+
+def _get_required_literal(regex: re.Pattern) -> str | None:
+    """Get the longest literal required by ``regex`` to match anything.
+
+    :param regex: a compiled regex
+    :return: the longest ASCII literal that any text must contain to be
+             matched by ``regex``, or ``None`` if there is no such literal
+    """
+    if not isinstance(regex.pattern, str):
+        return None
+
+    try:
+        parsed = sre_parse.parse(regex.pattern, regex.flags)
+    except re.error:
+        return None
+
+    longest = ''
+    run: list[str] = []
+    for char in itertools.chain(_iter_required_chars(parsed), [None]):
+        if char is not None:
+            run.append(char)
+            continue
+
+        if len(run) > len(longest):
+            longest = ''.join(run)
+        run = []
+
+    return longest or None
+
+
+def _get_prefilter_literals(rule: Rule) -> frozenset[str] | None:
+    # only these rules are known to match their regexes against the text of
+    # the line, without any other side effect; subclasses may override
+    # ``parse`` and must be matched against every line
+    if type(rule) not in (Rule, FindRule, SearchRule):
+        return None
+
+    literals = set()
+    for regex in rule._regexes:
+        literal = _get_required_literal(regex)
+        if literal is None:
+            # catch-all regex: the rule must be matched against every line
+            return None
+        literals.add(literal.lower())
+
+    return frozenset(literals) or None
+
+
+class _EventRules(NamedTuple):
+    """Rules listening to the same IRC event and CTCP command."""
+    rules: tuple[AbstractRule, ...]
+    """All the rules, sorted by priorities."""
+    generic: tuple[AbstractRule, ...]
+    """Rules that must be matched against every line, sorted by priorities."""
+    dispatchers: tuple[
+        tuple[re.Pattern, dict[str, list[AbstractRule]], list[AbstractRule]],
+        ...,
+    ]
+    """Dispatch regexes, each with its map of casefolded names to rules.
+
+    Each dispatch regex also comes with all of its rules, sorted by
+    priorities, for the lines that don't invoke a name from its map.
+    """
+    scanner: re.Pattern | None
+    """Regex that finds the required literals of prefiltered rules, if any.
+
+    Each literal has its own group in the regex.
+    """
+    scanned_rules: tuple[frozenset[AbstractRule], ...]
+    """Prefiltered rules to match for each group of :attr:`scanner`.
+
+    When a literal is found, all the literals it contains are found as well,
+    so each item includes the rules of these literals too.
+    """
+    order: dict[AbstractRule, int]
+    """Position of each rule in :attr:`rules`."""
+
+
+class ChannelPolicy(NamedTuple):
+    """Plugins and rules disabled in a channel.
+
+    A channel's policy comes from the ``disable_plugins`` and
+    ``disable_commands`` options of its own section in the configuration::
+
+        [#channel]
+        disable_plugins = plugin1,plugin2
+        disable_commands = {'plugin3': ['rule_label']}
+
+    Using ``*`` in ``disable_plugins`` disables every plugin. The rules of the
+    ``coretasks`` internal plugin can't be disabled.
+
+    .. versionadded:: 8.1
+    """
+    disabled_plugins: frozenset[str]
+    """Names of the disabled plugins, or ``*`` for all of them."""
+    disabled_commands: dict[str, frozenset[str]]
+    """Labels of the disabled rules, by plugin name."""
+
+    @classmethod
+    def from_options(
+        cls,
+        disable_plugins: Any,
+        disable_commands: Any,
+    ) -> ChannelPolicy:
+        """Parse the ``disable_plugins`` and ``disable_commands`` options.
+
+        :param disable_plugins: the raw value of the ``disable_plugins``
+                                option, if any
+        :param disable_commands: the raw value of the ``disable_commands``
+                                 option, if any
+        :return: the parsed policy
+        """
+        disabled_plugins: frozenset[str] = frozenset()
+        if isinstance(disable_plugins, str):
+            disabled_plugins = frozenset(disable_plugins.split(','))
+
+        disabled_commands: dict[str, frozenset[str]] = {}
+        if isinstance(disable_commands, str):
+            try:
+                commands = literal_eval(disable_commands)
+                disabled_commands = {
+                    plugin_name: frozenset(labels)
+                    for plugin_name, labels in commands.items()
+                }
+            except (ValueError, TypeError, SyntaxError, AttributeError):
+                LOGGER.warning(
+                    'Invalid disable_commands value: %r', disable_commands)
+
+        return cls(disabled_plugins, disabled_commands)
+
+    def allows(self, rule: AbstractRule) -> bool:
+        """Tell if the ``rule`` can be executed in the channel.
+
+        :param rule: the rule to check
+        :return: ``False`` if the rule's plugin or the rule itself is disabled
+        """
+        plugin_name = rule.get_plugin_name()
+
+        # disable listed plugins completely on provided channel
+        if '*' in self.disabled_plugins or plugin_name in self.disabled_plugins:
+            if plugin_name != 'coretasks':
+                return False
+            LOGGER.debug("disable_plugins refuses to skip a coretasks handler")
+
+        # disable chosen methods from plugins
+        labels = self.disabled_commands.get(plugin_name)
+        if labels and rule.get_rule_label() in labels:
+            if plugin_name != 'coretasks':
+                return False
+            LOGGER.debug("disable_commands refuses to skip a coretasks handler")
+
+        return True
+
+
 def _clean_callable_examples(examples: Iterable[dict]) -> tuple[dict, ...]:
     valid_keys = [
         # message
@@ -202,6 +408,23 @@ class Manager:
     Then to match the rules against a ``trigger``, see the
     :meth:`get_triggered_rules`, which returns a list of ``(rule, match)``,
     sorted by priorities (high first, medium second, and low last).
+
+    Internally, the manager keeps an index of rules by IRC event and CTCP
+    command, so that matching a line only considers the rules that listen to
+    its event. In that index, named rules that provide a
+    :meth:`dispatch regex <AbstractNamedRule.get_dispatch_regex>` are stored
+    in dispatch tables by name and alias, so a line is matched only against
+    the commands it could invoke.
+
+    Likewise, the regexes of generic rules (from :class:`Rule`,
+    :class:`FindRule`, and :class:`SearchRule`) are inspected at registration
+    time to extract the literal text they require to match. A line is scanned
+    once for all these literals, and a rule is matched against the line only
+    if its literals are found. Rules with a catch-all regex (such as ``.*``)
+    are always matched.
+
+    This index is rebuilt lazily whenever a rule is registered or a plugin is
+    unregistered.
     """
     def __init__(self):
         self._rules = tools.SopelMemoryWithDefault(list)
@@ -210,6 +433,12 @@ class Manager:
         self._action_commands = tools.SopelMemoryWithDefault(dict)
         self._url_callbacks = tools.SopelMemoryWithDefault(list)
         self._register_lock = threading.Lock()
+        self._event_index: dict[tuple[str, str | None], _EventRules] = {}
+        self._prefilter_literals: dict[
+            AbstractRule,
+            frozenset[str] | None,
+        ] = {}
+        self._channel_policies: dict[tuple[Any, Any], ChannelPolicy] = {}
 
     def unregister_plugin(self, plugin_name: str) -> int:
         """Unregister all the rules from a plugin.
@@ -234,6 +463,13 @@ class Manager:
                 rules_count = len(registry[plugin_name])
                 del registry[plugin_name]
                 unregistered_rules = unregistered_rules + rules_count
+            self._prefilter_literals = {
+                rule: literals
+                for rule, literals in self._prefilter_literals.items()
+                if rule.get_plugin_name() != plugin_name
+            }
+            self._channel_policies = {}
+            self._event_index = {}
 
         LOGGER.debug(
             '[%s] Successfully unregistered %d rules',
@@ -247,8 +483,11 @@ class Manager:
 
         :param rule: the rule to register
         """
+        literals = _get_prefilter_literals(rule)
         with self._register_lock:
             self._rules[rule.get_plugin_name()].append(rule)
+            self._prefilter_literals[rule] = literals
+            self._event_index = {}
         LOGGER.debug('Rule registered: %s', str(rule))
 
     def register_command(self, command: Command) -> None:
@@ -259,6 +498,7 @@ class Manager:
         with self._register_lock:
             plugin = command.get_plugin_name()
             self._commands[plugin][command.name] = command
+            self._event_index = {}
         LOGGER.debug('Command registered: %s', str(command))
 
     def register_nick_command(self, command: NickCommand) -> None:
@@ -269,6 +509,7 @@ class Manager:
         with self._register_lock:
             plugin = command.get_plugin_name()
             self._nick_commands[plugin][command.name] = command
+            self._event_index = {}
         LOGGER.debug('Nick Command registered: %s', str(command))
 
     def register_action_command(self, command: NickCommand) -> None:
@@ -280,6 +521,7 @@ class Manager:
         with self._register_lock:
             plugin = command.get_plugin_name()
             self._action_commands[plugin][command.name] = command
+            self._event_index = {}
         LOGGER.debug('Action Command registered: %s', str(command))
 
     def register_url_callback(self, url_callback: URLCallback) -> None:
@@ -291,6 +533,7 @@ class Manager:
         with self._register_lock:
             plugin = url_callback.get_plugin_name()
             self._url_callbacks[plugin].append(url_callback)
+            self._event_index = {}
         LOGGER.debug('URL callback registered: %s', str(url_callback))
 
     def has_rule(self, label: str, plugin: str | None = None) -> bool:
@@ -438,6 +681,23 @@ class Manager:
         # expose a copy of the registered generic rules
         return self._url_callbacks.items()
 
+    def get_rate_limit_size(self) -> int:
+        """Get the number of rate limit metrics kept by all the rules.
+
+        :return: the total number of user and channel metrics stored for
+                 rate limiting
+
+        This is meant for monitoring: these metrics are evicted once they
+        are older than their rule's longest rate limit.
+
+        .. versionadded:: 8.1
+        """
+        return sum(
+            rule.get_rate_limit_size()
+            for rule in self._iter_rules()
+            if isinstance(rule, Rule)
+        )
+
     def get_triggered_rules(
         self,
         bot: Sopel,
@@ -452,6 +712,101 @@ class Manager:
         :return: a tuple of ``(rule, match)``, sorted by priorities
         :rtype: tuple
         """
+        event_rules = self._get_event_index(pretrigger.event, pretrigger.ctcp)
+        rules: list[AbstractRule] = list(event_rules.generic)
+        args = pretrigger.args
+        text = args[-1] if args else ''
+        selected = False
+
+        if event_rules.scanner is not None:
+            found = set(
+                result.lastindex
+                for result in event_rules.scanner.finditer(text)
+                if result.lastindex
+            )
+            if found:
+                scanned_rules = event_rules.scanned_rules
+                rules.extend(frozenset().union(*(
+                    scanned_rules[index - 1] for index in found
+                )))
+                selected = True
+
+        for dispatch_regex, named_rules, dispatch_rules in (
+            event_rules.dispatchers
+        ):
+            result = dispatch_regex.match(text)
+            if result:
+                name = result.group(1).casefold()
+                # a prefix that can match more than one way (such as
+                # ``\.|\.\.``) may capture more than the name: the rules
+                # must then be matched as they would without dispatch
+                rules.extend(named_rules.get(name, dispatch_rules))
+                selected = True
+
+        if selected:
+            # restore the priority order of the indexed rules
+            rules.sort(key=event_rules.order.__getitem__)
+
+        # skip the rules that can't be executed in this channel
+        policy = self.get_channel_policy(bot.settings, pretrigger.sender)
+        if policy is not None:
+            rules = [rule for rule in rules if policy.allows(rule)]
+
+        matches = (
+            (rule, match)
+            for rule in rules
+            for match in rule.match(bot, pretrigger)
+        )
+        # Returning a tuple instead of a lazy object ensures that:
+        #   1. it's not a lazy object
+        #   2. it's an immutable iterable
+        # We can't accept lazy evaluation or yield results; it has to be a
+        # static list of (rule/match), otherwise Python will raise an error
+        # if any rule execution tries to alter the list of registered rules.
+        # Making it immutable is the cherry on top.
+        # Indexed rules are already sorted by priority, and each rule yields
+        # its matches in a row, so the result is sorted as well.
+        return tuple(matches)
+
+    def get_channel_policy(
+        self,
+        settings: Config,
+        channel: Identifier | None,
+    ) -> ChannelPolicy | None:
+        """Get the plugins and rules disabled in a ``channel``.
+
+        :param settings: the bot's settings
+        :param channel: the channel (or the nick for a private message)
+        :return: the channel's policy, or ``None`` if nothing can be disabled
+                 in this ``channel``
+
+        Policies are parsed once and kept by the manager for as long as the
+        channel's options don't change, so checking a rule against a policy
+        doesn't parse anything.
+
+        .. versionadded:: 8.1
+        """
+        if not channel or channel.is_nick() or channel not in settings:
+            return None
+
+        section = settings[channel]
+        options = (
+            getattr(section, 'disable_plugins', None),
+            getattr(section, 'disable_commands', None),
+        )
+        if options == (None, None):
+            return None
+
+        policy = self._channel_policies.get(options)
+        if policy is None:
+            policy = ChannelPolicy.from_options(*options)
+            self._channel_policies[options] = policy
+
+        return policy
+
+    def _iter_rules(self) -> Iterable[AbstractRule]:
+        # all rules in registration order: generic rules, commands,
+        # nick commands, action commands, and URL callbacks
         generic_rules = self._rules.values()
         command_rules = (
             rules_dict.values()
@@ -464,26 +819,122 @@ class Manager:
             for rules_dict in self._action_commands.values())
         url_callback_rules = self._url_callbacks.values()
 
-        rules = itertools.chain(
+        return itertools.chain(
             itertools.chain(*generic_rules),
             itertools.chain(*command_rules),
             itertools.chain(*nick_rules),
             itertools.chain(*action_rules),
             itertools.chain(*url_callback_rules),
         )
-        matches = (
-            (rule, match)
-            for rule in rules
-            for match in rule.match(bot, pretrigger)
-        )
-        # Returning a tuple instead of a sorted object ensures that:
-        #   1. it's not a lazy object
-        #   2. it's an immutable iterable
-        # We can't accept lazy evaluation or yield results; it has to be a
-        # static list of (rule/match), otherwise Python will raise an error
-        # if any rule execution tries to alter the list of registered rules.
-        # Making it immutable is the cherry on top.
-        return tuple(sorted(matches, key=lambda x: x[0].priority_scale))
+
+    def _get_event_rules(
+        self,
+        event: str,
+        ctcp: str | None,
+    ) -> tuple[AbstractRule, ...]:
+        """Get the rules listening to ``event`` and ``ctcp``.
+
+        :param event: the IRC event of a line
+        :param ctcp: the CTCP command of a line, if any
+        :return: a tuple of rules, sorted by priorities
+        """
+        return self._get_event_index(event, ctcp).rules
+
+    def _get_event_index(self, event: str, ctcp: str | None) -> _EventRules:
+        """Get the indexed rules for ``event`` and ``ctcp``.
+
+        :param event: the IRC event of a line
+        :param ctcp: the CTCP command of a line, if any
+        :return: the rules listening to ``event`` and ``ctcp``
+
+        Rules are selected with their :meth:`~AbstractRule.match_event` and
+        :meth:`~AbstractRule.match_ctcp` methods, then stored in the index
+        until the next registration change.
+        """
+        key = (event, ctcp)
+        event_rules = self._event_index.get(key)
+        if event_rules is not None:
+            return event_rules
+
+        with self._register_lock:
+            rules = tuple(sorted(
+                (
+                    rule for rule in self._iter_rules()
+                    if rule.match_event(event) and rule.match_ctcp(ctcp)
+                ),
+                key=lambda rule: rule.priority_scale,
+            ))
+            generic: list[AbstractRule] = []
+            literal_rules: dict[str, list[AbstractRule]] = {}
+            dispatchers: dict[
+                tuple[str, int],
+                tuple[
+                    re.Pattern,
+                    dict[str, list[AbstractRule]],
+                    list[AbstractRule],
+                ],
+            ] = {}
+
+            for rule in rules:
+                if not isinstance(rule, AbstractNamedRule):
+                    rule_literals = self._prefilter_literals.get(rule)
+                    if rule_literals is None:
+                        generic.append(rule)
+                        continue
+
+                    for literal in rule_literals:
+                        literal_rules.setdefault(literal, []).append(rule)
+                    continue
+
+                dispatch_regex = rule.get_dispatch_regex()
+                if dispatch_regex is None:
+                    generic.append(rule)
+                    continue
+
+                _, named_rules, dispatch_rules = dispatchers.setdefault(
+                    (dispatch_regex.pattern, dispatch_regex.flags),
+                    (dispatch_regex, {}, []),
+                )
+                dispatch_rules.append(rule)
+                for name in (rule.name, *rule.aliases):
+                    name_rules = named_rules.setdefault(name.casefold(), [])
+                    # an alias can be the name (or another alias) in a
+                    # different case: the rule must be listed only once
+                    if rule not in name_rules:
+                        name_rules.append(rule)
+
+            scanner: re.Pattern | None = None
+            scanned_rules: list[frozenset[AbstractRule]] = []
+            if literal_rules:
+                # longest literals first, as only one literal can be found at
+                # any given position of the text
+                literals = sorted(literal_rules, key=len, reverse=True)
+                scanner = re.compile(
+                    '(?=%s)' % '|'.join(
+                        '(%s)' % re.escape(literal) for literal in literals),
+                    re.IGNORECASE,
+                )
+                scanned_rules = [
+                    frozenset(
+                        rule
+                        for other in literals if other in literal
+                        for rule in literal_rules[other]
+                    )
+                    for literal in literals
+                ]
+
+            event_rules = _EventRules(
+                rules=rules,
+                generic=tuple(generic),
+                dispatchers=tuple(dispatchers.values()),
+                scanner=scanner,
+                scanned_rules=tuple(scanned_rules),
+                order=dict((rule, index) for index, rule in enumerate(rules)),
+            )
+            if len(self._event_index) < EVENT_INDEX_MAX_SIZE:
+                self._event_index[key] = event_rules
+
+        return event_rules
 
     def check_url_callback(self, bot, url):
         """Tell if the ``url`` matches any of the registered URL callbacks.
@@ -502,49 +953,118 @@ class Manager:
         )
 
 
+def _to_monotonic(value: datetime.datetime) -> float:
+    """Convert an aware ``datetime`` into a :func:`time.monotonic` value."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return time.monotonic() - (now - value).total_seconds()
+
+
+def _to_datetime(value: float) -> datetime.datetime:
+    """Convert a :func:`time.monotonic` value into an aware ``datetime``."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return now - datetime.timedelta(seconds=time.monotonic() - value)
+
+
 class RuleMetrics:
-    """Tracker of a rule's usage."""
+    """Tracker of a rule's usage.
+
+    .. versionchanged:: 8.1
+
+        Times are recorded with :func:`time.monotonic`; :attr:`started_at`,
+        :attr:`ended_at`, and :attr:`last_time` are computed from them.
+
+    """
     def __init__(self) -> None:
-        self.started_at: datetime.datetime | None = None
-        self.ended_at: datetime.datetime | None = None
+        self.started_time: float | None = None
+        """Monotonic time of the last start."""
+        self.ended_time: float | None = None
+        """Monotonic time of the last end."""
         self.last_return_value: Any = None
 
-    def start(self) -> None:
-        """Record a starting time (before execution)."""
-        self.started_at = datetime.datetime.now(datetime.timezone.utc)
+    def start(self, at_time: float | None = None) -> None:
+        """Record a starting time (before execution).
+
+        :param at_time: monotonic time to record (optional; now by default)
+        """
+        self.started_time = time.monotonic() if at_time is None else at_time
 
-    def end(self) -> None:
-        """Record a ending time (after execution)."""
-        self.ended_at = datetime.datetime.now(datetime.timezone.utc)
+    def end(self, at_time: float | None = None) -> None:
+        """Record a ending time (after execution).
+
+        :param at_time: monotonic time to record (optional; now by default)
+        """
+        self.ended_time = time.monotonic() if at_time is None else at_time
 
     def set_return_value(self, value: Any) -> None:
         """Set the last return value of a rule."""
         self.last_return_value = value
 
     @property
-    def last_time(self) -> datetime.datetime | None:
-        """Last recorded start/end time for the associated rule."""
+    def started_at(self) -> datetime.datetime | None:
+        """Last recorded start time, as an aware datetime."""
+        if self.started_time is None:
+            return None
+        return _to_datetime(self.started_time)
+
+    @property
+    def ended_at(self) -> datetime.datetime | None:
+        """Last recorded end time, as an aware datetime."""
+        if self.ended_time is None:
+            return None
+        return _to_datetime(self.ended_time)
+
+    @property
+    def is_running(self) -> bool:
+        """Tell if the associated rule started but didn't end yet."""
+        if self.started_time is None:
+            return False
+        return self.ended_time is None or self.started_time > self.ended_time
+
+    @property
+    def last_monotonic(self) -> float | None:
+        """Last recorded start/end monotonic time for the associated rule."""
         # detect if we just started something or if it ended
-        if (self.started_at and self.ended_at) and (self.started_at < self.ended_at):
-            return self.ended_at
+        if self.started_time is None or self.is_running:
+            return self.started_time
 
-        return self.started_at
+        return self.ended_time
+
+    @property
+    def last_time(self) -> datetime.datetime | None:
+        """Last recorded start/end time for the associated rule."""
+        last = self.last_monotonic
+        if last is None:
+            return None
+        return _to_datetime(last)
 
     def is_limited(
         self,
-        time_limit: datetime.datetime,
+        time_limit: datetime.datetime | float,
     ) -> bool:
-        """Determine if the rule hits the time limit."""
-        if not self.started_at:
+        """Determine if the rule hits the time limit.
+
+        :param time_limit: an aware datetime, or a monotonic time
+        :return: ``True`` if the rule was used after ``time_limit``
+
+        .. versionchanged:: 8.1
+
+            The ``time_limit`` can be a monotonic time.
+
+        """
+        last = self.last_monotonic
+        if last is None:
             # not even started, so not limited
             return False
 
-        if self.ended_at and self.started_at < self.ended_at:
+        if not self.is_running:
             # since it ended, check the return value
             if self.last_return_value == IGNORE_RATE_LIMIT:
                 return False
 
-        return self.last_time > time_limit if self.last_time else False
+        if isinstance(time_limit, datetime.datetime):
+            time_limit = _to_monotonic(time_limit)
+
+        return last > time_limit
 
     def __enter__(self) -> RuleMetrics:
         self.start()
@@ -559,6 +1079,103 @@ class RuleMetrics:
         self.end()
 
 
+class RateLimitStore:
+    """Store of :class:`RuleMetrics` by nick or channel, for rate limiting.
+
+    :param ttl: how long (in seconds) metrics are kept after their last use
+
+    Metrics that are not running and have not been used for ``ttl`` seconds
+    can't rate limit anything anymore, so they are evicted when new metrics
+    are used; running metrics are kept, without preventing the eviction of
+    the others. This keeps the store from growing with every nick and channel
+    that ever used a rule.
+
+    The number of metrics currently stored is given by ``len(store)``.
+
+    .. versionadded:: 8.1
+    """
+    def __init__(self, ttl: float) -> None:
+        self.ttl: float = max(0.0, ttl)
+        """How long (in seconds) metrics are kept after their last use."""
+        # ordered from the least to the most recently used
+        self._metrics: collections.OrderedDict[
+            Any,
+            RuleMetrics,
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._metrics)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._metrics
+
+    def get(self, key: Any) -> RuleMetrics | None:
+        """Get the metrics stored for ``key``.
+
+        :param key: the nick or channel of the metrics
+        :return: the metrics if stored, ``None`` otherwise
+        """
+        return self._metrics.get(key)
+
+    def items(self) -> list[tuple[Any, RuleMetrics]]:
+        """Get the stored metrics, by nick or channel.
+
+        :return: a snapshot of the stored metrics, from the least to the most
+                 recently used
+        """
+        with self._lock:
+            return list(self._metrics.items())
+
+    def use(self, key: Any) -> RuleMetrics:
+        """Get the metrics for ``key`` for a new use.
+
+        :param key: the nick or channel of the metrics
+        :return: the stored metrics, or new metrics if none are stored
+
+        Expired metrics are evicted first, then the metrics for ``key`` are
+        marked as the most recently used.
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+            metrics = self._metrics.get(key)
+            if metrics is None:
+                metrics = self._metrics[key] = RuleMetrics()
+            else:
+                self._metrics.move_to_end(key)
+            return metrics
+
+    def evict(self) -> int:
+        """Evict expired metrics.
+
+        :return: the number of evicted metrics
+        """
+        with self._lock:
+            return self._evict(time.monotonic())
+
+    def _evict(self, now: float) -> int:
+        limit = now - self.ttl
+        expired = []
+        for key, metrics in self._metrics.items():
+            last = metrics.last_monotonic
+            if last is not None and last > limit:
+                # not expired yet, and the next ones were used after it
+                break
+            if last is None or metrics.is_running:
+                # not used yet, or still in use: look at the next ones
+                continue
+            expired.append(key)
+
+        for key in expired:
+            del self._metrics[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove all metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+
 class AbstractRule(abc.ABC):
     """Abstract definition of a plugin's rule.
 
@@ -758,6 +1375,20 @@ class AbstractRule(abc.ABC):
         :rtype: bool
         """
 
+    def is_async(self) -> bool:
+        """Tell if the rule's execution is a coroutine.
+
+        :return: ``True`` if the rule must be executed with
+                 :meth:`execute_async` on the bot's event loop,
+                 ``False`` otherwise
+
+        An asynchronous rule is never executed in a thread, regardless of
+        :meth:`is_threaded`. By default, a rule is not asynchronous.
+
+        .. versionadded:: 8.1
+        """
+        return False
+
     @abc.abstractmethod
     def is_unblockable(self) -> bool:
         """Tell if the rule is unblockable.
@@ -904,6 +1535,22 @@ class AbstractRule(abc.ABC):
         This is the method called by the bot when a rule matches a ``trigger``.
         """
 
+    async def execute_async(self, bot, trigger):
+        """Execute the triggered rule as a coroutine.
+
+        :param bot: Sopel wrapper
+        :type bot: :class:`sopel.bot.AsyncSopelWrapper`
+        :param trigger: IRC line
+        :type trigger: :class:`sopel.trigger.Trigger`
+
+        This is the method called by the bot when an
+        :meth:`asynchronous <is_async>` rule matches a ``trigger``. By default,
+        it calls :meth:`execute`.
+
+        .. versionadded:: 8.1
+        """
+        return self.execute(bot, trigger)
+
 
 class Rule(AbstractRule):
     """Generic rule definition.
@@ -1105,6 +1752,7 @@ class Rule(AbstractRule):
 
         # execution
         self._threaded = bool(threaded)
+        self._async = handler is not None and _is_async_handler(handler)
         self._output_prefix = output_prefix or ''
 
         # rate limiting
@@ -1118,9 +1766,11 @@ class Rule(AbstractRule):
         self._global_rate_message: str | None = global_rate_message
         self._default_rate_message: str | None = default_rate_message
 
-        # metrics
-        self._metrics_nick: dict[Identifier, RuleMetrics] = {}
-        self._metrics_sender: dict[Identifier, RuleMetrics] = {}
+        # metrics: kept as long as the longest rate limit
+        rate_limit_ttl = max(
+            user_rate_limit, channel_rate_limit, global_rate_limit)
+        self._metrics_nick = RateLimitStore(rate_limit_ttl)
+        self._metrics_sender = RateLimitStore(rate_limit_ttl)
         self._metrics_global = RuleMetrics()
 
         # docs & tests
@@ -1245,6 +1895,9 @@ class Rule(AbstractRule):
     def is_threaded(self):
         return self._threaded
 
+    def is_async(self):
+        return self._async
+
     def is_unblockable(self):
         return self._unblockable
 
@@ -1252,14 +1905,23 @@ class Rule(AbstractRule):
         return self._rate_limit_admins
 
     def get_user_metrics(self, nick: Identifier) -> RuleMetrics:
-        return self._metrics_nick.get(nick, RuleMetrics())
+        return self._metrics_nick.get(nick) or RuleMetrics()
 
     def get_channel_metrics(self, channel: Identifier) -> RuleMetrics:
-        return self._metrics_sender.get(channel, RuleMetrics())
+        return self._metrics_sender.get(channel) or RuleMetrics()
 
     def get_global_metrics(self) -> RuleMetrics:
         return self._metrics_global
 
+    def get_rate_limit_size(self) -> int:
+        """Get the number of user and channel metrics kept by this rule.
+
+        :return: the number of metrics in the rule's rate limit stores
+
+        .. versionadded:: 8.1
+        """
+        return len(self._metrics_nick) + len(self._metrics_sender)
+
     @property
     def user_rate_limit(self) -> datetime.timedelta:
         return datetime.timedelta(seconds=self._user_rate_limit)
@@ -1320,10 +1982,8 @@ class Rule(AbstractRule):
         if not self._handler:
             raise RuntimeError('Improperly configured rule: no handler')
 
-        user_metrics: RuleMetrics = self._metrics_nick.setdefault(
-            trigger.nick, RuleMetrics())
-        sender_metrics: RuleMetrics = self._metrics_sender.setdefault(
-            trigger.sender, RuleMetrics())
+        user_metrics = self._metrics_nick.use(trigger.nick)
+        sender_metrics = self._metrics_sender.use(trigger.sender)
 
         # execute the handler
         with user_metrics, sender_metrics, self._metrics_global:
@@ -1335,6 +1995,26 @@ class Rule(AbstractRule):
         # return exit code
         return exit_code
 
+    async def execute_async(self, bot, trigger):
+        if not self._handler:
+            raise RuntimeError('Improperly configured rule: no handler')
+
+        user_metrics = self._metrics_nick.use(trigger.nick)
+        sender_metrics = self._metrics_sender.use(trigger.sender)
+
+        # execute and await the handler
+        with user_metrics, sender_metrics, self._metrics_global:
+            exit_code = self._handler(bot, trigger)
+            if inspect.isawaitable(exit_code):
+                # predicates can prevent the coroutine's creation
+                exit_code = await exit_code
+            user_metrics.set_return_value(exit_code)
+            sender_metrics.set_return_value(exit_code)
+            self._metrics_global.set_return_value(exit_code)
+
+        # return exit code
+        return exit_code
+
 
 class AbstractNamedRule(Rule):
     """Abstract base class for named rules.
@@ -1392,6 +2072,29 @@ class AbstractNamedRule(Rule):
         :return: a compiled regex for this named rule and its aliases
         """
 
+    def get_dispatch_regex(self) -> re.Pattern | None:
+        """Make the dispatch regex for this named rule.
+
+        :return: a compiled regex that captures the invoked name as its first
+                 group, or ``None`` if this rule can't be dispatched by name
+
+        The rules manager uses this regex to find which name a line invokes,
+        then looks up that name (case-insensitively) in a table of names and
+        aliases. Only the rules found this way are matched against the line
+        with their :meth:`rule regex <get_rule_regex>`. If the captured name
+        isn't found, all the rules sharing this dispatch regex are matched.
+
+        By default, a named rule can't be dispatched by name: it is matched
+        against every line like a generic rule.
+        """
+        return None
+
+    def _has_single_word_names(self) -> bool:
+        return not any(
+            any(char.isspace() for char in name)
+            for name in (self._name, *self._aliases)
+        )
+
 
 class Command(AbstractNamedRule):
     """Command rule definition.
@@ -1427,6 +2130,7 @@ class Command(AbstractNamedRule):
         ))?                 # Group 2 must be None, if there are no parameters.
         $                   # EoL, so there are no partial matches.
     """
+    DISPATCH_TEMPLATE = r"(?:{prefix})(\S+)"
 
     @classmethod
     def from_callable(cls, settings, handler):
@@ -1515,6 +2219,22 @@ class Command(AbstractNamedRule):
         pattern = self.PATTERN_TEMPLATE.format(prefix=prefix, command=pattern)
         return re.compile(pattern, re.IGNORECASE | re.VERBOSE)
 
+    def get_dispatch_regex(self):
+        """Make the dispatch regex for this command.
+
+        :return: a compiled regex that captures the word after the prefix, or
+                 ``None`` if the command or one of its aliases contains
+                 whitespace
+
+        Commands sharing the same prefix share the same dispatch regex.
+        """
+        if not self._has_single_word_names():
+            return None
+
+        prefix = re.sub(r"(\s)", r"\\\1", self._prefix)
+        pattern = self.DISPATCH_TEMPLATE.format(prefix=prefix)
+        return re.compile(pattern, re.IGNORECASE | re.VERBOSE)
+
 
 class NickCommand(AbstractNamedRule):
     """Nickname Command rule definition.
@@ -1553,6 +2273,7 @@ class NickCommand(AbstractNamedRule):
         ))?            # Group 1 must be None, if there are no parameters.
         $              # EoL, so there are no partial matches.
     """
+    DISPATCH_TEMPLATE = r"^$nickname[:,]?\s+(\S+)"
 
     @classmethod
     def from_callable(
@@ -1639,6 +2360,23 @@ class NickCommand(AbstractNamedRule):
             self._nick,
             self._nick_aliases)
 
+    def get_dispatch_regex(self):
+        """Make the dispatch regex for this nick command.
+
+        :return: a compiled regex that captures the word after the nick, or
+                 ``None`` if the command or one of its aliases contains
+                 whitespace
+
+        Nick commands sharing the same nicks share the same dispatch regex.
+        """
+        if not self._has_single_word_names():
+            return None
+
+        return _compile_pattern(
+            self.DISPATCH_TEMPLATE,
+            self._nick,
+            self._nick_aliases)
+
 
 class ActionCommand(AbstractNamedRule):
     """Action Command rule definition.
@@ -1674,6 +2412,7 @@ class ActionCommand(AbstractNamedRule):
                             # parameters.
         $                   # EoL, so there are no partial matches.
     """
+    DISPATCH_PATTERN = r"(\S+)"
 
     @classmethod
     def from_callable(
@@ -1725,6 +2464,18 @@ class ActionCommand(AbstractNamedRule):
         pattern = self.PATTERN_TEMPLATE.format(command=pattern)
         return re.compile(pattern, re.IGNORECASE | re.VERBOSE)
 
+    def get_dispatch_regex(self):
+        """Make the dispatch regex for this action command.
+
+        :return: a compiled regex that captures the first word of the action,
+                 or ``None`` if the command or one of its aliases contains
+                 whitespace
+        """
+        if not self._has_single_word_names():
+            return None
+
+        return re.compile(self.DISPATCH_PATTERN, re.IGNORECASE)
+
     def match_ctcp(self, command: str | None) -> bool:
         """Tell if ``command`` is an ``ACTION``.
 
@@ -7,6 +7,7 @@ from __future__ import annotations
 from typing import Iterable, NoReturn, TYPE_CHECKING
 
 from sopel.irc.abstract_backends import AbstractIRCBackend
+from sopel.irc.outbound import PRIORITY_NORMAL
 
 
 if TYPE_CHECKING:
@@ -77,7 +78,7 @@ class MockIRCBackend(AbstractIRCBackend):
     def is_connected(self) -> bool:
         return self.connected
 
-    def irc_send(self, data: bytes) -> None:
+    def irc_send(self, data: bytes, priority: int = PRIORITY_NORMAL) -> None:
         """Store ``data`` into :attr:`message_sent`."""
         self.message_sent.append(data)
 
@@ -44,8 +44,8 @@ def get_sendable_message(text, max_length=400):
     (e.g. to account precisely for the bot's hostmask).
 
     The ``max_length`` is the max length of text in **bytes**, but we take
-    care of multibyte UTF-8 characters by working on the Unicode string,
-    then making sure the bytes version is smaller than the max length.
+    care of multibyte UTF-8 characters by splitting the text only between two
+    characters, so the bytes version is never longer than the max length.
 
     .. note::
 
@@ -59,24 +59,96 @@ def get_sendable_message(text, max_length=400):
         ``max_length`` argument.
 
     .. versionadded:: 6.6.2
+    .. versionchanged:: 8.1
+        Uses :func:`get_sendable_messages` to encode the text only once.
     """
-    unicode_max_length = max_length
-    excess = ''
-
-    while len(text.encode('utf-8')) > max_length:
-        last_space = text.rfind(' ', 0, unicode_max_length)
-        if last_space == -1:
-            # No last space, just split where it is possible
-            excess = text[unicode_max_length:] + excess
-            text = text[:unicode_max_length]
-            # Decrease max length for the unicode string
-            unicode_max_length = unicode_max_length - 1
+    messages, excess = get_sendable_messages(text, max_length, 1)
+    return messages[0], excess
+
+
+def _skip_whitespace(data: bytes, position: int) -> int:
+    # skip every whitespace character (as per ``str.isspace``) of the UTF-8
+    # encoded ``data``, starting at ``position``, which must be on a character
+    size = len(data)
+    while position < size:
+        byte = data[position]
+        if byte < 0x80:
+            length = 1
+        elif byte < 0xE0:
+            length = 2
+        elif byte < 0xF0:
+            length = 3
         else:
-            # Split at the last best space found
-            excess = text[last_space:] + excess
-            text = text[:last_space]
+            length = 4
+
+        if not data[position:position + length].decode('utf-8').isspace():
+            break
+        position += length
+
+    return position
+
+
+def get_sendable_messages(
+    text: str,
+    max_length: int = 400,
+    max_messages: int | None = None,
+) -> tuple[list[str], str]:
+    """Split a ``text`` message into sendable messages.
 
-    return text, excess.lstrip()
+    :param text: text to send
+    :param max_length: maximum length of each message, in **bytes**
+    :param max_messages: maximum number of messages to get (optional; no
+                         limit by default)
+    :return: a tuple of two values, the list of sendable messages and the
+             excess text that didn't fit in ``max_messages`` messages
+
+    The ``text`` is encoded to UTF-8 once, then split at the last space within
+    ``max_length`` bytes, or between the last two characters that fit if there
+    is no such space. The whitespace at the beginning of the next message is
+    removed. Each message is the same as what :func:`get_sendable_message`
+    would return for the text that remains, and there is always at least one
+    message, even if it is empty::
+
+        >>> get_sendable_messages('aaa bbb ccc', 7)
+        (['aaa bbb', 'ccc'], '')
+        >>> get_sendable_messages('aaa bbb ccc', 3, max_messages=2)
+        (['aaa', 'bbb'], 'ccc')
+
+    If not a single character fits in ``max_length`` bytes, the last message
+    is empty and the rest of the ``text`` is its excess.
+
+    .. versionadded:: 8.1
+    """
+    data = text.encode('utf-8')
+    size = len(data)
+    messages: list[str] = []
+    start = 0
+
+    while max_messages is None or len(messages) < max_messages:
+        if size - start <= max_length:
+            messages.append(data[start:].decode('utf-8'))
+            return messages, ''
+
+        # split at the last space, if any...
+        end = data.rfind(b' ', start, start + max(0, max_length) + 1)
+        if end == -1:
+            # ... or between two characters: UTF-8 continuation bytes are
+            # always 0b10xxxxxx, and a character can't start with one of them
+            end = start + max(0, max_length)
+            while end > start and data[end] & 0xC0 == 0x80:
+                end -= 1
+
+        messages.append(data[start:end].decode('utf-8'))
+        next_start = _skip_whitespace(data, end)
+        if next_start == start:
+            # not even a single character fits: stop here
+            break
+        start = next_start
+
+        if start >= size:
+            return messages, ''
+
+    return messages, data[start:].decode('utf-8')
 
 
 def get_hostmask_regex(mask):
@@ -0,0 +1,328 @@
+"""Sopel's blocklist: internal tool to match users against ``*_blocks`` lists.
+
+The ``nick_blocks``, ``host_blocks``, and ``hostmask_blocks`` settings of the
+``[core]`` section contain regular expressions, but most entries are either
+plain names (e.g. ``spamuser`` or ``spamhost\\.com``) or domains with their
+subdomains (e.g. ``(.+\\.)*spamhost\\.com``). A :class:`Blocklist` indexes
+these entries once, so that a lookup doesn't try every entry one by one:
+
+* plain entries are stored in sets of lowercase names
+* domains (for ``host_blocks``) are stored in a trie of domain labels
+* every other entry is combined into a single compiled regular expression
+
+.. versionadded:: 8.1
+
+.. important::
+
+    This is an internal tool used by Sopel to ignore users and should not be
+    used by plugin authors. Its usage and documentation is for Sopel core
+    development and advanced developers. It is subject to rapid changes
+    between versions without much (or any) warning.
+
+"""
+# Licensed under the Eiffel Forum License 2.
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from typing import Any, Callable, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sopel.tools.identifiers import Identifier
+
+
+LOGGER = logging.getLogger(__name__)
+
+_LITERAL_PATTERN = re.compile(
+    r'(?:[^.^$*+?{}\[\]\\|()]|\\[.^$*+?{}\[\]\\|()\-])*')
+_DOMAIN_PREFIXES = {
+    # prefix: (match the domain itself, match with an empty subdomain)
+    r'(.+\.)*': (True, False),
+    r'(.+\.)?': (True, False),
+    r'.+\.': (False, False),
+    r'.*\.': (False, True),
+}
+_SEPARATE_PATTERN = re.compile(r'\(\?P[<=]|\\\d|^\(\?[aiLmsux-]')
+
+_SELF = 'self'
+_SUBDOMAIN = 'subdomain'
+_EMPTY_SUBDOMAIN = 'empty'
+
+
+def get_literal(mask: str) -> str | None:
+    """Get the plain text matched by ``mask``, if it has no special meaning.
+
+    :param mask: a regular expression
+    :return: the text matched by ``mask``, or ``None`` if ``mask`` contains
+             any unescaped special character, or any non-ASCII character
+
+    Escaped special characters are unescaped::
+
+        >>> get_literal('spamuser')
+        'spamuser'
+        >>> get_literal('spamhost\\\\.com')
+        'spamhost.com'
+        >>> get_literal('.*\\\\.spamhost\\\\.com') is None
+        True
+
+    """
+    if not mask.isascii() or not _LITERAL_PATTERN.fullmatch(mask):
+        return None
+    return re.sub(r'\\(.)', r'\1', mask)
+
+
+class DomainTrie:
+    """A trie of domain labels, to match a host and its subdomains.
+
+    A domain's labels are stored from the last one (e.g. ``com``) to the
+    first one, so looking up a host costs one step per label of the host,
+    whatever the number of domains in the trie.
+    """
+    def __init__(self) -> None:
+        self._root: dict[str, Any] = {}
+
+    def add(
+        self,
+        domain: str,
+        itself: bool = True,
+        subdomains: bool = True,
+        empty_subdomain: bool = False,
+    ) -> None:
+        """Add a ``domain`` to the trie.
+
+        :param domain: the domain to add
+        :param itself: if the ``domain`` itself must match
+        :param subdomains: if the ``domain``'s subdomains must match
+        :param empty_subdomain: if a subdomain can be empty (e.g. ``.domain``)
+        """
+        node = self._root
+        for label in reversed(domain.lower().split('.')):
+            node = node.setdefault(label + '.', {})
+
+        if itself:
+            node[_SELF] = True
+        if subdomains:
+            node[_SUBDOMAIN] = True
+        if empty_subdomain:
+            node[_EMPTY_SUBDOMAIN] = True
+
+    def match(self, host: str) -> bool:
+        """Tell if the ``host`` matches a domain of the trie.
+
+        :param host: the host to look up
+        :return: ``True`` if the ``host`` is one of the domains, or one of
+                 their subdomains (as added)
+        """
+        labels = host.lower().split('.')
+        node = self._root
+        for index in range(len(labels) - 1, -1, -1):
+            child = node.get(labels[index] + '.')
+            if child is None:
+                return False
+            node = child
+
+            if index == 0:
+                return _SELF in node
+
+            if _EMPTY_SUBDOMAIN in node:
+                return True
+            if _SUBDOMAIN in node and '.'.join(labels[:index]):
+                return True
+
+        return False
+
+
+class MaskIndex:
+    """Match a value against a list of masks, as regular expressions.
+
+    :param masks: the masks (regular expressions) to match
+    :param normalize: a function to normalize a value before comparing it to
+                      the masks as they are (optional)
+    :param domains: if domain masks must be stored in a :class:`DomainTrie`
+                    (optional; ``False`` by default)
+
+    A value matches a mask if the mask (as a regular expression, ignoring
+    case) matches the whole value, or if the value is equal to the mask
+    (once both are normalized). Invalid regular expressions are logged and
+    only compared as they are.
+    """
+    def __init__(
+        self,
+        masks: Iterable[str],
+        normalize: Callable[[str], str] | None = None,
+        domains: bool = False,
+    ) -> None:
+        self._normalize = normalize
+        self.names: set[str] = set()
+        """Normalized masks, to compare as they are."""
+        self.literals: set[str] = set()
+        """Lowercase text of the masks without any special character."""
+        self.domains = DomainTrie()
+        """Domains (and their subdomains) to match."""
+        self.pattern: re.Pattern | None = None
+        """Combined regular expression of the other masks."""
+        self.patterns: list[re.Pattern] = []
+        """Masks that can't be combined (e.g. with backreferences)."""
+
+        combined: list[str] = []
+        for mask in masks:
+            mask = mask.strip()
+            if not mask:
+                continue
+
+            # a mask is always compared as is
+            self.names.add(normalize(mask) if normalize else mask)
+
+            literal = get_literal(mask)
+            if literal is not None:
+                self.literals.add(literal.lower())
+                continue
+
+            if domains and self._add_domain(mask):
+                continue
+
+            try:
+                pattern = re.compile(mask + '$', re.IGNORECASE)
+            except re.error as error:
+                LOGGER.warning('Invalid block mask %r: %s', mask, error)
+                continue
+
+            if _SEPARATE_PATTERN.search(mask):
+                self.patterns.append(pattern)
+            else:
+                combined.append('(?:%s$)' % mask)
+
+        if combined:
+            try:
+                self.pattern = re.compile('|'.join(combined), re.IGNORECASE)
+            except re.error:
+                self.patterns.extend(
+                    re.compile(mask[3:-1], re.IGNORECASE)
+                    for mask in combined
+                )
+
+    def _add_domain(self, mask: str) -> bool:
+        for prefix, (itself, empty) in _DOMAIN_PREFIXES.items():
+            if not mask.startswith(prefix):
+                continue
+
+            domain = get_literal(mask[len(prefix):])
+            if domain:
+                self.domains.add(domain, itself, True, empty)
+                return True
+
+        return False
+
+    def match(self, value: str) -> bool:
+        """Tell if the ``value`` matches one of the masks.
+
+        :param value: the value to match
+        :return: ``True`` if the ``value`` matches a mask, ``False`` otherwise
+        """
+        normalized = self._normalize(value) if self._normalize else value
+        # str.lower, as an Identifier's lower method uses its casemapping
+        if normalized in self.names or str.lower(value) in self.literals:
+            return True
+        if self.domains.match(value):
+            return True
+        if self.pattern is not None and self.pattern.match(value):
+            return True
+        return any(pattern.match(value) for pattern in self.patterns)
+
+
+class Blocklist:
+    """Index of the ``nick_blocks``, ``host_blocks``, and ``hostmask_blocks``.
+
+    :param nick_blocks: the blocked nicks
+    :param host_blocks: the blocked hosts
+    :param hostmask_blocks: the blocked hostmasks
+    :param make_identifier: the bot's identifier factory, to compare nicks
+    :param cache_size: maximum number of hostmasks to keep results for
+                       (optional)
+
+    The results of :meth:`check` are cached by hostmask; once the cache is
+    full, the oldest result is discarded.
+    """
+    def __init__(
+        self,
+        nick_blocks: Iterable[str],
+        host_blocks: Iterable[str],
+        hostmask_blocks: Iterable[str],
+        make_identifier: Callable[[str], Identifier],
+        cache_size: int = 4096,
+    ) -> None:
+        self._make_identifier = make_identifier
+        self.nicks = MaskIndex(nick_blocks, normalize=self._lower_nick)
+        """Index of the blocked nicks."""
+        self.hosts = MaskIndex(host_blocks, domains=True)
+        """Index of the blocked hosts."""
+        self.hostmasks = MaskIndex(hostmask_blocks)
+        """Index of the blocked hostmasks."""
+        self._cache: dict[str | None, tuple[bool, bool, bool]] = {}
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+
+    def _lower_nick(self, nick: str) -> str:
+        return self._make_identifier(nick).lower()
+
+    def is_nick_blocked(self, nick: str) -> bool:
+        """Tell if a ``nick`` is blocked.
+
+        :param nick: the nick to check
+        """
+        return self.nicks.match(nick)
+
+    def is_host_blocked(self, host: str) -> bool:
+        """Tell if a ``host`` is blocked.
+
+        :param host: the host to check
+        """
+        return self.hosts.match(host)
+
+    def is_hostmask_blocked(self, hostmask: str | None) -> bool:
+        """Tell if a ``hostmask`` is blocked.
+
+        :param hostmask: the hostmask to check; it can't be blocked if it is
+                         ``None`` or empty
+        """
+        if not hostmask:
+            return False
+        return self.hostmasks.match(hostmask)
+
+    def check(
+        self,
+        nick: str,
+        host: str,
+        hostmask: str | None,
+    ) -> tuple[bool, bool, bool]:
+        """Tell if a user is blocked by nick, by host, or by hostmask.
+
+        :param nick: the user's nick
+        :param host: the user's host
+        :param hostmask: the user's hostmask (from which the ``nick`` and the
+                         ``host`` come)
+        :return: a tuple of 3 booleans: if the ``nick``, the ``host``, and
+                 the ``hostmask`` are blocked
+        """
+        try:
+            return self._cache[hostmask]
+        except KeyError:
+            pass
+
+        result = (
+            self.is_nick_blocked(nick),
+            self.is_host_blocked(host),
+            self.is_hostmask_blocked(hostmask),
+        )
+
+        with self._cache_lock:
+            if len(self._cache) >= self._cache_size:
+                # discard the oldest result
+                del self._cache[next(iter(self._cache))]
+            self._cache[hostmask] = result
+
+        return result
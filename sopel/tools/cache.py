@@ -0,0 +1,138 @@
+"""Sopel's caches: internal tool to keep the result of lookups in memory.
+
+.. versionadded:: 8.1
+
+.. important::
+
+    This is an internal tool used by Sopel to avoid repeated database
+    queries, and should not be used by plugin authors. Its usage and
+    documentation is for Sopel core development and advanced developers. It
+    is subject to rapid changes between versions without much (or any)
+    warning.
+
+"""
+# Licensed under the Eiffel Forum License 2.
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from typing import Any, NamedTuple
+
+
+MISSING: Any = object()
+"""Sentinel returned by :meth:`LRUCache.get` when a key is not cached.
+
+``None`` can be cached like any other value (e.g. to remember that a lookup
+found nothing), so this sentinel is used to tell a miss apart.
+"""
+
+
+class CacheStats(NamedTuple):
+    """Statistics of a :class:`LRUCache`."""
+    size: int
+    """Number of entries currently cached (including expired ones)."""
+    hits: int
+    """Number of lookups that found a cached value."""
+    misses: int
+    """Number of lookups that didn't find a cached value."""
+
+
+class LRUCache:
+    """Bounded cache that evicts the least recently used entries first.
+
+    :param max_size: maximum number of entries; ``0`` disables the cache
+    :param ttl: optional default time to live of the entries, in seconds
+
+    Entries are evicted when the cache is full, or when they have expired.
+    Each entry can have its own time to live, set by :meth:`set`::
+
+        cache = LRUCache(1024)
+        cache.set('known', 42)            # kept until evicted
+        cache.set('unknown', None, ttl=5)  # kept up to 5s
+
+        cache.get('known')    # 42
+        cache.get('missing')  # MISSING
+
+    The cache is thread safe, and it counts its hits and misses; see
+    :meth:`get_stats`.
+    """
+    def __init__(self, max_size: int, ttl: float | None = None) -> None:
+        if max_size < 0:
+            raise ValueError('max_size must not be negative')
+
+        self.max_size = max_size
+        """Maximum number of entries."""
+        self.ttl = ttl
+        """Default time to live of the entries, in seconds, if any."""
+        # ordered from the least to the most recently used;
+        # each value is (value, expiration time or None)
+        self._entries: collections.OrderedDict[
+            Any,
+            tuple[Any, float | None],
+        ] = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any) -> Any:
+        """Get the value cached for ``key``.
+
+        :param key: the key of the value
+        :return: the cached value, or :data:`MISSING` if ``key`` is not
+                 cached (or if its entry has expired)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expire_at = entry
+                if expire_at is None or expire_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+            self._misses += 1
+            return MISSING
+
+    def set(self, key: Any, value: Any, ttl: float | None = None) -> None:
+        """Cache a ``value`` for ``key``.
+
+        :param key: the key of the value
+        :param value: the value to cache; it can be ``None``
+        :param ttl: optional time to live of the entry, in seconds; by
+                    default, the cache's :attr:`ttl`
+        """
+        if not self.max_size:
+            return
+
+        ttl = ttl if ttl is not None else self.ttl
+        expire_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (value, expire_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        """Remove the entry of ``key``, if cached.
+
+        :param key: the key of the entry to remove
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> CacheStats:
+        """Get the current statistics of the cache.
+
+        :return: a snapshot of the cache's size, hits, and misses
+        """
+        with self._lock:
+            return CacheStats(len(self._entries), self._hits, self._misses)
@@ -13,30 +13,58 @@
 # Licensed under the Eiffel Forum License 2.
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import heapq
+import inspect
+import itertools
 import logging
+import random
 import threading
 import time
 from typing import TYPE_CHECKING
 
+from sopel.tools import stats as tools_stats, workers
+
 
 if TYPE_CHECKING:
+    from typing import Any, Coroutine
+
     from sopel.config import Config
     from sopel.plugins.callables import PluginJob
 
 
 LOGGER = logging.getLogger(__name__)
 
+OVERLAP_SKIP = 'skip'
+"""Skip the ticks that come while the job is running."""
+OVERLAP_QUEUE = 'queue'
+"""Run the job once more after it's done, on its last missed tick."""
+OVERLAP_COALESCE = 'coalesce'
+"""Run the job once more as soon as it's done, and restart its schedule."""
+OVERLAP_POLICIES = (OVERLAP_SKIP, OVERLAP_QUEUE, OVERLAP_COALESCE)
+"""All the policies available when a job's tick comes while it's running."""
+
 
 class Scheduler(threading.Thread):
     """Generic Job Scheduler.
 
     :param object manager: manager passed to jobs as argument
+    :param stats: optional registry to record the jobs' execution statistics
+    :type stats: :class:`sopel.tools.stats.StatsRegistry`
+    :param watchdog: optional watchdog to report jobs blocking their thread
+    :type watchdog: :class:`sopel.tools.watchdog.Watchdog`
+    :param int max_workers: maximum number of threads executing threaded jobs
 
     Scheduler is a :class:`thread <threading.Thread>` that keeps track of
-    :class:`Jobs <Job>` and periodically checks which ones are ready to
-    execute. When ready, their :meth:`~Job.execute` method is called, either
-    in a separate thread or in the scheduler's thread (it depends on the
-    job's :meth:`~Job.is_threaded` method).
+    :class:`Jobs <Job>` in a queue ordered by their :meth:`next time
+    <Job.get_next_time>`, and sleeps until the first one is ready to execute.
+    When ready, their :meth:`~Job.execute` method is called, either by a
+    :class:`pool of worker threads <sopel.tools.workers.WorkerPool>` or in
+    the scheduler's thread (it depends on the job's :meth:`~Job.is_threaded`
+    method). A job is queued again once its execution is over, so it never
+    runs twice at the same time: the ticks that come in the meantime are
+    handled by the job's :attr:`~Job.overlap` policy.
 
     It can be started as any other thread::
 
@@ -67,15 +95,43 @@ class Scheduler(threading.Thread):
         for Sopel core development and advanced developers. It is subject to
         rapid changes between versions without much (or any) warning.
 
+    .. versionchanged:: 8.1
+
+        The ``stats`` and ``watchdog`` parameters have been added.
+
+    .. versionchanged:: 8.1
+
+        Jobs are kept in a heap queue, and the scheduler wakes up when the
+        next job is due instead of every second: intervals can be shorter
+        than a second.
+
+    .. versionchanged:: 8.1
+
+        Threaded jobs are executed by a pool of at most ``max_workers``
+        threads, instead of a new thread for each execution.
+
     """
-    def __init__(self, manager):
+    def __init__(self, manager, stats=None, watchdog=None, max_workers=8):
         threading.Thread.__init__(self)
         self.manager = manager
         """Job manager, used as argument for jobs."""
+        self.stats: tools_stats.StatsRegistry = (
+            stats if stats is not None else tools_stats.StatsRegistry())
+        """Execution statistics of the jobs."""
+        self.watchdog = watchdog
+        """Watchdog reporting the jobs that block their thread, if any."""
         self.stopping = threading.Event()
         """Stopping flag. See :meth:`stop`."""
         self._jobs = []
         self._mutex = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pool = workers.WorkerPool(max_workers, name='sopel-job')
+        # heap of (next time, sequence, job); an entry is valid only if its
+        # sequence is the job's sequence in _scheduled, which holds all the
+        # registered jobs (with None as sequence while the job is running)
+        self._queue: list[tuple[float, int, Job]] = []
+        self._scheduled: dict[Job, int | None] = {}
+        self._sequence = itertools.count()
 
     def register(self, job):
         """Register a Job to the current job queue.
@@ -87,6 +143,7 @@ class Scheduler(threading.Thread):
         """
         with self._mutex:
             self._jobs.append(job)
+            self._schedule(job)
         LOGGER.debug('Job registered: %s', str(job))
 
     def clear_jobs(self):
@@ -97,6 +154,7 @@ class Scheduler(threading.Thread):
         """
         with self._mutex:
             self._jobs = []
+            self._unschedule_all()
 
     def stop(self):
         """Ask the job scheduler to stop.
@@ -111,6 +169,7 @@ class Scheduler(threading.Thread):
         Note that this won't cancel or stop any currently running jobs.
         """
         self.stopping.set()
+        self._wakeup.set()
 
     def remove_callable_job(self, callable):
         """Remove ``callable`` from the job queue.
@@ -122,6 +181,9 @@ class Scheduler(threading.Thread):
         currently running jobs.
         """
         with self._mutex:
+            for job in self._jobs:
+                if job._handler == callable:
+                    self._unschedule(job)
             self._jobs = [
                 job for job in self._jobs
                 if job._handler != callable
@@ -130,9 +192,10 @@ class Scheduler(threading.Thread):
     def run(self):
         """Run forever until :meth:`stop` is called.
 
-        This method waits at most a second between each iteration. At each step
-        it retrieves the jobs that are ready for execution, and executes them.
-        See the :meth:`Job.execute` method for more information.
+        This method retrieves the jobs that are ready for execution, executes
+        them, and then waits until the next job is ready, or until a job is
+        registered or queued again. See the :meth:`Job.execute` method for
+        more information.
 
         Internally, it loops forever until its :attr:`stopping` event is set.
 
@@ -144,17 +207,26 @@ class Scheduler(threading.Thread):
         """
         while not self.stopping.is_set():
             try:
-                now = time.time()
+                # Clear before looking at the queue: a job registered after
+                # that will wake the scheduler up
+                self._wakeup.clear()
 
                 # Collect ready jobs by now
-                for job in self._get_ready_jobs(now):
-                    self._run_job(job)
-
-                # Wait up to a second
-                time_spent = time.time() - now
-                wait_time = max(0, 1 - time_spent)
-                if wait_time:
-                    time.sleep(wait_time)
+                for job in self._get_ready_jobs(time.time()):
+                    try:
+                        self._run_job(job)
+                    except Exception as error:
+                        # the other ready jobs must run anyway
+                        LOGGER.error('Unable to run job %s: %s', job, error)
+                        self.manager.on_scheduler_error(self, error)
+                        # wait for the job's next tick, not to fail in a loop
+                        job.next(time.time())
+                        self._reschedule(job)
+
+                # Wait until the next job is ready
+                timeout = self._get_timeout(time.time())
+                if timeout is None or timeout > 0:
+                    self._wakeup.wait(timeout)
             except KeyboardInterrupt:
                 # Do not block on KeyboardInterrupt
                 LOGGER.debug('Job scheduler stopped by KeyboardInterrupt')
@@ -170,32 +242,174 @@ class Scheduler(threading.Thread):
                 # the log with useless error messages.
                 time.sleep(10.0)  # seconds
 
+        # let the workers finish the running jobs without waiting for them
+        self._pool.shutdown(timeout=0)
+
+    def _schedule(self, job):
+        # must be called with the mutex
+        sequence = next(self._sequence)
+        self._scheduled[job] = sequence
+        entry = (job.get_next_time(), sequence, job)
+        heapq.heappush(self._queue, entry)
+        if self._queue[0] is entry:
+            # the scheduler may be waiting for a later job
+            self._wakeup.set()
+
+    def _unschedule(self, job):
+        # must be called with the mutex; the job's entry is left in the queue
+        # and skipped when it is ready
+        self._scheduled.pop(job, None)
+
+    def _unschedule_all(self):
+        # must be called with the mutex
+        self._scheduled = {}
+        self._queue = []
+
+    def _reschedule(self, job):
+        """Queue a job again after its execution, if it is still registered."""
+        with self._mutex:
+            if job in self._scheduled and self._scheduled[job] is None:
+                self._schedule(job)
+
     def _get_ready_jobs(self, now):
+        jobs = []
         with self._mutex:
-            jobs = [job for job in self._jobs if job.is_ready_to_run(now)]
+            while self._queue and self._queue[0][0] <= now:
+                _, sequence, job = heapq.heappop(self._queue)
+                if self._scheduled.get(job) != sequence:
+                    # unregistered job
+                    continue
+                # mark the job as out of the queue until it is rescheduled
+                self._scheduled[job] = None
+                jobs.append(job)
 
         return jobs
 
+    def _get_timeout(self, now):
+        with self._mutex:
+            if not self._queue:
+                return None
+            return max(0.0, self._queue[0][0] - now)
+
     def _run_job(self, job):
-        if job.is_threaded():
-            # make sure the job knows it's running, even though the thread
+        if job.is_async():
+            # make sure the job knows it's running, even though the coroutine
             # isn't started yet.
             job.is_running.set()
-            t = threading.Thread(
-                target=self._call, args=(job,)
-            )
-            t.start()
+            coro = self._call_async(job, time.monotonic())
+            try:
+                self._run_coroutine(coro)
+            except Exception:
+                # the job won't run: it must not look like it's running
+                coro.close()
+                job.is_running.clear()
+                raise
+        elif job.is_threaded():
+            # make sure the job knows it's running, even though no worker
+            # picked it up yet.
+            job.is_running.set()
+            try:
+                task = self._pool.submit(
+                    self._call,
+                    job,
+                    time.monotonic(),
+                    name=str(job),
+                    group=job.get_plugin_name(),
+                )
+            except Exception:
+                job.is_running.clear()
+                raise
+            if task.dropped:
+                # dropped by a full pool: it won't run this time
+                job.is_running.clear()
+                job.next(time.time())
+                self._reschedule(job)
         else:
             self._call(job)
 
-    def _call(self, job):
-        """Wrap the job's execution to handle its state and errors."""
+    def _get_job_stats(self, job):
         try:
-            with job:
+            label = job.get_job_label()
+        except RuntimeError:
+            label = '(unknown)'
+
+        return self.stats.get(
+            tools_stats.KIND_JOB, job.get_plugin_name(), label)
+
+    def _record_stats(self, job, duration, failed, queue_wait, skipped_ticks):
+        stats = self._get_job_stats(job)
+        stats.record_execution(duration, error=failed, queue_wait=queue_wait)
+        if skipped_ticks:
+            stats.record_skipped(skipped_ticks)
+
+    def _track(self, job):
+        if self.watchdog is None:
+            return contextlib.nullcontext()
+        return self.watchdog.track('job %s' % job)
+
+    def _call(self, job, queued_at=None):
+        """Wrap the job's execution to handle its state, errors and stats."""
+        started_at = time.perf_counter()
+        queue_wait = 0.0
+        if queued_at is not None:
+            queue_wait = max(0.0, time.monotonic() - queued_at)
+        failed = False
+        skipped_ticks = job.skipped_ticks
+        try:
+            with job, self._track(job):
                 job.execute(self.manager)
         except Exception as error:  # TODO: Be specific
+            failed = True
             LOGGER.error('Error while processing job: %s', error)
             self.manager.on_job_error(self, job, error)
+        finally:
+            self._record_stats(
+                job,
+                time.perf_counter() - started_at,
+                failed,
+                queue_wait,
+                job.skipped_ticks - skipped_ticks,
+            )
+            self._reschedule(job)
+
+    async def _call_async(self, job, queued_at=None):
+        """Wrap the asynchronous job's execution like :meth:`_call`."""
+        started_at = time.perf_counter()
+        queue_wait = 0.0
+        if queued_at is not None:
+            queue_wait = max(0.0, time.monotonic() - queued_at)
+        failed = False
+        skipped_ticks = job.skipped_ticks
+        try:
+            with job:
+                await job.execute(self.manager)
+        except Exception as error:  # TODO: Be specific
+            failed = True
+            LOGGER.error('Error while processing job: %s', error)
+            self.manager.on_job_error(self, job, error)
+        finally:
+            self._record_stats(
+                job,
+                time.perf_counter() - started_at,
+                failed,
+                queue_wait,
+                job.skipped_ticks - skipped_ticks,
+            )
+            self._reschedule(job)
+
+    def _run_coroutine(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """Run the coroutine of an asynchronous job.
+
+        :param coro: the coroutine to run
+
+        By default, the coroutine runs in its own event loop, in a new thread,
+        so it doesn't block the scheduler. Subclasses can override this method
+        to run the coroutine on another event loop.
+
+        .. versionadded:: 8.1
+        """
+        thread = threading.Thread(target=asyncio.run, args=(coro,))
+        thread.start()
 
 
 class Job:
@@ -209,6 +423,10 @@ class Job:
     :param handler: function to be called when the job is ready to execute
     :type handler: :term:`function`
     :param str doc: optional documentation for the job
+    :param str overlap: what to do with the ticks that come while the job is
+                        running; one of :data:`OVERLAP_POLICIES`
+    :param float jitter: maximum random delay (in seconds) added to the job's
+                         first run, up to its shortest interval
 
     Job is a simple structure that holds information about when a function
     should be called next. They are best used with a :class:`Scheduler`
@@ -255,6 +473,10 @@ class Job:
         In all other case, the :class:`sopel.tools.jobs.Scheduler` class is a
         generic job scheduler.
 
+    .. versionchanged:: 8.1
+
+        The ``overlap`` and ``jitter`` parameters have been added.
+
     """
     @classmethod
     def kwargs_from_callable(cls, handler: PluginJob) -> dict:
@@ -273,13 +495,21 @@ class Job:
         :mod:`sopel.plugin` module.
         """
 
-        return {
+        kwargs: dict[str, Any] = {
             'plugin': handler.plugin_name,
             'label': handler.label,
             'threaded': handler.threaded,
             'doc': handler.doc,
         }
 
+        if handler.overlap is not None:
+            kwargs['overlap'] = handler.overlap
+
+        if handler.jitter is not None:
+            kwargs['jitter'] = handler.jitter
+
+        return kwargs
+
     @classmethod
     def from_callable(cls, settings: Config, handler: PluginJob) -> Job:
         """Instantiate a Job from the bot's ``settings`` and a ``handler``.
@@ -288,8 +518,12 @@ class Job:
         :type settings: :class:`sopel.config.Config`
         :param handler: callable used to instantiate a new job
         :type handler: :term:`function`
+
+        The job's jitter defaults to the
+        :attr:`~sopel.config.core_section.CoreSection.job_jitter` setting.
         """
         kwargs = cls.kwargs_from_callable(handler)
+        kwargs.setdefault('jitter', settings.core.job_jitter)
         return cls(
             set(handler.intervals),
             handler=handler,
@@ -301,16 +535,34 @@ class Job:
                  label=None,
                  handler=None,
                  threaded=True,
-                 doc=None):
+                 doc=None,
+                 overlap=OVERLAP_COALESCE,
+                 jitter=0.0):
+        if overlap not in OVERLAP_POLICIES:
+            raise ValueError('Unknown overlap policy: %r' % overlap)
+
         # scheduling
         now = time.time()
         self.intervals = set(intervals)
         """Set of intervals at which to execute the job."""
+        if jitter > 0 and self.intervals:
+            now += random.uniform(0, min(jitter, min(self.intervals)))
         self.next_times = dict(
             (interval, now + interval)
             for interval in self.intervals
         )
         """Tracking of when to execute the job next time."""
+        self.overlap = overlap
+        """Policy for the ticks that come while the job is running.
+
+        One of :data:`OVERLAP_POLICIES`; this is used by :meth:`next`.
+        """
+        self.skipped_ticks = 0
+        """Number of ticks skipped since the job was created.
+
+        A tick is skipped when it comes while the job is running, and the
+        job's :attr:`overlap` policy doesn't run the job for it.
+        """
 
         # meta
         self._plugin_name = plugin
@@ -419,6 +671,27 @@ class Job:
         """
         return self._threaded
 
+    def is_async(self):
+        """Tell if the job's handler is a coroutine function.
+
+        :return: ``True`` if the handler is defined with ``async def``,
+                 ``False`` otherwise
+        :rtype: bool
+
+        An asynchronous job is executed on an event loop instead of a thread,
+        and the :meth:`execute` method returns an awaitable.
+
+        .. versionadded:: 8.1
+        """
+        if self._handler is None:
+            return False
+
+        is_async = getattr(self._handler, 'is_async', None)
+        if isinstance(is_async, bool):
+            return is_async
+
+        return inspect.iscoroutinefunction(inspect.unwrap(self._handler))
+
     def is_ready_to_run(self, at_time):
         """Check if this job is (or will be) ready to run at the given time.
 
@@ -432,20 +705,57 @@ class Job:
             for next_time in self.next_times.values()
         )
 
+    def get_next_time(self):
+        """Get the earliest time at which the job is ready to run.
+
+        :return: the earliest of the job's :attr:`next_times`, as a timestamp
+                 in seconds
+        :rtype: float
+
+        .. versionadded:: 8.1
+        """
+        return min(self.next_times.values())
+
     def next(self, current_time):
         """Update :attr:`next_times`, assuming it executed at ``current_time``.
 
         :param int current_time: timestamp of the current time
         :return: a modified job object
+
+        When the job ran for longer than an interval, the ticks that came in
+        the meantime are handled according to the job's :attr:`overlap`
+        policy:
+
+        * ``skip``: they are skipped, and the job waits for its next tick
+        * ``queue``: the last one is kept, so the job runs again right away,
+          and the other ones are skipped
+        * ``coalesce``: they are merged into one execution, right away, and
+          the job's schedule restarts from ``current_time``
+
+        The skipped ticks are counted in :attr:`skipped_ticks`.
         """
         for interval, last_time in list(self.next_times.items()):
             if last_time >= current_time:
                 # no need to update this interval
                 continue
 
-            # if last time + interval is in the future, it's used
-            # else, try to run it asap
-            self.next_times[interval] = max(last_time + interval, current_time)
+            missed = 0
+            if interval > 0:
+                missed = int((current_time - last_time) // interval)
+
+            if not missed:
+                # last time + interval is in the future
+                self.next_times[interval] = last_time + interval
+            elif self.overlap == OVERLAP_SKIP:
+                self.next_times[interval] = last_time + (missed + 1) * interval
+                self.skipped_ticks += missed
+            elif self.overlap == OVERLAP_QUEUE:
+                self.next_times[interval] = last_time + missed * interval
+                self.skipped_ticks += missed - 1
+            else:
+                # try to run it asap
+                self.next_times[interval] = current_time
+                self.skipped_ticks += missed - 1
 
         return self
 
@@ -453,7 +763,8 @@ class Job:
         """Execute the job's handler and return its result.
 
         :param object manager: used as argument to the job's handler
-        :return: the return value from the handler's execution
+        :return: the return value from the handler's execution; an awaitable
+                 if the job :meth:`is asynchronous <is_async>`
 
         This method executes the job's handler. It doesn't change its running
         state, as this must be done by the caller::
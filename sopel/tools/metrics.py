@@ -0,0 +1,409 @@
+"""Sopel's metrics endpoint: internal tool to export runtime statistics.
+
+Sopel can serve its runtime statistics on a local HTTP endpoint, in the
+`Prometheus text format`__ (also accepted by OpenMetrics scrapers), so it can
+be monitored like any other service. The endpoint is enabled by the
+:attr:`~sopel.config.core_section.CoreSection.metrics_port` option.
+
+Counters (such as ``sopel_irc_lines_received_total``) only grow; per-second
+rates are computed by the scraper (e.g. with Prometheus' ``rate()``).
+
+.. __: https://prometheus.io/docs/instrumenting/exposition_formats/
+
+.. versionadded:: 8.1
+
+.. important::
+
+    This is an internal tool used by Sopel to export its statistics, and
+    should not be used by plugin authors. Its usage and documentation is for
+    Sopel core development and advanced developers. It is subject to rapid
+    changes between versions without much (or any) warning.
+
+"""
+# Licensed under the Eiffel Forum License 2.
+from __future__ import annotations
+
+import http.server
+import logging
+import threading
+from typing import Any, TYPE_CHECKING
+
+from sopel.tools import stats as tools_stats
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from sopel.bot import Sopel
+
+
+LOGGER = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+"""Content type of the metrics, as served by the endpoint."""
+METRICS_PATH = '/metrics'
+"""Path of the metrics on the endpoint."""
+
+
+def _escape(value: Any) -> str:
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\n', '\\n')
+        .replace('"', '\\"')
+    )
+
+
+def _format_labels(labels: Mapping[str, Any]) -> str:
+    if not labels:
+        return ''
+    return '{%s}' % ','.join(
+        '%s="%s"' % (name, _escape(value))
+        for name, value in labels.items()
+    )
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+class MetricsWriter:
+    """Writer of metrics in the Prometheus text format.
+
+    Each metric family is declared once with :meth:`declare`, followed by its
+    samples; :meth:`getvalue` returns the text of all the metrics.
+    """
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def declare(self, name: str, metric_type: str, help_text: str) -> None:
+        """Declare a metric family.
+
+        :param name: name of the metric family
+        :param metric_type: type of the metric family (e.g. ``counter``,
+                            ``gauge``, or ``histogram``)
+        :param help_text: description of the metric family
+        """
+        self._lines.append('# HELP %s %s' % (name, help_text))
+        self._lines.append('# TYPE %s %s' % (name, metric_type))
+
+    def sample(
+        self,
+        name: str,
+        value: float,
+        labels: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Add a sample of a metric.
+
+        :param name: name of the sample
+        :param value: value of the sample
+        :param labels: optional labels of the sample
+        """
+        self._lines.append('%s%s %s' % (
+            name, _format_labels(labels or {}), _format_value(value)))
+
+    def histogram(
+        self,
+        name: str,
+        buckets: Iterable[int],
+        total: float,
+        labels: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Add the samples of a histogram.
+
+        :param name: name of the histogram
+        :param buckets: number of observations per bucket of
+                        :data:`~sopel.tools.stats.EXECUTION_BUCKETS`, plus
+                        the observations above the last bucket
+        :param total: sum of the observations
+        :param labels: optional labels of the histogram
+
+        The counts of ``buckets`` are not cumulative: this method adds them up
+        as expected by the format.
+        """
+        labels = dict(labels or {})
+        bounds = [
+            repr(float(bound)) for bound in tools_stats.EXECUTION_BUCKETS
+        ] + ['+Inf']
+        count = 0
+        for bound, bucket_count in zip(bounds, buckets):
+            count += bucket_count
+            self.sample(name + '_bucket', count, dict(labels, le=bound))
+        self.sample(name + '_sum', total, labels)
+        self.sample(name + '_count', count, labels)
+
+    def getvalue(self) -> str:
+        """Get the text of the metrics.
+
+        :return: the metrics, one sample per line
+        """
+        return '\n'.join(self._lines) + '\n'
+
+
+def _handler_labels(
+    handler: tools_stats.HandlerStatsSnapshot,
+) -> dict[str, str]:
+    return {
+        'kind': handler.kind,
+        'plugin': handler.plugin or '',
+        'label': handler.label,
+    }
+
+
+def render_metrics(bot: Sopel) -> str:
+    """Render the runtime statistics of a ``bot``.
+
+    :param bot: the bot to get statistics from
+    :return: the statistics in the Prometheus text format
+    """
+    writer = MetricsWriter()
+
+    # network traffic
+    writer.declare(
+        'sopel_irc_lines_received_total', 'counter',
+        'Lines received from the IRC server.')
+    writer.sample('sopel_irc_lines_received_total', bot.lines_received)
+    writer.declare(
+        'sopel_irc_lines_sent_total', 'counter',
+        'Lines sent to the IRC server.')
+    writer.sample('sopel_irc_lines_sent_total', bot.lines_sent)
+
+    # inbound queue
+    inbound = bot.inbound_stats
+    writer.declare(
+        'sopel_dispatch_lag_seconds', 'gauge',
+        'Time the oldest message has been waiting for the dispatcher.')
+    writer.sample('sopel_dispatch_lag_seconds', bot.dispatch_lag)
+    writer.declare(
+        'sopel_inbound_queue_depth', 'gauge',
+        'Messages waiting for the dispatcher.')
+    writer.sample('sopel_inbound_queue_depth', inbound.queued)
+    writer.declare(
+        'sopel_inbound_dropped_total', 'counter',
+        'Messages dropped because the inbound queue was full.')
+    writer.sample('sopel_inbound_dropped_total', inbound.dropped)
+
+    # outbound queues
+    outbound = bot.outbound_stats
+    writer.declare(
+        'sopel_outbound_queue_depth', 'gauge',
+        'Messages waiting to be sent, by recipient.')
+    for recipient, queued in sorted(outbound.queued_by_recipient.items()):
+        writer.sample(
+            'sopel_outbound_queue_depth', queued, {'recipient': recipient})
+    writer.declare(
+        'sopel_outbound_flood_wait_seconds_total', 'counter',
+        'Time spent waiting for the flood protection.')
+    writer.sample(
+        'sopel_outbound_flood_wait_seconds_total', outbound.flood_wait_total)
+
+    # threads and workers
+    dispatch = bot.dispatch_stats
+    writer.declare('sopel_threads', 'gauge', 'Running threads.')
+    writer.sample('sopel_threads', threading.active_count())
+    writer.declare(
+        'sopel_dispatch_workers', 'gauge',
+        'Worker threads executing threaded rules.')
+    writer.sample('sopel_dispatch_workers', dispatch.workers)
+    writer.declare(
+        'sopel_dispatch_workers_busy', 'gauge',
+        'Worker threads currently executing a rule.')
+    writer.sample('sopel_dispatch_workers_busy', dispatch.busy)
+    writer.declare(
+        'sopel_dispatch_queue_depth', 'gauge',
+        'Triggered rules waiting for a worker.')
+    writer.sample('sopel_dispatch_queue_depth', dispatch.queued)
+    writer.declare(
+        'sopel_dispatch_dropped_total', 'counter',
+        'Triggered rules dropped because the dispatch queue was full.')
+    writer.sample('sopel_dispatch_dropped_total', dispatch.dropped)
+
+    # watchdog
+    watchdog = bot.watchdog_stats
+    if watchdog is not None:
+        writer.declare(
+            'sopel_watchdog_stalls_total', 'counter',
+            'Stalls detected by the watchdog.')
+        for name, stalls in sorted(watchdog.stalls_by_name.items()):
+            writer.sample(
+                'sopel_watchdog_stalls_total', stalls, {'name': name})
+        writer.declare(
+            'sopel_heartbeat_lag_seconds', 'gauge',
+            'Lag of the heartbeat sent to a thread or an event loop.')
+        for name, lag in sorted(watchdog.heartbeat_lags.items()):
+            writer.sample('sopel_heartbeat_lag_seconds', lag, {'name': name})
+
+    # database
+    queries = bot.db.query_stats.get_snapshot()
+    writer.declare(
+        'sopel_db_query_seconds', 'histogram',
+        'Execution time of the database queries.')
+    writer.histogram('sopel_db_query_seconds', queries.buckets, queries.total)
+    caches = (
+        ('nick_id', bot.db.nick_id_cache.get_stats()),
+        ('value', bot.db.value_cache.get_stats()),
+    )
+    writer.declare(
+        'sopel_db_cache_entries', 'gauge',
+        'Entries kept in a database cache.')
+    for name, cache in caches:
+        writer.sample('sopel_db_cache_entries', cache.size, {'cache': name})
+    writer.declare(
+        'sopel_db_cache_hits_total', 'counter',
+        'Lookups that found a value in a database cache.')
+    for name, cache in caches:
+        writer.sample('sopel_db_cache_hits_total', cache.hits, {'cache': name})
+    writer.declare(
+        'sopel_db_cache_misses_total', 'counter',
+        'Lookups that didn\'t find a value in a database cache.')
+    for name, cache in caches:
+        writer.sample(
+            'sopel_db_cache_misses_total', cache.misses, {'cache': name})
+    if bot.db.write_buffer is not None:
+        buffer = bot.db.write_buffer.get_stats()
+        writer.declare(
+            'sopel_db_pending_writes', 'gauge',
+            'Values waiting to be written to the database.')
+        writer.sample('sopel_db_pending_writes', buffer.pending)
+        writer.declare(
+            'sopel_db_coalesced_writes_total', 'counter',
+            'Values replaced by a newer one before being written.')
+        writer.sample('sopel_db_coalesced_writes_total', buffer.coalesced)
+        writer.declare(
+            'sopel_db_flushes_total', 'counter',
+            'Batches of values written to the database.')
+        writer.sample('sopel_db_flushes_total', buffer.flushes)
+        writer.declare(
+            'sopel_db_flush_errors_total', 'counter',
+            'Batches of values that failed to be written to the database.')
+        writer.sample('sopel_db_flush_errors_total', buffer.errors)
+        writer.declare(
+            'sopel_db_dropped_writes_total', 'counter',
+            'Values dropped after failing to be written too many times.')
+        writer.sample('sopel_db_dropped_writes_total', buffer.dropped)
+
+    # tracked channels and users
+    writer.declare('sopel_channels', 'gauge', 'Channels the bot is in.')
+    writer.sample('sopel_channels', len(bot.channels))
+    writer.declare('sopel_users', 'gauge', 'Users the bot is aware of.')
+    writer.sample('sopel_users', len(bot.users))
+
+    # plugin handlers
+    handlers = bot.handler_stats.get_snapshots()
+    counters = (
+        ('invocations', 'Executions of a plugin handler.'),
+        ('errors', 'Executions of a plugin handler that raised an error.'),
+        ('rate_limited', 'Executions of a plugin handler prevented by a '
+                         'rate limit.'),
+        ('skipped', 'Ticks of a plugin job skipped because it was still '
+                    'running.'),
+    )
+    for field, help_text in counters:
+        name = 'sopel_handler_%s_total' % field
+        writer.declare(name, 'counter', help_text)
+        for handler in handlers:
+            writer.sample(
+                name, getattr(handler, field), _handler_labels(handler))
+
+    writer.declare(
+        'sopel_handler_queue_wait_seconds_total', 'counter',
+        'Time spent by a plugin handler waiting for a worker.')
+    for handler in handlers:
+        writer.sample(
+            'sopel_handler_queue_wait_seconds_total',
+            handler.queue_wait_total,
+            _handler_labels(handler),
+        )
+
+    writer.declare(
+        'sopel_handler_execution_seconds', 'histogram',
+        'Execution time of a plugin handler.')
+    for handler in handlers:
+        writer.histogram(
+            'sopel_handler_execution_seconds',
+            handler.execution_buckets,
+            handler.execution_time_total,
+            _handler_labels(handler),
+        )
+
+    return writer.getvalue()
+
+
+class _MetricsRequestHandler(http.server.BaseHTTPRequestHandler):
+    server: _MetricsHTTPServer
+
+    def do_GET(self) -> None:
+        if self.path.split('?', 1)[0] != METRICS_PATH:
+            self.send_error(404)
+            return
+
+        try:
+            body = render_metrics(self.server.bot).encode('utf-8')
+        except Exception:
+            LOGGER.exception('Unable to render the metrics.')
+            self.send_error(500)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        LOGGER.debug('%s - %s', self.address_string(), format % args)
+
+
+class _MetricsHTTPServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], bot: Sopel) -> None:
+        super().__init__(address, _MetricsRequestHandler)
+        self.bot = bot
+
+
+class MetricsServer:
+    """HTTP server of the bot's metrics, running in its own thread.
+
+    :param bot: the bot to get statistics from
+    :param host: the address to listen on
+    :param port: the port to listen on; ``0`` to pick a free port
+
+    The metrics are served on :data:`METRICS_PATH`::
+
+        server = MetricsServer(bot, '127.0.0.1', 9712)
+        server.start()  # serve http://127.0.0.1:9712/metrics
+        server.stop()   # and stop serving
+
+    """
+    def __init__(self, bot: Sopel, host: str, port: int) -> None:
+        self._server = _MetricsHTTPServer((host, port), bot)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """The address and port the server listens on."""
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    def start(self) -> None:
+        """Start serving the metrics in a new thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name='sopel-metrics',
+            daemon=True,
+        )
+        self._thread.start()
+        host, port = self.address
+        LOGGER.info(
+            'Serving metrics on http://%s:%d%s', host, port, METRICS_PATH)
+
+    def stop(self) -> None:
+        """Stop serving the metrics and close the server."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
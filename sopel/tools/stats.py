@@ -0,0 +1,322 @@
+"""Sopel's runtime statistics: internal tool to measure rules, jobs, and more.
+
+.. versionadded:: 8.1
+
+.. important::
+
+    This is an internal tool used by Sopel to measure the execution of rules
+    and jobs, database queries, and network traffic, and should not be used by
+    plugin authors. Its usage and documentation is for Sopel core development
+    and advanced developers. It is subject to rapid changes between versions
+    without much (or any) warning.
+
+"""
+# Licensed under the Eiffel Forum License 2.
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import NamedTuple
+
+
+KIND_RULE = 'rule'
+"""Kind of the statistics of a plugin rule."""
+KIND_JOB = 'job'
+"""Kind of the statistics of a plugin job."""
+
+EXECUTION_BUCKETS: tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0,
+)
+"""Upper bounds (in seconds) of the execution time histogram's buckets.
+
+The histogram has one more bucket for execution times above the last bound.
+"""
+
+
+class HandlerStatsSnapshot(NamedTuple):
+    """Statistics of a rule or a job, at a given time."""
+    kind: str
+    """Kind of handler; one of :data:`KIND_RULE` or :data:`KIND_JOB`."""
+    plugin: str | None
+    """Name of the handler's plugin, if any."""
+    label: str
+    """Label of the handler."""
+    invocations: int
+    """Number of executions."""
+    errors: int
+    """Number of executions that raised an exception."""
+    rate_limited: int
+    """Number of times the handler was not executed due to a rate limit."""
+    skipped: int
+    """Number of ticks skipped because the job was still running."""
+    queue_wait_total: float
+    """Total time spent waiting for a worker before executions, in seconds."""
+    queue_wait_max: float
+    """Longest time spent waiting for a worker before execution, in seconds."""
+    execution_time_total: float
+    """Total execution time, in seconds."""
+    execution_time_max: float
+    """Longest execution time, in seconds."""
+    execution_buckets: tuple[int, ...]
+    """Number of executions per bucket of :data:`EXECUTION_BUCKETS`.
+
+    Counts are not cumulative, and the last count is for executions that took
+    longer than the last bucket's upper bound.
+    """
+
+    @property
+    def execution_time_avg(self) -> float:
+        """Average execution time, in seconds."""
+        if not self.invocations:
+            return 0.0
+        return self.execution_time_total / self.invocations
+
+    @property
+    def queue_wait_avg(self) -> float:
+        """Average time spent waiting for a worker, in seconds."""
+        if not self.invocations:
+            return 0.0
+        return self.queue_wait_total / self.invocations
+
+
+class HandlerStats:
+    """Counters of the executions of a rule or a job.
+
+    :param kind: kind of handler; one of :data:`KIND_RULE` or
+                 :data:`KIND_JOB`
+    :param plugin: name of the handler's plugin, if any
+    :param label: label of the handler
+
+    Counters are updated under a lock, so they can be recorded from any
+    thread; use :meth:`get_snapshot` to read them all at once.
+    """
+    def __init__(self, kind: str, plugin: str | None, label: str) -> None:
+        self.kind = kind
+        self.plugin = plugin
+        self.label = label
+        self._invocations = 0
+        self._errors = 0
+        self._rate_limited = 0
+        self._skipped = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        self._execution_time_total = 0.0
+        self._execution_time_max = 0.0
+        self._execution_buckets = [0] * (len(EXECUTION_BUCKETS) + 1)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return '<%s %s %s.%s>' % (
+            self.__class__.__name__, self.kind, self.plugin, self.label)
+
+    def record_execution(
+        self,
+        duration: float,
+        error: bool = False,
+        queue_wait: float = 0.0,
+    ) -> None:
+        """Record an execution of the handler.
+
+        :param duration: how long the execution took, in seconds
+        :param error: if the execution raised an exception
+        :param queue_wait: how long the execution waited for a worker, in
+                           seconds
+        """
+        bucket = bisect.bisect_left(EXECUTION_BUCKETS, duration)
+        with self._lock:
+            self._invocations += 1
+            if error:
+                self._errors += 1
+            self._queue_wait_total += queue_wait
+            self._queue_wait_max = max(self._queue_wait_max, queue_wait)
+            self._execution_time_total += duration
+            self._execution_time_max = max(self._execution_time_max, duration)
+            self._execution_buckets[bucket] += 1
+
+    def record_rate_limited(self) -> None:
+        """Record that the handler was not executed due to a rate limit."""
+        with self._lock:
+            self._rate_limited += 1
+
+    def record_skipped(self, count: int = 1) -> None:
+        """Record that the job skipped ticks because it was still running.
+
+        :param count: how many ticks were skipped
+        """
+        with self._lock:
+            self._skipped += count
+
+    def get_snapshot(self) -> HandlerStatsSnapshot:
+        """Get the current statistics of the handler.
+
+        :return: a snapshot of the handler's counters
+        """
+        with self._lock:
+            return HandlerStatsSnapshot(
+                self.kind,
+                self.plugin,
+                self.label,
+                self._invocations,
+                self._errors,
+                self._rate_limited,
+                self._skipped,
+                self._queue_wait_total,
+                self._queue_wait_max,
+                self._execution_time_total,
+                self._execution_time_max,
+                tuple(self._execution_buckets),
+            )
+
+
+class Counter:
+    """Counter that can be incremented from any thread.
+
+    :param value: initial value of the counter
+    """
+    def __init__(self, value: float = 0) -> None:
+        self._value = value
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> float:
+        """Current value of the counter."""
+        return self._value
+
+    def increment(self, amount: float = 1) -> None:
+        """Increment the counter.
+
+        :param amount: how much to add to the counter
+        """
+        with self._lock:
+            self._value += amount
+
+
+class DurationSnapshot(NamedTuple):
+    """Statistics of a :class:`DurationStats`, at a given time."""
+    observations: int
+    """Number of recorded durations."""
+    total: float
+    """Sum of the recorded durations, in seconds."""
+    max: float
+    """Longest recorded duration, in seconds."""
+    buckets: tuple[int, ...]
+    """Number of durations per bucket of :data:`EXECUTION_BUCKETS`.
+
+    Counts are not cumulative, and the last count is for durations longer
+    than the last bucket's upper bound.
+    """
+
+
+class DurationStats:
+    """Histogram of durations (such as database queries).
+
+    Durations are recorded under a lock, so they can be recorded from any
+    thread; use :meth:`get_snapshot` to read the statistics all at once.
+    """
+    def __init__(self) -> None:
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._buckets = [0] * (len(EXECUTION_BUCKETS) + 1)
+        self._lock = threading.Lock()
+
+    def record(self, duration: float) -> None:
+        """Record a duration.
+
+        :param duration: the duration to record, in seconds
+        """
+        bucket = bisect.bisect_left(EXECUTION_BUCKETS, duration)
+        with self._lock:
+            self._count += 1
+            self._total += duration
+            self._max = max(self._max, duration)
+            self._buckets[bucket] += 1
+
+    def get_snapshot(self) -> DurationSnapshot:
+        """Get the current statistics.
+
+        :return: a snapshot of the recorded durations
+        """
+        with self._lock:
+            return DurationSnapshot(
+                self._count,
+                self._total,
+                self._max,
+                tuple(self._buckets),
+            )
+
+
+class StatsRegistry:
+    """Registry of :class:`HandlerStats` by kind, plugin, and label.
+
+    The statistics of a handler are created the first time they are
+    requested with :meth:`get`, and they are kept until :meth:`clear` or
+    :meth:`remove_plugin` is called.
+    """
+    def __init__(self) -> None:
+        self._stats: dict[tuple[str, str | None, str], HandlerStats] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def get(self, kind: str, plugin: str | None, label: str) -> HandlerStats:
+        """Get the statistics of a handler.
+
+        :param kind: kind of handler; one of :data:`KIND_RULE` or
+                     :data:`KIND_JOB`
+        :param plugin: name of the handler's plugin, if any
+        :param label: label of the handler
+        :return: the handler's statistics, created if necessary
+        """
+        key = (kind, plugin, label)
+        stats = self._stats.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.get(key)
+                if stats is None:
+                    stats = self._stats[key] = HandlerStats(
+                        kind, plugin, label)
+        return stats
+
+    def get_snapshots(
+        self,
+        kind: str | None = None,
+        plugin: str | None = None,
+    ) -> list[HandlerStatsSnapshot]:
+        """Get the current statistics of the handlers.
+
+        :param kind: optional kind of handler to filter on
+        :param plugin: optional plugin name to filter on
+        :return: a snapshot of each handler's statistics, sorted by kind,
+                 plugin, and label
+        """
+        with self._lock:
+            items = sorted(
+                self._stats.items(),
+                key=lambda item: (item[0][0], item[0][1] or '', item[0][2]),
+            )
+
+        return [
+            stats.get_snapshot()
+            for (stats_kind, stats_plugin, _label), stats in items
+            if (kind is None or stats_kind == kind)
+            and (plugin is None or stats_plugin == plugin)
+        ]
+
+    def remove_plugin(self, plugin: str) -> None:
+        """Remove the statistics of a plugin's handlers.
+
+        :param plugin: the name of the plugin
+        """
+        with self._lock:
+            self._stats = {
+                key: stats
+                for key, stats in self._stats.items()
+                if key[1] != plugin
+            }
+
+    def clear(self) -> None:
+        """Remove all statistics."""
+        with self._lock:
+            self._stats = {}
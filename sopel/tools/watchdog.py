@@ -0,0 +1,281 @@
+"""Sopel's watchdog: internal tool to detect stalled threads and handlers.
+
+A slow handler can block the thread it runs in: a non-threaded rule blocks
+the dispatcher, a non-threaded job blocks the job scheduler, and an
+asynchronous handler that doesn't ``await`` blocks the event loop. The
+:class:`Watchdog` detects these stalls and logs the stack of the blocked
+thread, so they can be fixed before the server drops the connection.
+
+.. versionadded:: 8.1
+
+.. important::
+
+    This is an internal tool used by Sopel to monitor itself, and should not
+    be used by plugin authors. Its usage and documentation is for Sopel core
+    development and advanced developers. It is subject to rapid changes
+    between versions without much (or any) warning.
+
+"""
+# Licensed under the Eiffel Forum License 2.
+from __future__ import annotations
+
+import collections
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, NamedTuple, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class WatchdogStats(NamedTuple):
+    """Statistics of a :class:`Watchdog`."""
+    stalls: int
+    """Number of stalls detected since the watchdog was created."""
+    stalls_by_name: dict[str, int]
+    """Number of stalls detected for each execution or heartbeat name."""
+    heartbeat_lags: dict[str, float]
+    """Current lag of each heartbeat, in seconds."""
+
+
+class _Execution:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.thread_id = threading.get_ident()
+        self.started_at = time.monotonic()
+        self.reported = False
+
+
+class _Heartbeat:
+    def __init__(self, name: str, send: Callable[[Callable[[], None]], bool]):
+        self.name = name
+        self.send = send
+        self.thread_id: int | None = None
+        self.sent_at: float | None = None
+        self.received_at: float | None = None
+        self.lag = 0.0
+        self.reported = False
+
+    def is_pending(self) -> bool:
+        return self.sent_at is not None and self.received_at is None
+
+    def beat(self) -> None:
+        # called from the monitored thread (or event loop)
+        self.thread_id = threading.get_ident()
+        self.received_at = time.monotonic()
+
+
+async def beat_async(beat: Callable[[], None]) -> None:
+    """Call ``beat`` from a coroutine.
+
+    :param beat: the heartbeat's callback
+
+    This is a helper to send a heartbeat to an event loop, by scheduling this
+    coroutine on it.
+    """
+    beat()
+
+
+class Watchdog:
+    """Detector of stalled threads and handlers.
+
+    :param budget: how long (in seconds) an execution can run, or a heartbeat
+                   can be late, before it is reported as a stall
+    :param interval: how often (in seconds) to check for stalls; by default,
+                     a quarter of the ``budget``
+
+    The watchdog monitors two things:
+
+    * executions, such as a rule's handler, marked with :meth:`track`
+    * heartbeats, registered with :meth:`add_heartbeat`, that are sent
+      periodically to a thread or an event loop, and that are late when that
+      thread or loop is blocked
+
+    Each stall is reported once, with the stack of the blocked thread, and is
+    counted in the watchdog's :meth:`statistics <get_stats>`. The watchdog
+    checks for stalls in its own thread, between :meth:`start` and
+    :meth:`stop`.
+    """
+    def __init__(self, budget: float, interval: float | None = None) -> None:
+        if budget <= 0:
+            raise ValueError('Watchdog budget must be positive')
+
+        self.budget = budget
+        """How long an execution can run before it is reported as a stall."""
+        self.interval = interval if interval is not None else budget / 4
+        """How often to check for stalls, in seconds."""
+        self._executions: dict[int, _Execution] = {}
+        self._heartbeats: list[_Heartbeat] = []
+        self._stalls: collections.Counter[str] = collections.Counter()
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @contextlib.contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        """Track an execution in the current thread.
+
+        :param name: the name of the execution, used to report a stall
+
+        Use it as a context manager::
+
+            with watchdog.track('rule example.hello'):
+                handler(bot, trigger)
+
+        """
+        execution = _Execution(name)
+        key = id(execution)
+        with self._lock:
+            self._executions[key] = execution
+        try:
+            yield
+        finally:
+            with self._lock:
+                del self._executions[key]
+
+    def add_heartbeat(
+        self,
+        name: str,
+        send: Callable[[Callable[[], None]], bool],
+    ) -> None:
+        """Register a heartbeat.
+
+        :param name: the name of the monitored thread or event loop
+        :param send: a function that arranges for its argument to be called
+                     by the monitored thread or event loop, and returns
+                     ``True`` if it did (or ``False`` if it can't for now)
+        """
+        with self._lock:
+            self._heartbeats.append(_Heartbeat(name, send))
+
+    def get_stats(self) -> WatchdogStats:
+        """Get the current statistics of the watchdog.
+
+        :return: a snapshot of the stalls detected and of the heartbeat lags
+        """
+        with self._lock:
+            return WatchdogStats(
+                sum(self._stalls.values()),
+                dict(self._stalls),
+                {
+                    heartbeat.name: heartbeat.lag
+                    for heartbeat in self._heartbeats
+                },
+            )
+
+    def check(self) -> None:
+        """Check for stalls and send heartbeats.
+
+        This is called periodically by the watchdog's thread.
+        """
+        now = time.monotonic()
+        reports: list[tuple[str, int | None]] = []
+
+        with self._lock:
+            # only the latest execution of a thread is reported: it's the one
+            # that blocks the others in the same thread (if any)
+            latest: dict[int, _Execution] = {}
+            for execution in self._executions.values():
+                current = latest.get(execution.thread_id)
+                if (
+                    current is None
+                    or execution.started_at >= current.started_at
+                ):
+                    latest[execution.thread_id] = execution
+
+            for thread_id, execution in latest.items():
+                elapsed = now - execution.started_at
+                if execution.reported or elapsed < self.budget:
+                    continue
+                execution.reported = True
+                self._stalls[execution.name] += 1
+                reports.append((
+                    '%s has been running for %.1fs'
+                    % (execution.name, elapsed),
+                    thread_id,
+                ))
+
+            heartbeats = list(self._heartbeats)
+
+        for heartbeat in heartbeats:
+            if heartbeat.is_pending():
+                heartbeat.lag = now - (heartbeat.sent_at or now)
+                if not heartbeat.reported and heartbeat.lag >= self.budget:
+                    heartbeat.reported = True
+                    with self._lock:
+                        self._stalls[heartbeat.name] += 1
+                    reports.append((
+                        '%s is stalled: heartbeat late by %.1fs'
+                        % (heartbeat.name, heartbeat.lag),
+                        heartbeat.thread_id,
+                    ))
+                continue
+
+            if heartbeat.sent_at is not None and heartbeat.received_at:
+                heartbeat.lag = heartbeat.received_at - heartbeat.sent_at
+
+            heartbeat.sent_at = now
+            heartbeat.received_at = None
+            heartbeat.reported = False
+            try:
+                sent = heartbeat.send(heartbeat.beat)
+            except Exception:
+                LOGGER.exception(
+                    'Unable to send heartbeat to %s.', heartbeat.name)
+                sent = False
+            if not sent:
+                heartbeat.sent_at = None
+
+        if reports:
+            self._report(reports)
+
+    def _report(self, reports: list[tuple[str, int | None]]) -> None:
+        frames = sys._current_frames()
+        logged: set[int] = set()
+        for message, thread_id in reports:
+            if thread_id is None or thread_id not in frames:
+                LOGGER.warning('%s.', message)
+            elif thread_id in logged:
+                LOGGER.warning(
+                    '%s; blocked thread %d (stack above).',
+                    message, thread_id)
+            else:
+                logged.add(thread_id)
+                LOGGER.warning(
+                    '%s; stack of blocked thread %d:\n%s',
+                    message,
+                    thread_id,
+                    ''.join(traceback.format_stack(frames[thread_id])),
+                )
+
+    def start(self) -> None:
+        """Start checking for stalls in a new thread."""
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name='sopel-watchdog',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop checking for stalls and wait for the thread to end."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                LOGGER.exception('Unexpected error in the watchdog.')
@@ -0,0 +1,395 @@
+"""Sopel's Worker Pool: internal tool to execute tasks in threads.
+
+.. versionadded:: 8.1
+
+.. important::
+
+    This is an internal tool used by Sopel to execute threaded rules and
+    should not be used by plugin authors. Its usage and documentation is for
+    Sopel core development and advanced developers. It is subject to rapid
+    changes between versions without much (or any) warning.
+
+"""
+# Licensed under the Eiffel Forum License 2.
+from __future__ import annotations
+
+import collections
+import logging
+import queue
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    NamedTuple,
+    TYPE_CHECKING,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+LOGGER = logging.getLogger(__name__)
+
+POLICY_BLOCK = 'block'
+"""Wait for a free slot in the queue before submitting a task."""
+POLICY_DROP = 'drop'
+"""Drop the submitted task when the queue is full."""
+POLICY_OLDEST = 'oldest'
+"""Drop the oldest pending task when the queue is full."""
+POLICIES = (POLICY_BLOCK, POLICY_DROP, POLICY_OLDEST)
+"""All the policies available when the queue of a pool is full."""
+
+
+class Task:
+    """A callable submitted to a :class:`WorkerPool`.
+
+    :param func: the callable to execute
+    :param args: positional arguments for ``func``
+    :param name: the name of the task, used in logs and thread names
+    :param group: the group of the task, used to limit concurrency
+
+    A task can be joined, like a :class:`thread <threading.Thread>`, to wait
+    until it's done, either because it was executed or because it was dropped
+    from the queue.
+    """
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        args: tuple[Any, ...] = (),
+        name: str | None = None,
+        group: str | None = None,
+    ) -> None:
+        self.func = func
+        self.args = args
+        self.name = name or getattr(func, '__name__', 'task')
+        """Name of the task."""
+        self.group = group
+        """Group of the task, if any."""
+        self.submitted_at: float = time.monotonic()
+        """When the task was submitted (monotonic clock)."""
+        self.started_at: float | None = None
+        """When the task started (monotonic clock), if it did."""
+        self.thread: threading.Thread | None = None
+        """The worker thread executing the task, once started."""
+        self.dropped = False
+        """Flag set when the task is dropped without being executed."""
+        self._done = threading.Event()
+
+    def __repr__(self) -> str:
+        return '<%s %s%s>' % (
+            self.__class__.__name__,
+            self.name,
+            ' (group %s)' % self.group if self.group else '',
+        )
+
+    def is_alive(self) -> bool:
+        """Tell if the task is pending or running.
+
+        :return: ``True`` until the task is done or dropped
+        """
+        return not self._done.is_set()
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait until the task is done or dropped.
+
+        :param timeout: optional timeout in seconds
+        """
+        self._done.wait(timeout)
+
+
+class WorkerPoolStats(NamedTuple):
+    """Statistics of a :class:`WorkerPool`."""
+    workers: int
+    """Number of worker threads."""
+    busy: int
+    """Number of worker threads currently executing a task."""
+    queued: int
+    """Number of tasks waiting in the queue."""
+    submitted: int
+    """Number of tasks submitted since the pool was created."""
+    completed: int
+    """Number of tasks executed since the pool was created."""
+    dropped: int
+    """Number of tasks dropped since the pool was created."""
+    wait_time_avg: float
+    """Average time spent by executed tasks in the queue, in seconds."""
+    wait_time_max: float
+    """Longest time spent by an executed task in the queue, in seconds."""
+
+
+class WorkerPool:
+    """Bounded pool of threads executing tasks from a bounded queue.
+
+    :param max_workers: maximum number of worker threads
+    :param queue_size: maximum number of pending tasks; ``0`` for unbounded
+    :param policy: what to do when the queue is full; one of :data:`POLICIES`
+    :param group_limits: optional map of task groups to the maximum number of
+                         tasks of that group that can run at the same time
+    :param name: prefix used to name the worker threads
+
+    Worker threads are started on demand, up to ``max_workers``, and they
+    execute tasks in submission order. A task whose group already has as many
+    running tasks as its limit stays in the queue until one of them is done,
+    and other tasks can run in the meantime.
+
+    When the queue is full, the ``policy`` decides what happens:
+
+    * ``block``: :meth:`submit` waits until a task leaves the queue
+    * ``drop``: the submitted task is dropped
+    * ``oldest``: the oldest pending task is dropped to make room
+
+    .. warning::
+
+        With the ``block`` policy, submitting a task from a worker thread
+        while the queue is full can block that worker until another one frees
+        a slot in the queue. A thread that must never block (such as an event
+        loop) can submit with ``block=False``, and wait for a slot elsewhere
+        with :meth:`wait_for_slot`.
+
+    """
+    def __init__(
+        self,
+        max_workers: int,
+        queue_size: int = 0,
+        policy: str = POLICY_BLOCK,
+        group_limits: Mapping[str, int] | None = None,
+        name: str = 'sopel-worker',
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        if queue_size < 0:
+            raise ValueError('queue_size must not be negative')
+        if policy not in POLICIES:
+            raise ValueError('Unknown queue policy: %r' % policy)
+
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.policy = policy
+        self.group_limits: dict[str, int] = dict(group_limits or {})
+        self.name = name
+
+        self._condition = threading.Condition()
+        self._pending: collections.deque[Task] = collections.deque()
+        self._running: list[Task] = []
+        self._group_running: collections.Counter[str] = collections.Counter()
+        self._workers: list[threading.Thread] = []
+        self._idle = 0
+        self._stopping = False
+        self._submitted = 0
+        self._completed = 0
+        self._dropped = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        name: str | None = None,
+        group: str | None = None,
+        block: bool = True,
+    ) -> Task:
+        """Submit ``func`` to be executed by a worker thread.
+
+        :param func: the callable to execute
+        :param args: positional arguments for ``func``
+        :param name: optional name of the task
+        :param group: optional group of the task, to limit its concurrency
+        :param block: with the ``block`` policy, whether to wait for a free
+                      slot when the queue is full (the default)
+        :return: the submitted task; its :attr:`~Task.dropped` flag is set if
+                 it has been dropped immediately
+        :raise RuntimeError: when the pool is shut down
+        :raise queue.Full: when the queue is full, with the ``block`` policy
+                           and ``block=False``
+        """
+        task = Task(func, args, name=name, group=group)
+
+        with self._condition:
+            if self._stopping:
+                raise RuntimeError('Cannot submit a task to a stopped pool')
+
+            self._submitted += 1
+            if self._is_full():
+                if self.policy == POLICY_DROP:
+                    self._drop(task)
+                    return task
+                elif self.policy == POLICY_OLDEST:
+                    self._drop(self._pending.popleft())
+                elif not block:
+                    self._submitted -= 1
+                    raise queue.Full
+                else:
+                    while self._is_full() and not self._stopping:
+                        self._condition.wait()
+
+                    if self._stopping:
+                        self._drop(task)
+                        return task
+
+            self._pending.append(task)
+            # each pending task needs its own worker, up to max_workers
+            while (
+                len(self._pending) > self._idle
+                and len(self._workers) < self.max_workers
+            ):
+                self._start_worker()
+            self._condition.notify_all()
+
+        return task
+
+    def wait_for_slot(self, timeout: float | None = None) -> bool:
+        """Wait until the queue is not full, or the pool is shut down.
+
+        :param timeout: optional timeout in seconds
+        :return: ``True`` if a slot is free (or the pool is shut down),
+                 ``False`` on timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._is_full() or self._stopping,
+                timeout,
+            )
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Stop the workers once the pending tasks are done.
+
+        :param timeout: optional timeout in seconds to wait for the workers
+
+        Once shut down, the pool doesn't accept new tasks anymore.
+        """
+        with self._condition:
+            self._stopping = True
+            workers = list(self._workers)
+            self._condition.notify_all()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in workers:
+            if worker is threading.current_thread():
+                continue
+            if deadline is None:
+                worker.join()
+            else:
+                worker.join(max(0.0, deadline - time.monotonic()))
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of tasks waiting in the queue."""
+        return len(self._pending)
+
+    @property
+    def oldest_wait_time(self) -> float:
+        """How long the oldest pending task has been waiting, in seconds.
+
+        This is ``0`` when no task is waiting in the queue.
+        """
+        with self._condition:
+            if not self._pending:
+                return 0.0
+            return time.monotonic() - self._pending[0].submitted_at
+
+    @property
+    def tasks(self) -> list[Task]:
+        """Tasks currently running or waiting in the queue."""
+        with self._condition:
+            return self._running + list(self._pending)
+
+    def get_stats(self) -> WorkerPoolStats:
+        """Get the current statistics of this pool.
+
+        :return: a snapshot of the pool's statistics
+        """
+        with self._condition:
+            completed = self._completed
+            return WorkerPoolStats(
+                workers=len(self._workers),
+                busy=len(self._running),
+                queued=len(self._pending),
+                submitted=self._submitted,
+                completed=completed,
+                dropped=self._dropped,
+                wait_time_avg=(
+                    self._wait_time_total / completed if completed else 0.0),
+                wait_time_max=self._wait_time_max,
+            )
+
+    def _is_full(self) -> bool:
+        return bool(self.queue_size) and len(self._pending) >= self.queue_size
+
+    def _drop(self, task: Task) -> None:
+        # must be called with the condition acquired
+        self._dropped += 1
+        task.dropped = True
+        task._done.set()
+        LOGGER.warning(
+            '%s queue is full (%d tasks); dropping task %s',
+            self.name, len(self._pending), task.name)
+
+    def _start_worker(self) -> None:
+        # must be called with the condition acquired
+        # the new worker is idle until it pops a task
+        self._idle += 1
+        worker = threading.Thread(
+            target=self._work,
+            name='%s-%d' % (self.name, len(self._workers) + 1),
+            daemon=True,
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _pop_task(self) -> Task | None:
+        # must be called with the condition acquired
+        for index, task in enumerate(self._pending):
+            group = task.group
+            if group is not None and group in self.group_limits:
+                if self._group_running[group] >= self.group_limits[group]:
+                    # too many tasks of this group are running already
+                    continue
+            del self._pending[index]
+            return task
+        return None
+
+    def _work(self) -> None:
+        worker = threading.current_thread()
+        worker_name = worker.name
+
+        while True:
+            with self._condition:
+                task = self._pop_task()
+                while task is None:
+                    if self._stopping and not self._pending:
+                        self._idle -= 1
+                        return
+                    self._condition.wait()
+                    task = self._pop_task()
+                self._idle -= 1
+
+                task.started_at = time.monotonic()
+                task.thread = worker
+                wait_time = task.started_at - task.submitted_at
+                self._wait_time_total += wait_time
+                self._wait_time_max = max(self._wait_time_max, wait_time)
+                self._running.append(task)
+                if task.group:
+                    self._group_running[task.group] += 1
+                # a slot is free in the queue
+                self._condition.notify_all()
+
+            worker.name = '%s-%s' % (worker_name, task.name)
+            try:
+                task.func(*task.args)
+            except Exception:
+                LOGGER.exception('Unexpected error in task %s', task.name)
+            finally:
+                worker.name = worker_name
+                with self._condition:
+                    self._running.remove(task)
+                    self._completed += 1
+                    self._idle += 1
+                    if task.group:
+                        self._group_running[task.group] -= 1
+                        # another task of this group may run now
+                        self._condition.notify_all()
+                task._done.set()
@@ -10,9 +10,11 @@ aid of Sopel's core development.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+import functools
 import re
 from typing import (
     cast,
+    Iterable,
     Match,
     Sequence,
     TYPE_CHECKING,
@@ -29,7 +31,9 @@ if TYPE_CHECKING:
 
 __all__ = [
     'PreTrigger',
+    'PrivilegeMatcher',
     'Trigger',
+    'get_privilege_matcher',
 ]
 
 COMMANDS_WITH_CONTEXT = frozenset({
@@ -53,6 +57,111 @@ For IRC message types other than those listed here, the ``trigger``\'s
 """
 
 
+class PrivilegeMatcher:
+    """Tell if a user is the bot's owner, or one of its admins.
+
+    :param owner: the owner's nick or hostmask (which can contain ``*``
+                  wildcards)
+    :param owner_account: the owner's services account name; when set, it
+                          is used instead of ``owner``
+    :param admins: the admins' nicks or hostmasks
+    :param admin_accounts: the admins' services account names
+
+    The ``owner`` and ``admins`` patterns are compiled once, and the
+    ``admins`` are combined into a single regular expression, so that matching
+    a user doesn't compile anything.
+
+    .. seealso::
+
+        Use :func:`get_privilege_matcher` to get the matcher for the bot's
+        settings.
+
+    .. versionadded:: 8.1
+    """
+    def __init__(
+        self,
+        owner: str,
+        owner_account: str | None = None,
+        admins: Iterable[str] = tuple(),
+        admin_accounts: Iterable[str] = tuple(),
+    ) -> None:
+        self.owner_account = owner_account
+        self._owner_pattern = tools.get_hostmask_regex(owner)
+        self.admin_accounts = frozenset(admin_accounts)
+        patterns = [tools.get_hostmask_regex(admin).pattern for admin in admins]
+        self._admins_pattern = (
+            re.compile('|'.join(patterns), re.I) if patterns else None
+        )
+
+    @staticmethod
+    def _match(pattern: re.Pattern, nick: str, host: str | None) -> bool:
+        return bool(
+            pattern.match(nick) or
+            pattern.match('@'.join((nick, host or '')))
+        )
+
+    def is_owner(self, nick: str, host: str | None, account: str | None) -> bool:
+        """Tell if the user is the bot's owner.
+
+        :param nick: the user's nick
+        :param host: the user's host
+        :param account: the user's services account name, if any
+        :return: ``True`` if the user is the owner, ``False`` otherwise
+        """
+        if self.owner_account:
+            return self.owner_account == account
+        return self._match(self._owner_pattern, nick, host)
+
+    def is_admin(self, nick: str, host: str | None, account: str | None) -> bool:
+        """Tell if the user is one of the bot's admins.
+
+        :param nick: the user's nick
+        :param host: the user's host
+        :param account: the user's services account name, if any
+        :return: ``True`` if the user is an admin (or the owner), ``False``
+                 otherwise
+        """
+        return (
+            self.is_owner(nick, host, account) or
+            account in self.admin_accounts or
+            (
+                self._admins_pattern is not None and
+                self._match(self._admins_pattern, nick, host)
+            )
+        )
+
+
+@functools.lru_cache(maxsize=16)
+def _build_privilege_matcher(
+    owner: str,
+    owner_account: str | None,
+    admins: tuple[str, ...],
+    admin_accounts: tuple[str, ...],
+) -> PrivilegeMatcher:
+    return PrivilegeMatcher(owner, owner_account, admins, admin_accounts)
+
+
+def get_privilege_matcher(settings: config.Config) -> PrivilegeMatcher:
+    """Get the privilege matcher for the bot's ``settings``.
+
+    :param settings: the bot's settings
+    :return: the matcher for the ``owner``, ``owner_account``, ``admins``, and
+             ``admin_accounts`` settings of the ``[core]`` section
+
+    Matchers are cached by the value of these settings: a new matcher is built
+    only when one of them changes.
+
+    .. versionadded:: 8.1
+    """
+    core = settings.core
+    return _build_privilege_matcher(
+        core.owner,
+        core.owner_account,
+        tuple(core.admins),
+        tuple(core.admin_accounts),
+    )
+
+
 class PreTrigger:
     """A parsed raw message from the server.
 
@@ -171,6 +280,11 @@ class PreTrigger:
         self.urls: tuple[str, ...] = tuple()
         self.plain: str = ''
         self.ctcp: str | None = None
+        # owner & admin status, shared by every Trigger of this message
+        self._privileges: dict[
+            tuple[PrivilegeMatcher, str | None],
+            tuple[bool, bool],
+        ] = {}
 
         # Break off IRCv3 message tags, if present
         self.tags: dict[str, str | None] = {}
@@ -496,7 +610,7 @@ class Trigger(str):
 
     :type: dict
     """
-    admin = property(lambda self: self._admin)
+    admin = property(lambda self: self._get_privileges()[1])
     """Whether the triggering :attr:`nick` is one of the bot's admins.
 
     :type: bool
@@ -505,13 +619,23 @@ class Trigger(str):
 
     Note that Sopel's :attr:`~.config.core_section.CoreSection.owner` is also
     considered to be an admin.
+
+    .. versionchanged:: 8.1
+
+        Computed on first access, once for every trigger of the same message.
+
     """
-    owner = property(lambda self: self._owner)
+    owner = property(lambda self: self._get_privileges()[0])
     """Whether the :attr:`nick` which triggered the command is the bot's owner.
 
     :type: bool
 
     ``True`` if the triggering :attr:`nick` is Sopel's owner; ``False`` if not.
+
+    .. versionchanged:: 8.1
+
+        Computed on first access, once for every trigger of the same message.
+
     """
     account = property(lambda self: self.tags.get('account') or self._account)
     """The services account name of the user sending the message.
@@ -544,20 +668,16 @@ class Trigger(str):
         self._pretrigger = message
         self._match = match
         self._is_privmsg = message.sender and message.sender.is_nick()
-
-        def match_host_or_nick(pattern):
-            pattern = tools.get_hostmask_regex(pattern)
-            return bool(
-                pattern.match(self.nick) or
-                pattern.match('@'.join((self.nick, self.host)))
-            )
-
-        if settings.core.owner_account:
-            self._owner = settings.core.owner_account == self.account
-        else:
-            self._owner = match_host_or_nick(settings.core.owner)
-        self._admin = (
-            self._owner or
-            self.account in settings.core.admin_accounts or
-            any(match_host_or_nick(item) for item in settings.core.admins)
-        )
+        self._settings = settings
+
+    def _get_privileges(self) -> tuple[bool, bool]:
+        matcher = get_privilege_matcher(self._settings)
+        account = self.account
+        key = (matcher, account)
+        privileges = self._pretrigger._privileges.get(key)
+        if privileges is None:
+            owner = matcher.is_owner(self.nick, self.host, account)
+            admin = owner or matcher.is_admin(self.nick, self.host, account)
+            privileges = (owner, admin)
+            self._pretrigger._privileges[key] = privileges
+        return privileges
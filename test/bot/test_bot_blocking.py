@@ -98,3 +98,34 @@ def test_is_pretrigger_blocked_single(
     pretrigger = trigger.PreTrigger(bot.nick, line)
 
     assert bot._is_pretrigger_blocked(pretrigger) == result
+
+
+def test_is_pretrigger_blocked_settings_changed(
+    configfactory: ConfigFactory,
+    botfactory: BotFactory,
+):
+    """Test that the blocklist is updated when the settings change."""
+    bot = mockbot(botfactory, configfactory, NICK_CONFIG)
+
+    line = ':Foo!foo@example.com PRIVMSG #sopel :hello'
+    pretrigger = trigger.PreTrigger(bot.nick, line)
+    assert bot._is_pretrigger_blocked(pretrigger) == (False, False, False)
+
+    blocklist = bot._get_blocklist()
+    assert bot._get_blocklist() is blocklist, 'The blocklist must be reused'
+
+    bot.settings.core.host_blocks = [r'(.+\.)*example\.com']
+    assert bot._get_blocklist() is not blocklist
+    assert bot._is_pretrigger_blocked(pretrigger) == (False, True, False)
+
+
+def test_nick_blocked_escaped(
+    configfactory: ConfigFactory,
+    botfactory: BotFactory,
+):
+    """Test that escaped characters in a plain nick are matched."""
+    bot = mockbot(botfactory, configfactory, NICK_CONFIG)
+
+    assert bot._nick_blocked(bot.make_identifier('escaped[user]'))
+    assert bot._nick_blocked(bot.make_identifier('SpamUser'))
+    assert not bot._nick_blocked(bot.make_identifier('escapeduser'))
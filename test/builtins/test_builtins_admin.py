@@ -93,3 +93,23 @@ def test_invite_accept_not_us(irc: MockIRCServer, henry: MockUser) -> None:
     irc.bot.settings.admin.auto_accept_invite = True
     irc.invite(henry, 'Anne', '#boudoir')
     assert len(irc.bot.backend.message_sent) == 0
+
+
+def test_handler_stats(irc: MockIRCServer, owner: MockUser) -> None:
+    """Verify that the slowest handlers are listed."""
+    stats = irc.bot.handler_stats.get('rule', 'testplugin', 'testrule')
+    stats.record_execution(0.25, error=True)
+
+    irc.pm(owner, '.handlerstats testplugin')
+    assert irc.bot.backend.message_sent == rawlist(
+        'PRIVMSG Uowner :rule testplugin.testrule: 1 calls, 1 errors, '
+        '0 rate-limited; avg 250.0ms, max 250.0ms; queue avg 0.0ms',
+    )
+
+
+def test_handler_stats_empty(irc: MockIRCServer, owner: MockUser) -> None:
+    """Verify the reply when there are no statistics for a plugin."""
+    irc.pm(owner, '.handlerstats unknown')
+    assert irc.bot.backend.message_sent == rawlist(
+        'PRIVMSG Uowner :Uowner: No statistics yet.',
+    )
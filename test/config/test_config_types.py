@@ -385,6 +385,75 @@ def test_choice_serialize():
         option.serialize('d')
 
 
+def test_integer_attribute():
+    option = types.IntegerAttribute('foo')
+    assert option.name == 'foo'
+    assert option.default is None
+    assert option.is_secret is False
+    assert option.minimum is None
+    assert option.maximum is None
+
+
+def test_integer_parse():
+    option = types.IntegerAttribute('foo')
+    assert option.parse('1') == 1
+    assert option.parse('-5') == -5
+
+    with pytest.raises(ValueError):
+        option.parse('a')
+
+
+def test_integer_parse_range():
+    option = types.IntegerAttribute('foo', minimum=1, maximum=10)
+    assert option.parse('1') == 1
+    assert option.parse('10') == 10
+
+    with pytest.raises(ValueError):
+        option.parse('0')
+
+    with pytest.raises(ValueError):
+        option.parse('11')
+
+
+def test_integer_serialize():
+    option = types.IntegerAttribute('foo', minimum=0)
+    assert option.serialize(0) == '0'
+    assert option.serialize(42) == '42'
+
+    with pytest.raises(ValueError):
+        option.serialize(-1)
+
+
+def test_float_parse():
+    option = types.FloatAttribute('foo')
+    assert option.parse('1') == 1.0
+    assert option.parse('-0.5') == -0.5
+
+    with pytest.raises(ValueError):
+        option.parse('a')
+
+
+def test_float_parse_range():
+    option = types.FloatAttribute('foo', minimum=0, maximum=1)
+    assert option.parse('0') == 0.0
+    assert option.parse('0.5') == 0.5
+
+    with pytest.raises(ValueError):
+        option.parse('-0.1')
+
+    with pytest.raises(ValueError):
+        option.parse('1.5')
+
+
+def test_float_serialize():
+    option = types.FloatAttribute('foo', minimum=0)
+    assert option.serialize(0) == '0.0'
+    assert option.serialize(2.5) == '2.5'
+
+    with pytest.raises(ValueError):
+        option.serialize(-1)
+
+
 def test_filename_attribute():
     option = types.FilenameAttribute('foo')
     assert option.name == 'foo'
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import pytest
 
+from sopel.irc import outbound
 from sopel.irc.isupport import ISupport
 from sopel.tests.mocks import MockIRCBackend
 
@@ -86,6 +87,48 @@ def test_send_command():
     assert bot.message_sent == [expected]
 
 
+class PriorityBackend(MockIRCBackend):
+    def irc_send(self, data, priority=outbound.PRIORITY_NORMAL):
+        self.message_sent.append((data, priority))
+
+
+class LegacyBackend(MockIRCBackend):
+    # backend written before the priority parameter existed
+    def irc_send(self, data):
+        self.message_sent.append(data)
+
+
+def test_send_command_priority():
+    backend = PriorityBackend(BotCollector())
+
+    backend.send_command('JOIN', '#sopel')
+    backend.send_command('PART', '#sopel')
+    backend.send_command('PRIVMSG', '#sopel', text='Hi!')
+    backend.send_command('PRIVMSG', '#sopel', text='Hi!',
+                         priority=outbound.PRIORITY_ADMIN)
+
+    assert backend.message_sent == [
+        (b'JOIN #sopel\r\n', outbound.PRIORITY_PROTOCOL),
+        (b'PART #sopel\r\n', outbound.PRIORITY_PROTOCOL),
+        (b'PRIVMSG #sopel :Hi!\r\n', outbound.PRIORITY_NORMAL),
+        (b'PRIVMSG #sopel :Hi!\r\n', outbound.PRIORITY_ADMIN),
+    ]
+
+
+def test_send_command_legacy_irc_send():
+    bot = BotCollector()
+    backend = LegacyBackend(bot)
+
+    backend.send_command('JOIN', '#sopel')
+    backend.send_command('PRIVMSG', '#sopel', text='Hi!')
+
+    assert backend.message_sent == [
+        b'JOIN #sopel\r\n',
+        b'PRIVMSG #sopel :Hi!\r\n',
+    ]
+    assert bot.message_sent == ['JOIN #sopel\r\n', 'PRIVMSG #sopel :Hi!\r\n']
+
+
 def test_send_command_args():
     bot = BotCollector()
     backend = MockIRCBackend(bot)
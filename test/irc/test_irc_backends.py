@@ -0,0 +1,87 @@
+"""Tests for core ``sopel.irc.backends``"""
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from sopel.irc import outbound
+from sopel.irc.backends import AsyncioBackend
+
+
+TMP_CONFIG = """
+[core]
+owner = Exirel
+nick = Sopel
+"""
+
+
+class MockWriter:
+    def __init__(self):
+        self.data = []
+
+    def write(self, data):
+        self.data.append(data)
+
+    async def drain(self):
+        pass
+
+
+@pytest.fixture
+def backend(configfactory, botfactory):
+    settings = configfactory('conf.ini', TMP_CONFIG)
+    bot = botfactory(settings)
+    backend = AsyncioBackend(bot, 'irc.example.com', 6667, None)
+    backend._writer = MockWriter()
+    return backend
+
+
+def run_write_forever(backend, *lines, wait=0):
+    async def run():
+        backend._loop = asyncio.get_running_loop()
+        for data, priority in lines:
+            backend.irc_send(data, priority)
+
+        await asyncio.sleep(wait)
+        task = asyncio.create_task(backend.write_forever())
+        for _ in range(len(lines) + 1):
+            await asyncio.sleep(0)
+        task.cancel()
+
+    asyncio.run(run())
+
+
+def test_asyncio_backend_write_priority(backend):
+    run_write_forever(
+        backend,
+        (b'PRIVMSG #sopel :one\r\n', outbound.PRIORITY_NORMAL),
+        (b'PRIVMSG #sopel :admin\r\n', outbound.PRIORITY_ADMIN),
+        (b'PRIVMSG #sopel :two\r\n', outbound.PRIORITY_NORMAL),
+        (b'PONG irc.example.com\r\n', outbound.PRIORITY_PROTOCOL),
+    )
+
+    assert backend._writer.data == [
+        b'PONG irc.example.com\r\n',
+        b'PRIVMSG #sopel :admin\r\n',
+        b'PRIVMSG #sopel :one\r\n',
+        b'PRIVMSG #sopel :two\r\n',
+    ]
+
+
+def test_asyncio_backend_write_deadline(backend):
+    backend.bot.settings.core.output_deadline = 0.01
+    start = time.monotonic()
+    run_write_forever(
+        backend,
+        (b'PRIVMSG #sopel :stale\r\n', outbound.PRIORITY_NORMAL),
+        (b'PRIVMSG #sopel :admin\r\n', outbound.PRIORITY_ADMIN),
+        (b'PONG irc.example.com\r\n', outbound.PRIORITY_PROTOCOL),
+        wait=0.02,
+    )
+    assert time.monotonic() - start >= 0.02
+
+    assert backend._writer.data == [
+        b'PONG irc.example.com\r\n',
+        b'PRIVMSG #sopel :admin\r\n',
+    ], 'Only normal messages can be dropped'
@@ -0,0 +1,152 @@
+"""Tests for core ``sopel.irc.outbound``"""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from sopel.irc import outbound
+from sopel.tests import rawlist
+
+
+TMP_CONFIG = """
+[core]
+owner = Exirel
+nick = Sopel
+user = sopel
+name = Sopel (https://sopel.chat)
+flood_burst_lines = 2
+flood_refill_rate = 1
+flood_empty_wait = 0.05
+flood_max_wait = 0.05
+"""
+
+
+@pytest.fixture
+def bot(configfactory, botfactory):
+    settings = configfactory('conf.ini', TMP_CONFIG)
+    return botfactory(settings)
+
+
+def test_say_burst(bot):
+    bot.say('one', '#a')
+    bot.say('two', '#a')
+
+    assert bot.backend.message_sent == rawlist(
+        'PRIVMSG #a :one',
+        'PRIVMSG #a :two',
+    ), 'Messages within the burst must be sent right away'
+    assert bot._outbound.queued == 0
+
+
+def test_say_queued(bot):
+    for index in range(4):
+        bot.say('line %d' % index, '#busy')
+
+    assert bot.backend.message_sent == rawlist(
+        'PRIVMSG #busy :line 0',
+        'PRIVMSG #busy :line 1',
+    ), 'Messages beyond the burst must not block the caller'
+    assert bot._outbound.queued == 2
+
+    bot.say('hello', '#quiet')
+    assert bot.backend.message_sent[-1:] == rawlist('PRIVMSG #quiet :hello'), (
+        'A quiet recipient must not wait behind a busy one')
+
+    assert bot._outbound.join(timeout=5)
+    assert bot.backend.message_sent[3:] == rawlist(
+        'PRIVMSG #busy :line 2',
+        'PRIVMSG #busy :line 3',
+    )
+
+
+def test_outbound_stats(bot):
+    for index in range(4):
+        bot.say('line %d' % index, '#busy')
+    bot.say('hello', '#quiet')
+
+    stats = bot.outbound_stats
+    assert stats.queued == 2
+    assert stats.queued_by_recipient == {'#busy': 2}
+
+    assert bot._outbound.join(timeout=5)
+    stats = bot.outbound_stats
+    assert stats.queued == 0
+    assert stats.queued_by_recipient == {}
+    assert stats.flood_wait_total > 0, 'The sender must wait for the flood'
+
+
+def test_say_queued_fairness(bot):
+    for index in range(4):
+        bot.say('a%d' % index, '#a')
+        bot.say('b%d' % index, '#b')
+
+    assert bot._outbound.join(timeout=5)
+    assert bot.backend.message_sent == rawlist(
+        'PRIVMSG #a :a0',
+        'PRIVMSG #b :b0',
+        'PRIVMSG #a :a1',
+        'PRIVMSG #b :b1',
+        'PRIVMSG #a :a2',
+        'PRIVMSG #b :b2',
+        'PRIVMSG #a :a3',
+        'PRIVMSG #b :b3',
+    )
+
+
+def test_say_queued_stop(bot):
+    for index in range(4):
+        bot.say('line %d' % index, '#busy')
+
+    bot._outbound.stop()
+    assert bot._outbound.queued == 0
+    assert bot._outbound.join(timeout=1)
+    assert len(bot.backend.message_sent) == 2
+
+
+def test_say_queued_priority(bot):
+    for index in range(4):
+        bot.say('line %d' % index, '#busy')
+    bot.say('admin', '#busy', priority=outbound.PRIORITY_ADMIN)
+
+    assert bot._outbound.join(timeout=5)
+    assert bot.backend.message_sent[2:] == rawlist(
+        'PRIVMSG #busy :admin',
+        'PRIVMSG #busy :line 2',
+        'PRIVMSG #busy :line 3',
+    ), 'Messages with a higher priority must be sent first'
+
+
+def test_say_queued_deadline(bot):
+    bot.settings.core.flood_empty_wait = 0.2
+    bot.settings.core.flood_max_wait = 0.2
+    bot.settings.core.output_deadline = 0.1
+
+    for index in range(3):
+        bot.say('line %d' % index, '#busy')
+    bot.say('admin', '#busy', priority=outbound.PRIORITY_ADMIN)
+    bot.say('late', '#busy')
+
+    start = time.monotonic()
+    assert bot._outbound.join(timeout=5)
+    assert time.monotonic() - start >= 0.1
+    assert bot.backend.message_sent == rawlist(
+        'PRIVMSG #busy :line 0',
+        'PRIVMSG #busy :line 1',
+        'PRIVMSG #busy :admin',
+    ), 'Stale messages must be dropped'
+
+
+@pytest.mark.parametrize('command, expected', (
+    ('PONG', outbound.PRIORITY_PROTOCOL),
+    ('cap', outbound.PRIORITY_PROTOCOL),
+    ('WHO', outbound.PRIORITY_PROTOCOL),
+    ('AUTHENTICATE', outbound.PRIORITY_PROTOCOL),
+    ('JOIN', outbound.PRIORITY_PROTOCOL),
+    ('part', outbound.PRIORITY_PROTOCOL),
+    ('PRIVMSG', outbound.PRIORITY_NORMAL),
+    ('NOTICE', outbound.PRIORITY_NORMAL),
+    ('QUIT', outbound.PRIORITY_NORMAL),
+))
+def test_get_command_priority(command, expected):
+    assert outbound.get_command_priority(command) == expected
@@ -356,6 +356,8 @@ def test_callable_call_guarded(
     assert plugin_callable(wrapped, wrapped._trigger) is None, (
         'One predicate returns false, the handler must not execute.'
     )
+    # the flood protection queued the last message
+    assert mockbot._outbound.join(timeout=5)
     assert mockbot.backend.message_sent[n:] == rawlist(
         'PRIVMSG #channel :free',
         'PRIVMSG #channel :guarded',
@@ -1,8 +1,10 @@
 """Tests for the ``sopel.plugins.rules`` module."""
 from __future__ import annotations
 
+import asyncio
 import datetime
 import re
+import time
 
 import pytest
 
@@ -398,6 +400,346 @@ def test_manager_rule_trigger_on_event(mockbot):
     assert rule_events in items[0]
 
 
+def test_manager_rule_trigger_on_event_index(mockbot):
+    regex = re.compile('.*')
+    rule_privmsg = rules.Rule([regex], plugin='testplugin', label='privmsg')
+    rule_join = rules.Rule(
+        [regex],
+        plugin='testplugin',
+        label='join',
+        events=['JOIN'],
+        priority=rules.PRIORITY_LOW,
+    )
+    manager = rules.Manager()
+    manager.register(rule_privmsg)
+    manager.register(rule_join)
+
+    line = ':Foo!foo@example.com JOIN #sopel'
+    pretrigger = trigger.PreTrigger(mockbot.nick, line)
+
+    items = manager.get_triggered_rules(mockbot, pretrigger)
+    assert len(items) == 1, 'Only the JOIN rule must match'
+    assert rule_join in items[0]
+    assert manager._get_event_rules('JOIN', None) == (rule_join,)
+    assert manager._get_event_rules('PRIVMSG', None) == (rule_privmsg,)
+    assert manager._get_event_rules('MODE', None) == tuple()
+
+    # registering a new rule must update the index
+    rule_join_medium = rules.Rule(
+        [regex],
+        plugin='otherplugin',
+        label='join_medium',
+        events=['JOIN'],
+    )
+    manager.register(rule_join_medium)
+
+    items = manager.get_triggered_rules(mockbot, pretrigger)
+    assert len(items) == 2, 'Both JOIN rules must match'
+    assert rule_join_medium in items[0], 'Medium priority must come first'
+    assert rule_join in items[1]
+
+    # unregistering a plugin must update the index
+    manager.unregister_plugin('testplugin')
+
+    items = manager.get_triggered_rules(mockbot, pretrigger)
+    assert len(items) == 1, 'Only the remaining JOIN rule must match'
+    assert rule_join_medium in items[0]
+
+
+def test_manager_rule_trigger_on_ctcp_index(mockbot):
+    regex = re.compile('.*')
+    rule_default = rules.Rule([regex], plugin='testplugin', label='default')
+    rule_action = rules.Rule(
+        [regex],
+        plugin='testplugin',
+        label='action',
+        ctcp=[re.compile('ACTION')],
+    )
+    action = rules.ActionCommand('hello', plugin='testplugin')
+    manager = rules.Manager()
+    manager.register(rule_default)
+    manager.register(rule_action)
+    manager.register_action_command(action)
+
+    assert manager._get_event_rules('PRIVMSG', None) == (rule_default,)
+    assert manager._get_event_rules('PRIVMSG', 'ACTION') == (
+        rule_default, rule_action, action,
+    )
+    assert manager._get_event_rules('PRIVMSG', 'VERSION') == (rule_default,)
+
+    line = ':Foo!foo@example.com PRIVMSG #sopel :\x01ACTION hello\x01'
+    pretrigger = trigger.PreTrigger(mockbot.nick, line)
+
+    items = manager.get_triggered_rules(mockbot, pretrigger)
+    assert len(items) == 3, 'All three rules must match'
+    assert [rule for rule, match in items] == [
+        rule_default, rule_action, action,
+    ]
+
+
+def test_manager_command_dispatch(mockbot):
+    hello = rules.Command(
+        'hello', prefix=r'\.', aliases=['hi'], plugin='testplugin')
+    bye = rules.Command('bye', prefix=r'\.', plugin='testplugin')
+    multi = rules.Command('multi word', prefix=r'\.', plugin='testplugin')
+    manager = rules.Manager()
+    manager.register_command(hello)
+    manager.register_command(bye)
+    manager.register_command(multi)
+
+    event_rules = manager._get_event_index('PRIVMSG', None)
+    assert event_rules.rules == (hello, bye, multi)
+    assert event_rules.generic == (multi,), (
+        'Command with whitespace must not be dispatched by name')
+    assert len(event_rules.dispatchers) == 1, (
+        'Commands with the same prefix must share their dispatch regex')
+
+    _, named_rules, _ = event_rules.dispatchers[0]
+    assert named_rules == {
+        'hello': [hello],
+        'hi': [hello],
+        'bye': [bye],
+    }
+
+    for text, expected in (
+        ('.hello', [hello]),
+        ('.HI there', [hello]),
+        ('.bye', [bye]),
+        ('.multi word', [multi]),
+        ('.unknown', []),
+        ('hello', []),
+    ):
+        line = ':Foo!foo@example.com PRIVMSG #sopel :%s' % text
+        pretrigger = trigger.PreTrigger(mockbot.nick, line)
+        items = manager.get_triggered_rules(mockbot, pretrigger)
+        assert [rule for rule, match in items] == expected, text
+
+
+def test_manager_command_dispatch_duplicate_aliases(mockbot):
+    hello = rules.Command(
+        'hello',
+        prefix=r'\.',
+        aliases=['HELLO', 'Hello', 'hi', 'hi'],
+        plugin='testplugin',
+    )
+    manager = rules.Manager()
+    manager.register_command(hello)
+
+    _, named_rules, _ = manager._get_event_index('PRIVMSG', None).dispatchers[0]
+    assert named_rules == {
+        'hello': [hello],
+        'hi': [hello],
+    }
+
+    for text in ('.hello', '.HELLO', '.hi'):
+        line = ':Foo!foo@example.com PRIVMSG #sopel :%s' % text
+        pretrigger = trigger.PreTrigger(mockbot.nick, line)
+        items = manager.get_triggered_rules(mockbot, pretrigger)
+        assert [rule for rule, match in items] == [hello], (
+            'A rule must match only once, whatever its aliases')
+
+
+def test_manager_command_dispatch_alternation_prefix(mockbot):
+    hello = rules.Command('hello', prefix=r'\.|\.\.', plugin='testplugin')
+    bye = rules.Command('bye', prefix=r'\.|\.\.', plugin='testplugin')
+    manager = rules.Manager()
+    manager.register_command(hello)
+    manager.register_command(bye)
+
+    for text, expected in (
+        ('.hello', [hello]),
+        ('..hello', [hello]),
+        ('..bye', [bye]),
+        ('..unknown', []),
+    ):
+        line = ':Foo!foo@example.com PRIVMSG #sopel :%s' % text
+        pretrigger = trigger.PreTrigger(mockbot.nick, line)
+        items = manager.get_triggered_rules(mockbot, pretrigger)
+        assert [rule for rule, match in items] == expected, text
+
+
+def test_manager_command_dispatch_priority(mockbot):
+    regex = re.compile('.*')
+    rule = rules.Rule([regex], plugin='testplugin', label='rule')
+    command = rules.Command('hello', prefix=r'\.', plugin='testplugin')
+    command_high = rules.Command(
+        'hello', prefix=r'\.', plugin='otherplugin', priority='high')
+    command_low = rules.Command(
+        'hello', prefix=r'\.', plugin='lowplugin', priority='low')
+    manager = rules.Manager()
+    manager.register(rule)
+    manager.register_command(command_low)
+    manager.register_command(command)
+    manager.register_command(command_high)
+
+    line = ':Foo!foo@example.com PRIVMSG #sopel :.hello'
+    pretrigger = trigger.PreTrigger(mockbot.nick, line)
+    items = manager.get_triggered_rules(mockbot, pretrigger)
+
+    assert [rule for rule, match in items] == [
+        rule, command, command_high, command_low,
+    ], 'Dispatched rules must keep the same order as without dispatch'
+
+
+def test_manager_nick_and_action_command_dispatch(mockbot):
+    nick_command = rules.NickCommand(
+        'TestBot', 'hello', aliases=['hi'], plugin='testplugin')
+    action_command = rules.ActionCommand(
+        'hello', aliases=['hi'], plugin='testplugin')
+    manager = rules.Manager()
+    manager.register_nick_command(nick_command)
+    manager.register_action_command(action_command)
+
+    assert manager._get_event_index('PRIVMSG', None).generic == ()
+    assert manager._get_event_index('PRIVMSG', 'ACTION').generic == ()
+
+    line = ':Foo!foo@example.com PRIVMSG #sopel :TestBot: HI'
+    pretrigger = trigger.PreTrigger(mockbot.nick, line)
+    items = manager.get_triggered_rules(mockbot, pretrigger)
+    assert [rule for rule, match in items] == [nick_command]
+
+    line = ':Foo!foo@example.com PRIVMSG #sopel :TestBot: bye'
+    pretrigger = trigger.PreTrigger(mockbot.nick, line)
+    assert not manager.get_triggered_rules(mockbot, pretrigger)
+
+    line = ':Foo!foo@example.com PRIVMSG #sopel :\x01ACTION hi there\x01'
+    pretrigger = trigger.PreTrigger(mockbot.nick, line)
+    items = manager.get_triggered_rules(mockbot, pretrigger)
+    assert [rule for rule, match in items] == [action_command]
+
+
+@pytest.mark.parametrize('pattern, expected', (
+    (r'.*', None),
+    (r'(.*)', None),
+    (r'[a-z]+', None),
+    (r'hello', 'hello'),
+    (r'(?i)\bsopel\b', 'sopel'),
+    (r'^\.?(?:foo|bar)bazz+', 'baz'),
+    (r'https?://\S+', 'http'),
+    (r'ab?c', 'a'),
+    (r'(hello) (world)', 'hello world'),
+))
+def test_get_required_literal(pattern, expected):
+    assert rules._get_required_literal(re.compile(pattern)) == expected
+
+
+def test_manager_rule_prefilter(mockbot):
+    catch_all = rules.Rule(
+        [re.compile(r'.*')], plugin='testplugin', label='catch_all')
+    hello = rules.Rule(
+        [re.compile(r'hello (\w+)', re.IGNORECASE)],
+        plugin='testplugin',
+        label='hello')
+    hell = rules.SearchRule(
+        [re.compile(r'\bhell\b'), re.compile('inferno')],
+        plugin='testplugin',
+        label='hell')
+    find = rules.FindRule(
+        [re.compile(r'(\w+)\+\+')], plugin='testplugin', label='find')
+    manager = rules.Manager()
+    manager.register(catch_all)
+    manager.register(hello)
+    manager.register(hell)
+    manager.register(find)
+
+    event_rules = manager._get_event_index('PRIVMSG', None)
+    assert event_rules.rules == (catch_all, hello, hell, find)
+    assert event_rules.generic == (catch_all,)
+    assert event_rules.scanner is not None
+
+    for text, expected in (
+        ('nothing to see', [catch_all]),
+        ('HELLO world', [catch_all, hello]),
+        ('to hell and back', [catch_all, hell]),
+        ('dante\'s inferno', [catch_all, hell]),
+        ('sopel++', [catch_all, find]),
+        ('hello sopel++', [catch_all, hello, find]),
+        # "hell" is found in "hello" but doesn't match as a word
+        ('hello hello', [catch_all, hello]),
+    ):
+        line = ':Foo!foo@example.com PRIVMSG #sopel :%s' % text
+        pretrigger = trigger.PreTrigger(mockbot.nick, line)
+        items = manager.get_triggered_rules(mockbot, pretrigger)
+        assert [rule for rule, match in items] == expected, text
+
+    manager.unregister_plugin('testplugin')
+    assert not manager._prefilter_literals
+
+
+def test_manager_channel_policy(configfactory, botfactory):
+    settings = configfactory('test.cfg', TMP_CONFIG + """
+[#disabled]
+disable_plugins = testplugin
+
+[#partial]
+disable_commands = {'testplugin': ['hello'], 'coretasks': ['startup']}
+
+[#everything]
+disable_plugins = *
+""")
+    mockbot = botfactory(settings)
+    hello = rules.Rule(
+        [re.compile(r'hello')], plugin='testplugin', label='hello')
+    other = rules.Rule(
+        [re.compile(r'hello')], plugin='otherplugin', label='hello')
+    core = rules.Rule(
+        [re.compile(r'hello')], plugin='coretasks', label='startup')
+    manager = rules.Manager()
+    manager.register(hello)
+    manager.register(other)
+    manager.register(core)
+
+    for channel, expected in (
+        ('#sopel', [hello, other, core]),
+        ('#disabled', [other, core]),
+        ('#partial', [other, core]),
+        ('#everything', [core]),
+        ('TestBot', [hello, other, core]),
+    ):
+        line = ':Foo!foo@example.com PRIVMSG %s :hello' % channel
+        pretrigger = trigger.PreTrigger(mockbot.nick, line)
+        items = manager.get_triggered_rules(mockbot, pretrigger)
+        assert [rule for rule, match in items] == expected, channel
+
+    policy = manager.get_channel_policy(
+        settings, mockbot.make_identifier('#partial'))
+    assert policy is manager.get_channel_policy(
+        settings, mockbot.make_identifier('#partial')), (
+            'A policy must be parsed only once')
+    assert manager.get_channel_policy(
+        settings, mockbot.make_identifier('#sopel')) is None
+
+    # change the channel's options
+    settings['#partial'].disable_commands = "{'testplugin': ['other']}"
+    new_policy = manager.get_channel_policy(
+        settings, mockbot.make_identifier('#partial'))
+    assert new_policy is not policy
+    assert new_policy.allows(hello)
+
+
+def test_channel_policy():
+    hello = rules.Rule(
+        [re.compile(r'hello')], plugin='testplugin', label='hello')
+    policy = rules.ChannelPolicy.from_options(
+        'spam,eggs', "{'testplugin': ['hello', 'hi']}")
+
+    assert policy.disabled_plugins == frozenset(['spam', 'eggs'])
+    assert policy.disabled_commands == {
+        'testplugin': frozenset(['hello', 'hi']),
+    }
+    assert not policy.allows(hello)
+
+
+def test_channel_policy_invalid_commands():
+    hello = rules.Rule(
+        [re.compile(r'hello')], plugin='testplugin', label='hello')
+    policy = rules.ChannelPolicy.from_options(None, "{'testplugin': [")
+
+    assert policy.disabled_plugins == frozenset()
+    assert policy.disabled_commands == {}
+    assert policy.allows(hello)
+
+
 def test_manager_has_command():
     command = rules.Command('hello', prefix=r'\.', plugin='testplugin')
     manager = rules.Manager()
@@ -489,6 +831,79 @@ def test_rulemetrics():
     assert not metrics.is_limited(now - time_window)
     assert not metrics.is_limited(now + time_window)
 
+
+def test_rulemetrics_monotonic():
+    metrics = rules.RuleMetrics()
+    assert metrics.last_monotonic is None
+    assert metrics.last_time is None
+
+    metrics.start(100.0)
+    assert metrics.is_running
+    assert metrics.last_monotonic == 100.0
+    assert metrics.is_limited(99.5)
+    assert not metrics.is_limited(100.0)
+
+    metrics.end(102.0)
+    assert not metrics.is_running
+    assert metrics.last_monotonic == 102.0
+    assert metrics.is_limited(101.0)
+    assert not metrics.is_limited(102.0)
+
+
+def test_ratelimitstore():
+    store = rules.RateLimitStore(5)
+    assert len(store) == 0
+    assert store.get('Foo') is None
+
+    metrics = store.use('Foo')
+    assert store.get('Foo') is metrics
+    assert store.use('Foo') is metrics
+    assert len(store) == 1
+    assert 'Foo' in store
+
+
+def test_ratelimitstore_evict():
+    store = rules.RateLimitStore(5)
+    now = time.monotonic()
+
+    # used 10s ago: expired
+    old = store.use('Old')
+    old.start(now - 10)
+    old.end(now - 10)
+
+    # started 10s ago, still running: can't expire
+    running = store.use('Running')
+    running.start(now - 10)
+
+    # used 8s ago, after the running one: expired
+    idle = store.use('Idle')
+    idle.start(now - 8)
+    idle.end(now - 8)
+
+    # used 2s ago: not expired yet
+    recent = store.use('Recent')
+    recent.start(now - 2)
+    recent.end(now - 2)
+
+    assert 'Old' not in store, 'Expired metrics must be evicted on use'
+    assert 'Idle' not in store, (
+        'Running metrics must not prevent the eviction of the next ones')
+    assert 'Running' in store, 'Running metrics must not be evicted'
+    assert len(store) == 2
+
+    store.use('New')
+    assert len(store) == 3
+
+    running.end(now - 9)
+    assert store.evict() == 1
+    assert 'Running' not in store
+    assert 'Recent' in store
+    assert 'New' in store
+
+    store.clear()
+    assert len(store) == 0
+
+
 # -----------------------------------------------------------------------------
 # tests for :class:`Rule`
 
@@ -899,6 +1314,30 @@ def test_rule_execute(mockbot):
     assert result == 'The return value'
 
 
+def test_rule_execute_async(mockbot):
+    regex = re.compile(r'.*')
+
+    async def handler(wrapped, trigger):
+        await wrapped.say('Hi!')
+        return 'The return value'
+
+    rule = rules.Rule([regex], handler=handler)
+    assert rule.is_async()
+    assert not rules.Rule([regex], handler=lambda b, t: None).is_async()
+
+    line = ':Foo!foo@example.com PRIVMSG #sopel :Hello, world'
+    pretrigger = trigger.PreTrigger(mockbot.nick, line)
+    matches = list(rule.match(mockbot, pretrigger))
+    match = matches[0]
+    match_trigger = trigger.Trigger(
+        mockbot.settings, pretrigger, match, account=None)
+    wrapped = bot.AsyncSopelWrapper(mockbot, match_trigger)
+    result = asyncio.run(rule.execute_async(wrapped, match_trigger))
+
+    assert mockbot.backend.message_sent == rawlist('PRIVMSG #sopel :Hi!')
+    assert result == 'The return value'
+
+
 def test_rule_from_callable(mockbot):
     # prepare callable
     @plugin.rule(r'hello', r'hi', r'hey', r'hello|hi')
@@ -1601,6 +2040,36 @@ def test_rule_rate_limit(mockbot, triggerfactory):
     assert rule.is_global_rate_limited(at_time) is True
 
 
+def test_rule_rate_limit_size(mockbot, triggerfactory):
+    def handler(bot, trigger):
+        return 'hello'
+
+    regex = re.compile(r'.*')
+    rule = rules.Rule(
+        [regex],
+        plugin='testplugin',
+        label='testrule',
+        handler=handler,
+        user_rate_limit=20,
+        channel_rate_limit=5,
+    )
+    manager = rules.Manager()
+    manager.register(rule)
+    assert rule.get_rate_limit_size() == 0
+
+    for nick in ('Foo', 'Bar'):
+        wrapper = triggerfactory.wrapper(
+            mockbot, ':%s!user@example.com PRIVMSG #channel :test' % nick)
+        rule.execute(mockbot, wrapper._trigger)
+
+    assert rule.get_rate_limit_size() == 3
+    assert manager.get_rate_limit_size() == 3
+
+    # metrics are kept as long as the longest rate limit
+    assert rule._metrics_nick.ttl == 20
+    assert rule._metrics_sender.ttl == 20
+
+
 def test_rule_rate_limit_no_limit(mockbot, triggerfactory):
     def handler(bot, trigger):
         return 'hello'
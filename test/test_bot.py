@@ -3,11 +3,13 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 import re
+import threading
 import typing
 
 import pytest
 
 from sopel import bot, plugin, plugins, trigger
+from sopel.irc import outbound
 from sopel.plugins import rules
 from sopel.tests import rawlist
 from sopel.tools import Identifier, SopelMemory, target
@@ -150,6 +152,17 @@ def test_wrapper_say(mockbot, triggerfactory):
     )
 
 
+def test_wrapper_output_priority(mockbot, triggerfactory):
+    wrapper = triggerfactory.wrapper(
+        mockbot, ':Test!test@example.com PRIVMSG #channel :test message')
+    assert wrapper.output_priority == outbound.PRIORITY_NORMAL
+
+    # 'testnick' is the bot's owner/admin in `mockbot`'s config above
+    wrapper = triggerfactory.wrapper(
+        mockbot, ':testnick!test@example.com PRIVMSG #channel :test message')
+    assert wrapper.output_priority == outbound.PRIORITY_ADMIN
+
+
 def test_wrapper_say_statusmsg(mockbot, triggerfactory):
     mockbot._isupport = mockbot.isupport.apply(
         STATUSMSG=tuple('+'),
@@ -398,6 +411,32 @@ def test_register_unregister_plugin(tmpconfig, mockplugin):
     assert not sopel.rules.has_action_command('tell')
 
 
+def test_unregister_plugin_handler_stats(tmpconfig, tmpdir):
+    mod_file = tmpdir.mkdir('stats_mods').join('mockplugin.py')
+    mod_file.write(
+        'from sopel import plugin\n'
+        '@plugin.command("do")\n'
+        'def do(bot, trigger):\n'
+        '    pass\n'
+    )
+    mockplugin = plugins.handlers.PyFilePlugin(mod_file.strpath)
+    sopel = bot.Sopel(tmpconfig, daemon=False)
+    mockplugin.load()
+    mockplugin.register(sopel)
+    sopel.handler_stats.get('rule', 'mockplugin', 'do').record_execution(0.1)
+    sopel.handler_stats.get('rule', 'other', 'do').record_execution(0.1)
+
+    # reloading starts the plugin's statistics over
+    sopel.reload_plugin('mockplugin')
+    assert sopel.handler_stats.get_snapshots(plugin='mockplugin') == []
+    sopel.handler_stats.get('rule', 'mockplugin', 'do').record_execution(0.1)
+
+    # unregistering removes them
+    mockplugin.unregister(sopel)
+    assert sopel.handler_stats.get_snapshots(plugin='mockplugin') == []
+    assert len(sopel.handler_stats.get_snapshots(plugin='other')) == 1
+
+
 def test_remove_plugin_unknown_plugin(tmpconfig):
     sopel = bot.Sopel(tmpconfig, daemon=False)
 
@@ -860,6 +899,24 @@ def test_call_rule(
     assert items == [1, 1]
 
 
+def test_times_legacy(mockbot: bot.Sopel) -> None:
+    def testfunc(bot, trigger):
+        pass
+
+    store = mockbot._rate_limits.setdefault(
+        testfunc, rules.RateLimitStore(60))
+    metrics = store.use(Identifier('Test'))
+    metrics.start()
+    metrics.end()
+    # not used yet: not in the legacy mapping
+    store.use(Identifier('#channel'))
+
+    times = mockbot._times
+    assert list(times) == [Identifier('Test')]
+    last_used = times[Identifier('Test')][testfunc]
+    assert abs(last_used - datetime.now(timezone.utc).timestamp()) < 5
+
+
 def test_call_rule_multiple_matches(
     mockbot: bot.Sopel,
     multimatch_hello_rule: typing.Callable,
@@ -890,6 +947,29 @@ def test_call_rule_multiple_matches(
     assert items == [1, 1, 1]
 
 
+def test_call_rule_disabled_in_channel(mockbot, match_hello_rule):
+    items = []
+
+    # setup
+    def testrule(bot, trigger):
+        items.append(1)
+
+    rule_hello = rules.Rule(
+        [re.compile(r'(hi|hello|hey|sup)')],
+        plugin='testplugin',
+        label='testrule',
+        handler=testrule,
+    )
+    mockbot.settings.parser.add_section('#channel')
+    mockbot.settings.parser.set('#channel', 'disable_plugins', 'testplugin')
+
+    match, rule_trigger, wrapper = match_hello_rule(rule_hello)
+
+    # call rule
+    mockbot.call_rule(rule_hello, wrapper, rule_trigger)
+    assert items == [], 'The rule must not be executed in #channel'
+
+
 def test_call_rule_rate_limited_user(mockbot, match_hello_rule):
     items = []
 
@@ -936,6 +1016,37 @@ def test_call_rule_rate_limited_user(mockbot, match_hello_rule):
     assert items == [1], 'There must not be any new item'
 
 
+def test_call_rule_handler_stats(mockbot, match_hello_rule):
+    def testrule(bot, trigger):
+        if trigger.group(0) == 'hey':
+            raise ValueError('Error in rule')
+        bot.say('hi')
+
+    rule_hello = rules.Rule(
+        [re.compile(r'(hi|hello|hey|sup)')],
+        plugin='testplugin',
+        label='testrule',
+        handler=testrule,
+        user_rate_limit=100,
+    )
+
+    match, rule_trigger, wrapper = match_hello_rule(rule_hello)
+    mockbot.call_rule(rule_hello, wrapper, rule_trigger)
+    match, rule_trigger, wrapper = match_hello_rule(rule_hello)
+    mockbot.call_rule(rule_hello, wrapper, rule_trigger)
+
+    snapshots = mockbot.handler_stats.get_snapshots(plugin='testplugin')
+    assert len(snapshots) == 1
+
+    stats = snapshots[0]
+    assert stats.kind == 'rule'
+    assert stats.label == 'testrule'
+    assert stats.invocations == 1
+    assert stats.errors == 0
+    assert stats.rate_limited == 1, 'The second call must be rate limited'
+    assert sum(stats.execution_buckets) == 1
+
+
 def test_call_rule_rate_limited_user_admin(mockbot, match_hello_rule_admin):
     items = []
 
@@ -1896,6 +2007,182 @@ def test_ignore_replay_servertime(mockbot):
     assert mockbot.backend.message_sent == rawlist("PRIVMSG #test :user2!")
 
 
+def test_dispatch_threaded_rule(mockbot):
+    """Test threaded rules are executed by the worker pool."""
+    @plugin.rule("$nickname!")
+    def ping(bot, trigger):
+        bot.say(trigger.nick + "!")
+
+    ping.setup(mockbot.settings)
+    ping.plugin_name = "testplugin"
+    mockbot.register_callables([ping])
+
+    mockbot.on_message(":user!user@user PRIVMSG #test :TestBot!")
+    tasks = mockbot.running_triggers
+    for task in tasks:
+        task.join()
+
+    assert mockbot.backend.message_sent == rawlist("PRIVMSG #test :user!")
+    assert not mockbot.running_triggers
+
+    stats = mockbot.dispatch_stats
+    assert stats.submitted == 1
+    assert stats.completed == 1
+    assert stats.dropped == 0
+    assert stats.queued == 0
+
+
+def test_dispatch_async_rule(mockbot):
+    """Test async rules are executed as coroutines."""
+    wrappers = []
+
+    @plugin.rule("$nickname!")
+    async def ping(bot, trigger):
+        wrappers.append(bot)
+        await bot.say(trigger.nick + "!")
+        await bot.reply("pong")
+
+    ping.setup(mockbot.settings)
+    ping.plugin_name = "testplugin"
+    mockbot.register_callables([ping])
+
+    mockbot.on_message(":user!user@user PRIVMSG #test :TestBot!")
+
+    assert mockbot.backend.message_sent == rawlist(
+        "PRIVMSG #test :user!",
+        "PRIVMSG #test :user: pong",
+    )
+    assert not mockbot.running_triggers, 'Async rules must not use threads'
+    assert len(wrappers) == 1
+    assert isinstance(wrappers[0], bot.AsyncSopelWrapper)
+
+
+def test_dispatch_async_rule_output(mockbot):
+    """Test async rules send their messages right away, in order."""
+    futures = []
+    echoed = []
+
+    @plugin.rule("$nickname!")
+    async def ping(bot, trigger):
+        # not awaited: the messages are sent anyway, in order
+        futures.append(bot.say("one"))
+        futures.append(bot.say("two"))
+        futures.append(bot.notice("three"))
+
+    @plugin.echo
+    @plugin.rule("one")
+    @plugin.thread(False)
+    def one(bot, trigger):
+        echoed.append(trigger.sender)
+
+    for rule in (ping, one):
+        rule.setup(mockbot.settings)
+        rule.plugin_name = "testplugin"
+    mockbot.register_callables([ping, one])
+
+    mockbot.on_message(":user!user@user PRIVMSG #test :TestBot!")
+
+    assert mockbot.backend.message_sent == rawlist(
+        "PRIVMSG #test :one",
+        "PRIVMSG #test :two",
+        "NOTICE #test :three",
+    )
+    assert all(future.done() for future in futures)
+    assert echoed == ["#test"], 'The echo must be dispatched'
+
+
+def test_say_many_echo(mockbot):
+    """Test messages to many targets are echoed once per target."""
+    senders = []
+
+    @plugin.echo
+    @plugin.rule("Hello!")
+    @plugin.thread(False)
+    def hello(bot, trigger):
+        senders.append(trigger.sender)
+
+    hello.setup(mockbot.settings)
+    hello.plugin_name = "testplugin"
+    mockbot.register_callables([hello])
+    mockbot._isupport = mockbot.isupport.apply(TARGMAX=(('PRIVMSG', 4),))
+
+    mockbot.say_many("Hello!", ["#a", "#b"])
+
+    assert mockbot.backend.message_sent == rawlist("PRIVMSG #a,#b :Hello!")
+    assert senders == ["#a", "#b"]
+
+
+def test_echo_full_dispatch_queue(configfactory, botfactory):
+    """Test an echo doesn't hold the send lock while the queue is full."""
+    settings = configfactory('test.cfg', TMP_CONFIG + """
+dispatch_workers = 2
+dispatch_queue_size = 1
+dispatch_queue_policy = block
+""")
+    mockbot = botfactory(settings)
+    speak_now = threading.Event()
+    reply_now = threading.Event()
+    echoed = threading.Event()
+    replied = threading.Event()
+
+    @plugin.rule("speak")
+    def speak(bot, trigger):
+        speak_now.wait(5)
+        bot.say("Hello!")
+
+    @plugin.rule("reply")
+    def reply(bot, trigger):
+        reply_now.wait(5)
+        bot.say("Done!")
+        replied.set()
+
+    @plugin.rule("fill")
+    def fill(bot, trigger):
+        pass
+
+    @plugin.echo
+    @plugin.rule("Hello!")
+    def hello(bot, trigger):
+        echoed.set()
+
+    for rule in (speak, reply, fill, hello):
+        rule.setup(mockbot.settings)
+        rule.plugin_name = "testplugin"
+    mockbot.register_callables([speak, reply, fill, hello])
+
+    # both workers are busy, and the queue is full
+    mockbot.on_message(":user!user@user PRIVMSG #test :speak")
+    mockbot.on_message(":user!user@user PRIVMSG #test :reply")
+    mockbot.on_message(":user!user@user PRIVMSG #test :fill")
+
+    # the echo of "Hello!" waits for a free slot, without the send lock
+    speak_now.set()
+    reply_now.set()
+
+    assert replied.wait(5), 'A rule must be able to send during the wait'
+    assert echoed.wait(5), 'The echo must be dispatched once a slot is free'
+
+
+def test_dispatch_plugin_workers(configfactory, botfactory):
+    settings = configfactory('test.cfg', TMP_CONFIG + """
+dispatch_workers = 4
+dispatch_queue_size = 10
+dispatch_queue_policy = drop
+dispatch_plugin_workers =
+    url:2
+    wikipedia:1
+    invalid
+    invalid:nan
+""")
+    mockbot = botfactory(settings)
+    pool = mockbot._worker_pool
+
+    assert pool.max_workers == 4
+    assert pool.queue_size == 10
+    assert pool.policy == 'drop'
+    assert pool.group_limits == {'url': 2, 'wikipedia': 1}
+
+
 def test_user_quit(
     tmpconfig: Config,
     botfactory: BotFactory,
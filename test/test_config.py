@@ -187,6 +187,34 @@ def test_choiceattribute_when_valid(fakeconfig):
     assert fakeconfig.fake.choiceattr == 'bacon'
 
 
+@pytest.mark.parametrize('option, value', (
+    ('db_nick_id_cache_size', '-1'),
+    ('db_sqlite_busy_timeout', '-1'),
+    ('db_sqlite_cache_size', '-1'),
+    ('db_sqlite_mmap_size', '-1'),
+    ('db_value_cache_size', '-1'),
+    ('db_value_cache_ttl', '-1'),
+    ('db_write_behind_interval', '-1'),
+    ('db_write_behind_interval', 'soon'),
+    ('db_write_behind_max_pending', '0'),
+    ('dispatch_workers', '0'),
+    ('dispatch_queue_size', '-1'),
+    ('inbound_queue_size', '-1'),
+    ('job_workers', '0'),
+))
+def test_core_integer_out_of_range(tmphomedir, option, value):
+    conf_file = tmphomedir.join('conf.cfg')
+    conf_file.write(
+        FAKE_CONFIG.format(homedir=tmphomedir.strpath)
+        + '%s = %s\n' % (option, value))
+
+    with pytest.raises(ValueError) as excinfo:
+        config.Config(conf_file.strpath)
+
+    assert str(excinfo.value).startswith(
+        'Invalid value for core.%s:' % option)
+
+
 def test_booleanattribute_default(fakeconfig):
     assert fakeconfig.fake.booleanattr is False
     assert fakeconfig.fake.booleanattr_true is True
@@ -290,6 +318,8 @@ def test_fileattribute_absolute_with_inside_quotes(fakeconfig):
 
 def test_configparser_env_priority_over_file(monkeypatch, fakeconfig):
     monkeypatch.setenv('SOPEL_CORE_OWNER', 'not_dgw')
+    # values read at load time are cached
+    fakeconfig.clear_cache()
     assert fakeconfig.core.owner == 'not_dgw'
 
 
@@ -325,6 +355,8 @@ def test_configparser_multi_env(monkeypatch, multi_fakeconfig):
         'SOPEL_SPAM_CHANNELS',
         '"#sopel"\n&strange\n*someZnc\n"#public"\n"#frontquote\n&backquote"\n"&bothquoted"\n"*starchan"'
     )
+    # values read at load time are cached
+    multi_fakeconfig.clear_cache()
 
     assert multi_fakeconfig.spam.eggs == [
         'five',
@@ -457,3 +489,85 @@ def test_get_defined_sections(multi_fakeconfig):
     assert 'spam' in items
     assert 'somesection' not in items, (
         'somesection was not defined and should not appear as such')
+
+
+def test_cached_value(multi_fakeconfig):
+    multi_fakeconfig.spam.eggs  # read once to cache the value
+
+    multi_fakeconfig.parser.set('spam', 'eggs', 'scrambled')
+    assert multi_fakeconfig.spam.eggs == [
+        'one',
+        'two',
+        'three',
+        'four',
+        'and a half',
+    ], 'Changing the parser directly must not change the cached value'
+
+    multi_fakeconfig.spam.clear_cache()
+    assert multi_fakeconfig.spam.eggs == ['scrambled']
+
+
+def test_cached_value_list_copy(multi_fakeconfig):
+    eggs = multi_fakeconfig.spam.eggs
+    eggs.append('fried')
+
+    assert 'fried' not in multi_fakeconfig.spam.eggs, (
+        'Changing the returned list must not change the cached value')
+
+    multi_fakeconfig.spam.eggs = eggs
+    assert multi_fakeconfig.spam.eggs[-1] == 'fried'
+
+
+def test_cached_value_set_and_delete(multi_fakeconfig):
+    multi_fakeconfig.spam.eggs  # read once to cache the value
+
+    multi_fakeconfig.spam.eggs = ['fried']
+    assert multi_fakeconfig.spam.eggs == ['fried']
+
+    del multi_fakeconfig.spam.eggs
+    assert multi_fakeconfig.spam.eggs == []
+
+    multi_fakeconfig.fake.booleanattr = True
+    assert multi_fakeconfig.fake.booleanattr is True
+    assert multi_fakeconfig.fake.booleanattr_true is True
+
+    multi_fakeconfig.fake.booleanattr = None
+    assert multi_fakeconfig.fake.booleanattr is False
+    assert multi_fakeconfig.fake.booleanattr_true is True
+
+
+def test_cached_value_save(multi_fakeconfig):
+    multi_fakeconfig.parser.set('spam', 'eggs', 'scrambled')
+    multi_fakeconfig.save()
+
+    assert multi_fakeconfig.spam.eggs == ['scrambled']
+
+
+def test_reload(multi_fakeconfig):
+    multi_fakeconfig.spam.eggs = ['fried']
+    multi_fakeconfig.somesection.is_defined = 'yes'
+    assert multi_fakeconfig.somesection.is_defined == 'yes'
+
+    multi_fakeconfig.reload()
+
+    assert multi_fakeconfig.spam.eggs == [
+        'one',
+        'two',
+        'three',
+        'four',
+        'and a half',
+    ], 'Unsaved changes must be discarded'
+    assert multi_fakeconfig.somesection.is_defined == 'no'
+    assert multi_fakeconfig.fake.valattr is None
+    multi_fakeconfig.fake.valattr = 'spam'
+    assert multi_fakeconfig.fake.valattr == 'spam', (
+        'Defined sections must still be usable after a reload')
+
+
+def test_reload_env(monkeypatch, fakeconfig):
+    assert fakeconfig.core.owner == 'dgw'
+    monkeypatch.setenv('SOPEL_CORE_OWNER', 'not_dgw')
+    assert fakeconfig.core.owner == 'dgw'
+
+    fakeconfig.reload()
+    assert fakeconfig.core.owner == 'not_dgw'
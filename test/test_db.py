@@ -6,11 +6,17 @@ practice would probably be not to do that."""
 from __future__ import annotations
 
 import json
+import logging
+import threading
+import time
 
 import pytest
 from sqlalchemy.engine import make_url
-from sqlalchemy.sql import func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql import func, select, text, update
 
+from sopel import db as sopel_db
 from sopel.db import (
     ChannelValues,
     NickIDs,
@@ -55,6 +61,17 @@ def test_execute(db: SopelDB):
 
 # Test connect
 
+def test_query_stats(db: SopelDB):
+    before = db.query_stats.get_snapshot()
+    with db.session() as session:
+        session.execute(select(func.count()).select_from(Nicknames))
+
+    stats = db.query_stats.get_snapshot()
+    assert stats.observations == before.observations + 1
+    assert sum(stats.buckets) == stats.observations
+    assert stats.total >= before.total
+
+
 def test_connect(db: SopelDB):
     """Test it's possible to get a raw connection and to use it properly."""
     nick_id = db.get_nick_id('MrEricPraline', create=True)
@@ -70,6 +87,77 @@ def test_connect(db: SopelDB):
         connection.close()
 
 
+def _get_pragma(db: SopelDB, name: str):
+    with db.engine.connect() as connection:
+        return connection.exec_driver_sql('PRAGMA %s' % name).scalar()
+
+
+def test_sqlite_default_profile(db: SopelDB):
+    assert not isinstance(db.engine.pool, QueuePool)
+    assert _get_pragma(db, 'journal_mode') == 'delete'
+    assert _get_pragma(db, 'busy_timeout') == 5000
+
+
+def test_sqlite_performance_profile(configfactory, tmpdir):
+    content = TMP_CONFIG.format(db_filename=tmpdir.join('test.sqlite'))
+    settings = configfactory('default.cfg', content)
+    settings.core.db_sqlite_profile = 'performance'
+    settings.core.db_sqlite_busy_timeout = 2.5
+    settings.core.db_sqlite_cache_size = 4096
+    settings.core.db_sqlite_mmap_size = 1024
+    db = SopelDB(settings)
+
+    assert isinstance(db.engine.pool, QueuePool)
+    assert _get_pragma(db, 'journal_mode') == 'wal'
+    assert _get_pragma(db, 'synchronous') == 1  # NORMAL
+    assert _get_pragma(db, 'busy_timeout') == 2500
+    assert _get_pragma(db, 'cache_size') == -4096
+    assert _get_pragma(db, 'mmap_size') == 1024 * 1024
+
+
+def test_sqlite_performance_profile_pool_size(configfactory, tmpdir):
+    content = TMP_CONFIG.format(db_filename=tmpdir.join('test.sqlite'))
+    settings = configfactory('default.cfg', content)
+    settings.core.db_sqlite_profile = 'performance'
+    settings.core.dispatch_workers = 20
+    settings.core.job_workers = 6
+    db = SopelDB(settings)
+
+    # one connection per worker, and some for the other threads
+    assert db.engine.pool.size() == (
+        20 + 6 + sopel_db.SQLITE_POOL_EXTRA_CONNECTIONS)
+
+
+def test_sqlite_performance_profile_threads(configfactory, tmpdir):
+    content = TMP_CONFIG.format(db_filename=tmpdir.join('test.sqlite'))
+    settings = configfactory('default.cfg', content)
+    settings.core.db_sqlite_profile = 'performance'
+    db = SopelDB(settings)
+    errors = []
+
+    def write(index):
+        try:
+            for count in range(20):
+                db.set_plugin_value('plugin', 'key%d' % index, count)
+                db.get_plugin_value('plugin', 'key%d' % index)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [
+        threading.Thread(target=write, args=(index,))
+        for index in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert db.get_plugin_values('plugin', ['key%d' % i for i in range(8)]) == {
+        'key%d' % i: 19 for i in range(8)
+    }
+
+
 # Test url
 
 def test_get_uri(db: SopelDB, tmpconfig):
@@ -180,6 +268,71 @@ def test_get_nick_id_migration(db: SopelDB):
         assert nickname_found.canonical == nick
 
 
+def test_get_nick_id_cache(db: SopelDB):
+    nick = 'MrEricPraline'
+    nick_id = db.get_nick_id(nick, create=True)
+
+    before = db.query_stats.get_snapshot()
+    assert db.get_nick_id(nick) == nick_id
+    assert db.get_nick_id(nick.upper()) == nick_id
+    assert db.query_stats.get_snapshot() == before, 'ID must be cached'
+    assert db.nick_id_cache.get_stats().hits >= 2
+
+
+def test_get_nick_id_cache_miss(db: SopelDB):
+    with pytest.raises(ValueError):
+        db.get_nick_id('Unknown')
+
+    # the miss is cached
+    before = db.query_stats.get_snapshot()
+    with pytest.raises(ValueError):
+        db.get_nick_id('Unknown')
+    assert db.get_nick_value('Unknown', 'key', 'default') == 'default'
+    assert db.query_stats.get_snapshot() == before, 'Miss must be cached'
+
+    # but a nick can still be created
+    nick_id = db.get_nick_id('Unknown', create=True)
+    assert db.get_nick_id('Unknown') == nick_id
+
+
+def test_get_nick_id_cache_disabled(configfactory, tmpdir):
+    content = TMP_CONFIG.format(db_filename=tmpdir.join('test.sqlite'))
+    db = SopelDB(configfactory(
+        'default.cfg', content + 'db_nick_id_cache_size = 0\n'))
+
+    nick_id = db.get_nick_id('MrEricPraline', create=True)
+    assert db.get_nick_id('MrEricPraline') == nick_id
+    assert len(db.nick_id_cache) == 0
+
+
+def test_get_nick_id_cache_invalidation(db: SopelDB):
+    nick = 'MrEricPraline'
+    nick_id = db.get_nick_id(nick, create=True)
+
+    # alias_nick: the alias is not a miss anymore
+    with pytest.raises(ValueError):
+        db.get_nick_id('DeadParrot')
+    db.alias_nick(nick, 'DeadParrot')
+    assert db.get_nick_id('DeadParrot') == nick_id
+
+    # unalias_nick: the alias is forgotten
+    db.unalias_nick('DeadParrot')
+    with pytest.raises(ValueError):
+        db.get_nick_id('DeadParrot')
+
+    # merge_nick_groups: the second group's nicks have a new ID
+    other_id = db.get_nick_id('JohnCleese', create=True)
+    assert other_id != nick_id
+    db.merge_nick_groups(nick, 'JohnCleese')
+    assert db.get_nick_id('JohnCleese') == nick_id
+
+    # forget_nick_group: all the nicks of the group are gone
+    db.forget_nick_group(nick)
+    for name in (nick, 'JohnCleese'):
+        with pytest.raises(ValueError):
+            db.get_nick_id(name)
+
+
 def test_alias_nick(db: SopelDB):
     nick = 'MrEricPraline'
     aliases = ['MrÉrïcPrâliné', 'John`Cleese', 'DeadParrot']
@@ -298,6 +451,53 @@ def test_get_nick_value_default(db: SopelDB):
     assert db.get_nick_value("TerryGilliam", "nokey", "default") == "default"
 
 
+def test_set_get_nick_values(db: SopelDB):
+    nick = 'Piv'
+    db.set_nick_value(nick, 'existing', 'old')
+    db.set_nick_values(nick, {
+        'existing': 'new',
+        'number': 42,
+        'mapping': {'a': [1, 2]},
+    })
+
+    assert db.get_nick_value(nick, 'existing') == 'new'
+    assert db.get_nick_values(nick, ['existing', 'number', 'mapping', 'none']) == {
+        'existing': 'new',
+        'number': 42,
+        'mapping': {'a': [1, 2]},
+    }
+    assert db.get_nick_values(nick.upper(), ['number']) == {'number': 42}
+    assert db.get_nick_values(nick, []) == {}
+    assert db.get_nick_values('Unknown', ['number']) == {}
+
+
+def test_set_nick_values_single_query(db: SopelDB):
+    nick = 'Piv'
+    db.get_nick_id(nick, create=True)
+
+    before = db.query_stats.get_snapshot()
+    db.set_nick_values(nick, {'a': 1, 'b': 2, 'c': 3})
+    after = db.query_stats.get_snapshot()
+    assert after.observations == before.observations + 1
+
+    db.get_nick_values(nick, ['a', 'b', 'c'])
+    assert db.query_stats.get_snapshot().observations == (
+        after.observations + 1)
+
+
+def test_set_nick_values_without_upsert(db: SopelDB, monkeypatch):
+    # other databases select the existing keys, then update and insert
+    monkeypatch.setattr(db.engine.dialect, 'name', 'other')
+    nick = 'Piv'
+    db.set_nick_value(nick, 'existing', 'old')
+    db.set_nick_values(nick, {'existing': 'new', 'number': 42})
+
+    assert db.get_nick_values(nick, ['existing', 'number']) == {
+        'existing': 'new',
+        'number': 42,
+    }
+
+
 def test_unalias_nick(db: SopelDB):
     nick = 'Embolalia'
     nick_id = 42
@@ -489,6 +689,17 @@ def test_get_channel_value_default(db: SopelDB):
     assert db.get_channel_value("#channel", "nokey", "value") == "value"
 
 
+def test_set_get_channel_values(db: SopelDB):
+    db.set_channel_value('#Asdf', 'existing', 'old')
+    db.set_channel_values('#Asdf', {'existing': 'new', 'number': 42})
+
+    assert db.get_channel_values('#asdf', ['existing', 'number', 'none']) == {
+        'existing': 'new',
+        'number': 42,
+    }
+    assert db.get_channel_value('#ASDF', 'number') == 42
+
+
 def test_forget_channel(db: SopelDB):
     db.set_channel_value('#channel', 'testkey1', 'value1')
     db.set_channel_value('#channel', 'testkey2', 'value2')
@@ -556,6 +767,17 @@ def test_get_plugin_value_default(db: SopelDB):
     assert db.get_plugin_value("TestPlugin", "DoesntExist", "MyDefault") == "MyDefault"
 
 
+def test_set_get_plugin_values(db: SopelDB):
+    db.set_plugin_value('Plugin', 'existing', 'old')
+    db.set_plugin_values('plugin', {'existing': 'new', 'number': 42})
+
+    assert db.get_plugin_values('PLUGIN', ['existing', 'number', 'none']) == {
+        'existing': 'new',
+        'number': 42,
+    }
+    assert db.get_plugin_value('plugin', 'number') == 42
+
+
 def test_forget_plugin(db: SopelDB):
     db.set_plugin_value('plugin', 'wasd', 'uldr')
     db.set_plugin_value('plugin', 'asdf', 'hjkl')
@@ -618,3 +840,472 @@ def test_get_preferred_value_none(db: SopelDB):
     names = ['notuser', '#notchannel']
     assert db.get_preferred_value(names, 'userkey') is None
     assert db.get_preferred_value(names, 'channelkey') is None
+
+
+# Test value cache
+
+@pytest.fixture
+def cached_db(configfactory, tmpdir):
+    content = TMP_CONFIG.format(db_filename=tmpdir.join('test.sqlite'))
+    settings = configfactory('default.cfg', content)
+    settings.core.db_value_cache_size = 100
+    return SopelDB(settings)
+
+
+def test_value_cache_disabled(db: SopelDB):
+    db.set_plugin_value('plugin', 'key', 'value')
+    assert db.get_plugin_value('plugin', 'key') == 'value'
+    assert len(db.value_cache) == 0
+
+
+def test_value_cache(cached_db: SopelDB):
+    db = cached_db
+    db.set_nick_value('Embolalia', 'key', 'nick-value')
+    db.set_channel_value('#channel', 'key', 'channel-value')
+    db.set_plugin_value('plugin', 'key', 'plugin-value')
+
+    for _ in range(3):
+        assert db.get_nick_value('Embolalia', 'key') == 'nick-value'
+        assert db.get_channel_value('#channel', 'key') == 'channel-value'
+        assert db.get_plugin_value('plugin', 'key') == 'plugin-value'
+
+    stats = db.value_cache.get_stats()
+    assert stats.size == 3
+    assert stats.misses == 3
+    assert stats.hits == 6
+
+    # cached values don't query the database
+    before = db.query_stats.get_snapshot().observations
+    assert db.get_nick_value('Embolalia', 'key') == 'nick-value'
+    assert db.get_channel_value('#channel', 'key') == 'channel-value'
+    assert db.get_plugin_value('plugin', 'key') == 'plugin-value'
+    assert db.get_nick_or_channel_value('Embolalia', 'key') == 'nick-value'
+    assert db.get_preferred_value(['#channel'], 'key') == 'channel-value'
+    assert db.query_stats.get_snapshot().observations == before
+
+
+def test_value_cache_missing(cached_db: SopelDB):
+    db = cached_db
+    assert db.get_plugin_value('plugin', 'key') is None
+    assert db.get_plugin_value('plugin', 'key', 'default') == 'default'
+    assert db.value_cache.get_stats().hits == 1
+
+    db.set_plugin_value('plugin', 'key', 'value')
+    assert db.get_plugin_value('plugin', 'key', 'default') == 'value'
+
+
+def test_value_cache_copy(cached_db: SopelDB):
+    db = cached_db
+    db.set_plugin_value('plugin', 'key', {'list': [1, 2]})
+
+    value = db.get_plugin_value('plugin', 'key')
+    value['list'].append(3)
+
+    assert db.get_plugin_value('plugin', 'key') == {'list': [1, 2]}
+
+
+def test_value_cache_invalidation(cached_db: SopelDB):
+    db = cached_db
+    db.set_nick_value('Embolalia', 'key', 'old')
+    db.set_channel_value('#channel', 'key', 'old')
+    db.set_plugin_value('plugin', 'key', 'old')
+    assert db.get_nick_value('Embolalia', 'key') == 'old'
+    assert db.get_channel_value('#channel', 'key') == 'old'
+    assert db.get_plugin_value('plugin', 'key') == 'old'
+
+    # set
+    db.set_nick_value('Embolalia', 'key', 'new')
+    db.set_channel_value('#channel', 'key', 'new')
+    db.set_plugin_value('plugin', 'key', 'new')
+    assert db.get_nick_value('Embolalia', 'key') == 'new'
+    assert db.get_channel_value('#channel', 'key') == 'new'
+    assert db.get_plugin_value('plugin', 'key') == 'new'
+
+    # set many
+    db.set_nick_values('Embolalia', {'key': 'many'})
+    db.set_channel_values('#channel', {'key': 'many'})
+    db.set_plugin_values('plugin', {'key': 'many'})
+    assert db.get_nick_value('Embolalia', 'key') == 'many'
+    assert db.get_channel_value('#channel', 'key') == 'many'
+    assert db.get_plugin_value('plugin', 'key') == 'many'
+
+    # delete
+    db.delete_nick_value('Embolalia', 'key')
+    db.delete_channel_value('#channel', 'key')
+    db.delete_plugin_value('plugin', 'key')
+    assert db.get_nick_value('Embolalia', 'key') is None
+    assert db.get_channel_value('#channel', 'key') is None
+    assert db.get_plugin_value('plugin', 'key') is None
+
+
+def test_value_cache_forget(cached_db: SopelDB):
+    db = cached_db
+    db.set_channel_value('#channel', 'key', 'value')
+    db.set_plugin_value('plugin', 'key', 'value')
+    assert db.get_channel_value('#channel', 'key') == 'value'
+    assert db.get_plugin_value('plugin', 'key') == 'value'
+
+    db.forget_channel('#channel')
+    db.forget_plugin('plugin')
+    assert db.get_channel_value('#channel', 'key') is None
+    assert db.get_plugin_value('plugin', 'key') is None
+
+
+def test_value_cache_merge_nick_groups(cached_db: SopelDB):
+    db = cached_db
+    db.set_nick_value('Embolalia', 'key', 'first')
+    db.set_nick_value('NotEmbolalia', 'key', 'second')
+    db.set_nick_value('NotEmbolalia', 'other', 'second')
+    assert db.get_nick_value('NotEmbolalia', 'key') == 'second'
+
+    db.merge_nick_groups('Embolalia', 'NotEmbolalia')
+    assert db.get_nick_value('NotEmbolalia', 'key') == 'first'
+    assert db.get_nick_value('Embolalia', 'other') == 'second'
+
+
+def test_value_cache_ttl(configfactory, tmpdir):
+    content = TMP_CONFIG.format(db_filename=tmpdir.join('test.sqlite'))
+    settings = configfactory('default.cfg', content)
+    settings.core.db_value_cache_size = 100
+    settings.core.db_value_cache_ttl = 0.05
+    db = SopelDB(settings)
+
+    db.set_plugin_value('plugin', 'key', 'old')
+    assert db.get_plugin_value('plugin', 'key') == 'old'
+
+    # changed behind the bot's back
+    with db.session() as session:
+        session.execute(
+            update(PluginValues).values(value=json.dumps('new')))
+        session.commit()
+
+    assert db.get_plugin_value('plugin', 'key') == 'old'
+    time.sleep(0.1)
+    assert db.get_plugin_value('plugin', 'key') == 'new'
+
+
+def test_value_cache_get_values(cached_db: SopelDB):
+    db = cached_db
+    db.set_plugin_values('plugin', {'first': 1, 'second': 2})
+    assert db.get_plugin_values('plugin', ['first', 'second', 'none']) == {
+        'first': 1,
+        'second': 2,
+    }
+
+    before = db.query_stats.get_snapshot().observations
+    assert db.get_plugin_values('plugin', ['first', 'second', 'none']) == {
+        'first': 1,
+        'second': 2,
+    }
+    assert db.get_plugin_value('plugin', 'none') is None
+    assert db.query_stats.get_snapshot().observations == before
+
+
+def test_value_cache_set_while_fetching(cached_db: SopelDB, monkeypatch):
+    db = cached_db
+    db.set_plugin_value('plugin', 'key', 'old')
+    db.set_plugin_value('plugin', 'other', 'old')
+    deserialize = sopel_db._deserialize
+
+    def set_while_fetching(value):
+        # the value is set after it has been read, before it is cached
+        monkeypatch.setattr(sopel_db, '_deserialize', deserialize)
+        db.set_plugin_value('plugin', 'key', 'new')
+        return deserialize(value)
+
+    monkeypatch.setattr(sopel_db, '_deserialize', set_while_fetching)
+    assert db.get_plugin_value('plugin', 'key') == 'old'
+    assert db.get_plugin_value('plugin', 'key') == 'new'
+
+    monkeypatch.setattr(sopel_db, '_deserialize', set_while_fetching)
+    assert db.get_plugin_values('plugin', ['key', 'other']) == {
+        'key': 'new',
+        'other': 'old',
+    }
+    db.set_plugin_value('plugin', 'key', 'newer')
+    assert db.get_plugin_values('plugin', ['key', 'other']) == {
+        'key': 'newer',
+        'other': 'old',
+    }
+    assert not db._value_fetches
+
+
+def test_value_cache_forget_while_fetching(cached_db: SopelDB, monkeypatch):
+    db = cached_db
+    db.set_plugin_value('plugin', 'key', 'value')
+    deserialize = sopel_db._deserialize
+
+    def forget_while_fetching(value):
+        monkeypatch.setattr(sopel_db, '_deserialize', deserialize)
+        db.forget_plugin('plugin')
+        return deserialize(value)
+
+    monkeypatch.setattr(sopel_db, '_deserialize', forget_while_fetching)
+    assert db.get_plugin_value('plugin', 'key') == 'value'
+    assert db.get_plugin_value('plugin', 'key') is None
+    assert not db._value_fetches
+
+
+# Test write-behind buffer
+
+@pytest.fixture
+def buffered_db(configfactory, tmpdir):
+    content = TMP_CONFIG.format(db_filename=tmpdir.join('test.sqlite'))
+    settings = configfactory('default.cfg', content)
+    # long enough for values to stay pending during a test
+    settings.core.db_write_behind_interval = 3600
+    db = SopelDB(settings)
+    yield db
+    db.shutdown()
+
+
+def _count_values(db: SopelDB, model) -> int:
+    with db.session() as session:
+        return session.execute(
+            select(func.count()).select_from(model)
+        ).scalar_one()
+
+
+def test_write_behind_disabled(db: SopelDB):
+    assert db.write_buffer is None
+    db.set_nick_value('Embolalia', 'key', 'value')
+    assert _count_values(db, NickValues) == 1
+    db.flush()  # does nothing
+    db.shutdown()  # does nothing
+
+
+def test_write_behind_read_your_writes(buffered_db: SopelDB):
+    db = buffered_db
+    db.set_nick_value('Embolalia', 'key', 'nick-value')
+    db.set_channel_value('#channel', 'key', 'channel-value')
+    db.set_plugin_value('plugin', 'key', 'plugin-value')
+    db.set_nick_values('Embolalia', {'other': [1, 2]})
+
+    # nothing is written yet
+    assert len(db.write_buffer) == 4
+    assert _count_values(db, NickValues) == 0
+    assert _count_values(db, ChannelValues) == 0
+    assert _count_values(db, PluginValues) == 0
+
+    # but pending values are visible
+    assert db.get_nick_value('Embolalia', 'key') == 'nick-value'
+    assert db.get_nick_values('Embolalia', ['key', 'other', 'none']) == {
+        'key': 'nick-value',
+        'other': [1, 2],
+    }
+    assert db.get_channel_value('#channel', 'key') == 'channel-value'
+    assert db.get_plugin_value('plugin', 'key') == 'plugin-value'
+
+    db.flush()
+    assert len(db.write_buffer) == 0
+    assert _count_values(db, NickValues) == 2
+    assert _count_values(db, ChannelValues) == 1
+    assert _count_values(db, PluginValues) == 1
+    assert db.get_nick_value('Embolalia', 'key') == 'nick-value'
+    assert db.get_channel_value('#channel', 'key') == 'channel-value'
+    assert db.get_plugin_value('plugin', 'key') == 'plugin-value'
+
+
+def test_write_behind_coalesce(buffered_db: SopelDB):
+    db = buffered_db
+    for value in range(10):
+        db.set_plugin_value('plugin', 'counter', value)
+
+    stats = db.write_buffer.get_stats()
+    assert stats.pending == 1
+    assert stats.writes == 10
+    assert stats.coalesced == 9
+
+    db.flush()
+    assert db.write_buffer.get_stats().flushes == 1
+    with db.session() as session:
+        result = session.execute(select(PluginValues.value)).scalar_one()
+    assert json.loads(result) == 9
+
+
+def test_write_behind_single_transaction(buffered_db: SopelDB):
+    db = buffered_db
+    db.set_nick_value('Embolalia', 'key', 'value')
+    db.set_channel_value('#channel', 'key', 'value')
+    db.set_plugin_value('plugin', 'key', 'value')
+
+    before = db.query_stats.get_snapshot().observations
+    db.flush()
+    after = db.query_stats.get_snapshot().observations
+
+    # one upsert per owner
+    assert after - before == 3
+
+
+def test_write_behind_max_pending(configfactory, tmpdir):
+    content = TMP_CONFIG.format(db_filename=tmpdir.join('test.sqlite'))
+    settings = configfactory('default.cfg', content)
+    settings.core.db_write_behind_interval = 3600
+    settings.core.db_write_behind_max_pending = 2
+    db = SopelDB(settings)
+    try:
+        db.set_plugin_value('plugin', 'first', 1)
+        db.set_plugin_value('plugin', 'second', 2)
+
+        # wait for the thread to write the values
+        for _ in range(100):
+            if db.write_buffer.get_stats().flushes:
+                break
+            time.sleep(0.01)
+
+        assert len(db.write_buffer) == 0
+        assert _count_values(db, PluginValues) == 2
+    finally:
+        db.shutdown()
+
+
+def test_write_behind_delete(buffered_db: SopelDB):
+    db = buffered_db
+    db.set_nick_value('Embolalia', 'key', 'value')
+    db.set_channel_value('#channel', 'key', 'value')
+    db.set_plugin_value('plugin', 'key', 'value')
+
+    db.delete_nick_value('Embolalia', 'key')
+    db.delete_channel_value('#channel', 'key')
+    db.delete_plugin_value('plugin', 'key')
+
+    assert len(db.write_buffer) == 0
+    assert db.get_nick_value('Embolalia', 'key') is None
+    assert db.get_channel_value('#channel', 'key') is None
+    assert db.get_plugin_value('plugin', 'key') is None
+
+    db.flush()
+    assert _count_values(db, NickValues) == 0
+    assert _count_values(db, ChannelValues) == 0
+    assert _count_values(db, PluginValues) == 0
+
+
+def test_write_behind_forget(buffered_db: SopelDB):
+    db = buffered_db
+    db.set_nick_value('Embolalia', 'key', 'value')
+    db.set_channel_value('#channel', 'key', 'value')
+    db.set_plugin_value('plugin', 'key', 'value')
+
+    db.forget_nick_group('Embolalia')
+    db.forget_channel('#channel')
+    db.forget_plugin('plugin')
+
+    assert len(db.write_buffer) == 0
+    db.flush()
+    assert _count_values(db, NickValues) == 0
+    assert _count_values(db, ChannelValues) == 0
+    assert _count_values(db, PluginValues) == 0
+
+
+def test_write_behind_merge_nick_groups(buffered_db: SopelDB):
+    db = buffered_db
+    db.set_nick_value('Embolalia', 'first', 'value')
+    db.set_nick_value('NotEmbolalia', 'second', 'value')
+
+    db.merge_nick_groups('Embolalia', 'NotEmbolalia')
+
+    assert db.get_nick_value('Embolalia', 'first') == 'value'
+    assert db.get_nick_value('Embolalia', 'second') == 'value'
+    assert db.get_nick_value('NotEmbolalia', 'second') == 'value'
+
+    db.flush()
+    with db.session() as session:
+        results = session.execute(
+            select(NickValues.key, NickValues.value)
+        ).all()
+    assert sorted(results) == [('first', '"value"'), ('second', '"value"')]
+
+
+def test_write_behind_flush_error(buffered_db: SopelDB, monkeypatch):
+    db = buffered_db
+    db.set_plugin_value('plugin', 'key', 'old')
+
+    def fail(batch):
+        # a newer value is set while the batch is being written
+        db.set_plugin_value('plugin', 'key', 'new')
+        raise OperationalError('INSERT', {}, Exception('database is locked'))
+
+    monkeypatch.setattr(db.write_buffer, '_write', fail)
+    with pytest.raises(OperationalError):
+        db.flush()
+
+    stats = db.write_buffer.get_stats()
+    assert stats.errors == 1
+    assert stats.pending == 1
+    assert db.get_plugin_value('plugin', 'key') == 'new'
+
+    monkeypatch.undo()
+    db.flush()
+    assert len(db.write_buffer) == 0
+    assert db.get_plugin_value('plugin', 'key') == 'new'
+    assert _count_values(db, PluginValues) == 1
+
+
+def test_write_behind_flush_error_isolated(buffered_db: SopelDB, monkeypatch):
+    db = buffered_db
+    db.set_plugin_value('good', 'key', 'value')
+    db.set_plugin_value('bad', 'key', 'value')
+    db.set_channel_value('#channel', 'key', 'value')
+    write_values = db._write_values
+
+    def fail_bad(batch):
+        if 'bad' in [owner for _, owner in batch]:
+            raise OperationalError('INSERT', {}, Exception('invalid value'))
+        write_values(batch)
+
+    monkeypatch.setattr(db.write_buffer, '_write', fail_bad)
+    with pytest.raises(OperationalError):
+        db.flush()
+
+    # the other owners' values are written anyway
+    assert db.write_buffer.get_stats().pending == 1
+    assert _count_values(db, PluginValues) == 1
+    assert _count_values(db, ChannelValues) == 1
+    assert db.get_plugin_value('bad', 'key') == 'value'
+
+
+def test_write_behind_flush_error_dropped(
+    buffered_db: SopelDB,
+    monkeypatch,
+    caplog,
+):
+    db = buffered_db
+    db.set_plugin_value('bad', 'key', 'value')
+
+    def fail(batch):
+        raise OperationalError('INSERT', {}, Exception('invalid value'))
+
+    monkeypatch.setattr(db.write_buffer, '_write', fail)
+    for attempt in range(db.write_buffer.max_attempts - 1):
+        with pytest.raises(OperationalError):
+            db.flush()
+        assert len(db.write_buffer) == 1
+
+    with caplog.at_level(logging.ERROR, logger='sopel.db'):
+        with pytest.raises(OperationalError):
+            db.flush()
+
+    stats = db.write_buffer.get_stats()
+    assert stats.pending == 0
+    assert stats.dropped == 1
+    assert stats.errors == db.write_buffer.max_attempts
+    assert 'Dropping 1 values' in caplog.text
+    assert db.get_plugin_value('bad', 'key') is None
+
+    # once dropped, nothing is left to write
+    db.flush()
+    assert db.write_buffer.get_stats().errors == db.write_buffer.max_attempts
+
+
+def test_write_behind_shutdown(buffered_db: SopelDB):
+    db = buffered_db
+    db.set_plugin_value('plugin', 'key', 'value')
+    assert _count_values(db, PluginValues) == 0
+
+    db.shutdown()
+    assert _count_values(db, PluginValues) == 1
+
+    # once shut down, values are written immediately
+    db.set_plugin_value('plugin', 'other', 'value')
+    assert len(db.write_buffer) == 0
+    assert _count_values(db, PluginValues) == 2
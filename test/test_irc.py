@@ -1,12 +1,15 @@
 """Tests for core ``sopel.irc``"""
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 
 import pytest
 
+from sopel import irc
 from sopel.tests import rawlist
-from sopel.tools import Identifier
+from sopel.tools import Identifier, workers
 from sopel.tools.target import User
 
 
@@ -126,6 +129,116 @@ def test_on_connect_auth_password_override_server_auth(bot):
     )
 
 
+def test_on_message_ping(bot):
+    bot.on_message('PING :irc.example.com')
+
+    assert bot.backend.message_sent == rawlist('PONG irc.example.com')
+
+
+def test_queue_message(bot):
+    bot.queue_message(':irc.example.com 001 Sopel :Welcome!')
+    bot.queue_message(
+        '@time=2022-01-01T00:00:00.000Z :irc.example.com PING :token')
+
+    # the PING is answered right away, once
+    assert bot.backend.message_sent == rawlist('PONG token')
+
+    for task in bot._inbound_pool.tasks:
+        task.join()
+
+    assert bot.last_raw_line.endswith('PING :token')
+    assert bot.backend.message_sent == rawlist('PONG token')
+    assert bot.dispatch_lag == 0
+
+    stats = bot.inbound_stats
+    assert stats.submitted == 2
+    assert stats.completed == 2
+    assert stats.queued == 0
+
+
+def test_queue_message_async_full(bot, monkeypatch):
+    release = threading.Event()
+    handled = []
+
+    def handle(message, send_pong):
+        release.wait(5)
+        handled.append(message)
+
+    monkeypatch.setattr(bot, '_handle_queued_message', handle)
+    bot._inbound_pool = workers.WorkerPool(
+        1, queue_size=1, name='test-inbound')
+
+    async def receive():
+        await bot.queue_message_async(':irc.example.com NOTICE * :first')
+        await bot.queue_message_async(':irc.example.com NOTICE * :second')
+
+        # the queue is full: the PING must wait, but not the event loop
+        waiting = asyncio.create_task(
+            bot.queue_message_async(':irc.example.com PING :token'))
+        await asyncio.sleep(0.1)
+        assert not waiting.done()
+        assert bot.backend.message_sent == rawlist('PONG token'), (
+            'A PING must be answered before waiting for the queue')
+
+        release.set()
+        await asyncio.wait_for(waiting, 5)
+
+    try:
+        asyncio.run(receive())
+    finally:
+        release.set()
+        bot._inbound_pool.shutdown(timeout=5)
+
+    assert handled == [
+        ':irc.example.com NOTICE * :first',
+        ':irc.example.com NOTICE * :second',
+        ':irc.example.com PING :token',
+    ]
+
+
+def test_on_close_event_loop(bot, monkeypatch):
+    release = threading.Event()
+    shutdown = threading.Event()
+    handled = []
+
+    def handle(message, send_pong):
+        release.wait(5)
+        handled.append(message)
+
+    monkeypatch.setattr(bot, '_handle_queued_message', handle)
+    monkeypatch.setattr(bot, '_shutdown', shutdown.set)
+    bot.queue_message(':irc.example.com NOTICE * :last')
+
+    async def close():
+        # the last message is still handled: the event loop must not wait
+        bot.on_close()
+        await asyncio.sleep(0.1)
+        assert not shutdown.is_set()
+        release.set()
+
+    try:
+        asyncio.run(close())
+    finally:
+        release.set()
+
+    assert shutdown.wait(5), 'The bot must shut down once the loop is free'
+    assert handled == [':irc.example.com NOTICE * :last']
+
+
+@pytest.mark.parametrize('message, expected', (
+    ('PING :token', True),
+    ('ping :token', True),
+    (':irc.example.com PING :token', True),
+    ('@time=2022-01-01T00:00:00.000Z PING :token', True),
+    ('@time=2022-01-01T00:00:00.000Z :irc.example.com PING :token', True),
+    ('PONG :token', False),
+    (':irc.example.com PRIVMSG #channel :PING', False),
+    (':user!user@example.com PRIVMSG Sopel :PING token', False),
+))
+def test_is_ping(message, expected):
+    assert irc._is_ping(message) is expected
+
+
 def test_write(bot):
     bot.write(['INFO'])
 
@@ -309,6 +422,21 @@ def test_say_long_extra_multi_message_multibyte_recipient(bot):
     )
 
 
+def test_say_long_extra_many_messages_multibyte(bot):
+    """Test a long multi-byte message split into many messages."""
+    length = 512 - prefix_length(bot) - len('PRIVMSG #sopel :\r\n')
+    chars = length // 3
+    text = 'अ' * (chars * 4)
+    bot.say(text, '#sopel', max_messages=3, truncation='...')
+
+    assert bot.backend.message_sent == rawlist(
+        'PRIVMSG #sopel :%s' % ('अ' * chars),
+        'PRIVMSG #sopel :%s' % ('अ' * chars),
+        # the 4th part is truncated
+        'PRIVMSG #sopel :%s...' % ('अ' * ((length - 3) // 3)),
+    )
+
+
 def test_say_long_truncation_fit(bot):
     """Test optional truncation indicator with message that fits in one line."""
     text = 'a' * (512 - prefix_length(bot) - len('PRIVMSG #sopel :\r\n') - 3)
@@ -383,6 +511,60 @@ def test_say_long_truncation_trailing(bot):
     )
 
 
+def test_say_many(bot):
+    bot._isupport = bot.isupport.apply(TARGMAX=(('PRIVMSG', 3),))
+    bot.say_many('Hello!', ['#a', '#b', '#c', '#d', '#A', 'Nick'])
+
+    assert bot.backend.message_sent == rawlist(
+        'PRIVMSG #a,#b,#c :Hello!',
+        'PRIVMSG #d,Nick :Hello!',
+    )
+
+
+def test_say_many_no_targmax(bot):
+    bot.say_many('Hello!', ['#a', '#b'])
+
+    assert bot.backend.message_sent == rawlist(
+        'PRIVMSG #a :Hello!',
+        'PRIVMSG #b :Hello!',
+    )
+
+
+def test_say_many_unlimited_targmax(bot):
+    bot._isupport = bot.isupport.apply(TARGMAX=(('PRIVMSG', None),))
+    channels = ['#channel%03d' % index for index in range(100)]
+    text = 'x' * 200
+    bot.say_many(text, channels)
+
+    lines = bot.backend.message_sent
+    assert 1 < len(lines) < 100, 'Lines must be limited by their length'
+    assert all(len(line) <= 512 for line in lines)
+
+    sent_to = []
+    for line in lines:
+        command, targets, sent_text = line.decode('utf-8').split(' ', 2)
+        assert sent_text == ':%s\r\n' % text
+        sent_to.extend(targets.split(','))
+    assert sent_to == channels
+
+
+def test_say_many_flood(bot):
+    bot._isupport = bot.isupport.apply(TARGMAX=(('PRIVMSG', 4),))
+    bot.settings.core.flood_burst_lines = 1
+    bot.settings.core.flood_empty_wait = 0.01
+    bot.settings.core.flood_max_wait = 0.01
+    bot.say('Hi!', '#b')
+    bot.say_many('Hello!', ['#a', '#b', '#c'])
+
+    assert bot.backend.message_sent == rawlist(
+        'PRIVMSG #b :Hi!',
+        'PRIVMSG #a,#c :Hello!',
+    ), 'Recipients without flood tokens must not delay the others'
+
+    assert bot._outbound.join(timeout=5)
+    assert bot.backend.message_sent[2:] == rawlist('PRIVMSG #b :Hello!')
+
+
 def test_say_antiloop(bot):
     # five is fine
     bot.say('hello', '#sopel')
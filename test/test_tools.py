@@ -187,6 +187,40 @@ def test_get_sendable_message_bigger_multibyte_whitespace():
     assert second == expected_second
 
 
+def test_get_sendable_messages():
+    messages, excess = tools.get_sendable_messages('aaa bbb ccc', 7)
+    assert messages == ['aaa bbb', 'ccc']
+    assert excess == ''
+
+    messages, excess = tools.get_sendable_messages('aaa bbb ccc', 3, 2)
+    assert messages == ['aaa', 'bbb']
+    assert excess == 'ccc'
+
+    messages, excess = tools.get_sendable_messages('', 3)
+    assert messages == ['']
+    assert excess == ''
+
+    messages, excess = tools.get_sendable_messages('aaa   ', 3)
+    assert messages == ['aaa']
+    assert excess == ''
+
+
+def test_get_sendable_messages_multibyte():
+    messages, excess = tools.get_sendable_messages('αααα α𡃤𡃤 अअअ', 5)
+    assert messages == ['αα', 'αα', 'α', '𡃤', '𡃤', 'अ', 'अ', 'अ']
+    assert excess == ''
+
+    messages, excess = tools.get_sendable_messages('𡃤𡃤𡃤', 6, 2)
+    assert messages == ['𡃤', '𡃤']
+    assert excess == '𡃤'
+
+
+def test_get_sendable_messages_too_short():
+    messages, excess = tools.get_sendable_messages('α a', 1)
+    assert messages == ['']
+    assert excess == 'α a'
+
+
 def test_chain_loaders(configfactory):
     re_numeric = re.compile(r'\d+')
     re_text = re.compile(r'\w+')
@@ -7,7 +7,12 @@ import re
 import pytest
 
 from sopel.tools import Identifier
-from sopel.trigger import PreTrigger, Trigger
+from sopel.trigger import (
+    get_privilege_matcher,
+    PreTrigger,
+    PrivilegeMatcher,
+    Trigger,
+)
 
 
 TMP_CONFIG = """
@@ -433,3 +438,69 @@ def test_statusmsg_trigger(nick, configfactory):
     assert trigger.sender == '#channel'
     assert trigger.sender == Identifier('#channel')
     assert trigger.status_prefix == '@'
+
+
+@pytest.mark.parametrize('nick, host, account, owner, admin', (
+    ('Foo', 'example.com', None, True, True),
+    ('foo', 'example.com', None, True, True),
+    ('Bar', 'example.com', None, False, True),
+    ('Baz', 'admin.example.com', None, False, True),
+    ('Baz', 'example.com', None, False, False),
+    ('Baz', 'example.com', 'spam', False, True),
+    ('Baz', None, None, False, False),
+))
+def test_privilege_matcher(nick, host, account, owner, admin):
+    matcher = PrivilegeMatcher(
+        'Foo', admins=['Bar', '*@admin.example.com'], admin_accounts=['spam'])
+
+    assert matcher.is_owner(nick, host, account) is owner
+    assert matcher.is_admin(nick, host, account) is admin
+
+
+def test_privilege_matcher_owner_account():
+    matcher = PrivilegeMatcher('Foo', owner_account='bar')
+
+    assert matcher.is_owner('Foo', 'example.com', None) is False
+    assert matcher.is_owner('Baz', 'example.com', 'bar') is True
+    assert matcher.is_admin('Baz', 'example.com', 'bar') is True
+
+
+def test_privilege_matcher_no_admins():
+    matcher = PrivilegeMatcher('Foo')
+
+    assert matcher.is_admin('Bar', 'example.com', None) is False
+    assert matcher.is_admin('Foo', 'example.com', None) is True
+
+
+def test_get_privilege_matcher(configfactory):
+    config = configfactory('default.cfg', TMP_CONFIG)
+    matcher = get_privilege_matcher(config)
+
+    assert get_privilege_matcher(config) is matcher, (
+        'The matcher must be built once')
+
+    config.core.admins = ['Bar', 'Baz']
+    new_matcher = get_privilege_matcher(config)
+    assert new_matcher is not matcher, (
+        'The matcher must be rebuilt when the settings change')
+    assert new_matcher.is_admin('Baz', 'example.com', None)
+
+
+def test_trigger_privileges_shared(nick, configfactory):
+    line = ':Bar!bar@example.com PRIVMSG #Sopel :Hello, world'
+    pretrigger = PreTrigger(nick, line)
+    config = configfactory('default.cfg', TMP_CONFIG)
+    fakematch = re.match('.*', line)
+
+    trigger = Trigger(config, pretrigger, fakematch)
+    other_trigger = Trigger(config, pretrigger, fakematch)
+    assert not pretrigger._privileges, 'Privileges must be computed lazily'
+
+    assert trigger.admin is True
+    assert trigger.owner is False
+    assert len(pretrigger._privileges) == 1
+
+    assert other_trigger.admin is True
+    assert other_trigger.owner is False
+    assert len(pretrigger._privileges) == 1, (
+        'Privileges must be shared by every trigger of the same message')
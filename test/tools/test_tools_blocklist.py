@@ -0,0 +1,132 @@
+"""Tests for Sopel's blocklist tool"""
+from __future__ import annotations
+
+import pytest
+
+from sopel.tools import blocklist, identifiers
+
+
+@pytest.mark.parametrize('mask, expected', (
+    ('spamuser', 'spamuser'),
+    (r'spamhost\.com', 'spamhost.com'),
+    (r'escaped\[user\]', 'escaped[user]'),
+    ('spam-user', 'spam-user'),
+    (r'.*\.spamhost\.com', None),
+    ('spam|user', None),
+    ('spamüser', None),
+))
+def test_get_literal(mask, expected):
+    assert blocklist.get_literal(mask) == expected
+
+
+@pytest.mark.parametrize('host, expected', (
+    ('spamhost.com', True),
+    ('SpamHost.com', True),
+    ('a.spamhost.com', True),
+    ('a.b.spamhost.com', True),
+    ('.spamhost.com', False),
+    ('notspamhost.com', False),
+    ('spamhost.com.example', False),
+    ('example.com', False),
+    ('sub.evil.org', True),
+    ('evil.org', False),
+    ('.evil.org', True),
+))
+def test_domain_trie(host, expected):
+    trie = blocklist.DomainTrie()
+    trie.add('spamhost.com')
+    trie.add('evil.org', itself=False, empty_subdomain=True)
+
+    assert trie.match(host) is expected
+
+
+@pytest.mark.parametrize('value, expected', (
+    ('spamhost.com', True),
+    ('SPAMHOST.com', True),
+    ('spamhostxcom', False),
+    ('a.evil.org', True),
+    ('evil.org', True),
+    ('evil.org.example', False),
+    ('x.bad.net', True),
+    ('bad.net', False),
+    ('foo.example', True),
+    ('bar', True),
+    ('xbar', False),
+    ('aa', True),
+    ('ab', False),
+    ('(broken', True),
+    ('example.com', False),
+))
+def test_mask_index(value, expected):
+    index = blocklist.MaskIndex([
+        r'spamhost\.com',
+        r'(.+\.)*evil\.org',
+        r'.*\.bad\.net',
+        'foo|bar',
+        r'(\w)\1',
+        '(broken',
+        '',
+    ], domains=True)
+
+    assert index.match(value) is expected
+
+
+def test_mask_index_classification():
+    index = blocklist.MaskIndex([
+        r'spamhost\.com',
+        r'(.+\.)*evil\.org',
+        'foo|bar',
+        r'(\w)\1',
+        '(broken',
+    ], domains=True)
+
+    assert index.literals == {'spamhost.com'}
+    assert index.domains.match('evil.org')
+    assert index.pattern is not None
+    assert index.pattern.pattern == '(?:foo|bar$)'
+    assert len(index.patterns) == 1, 'Backreferences must not be combined'
+
+
+def test_blocklist():
+    def make_identifier(name):
+        return identifiers.Identifier(
+            name, casemapping=identifiers.rfc1459_lower)
+
+    blocked = blocklist.Blocklist(
+        ['spamuser', r'Guest\d+', '[Spam]'],
+        [r'(.+\.)*spamhost\.com'],
+        [r'.*!.*@evil\.org'],
+        make_identifier,
+    )
+
+    assert blocked.is_nick_blocked(make_identifier('SpamUser'))
+    assert blocked.is_nick_blocked(make_identifier('guest123'))
+    assert blocked.is_nick_blocked(make_identifier('{spam}')), (
+        'Nicks must be compared with the casemapping')
+    assert not blocked.is_nick_blocked(make_identifier('Guest'))
+
+    assert blocked.is_host_blocked('a.spamhost.com')
+    assert not blocked.is_host_blocked('example.com')
+
+    assert blocked.is_hostmask_blocked('Foo!foo@evil.org')
+    assert not blocked.is_hostmask_blocked('Foo!foo@example.com')
+    assert not blocked.is_hostmask_blocked(None)
+    assert not blocked.is_hostmask_blocked('')
+
+
+def test_blocklist_check_cache():
+    blocked = blocklist.Blocklist(
+        ['spamuser'], [], [], identifiers.Identifier, cache_size=2)
+
+    assert blocked.check('spamuser', 'a', 'spamuser!a@a') == (
+        True, False, False)
+    assert blocked.check('other', 'b', 'other!b@b') == (False, False, False)
+    assert blocked._cache == {
+        'spamuser!a@a': (True, False, False),
+        'other!b@b': (False, False, False),
+    }
+
+    assert blocked.check('another', 'c', 'another!c@c') == (
+        False, False, False)
+    assert list(blocked._cache) == ['other!b@b', 'another!c@c'], (
+        'The oldest result must be discarded')
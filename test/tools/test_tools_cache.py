@@ -0,0 +1,61 @@
+"""Tests for Sopel's caches"""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from sopel.tools import cache
+
+
+def test_lru_cache():
+    lru = cache.LRUCache(2)
+    assert lru.get('a') is cache.MISSING
+
+    lru.set('a', 1)
+    lru.set('b', None)
+    assert lru.get('a') == 1
+    assert lru.get('b') is None
+
+    # 'a' was used last: 'b' is evicted
+    lru.get('a')
+    lru.set('c', 3)
+    assert len(lru) == 2
+    assert lru.get('b') is cache.MISSING
+    assert lru.get('a') == 1
+    assert lru.get('c') == 3
+
+    lru.pop('a')
+    lru.pop('unknown')
+    assert lru.get('a') is cache.MISSING
+
+    stats = lru.get_stats()
+    assert stats.size == 1
+    assert stats.hits == 5
+    assert stats.misses == 3
+
+    lru.clear()
+    assert len(lru) == 0
+
+
+def test_lru_cache_ttl():
+    lru = cache.LRUCache(10, ttl=60)
+    lru.set('default', 1)
+    lru.set('short', 2, ttl=0.01)
+
+    time.sleep(0.02)
+    assert lru.get('default') == 1
+    assert lru.get('short') is cache.MISSING
+    assert len(lru) == 1, 'Expired entry must be removed'
+
+
+def test_lru_cache_disabled():
+    lru = cache.LRUCache(0)
+    lru.set('a', 1)
+    assert lru.get('a') is cache.MISSING
+    assert len(lru) == 0
+
+
+def test_lru_cache_invalid_size():
+    with pytest.raises(ValueError):
+        cache.LRUCache(-1)
@@ -1,12 +1,14 @@
 """Tests for Job Scheduler"""
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
 
 import pytest
 
 from sopel import plugin
-from sopel.tools import jobs
+from sopel.tools import jobs, workers
 
 
 TMP_CONFIG = """
@@ -35,6 +37,127 @@ def test_jobscheduler_stop(mockconfig, botfactory):
     assert scheduler.stopping.is_set(), 'Stopping must have been set'
 
 
+def test_jobscheduler_get_ready_jobs(mockconfig, botfactory):
+    mockbot = botfactory(mockconfig)
+    scheduler = jobs.Scheduler(mockbot)
+    job_short = jobs.Job([5], handler=lambda manager: None)
+    job_long = jobs.Job([10], handler=lambda manager: None)
+    job_removed = jobs.Job([5], handler=lambda manager: None)
+    scheduler.register(job_long)
+    scheduler.register(job_short)
+    scheduler.register(job_removed)
+    scheduler.remove_callable_job(job_removed._handler)
+
+    now = time.time()
+    assert scheduler._get_ready_jobs(now) == []
+    assert 4 < scheduler._get_timeout(now) <= 5
+
+    assert scheduler._get_ready_jobs(now + 6) == [job_short]
+    # the job is out of the queue until it has been executed
+    assert scheduler._get_ready_jobs(now + 6) == []
+    assert 3 < scheduler._get_timeout(now + 6) <= 10 - 6
+
+    # once executed, the job is queued again
+    scheduler._call(job_short)
+    assert set(scheduler._get_ready_jobs(now + 11)) == {job_long, job_short}
+    assert scheduler._get_timeout(now) is None
+
+
+def test_jobscheduler_run_subsecond(mockconfig, botfactory):
+    mockbot = botfactory(mockconfig)
+    scheduler = jobs.Scheduler(mockbot)
+    executed = []
+    done = threading.Event()
+
+    def handler(manager):
+        executed.append(time.time())
+        if len(executed) >= 3:
+            done.set()
+
+    # register a later job first: the scheduler must not wait for it
+    scheduler.register(jobs.Job([3600], handler=lambda manager: None))
+    scheduler.start()
+    try:
+        time.sleep(0.05)
+        scheduler.register(jobs.Job([0.1], handler=handler, threaded=False))
+        assert done.wait(2), 'The job must run every 0.1s'
+    finally:
+        scheduler.stop()
+        scheduler.join(2)
+
+    assert not scheduler.is_alive()
+
+
+def test_jobscheduler_run_no_overlap(mockconfig, botfactory):
+    mockbot = botfactory(mockconfig)
+    scheduler = jobs.Scheduler(mockbot)
+    running = threading.Semaphore(1)
+    overlaps = []
+    executions = []
+
+    def handler(manager):
+        if not running.acquire(blocking=False):
+            overlaps.append(True)
+            return
+        executions.append(True)
+        time.sleep(0.1)
+        running.release()
+
+    scheduler.register(jobs.Job([0.01], handler=handler))
+    scheduler.start()
+    try:
+        time.sleep(0.35)
+    finally:
+        scheduler.stop()
+        scheduler.join(2)
+
+    assert executions
+    assert not overlaps, 'A threaded job must not run twice at the same time'
+
+
+def test_jobscheduler_run_submit_error(mockconfig, botfactory, monkeypatch):
+    mockbot = botfactory(mockconfig)
+    scheduler = jobs.Scheduler(mockbot)
+    errors = []
+    executed = {'first': threading.Event(), 'second': threading.Event()}
+    submit = scheduler._pool.submit
+
+    def fail_once(*args, **kwargs):
+        if not errors:
+            raise RuntimeError('Cannot submit')
+        return submit(*args, **kwargs)
+
+    monkeypatch.setattr(scheduler._pool, 'submit', fail_once)
+    monkeypatch.setattr(
+        mockbot,
+        'on_scheduler_error',
+        lambda scheduler, error: errors.append(error),
+    )
+
+    # both jobs are ready at the same time, and the first one fails
+    now = time.time()
+    for label, event in executed.items():
+        job = jobs.Job([0.1], label=label, handler=(
+            lambda manager, event=event: event.set()))
+        job.next_times = {0.1: now}
+        scheduler.register(job)
+
+    scheduler.start()
+    try:
+        assert executed['second'].wait(2), 'The other job must run'
+        assert executed['first'].wait(2), 'The failed job must run again'
+    finally:
+        scheduler.stop()
+        scheduler.join(2)
+
+    assert len(errors) == 1
+
+
+def test_job_get_next_time():
+    job = jobs.Job([5, 10])
+    assert job.get_next_time() == job.next_times[5]
+
+
 def test_job_is_ready_to_run():
     now = time.time()
     job = jobs.Job([5])
@@ -198,6 +321,104 @@ def test_job_next_many():
     }
 
 
+def test_job_next_overlap_skip():
+    timestamp = 523549800
+    job = jobs.Job([5], overlap=jobs.OVERLAP_SKIP)
+    job.next_times[5] = timestamp
+
+    # no tick missed
+    job.next(timestamp + 1)
+    assert job.next_times == {5: timestamp + 5}
+    assert job.skipped_ticks == 0
+
+    # the ticks at +10s and +15s are skipped: wait for the next one
+    job.next(timestamp + 17)
+    assert job.next_times == {5: timestamp + 20}
+    assert job.skipped_ticks == 2
+
+
+def test_job_next_overlap_queue():
+    timestamp = 523549800
+    job = jobs.Job([5], overlap=jobs.OVERLAP_QUEUE)
+    job.next_times[5] = timestamp
+
+    # the tick at +10s is kept (due now), the one at +5s is skipped
+    job.next(timestamp + 12)
+    assert job.next_times == {5: timestamp + 10}
+    assert job.skipped_ticks == 1
+
+    # and the job keeps its original schedule
+    job.next(timestamp + 13)
+    assert job.next_times == {5: timestamp + 15}
+    assert job.skipped_ticks == 1
+
+
+def test_job_next_overlap_coalesce():
+    timestamp = 523549800
+    job = jobs.Job([5])
+    assert job.overlap == jobs.OVERLAP_COALESCE
+    job.next_times[5] = timestamp
+
+    # the ticks at +5s and +10s are merged into one execution, right away
+    job.next(timestamp + 12)
+    assert job.next_times == {5: timestamp + 12}
+    assert job.skipped_ticks == 1
+
+    # and the schedule restarts from there
+    job.next(timestamp + 13)
+    assert job.next_times == {5: timestamp + 17}
+
+
+def test_job_overlap_invalid():
+    with pytest.raises(ValueError):
+        jobs.Job([5], overlap='invalid')
+
+
+def test_job_jitter():
+    before = time.time()
+    job = jobs.Job([5], jitter=60)
+    after = time.time()
+
+    # the jitter is capped to the job's interval
+    assert before + 5 <= job.next_times[5] <= after + 10
+
+
+def test_job_from_callable_overlap_jitter(mockconfig):
+    @plugin.interval(60, overlap='skip', jitter=10)
+    def handler(manager):
+        return 'tested'
+
+    handler.setup(mockconfig)
+    handler.plugin_name = 'testplugin'
+
+    kwargs = jobs.Job.kwargs_from_callable(handler)
+    assert kwargs['overlap'] == 'skip'
+    assert kwargs['jitter'] == 10
+
+    job = jobs.Job.from_callable(mockconfig, handler)
+    assert job.overlap == jobs.OVERLAP_SKIP
+
+
+def test_jobscheduler_call_skipped_stats(mockconfig, botfactory):
+    mockbot = botfactory(mockconfig)
+    scheduler = jobs.Scheduler(mockbot)
+
+    job = jobs.Job(
+        [0.01],
+        plugin='testplugin',
+        label='testjob',
+        handler=lambda manager: time.sleep(0.05),
+        overlap=jobs.OVERLAP_SKIP,
+    )
+    job.next_times[0.01] = time.time()
+    scheduler._call(job)
+
+    stats = scheduler.stats.get('job', 'testplugin', 'testjob').get_snapshot()
+    assert stats.invocations == 1
+    assert stats.skipped >= 4
+    assert stats.skipped == job.skipped_ticks
+
+
 def test_job_from_callable(mockconfig):
     @plugin.interval(5)
     @plugin.label('testjob')
@@ -221,6 +442,100 @@ def test_job_from_callable(mockconfig):
     assert str(job) == '<Job testplugin.testjob [5s]>'
 
 
+def test_job_from_callable_async(mockconfig):
+    @plugin.interval(5)
+    async def handler(manager):
+        return 'tested'
+
+    handler.setup(mockconfig)
+    handler.plugin_name = 'testplugin'
+
+    job = jobs.Job.from_callable(mockconfig, handler)
+
+    assert job.is_async()
+    assert asyncio.run(job.execute(None)) == 'tested'
+
+
+def test_jobscheduler_run_async_job(mockconfig, botfactory):
+    mockbot = botfactory(mockconfig)
+    scheduler = jobs.Scheduler(mockbot)
+    executed = threading.Event()
+
+    async def handler(manager):
+        assert manager is mockbot
+        executed.set()
+
+    job = jobs.Job([5], handler=handler)
+    assert job.is_async()
+    assert not jobs.Job([5], handler=lambda manager: None).is_async()
+
+    scheduler._run_job(job)
+    assert executed.wait(5), 'The async job must be executed'
+
+
+def test_jobscheduler_run_job_submit_error(
+    mockconfig,
+    botfactory,
+    monkeypatch,
+):
+    mockbot = botfactory(mockconfig)
+    scheduler = jobs.Scheduler(mockbot)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError('Cannot submit')
+
+    monkeypatch.setattr(scheduler._pool, 'submit', fail)
+    monkeypatch.setattr(scheduler, '_run_coroutine', fail)
+
+    async def async_handler(manager):
+        pass
+
+    for handler in (lambda manager: None, async_handler):
+        job = jobs.Job([5], handler=handler)
+        with pytest.raises(RuntimeError):
+            scheduler._run_job(job)
+        assert not job.is_running.is_set(), 'The job is not running'
+
+
+def test_jobscheduler_run_job_dropped(mockconfig, botfactory, monkeypatch):
+    mockbot = botfactory(mockconfig)
+    scheduler = jobs.Scheduler(mockbot)
+    now = time.time()
+    job = jobs.Job([5], handler=lambda manager: None)
+    job.next_times = {5: now - 1}
+    scheduler.register(job)
+    assert scheduler._get_ready_jobs(now) == [job]
+
+    def drop(func, *args, **kwargs):
+        task = workers.Task(func, args)
+        task.dropped = True
+        return task
+
+    monkeypatch.setattr(scheduler._pool, 'submit', drop)
+    scheduler._run_job(job)
+
+    assert not job.is_running.is_set(), 'A dropped job is not running'
+    # the job waits for its next tick
+    assert job.get_next_time() > now
+    assert scheduler._get_ready_jobs(job.get_next_time()) == [job]
+
+
+def test_jobscheduler_call_stats(mockconfig, botfactory):
+    mockbot = botfactory(mockconfig)
+    scheduler = jobs.Scheduler(mockbot)
+
+    def handler(manager):
+        raise WithJobMockException
+
+    job = jobs.Job([5], plugin='testplugin', label='testjob', handler=handler)
+    scheduler._call(job, time.monotonic() - 2)
+
+    stats = scheduler.stats.get('job', 'testplugin', 'testjob').get_snapshot()
+    assert stats.invocations == 1
+    assert stats.errors == 1
+    assert stats.queue_wait_total >= 2
+
+
 def test_job_with():
     job = jobs.Job([5])
     # play with time: move 1s back in the future
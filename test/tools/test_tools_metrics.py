@@ -0,0 +1,119 @@
+"""Tests for the metrics endpoint"""
+from __future__ import annotations
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from sopel.tools import metrics
+
+
+TMP_CONFIG = """
+[core]
+owner = testnick
+nick = TestBot
+enable = coretasks
+"""
+
+
+@pytest.fixture
+def mockbot(configfactory, botfactory):
+    return botfactory(configfactory('default.cfg', TMP_CONFIG))
+
+
+def test_metrics_writer():
+    writer = metrics.MetricsWriter()
+    writer.declare('test_total', 'counter', 'A test counter.')
+    writer.sample('test_total', 3, {'name': 'a "quoted"\\value\n'})
+    writer.declare('test_seconds', 'histogram', 'A test histogram.')
+    writer.histogram(
+        'test_seconds', (1, 0, 2, 0, 0, 0, 0, 0, 0, 1), 12.5, {'name': 'b'})
+
+    assert writer.getvalue().splitlines() == [
+        '# HELP test_total A test counter.',
+        '# TYPE test_total counter',
+        'test_total{name="a \\"quoted\\"\\\\value\\n"} 3',
+        '# HELP test_seconds A test histogram.',
+        '# TYPE test_seconds histogram',
+        'test_seconds_bucket{name="b",le="0.001"} 1',
+        'test_seconds_bucket{name="b",le="0.005"} 1',
+        'test_seconds_bucket{name="b",le="0.01"} 3',
+        'test_seconds_bucket{name="b",le="0.05"} 3',
+        'test_seconds_bucket{name="b",le="0.1"} 3',
+        'test_seconds_bucket{name="b",le="0.5"} 3',
+        'test_seconds_bucket{name="b",le="1.0"} 3',
+        'test_seconds_bucket{name="b",le="5.0"} 3',
+        'test_seconds_bucket{name="b",le="10.0"} 3',
+        'test_seconds_bucket{name="b",le="+Inf"} 4',
+        'test_seconds_sum{name="b"} 12.5',
+        'test_seconds_count{name="b"} 4',
+    ]
+
+
+def test_render_metrics(mockbot):
+    mockbot.on_message(':irc.example.com NOTICE * :Welcome')
+    mockbot.handler_stats.get('rule', 'testplugin', 'testrule') \
+        .record_execution(0.02)
+
+    lines = metrics.render_metrics(mockbot).splitlines()
+    assert 'sopel_irc_lines_received_total 1' in lines
+    assert 'sopel_channels 0' in lines
+    assert (
+        'sopel_handler_invocations_total'
+        '{kind="rule",plugin="testplugin",label="testrule"} 1'
+    ) in lines
+    assert (
+        'sopel_handler_execution_seconds_bucket'
+        '{kind="rule",plugin="testplugin",label="testrule",le="0.05"} 1'
+    ) in lines
+    assert any(
+        line.startswith('sopel_db_query_seconds_count ') for line in lines)
+    assert 'sopel_db_cache_entries{cache="value"} 0' in lines
+    # watchdog is disabled by default
+    assert not any(line.startswith('sopel_watchdog_') for line in lines)
+
+
+def test_render_metrics_watchdog(configfactory, botfactory):
+    settings = configfactory(
+        'default.cfg', TMP_CONFIG + 'watchdog_budget = 5\n')
+    mockbot = botfactory(settings)
+
+    lines = metrics.render_metrics(mockbot).splitlines()
+    assert '# TYPE sopel_watchdog_stalls_total counter' in lines
+    assert 'sopel_heartbeat_lag_seconds{name="event loop"} 0.0' in lines
+
+
+def test_render_metrics_write_behind(configfactory, botfactory):
+    settings = configfactory(
+        'default.cfg', TMP_CONFIG + 'db_write_behind_interval = 3600\n')
+    mockbot = botfactory(settings)
+    try:
+        mockbot.db.set_plugin_value('testplugin', 'key', 1)
+        mockbot.db.set_plugin_value('testplugin', 'key', 2)
+
+        lines = metrics.render_metrics(mockbot).splitlines()
+        assert 'sopel_db_pending_writes 1' in lines
+        assert 'sopel_db_coalesced_writes_total 1' in lines
+        assert 'sopel_db_flushes_total 0' in lines
+    finally:
+        mockbot.db.shutdown()
+
+
+def test_metrics_server(mockbot):
+    server = metrics.MetricsServer(mockbot, '127.0.0.1', 0)
+    server.start()
+    try:
+        host, port = server.address
+        url = 'http://%s:%d' % (host, port)
+
+        with urllib.request.urlopen(url + metrics.METRICS_PATH) as response:
+            assert response.headers['Content-Type'] == metrics.CONTENT_TYPE
+            body = response.read().decode('utf-8')
+        assert 'sopel_irc_lines_sent_total 0\n' in body
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(url + '/unknown')
+        assert error.value.code == 404
+    finally:
+        server.stop()
@@ -0,0 +1,84 @@
+"""Tests for handler statistics"""
+from __future__ import annotations
+
+import pytest
+
+from sopel.tools import stats
+
+
+def test_handler_stats():
+    handler_stats = stats.HandlerStats(stats.KIND_RULE, 'plugin', 'label')
+    snapshot = handler_stats.get_snapshot()
+    assert snapshot.invocations == 0
+    assert snapshot.execution_time_avg == 0.0
+    assert snapshot.queue_wait_avg == 0.0
+    assert snapshot.execution_buckets == (0,) * 10
+
+    handler_stats.record_execution(0.002, queue_wait=0.5)
+    handler_stats.record_execution(0.004, error=True)
+    handler_stats.record_execution(20.0)
+    handler_stats.record_rate_limited()
+    handler_stats.record_skipped(2)
+
+    snapshot = handler_stats.get_snapshot()
+    assert snapshot.kind == stats.KIND_RULE
+    assert snapshot.plugin == 'plugin'
+    assert snapshot.label == 'label'
+    assert snapshot.invocations == 3
+    assert snapshot.errors == 1
+    assert snapshot.rate_limited == 1
+    assert snapshot.skipped == 2
+    assert snapshot.queue_wait_max == 0.5
+    assert snapshot.execution_time_max == 20.0
+    assert snapshot.execution_time_avg == pytest.approx(20.006 / 3)
+    assert snapshot.queue_wait_avg == pytest.approx(0.5 / 3)
+    assert snapshot.execution_buckets == (0, 2, 0, 0, 0, 0, 0, 0, 0, 1)
+
+
+def test_stats_registry():
+    registry = stats.StatsRegistry()
+    rule_stats = registry.get(stats.KIND_RULE, 'plugin', 'label')
+    assert registry.get(stats.KIND_RULE, 'plugin', 'label') is rule_stats
+    registry.get(stats.KIND_JOB, 'plugin', 'label')
+    registry.get(stats.KIND_JOB, None, 'label')
+    registry.get(stats.KIND_RULE, 'other', 'label')
+    assert len(registry) == 4
+
+    snapshots = registry.get_snapshots()
+    assert [(item.kind, item.plugin) for item in snapshots] == [
+        (stats.KIND_JOB, None),
+        (stats.KIND_JOB, 'plugin'),
+        (stats.KIND_RULE, 'other'),
+        (stats.KIND_RULE, 'plugin'),
+    ]
+    assert len(registry.get_snapshots(kind=stats.KIND_RULE)) == 2
+    assert len(registry.get_snapshots(plugin='plugin')) == 2
+    assert len(registry.get_snapshots(stats.KIND_JOB, 'plugin')) == 1
+
+    registry.remove_plugin('plugin')
+    assert len(registry) == 2
+
+    registry.clear()
+    assert len(registry) == 0
+
+
+def test_counter():
+    counter = stats.Counter()
+    assert counter.value == 0
+
+    counter.increment()
+    counter.increment(2.5)
+    assert counter.value == 3.5
+
+
+def test_duration_stats():
+    durations = stats.DurationStats()
+    assert durations.get_snapshot() == (0, 0.0, 0.0, (0,) * 10)
+
+    durations.record(0.0005)
+    durations.record(0.2)
+    snapshot = durations.get_snapshot()
+    assert snapshot.observations == 2
+    assert snapshot.total == pytest.approx(0.2005)
+    assert snapshot.max == 0.2
+    assert snapshot.buckets == (1, 0, 0, 0, 0, 1, 0, 0, 0, 0)
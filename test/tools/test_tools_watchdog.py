@@ -0,0 +1,110 @@
+"""Tests for Sopel's watchdog"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+import pytest
+
+from sopel.tools import watchdog
+
+
+def test_watchdog_budget():
+    with pytest.raises(ValueError):
+        watchdog.Watchdog(0)
+
+    dog = watchdog.Watchdog(2)
+    assert dog.budget == 2
+    assert dog.interval == 0.5
+
+
+def test_watchdog_track(caplog):
+    dog = watchdog.Watchdog(0.01)
+
+    with caplog.at_level(logging.WARNING):
+        with dog.track('rule test.fast'):
+            pass
+        dog.check()
+    assert not caplog.records
+    assert dog.get_stats().stalls == 0
+
+    with caplog.at_level(logging.WARNING):
+        with dog.track('rule test.slow'):
+            time.sleep(0.02)
+            dog.check()
+            # each stall is reported only once
+            dog.check()
+
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert 'rule test.slow has been running for' in message
+    assert 'test_watchdog_track' in message, 'Stack must be logged'
+
+    stats = dog.get_stats()
+    assert stats.stalls == 1
+    assert stats.stalls_by_name == {'rule test.slow': 1}
+
+
+def test_watchdog_track_nested(caplog):
+    dog = watchdog.Watchdog(0.01)
+
+    with caplog.at_level(logging.WARNING):
+        with dog.track('dispatcher'):
+            with dog.track('rule test.slow'):
+                time.sleep(0.02)
+                dog.check()
+
+    # only the innermost execution blocks the thread
+    assert dog.get_stats().stalls_by_name == {'rule test.slow': 1}
+
+
+def test_watchdog_heartbeat(caplog):
+    dog = watchdog.Watchdog(0.01)
+    pending = []
+    dog.add_heartbeat('test loop', lambda beat: pending.append(beat) or True)
+
+    dog.check()  # send a heartbeat
+    assert len(pending) == 1
+    pending.pop()()  # and receive it
+    dog.check()  # compute its lag, and send a new one
+    assert len(pending) == 1
+    lag = dog.get_stats().heartbeat_lags['test loop']
+    assert 0 <= lag < 0.01
+
+    with caplog.at_level(logging.WARNING):
+        time.sleep(0.02)
+        dog.check()  # the heartbeat is late
+        dog.check()
+
+    assert len(caplog.records) == 1
+    assert 'test loop is stalled' in caplog.records[0].getMessage()
+    stats = dog.get_stats()
+    assert stats.stalls_by_name == {'test loop': 1}
+    assert stats.heartbeat_lags['test loop'] >= 0.02
+
+
+def test_watchdog_heartbeat_not_sent():
+    dog = watchdog.Watchdog(0.01)
+    dog.add_heartbeat('test loop', lambda beat: False)
+
+    dog.check()
+    time.sleep(0.02)
+    dog.check()
+
+    # a heartbeat that can't be sent is never late
+    stats = dog.get_stats()
+    assert stats.stalls == 0
+    assert stats.heartbeat_lags == {'test loop': 0.0}
+
+
+def test_watchdog_start_stop():
+    dog = watchdog.Watchdog(0.01)
+    received = threading.Event()
+    dog.add_heartbeat('test', lambda beat: received.set() or True)
+
+    dog.start()
+    try:
+        assert received.wait(1)
+    finally:
+        dog.stop()
@@ -0,0 +1,238 @@
+"""Tests for Worker Pool"""
+from __future__ import annotations
+
+import queue
+import threading
+
+import pytest
+
+from sopel.tools import workers
+
+
+def test_worker_pool_invalid_arguments():
+    with pytest.raises(ValueError):
+        workers.WorkerPool(0)
+
+    with pytest.raises(ValueError):
+        workers.WorkerPool(1, queue_size=-1)
+
+    with pytest.raises(ValueError):
+        workers.WorkerPool(1, policy='unknown')
+
+
+def test_worker_pool_submit():
+    pool = workers.WorkerPool(2)
+    results = []
+
+    tasks = [pool.submit(results.append, index) for index in range(10)]
+    for task in tasks:
+        task.join()
+
+    assert sorted(results) == list(range(10))
+    assert not any(task.is_alive() for task in tasks)
+    assert not any(task.dropped for task in tasks)
+    assert pool.tasks == []
+
+    stats = pool.get_stats()
+    assert stats.workers <= 2
+    assert stats.busy == 0
+    assert stats.queued == 0
+    assert stats.submitted == 10
+    assert stats.completed == 10
+    assert stats.dropped == 0
+
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        pool.submit(results.append, 10)
+
+
+def test_worker_pool_idle_worker_burst():
+    pool = workers.WorkerPool(4)
+    # leave one idle worker
+    pool.submit(lambda: None).join()
+    assert pool.get_stats().workers == 1
+
+    release = threading.Event()
+    slow = pool.submit(release.wait, 5, name='slow')
+    fast = pool.submit(lambda: None, name='fast')
+
+    try:
+        fast.join(1)
+        assert not fast.is_alive(), (
+            'A quick task must not wait behind a slow one')
+        assert slow.is_alive()
+        assert pool.get_stats().workers == 2
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_worker_pool_task_error():
+    pool = workers.WorkerPool(1)
+
+    def fail():
+        raise ValueError('Error in task')
+
+    task = pool.submit(fail, name='failing')
+    task.join()
+    assert task.name == 'failing'
+    assert not task.is_alive()
+
+    task = pool.submit(lambda: None)
+    task.join()
+    assert pool.get_stats().completed == 2, 'Worker must survive an error'
+    pool.shutdown()
+
+
+def test_worker_pool_thread_name():
+    pool = workers.WorkerPool(1, name='test-pool')
+    names = []
+
+    def get_name():
+        names.append(threading.current_thread().name)
+
+    pool.submit(get_name, name='task').join()
+    assert names == ['test-pool-1-task']
+    pool.shutdown()
+
+
+@pytest.mark.parametrize('policy, expected', (
+    (workers.POLICY_DROP, ['first', 'second']),
+    (workers.POLICY_OLDEST, ['first', 'third']),
+))
+def test_worker_pool_queue_full(policy, expected):
+    pool = workers.WorkerPool(1, queue_size=1, policy=policy)
+    started = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def blocking():
+        started.set()
+        release.wait()
+        results.append('first')
+
+    first = pool.submit(blocking)
+    started.wait()
+    second = pool.submit(results.append, 'second')
+    assert pool.queue_depth == 1
+    third = pool.submit(results.append, 'third')
+    assert pool.queue_depth == 1
+
+    release.set()
+    for task in (first, second, third):
+        task.join()
+
+    assert results == expected
+    assert [task.dropped for task in (first, second, third)] == [
+        False,
+        policy == workers.POLICY_OLDEST,
+        policy == workers.POLICY_DROP,
+    ]
+    assert pool.get_stats().dropped == 1
+    pool.shutdown()
+
+
+def test_worker_pool_queue_full_block():
+    pool = workers.WorkerPool(1, queue_size=1, policy=workers.POLICY_BLOCK)
+    started = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def blocking():
+        started.set()
+        release.wait()
+        results.append('first')
+
+    pool.submit(blocking)
+    started.wait()
+    pool.submit(results.append, 'second')
+
+    submitter = threading.Thread(
+        target=pool.submit, args=(results.append, 'third'))
+    submitter.start()
+    submitter.join(0.1)
+    assert submitter.is_alive(), 'Submit must block when the queue is full'
+
+    release.set()
+    submitter.join()
+    pool.shutdown()
+
+    assert results == ['first', 'second', 'third']
+    assert pool.get_stats().dropped == 0
+
+
+def test_worker_pool_queue_full_no_block():
+    pool = workers.WorkerPool(1, queue_size=1, policy=workers.POLICY_BLOCK)
+    started = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def blocking():
+        started.set()
+        release.wait()
+        results.append('first')
+
+    pool.submit(blocking)
+    started.wait()
+    pool.submit(results.append, 'second')
+
+    with pytest.raises(queue.Full):
+        pool.submit(results.append, 'third', block=False)
+    assert pool.get_stats().submitted == 2
+    assert not pool.wait_for_slot(0.1), 'The queue must still be full'
+
+    release.set()
+    assert pool.wait_for_slot(5)
+    pool.submit(results.append, 'third', block=False)
+    pool.shutdown()
+
+    assert results == ['first', 'second', 'third']
+    assert pool.get_stats().dropped == 0
+
+
+def test_worker_pool_oldest_wait_time():
+    pool = workers.WorkerPool(1)
+    started = threading.Event()
+    release = threading.Event()
+
+    assert pool.oldest_wait_time == 0
+
+    pool.submit(lambda: (started.set(), release.wait()))
+    started.wait()
+    assert pool.oldest_wait_time == 0, 'Running tasks are not waiting'
+
+    task = pool.submit(lambda: None)
+    assert pool.oldest_wait_time > 0
+
+    release.set()
+    task.join()
+    assert pool.oldest_wait_time == 0
+    pool.shutdown()
+
+
+def test_worker_pool_group_limits():
+    pool = workers.WorkerPool(3, group_limits={'slow': 1})
+    started = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def blocking():
+        started.set()
+        release.wait()
+        results.append('slow')
+
+    first = pool.submit(blocking, group='slow')
+    started.wait()
+    second = pool.submit(results.append, 'slow', group='slow')
+    other = pool.submit(results.append, 'fast', group='fast')
+
+    other.join()
+    assert results == ['fast'], 'Other groups must not wait for the limit'
+    assert second.is_alive(), 'Task must wait for its group'
+    assert second.started_at is None
+
+    release.set()
+    first.join()
+    second.join()
+    assert results == ['fast', 'slow', 'slow']
+    pool.shutdown()